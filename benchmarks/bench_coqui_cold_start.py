@@ -0,0 +1,127 @@
+"""Benchmark CoquiSynthesizerAdapter cold start — model manager vs snapshot.
+
+Every measurement is a fresh interpreter, timed from spawn until the
+adapter is constructed (imports included). Modes:
+
+  model          — ``CoquiSynthesizerAdapter(model_name=...)`` (or the tiny
+                   random VITS built from its config)
+  snapshot-read  — ``from_snapshot(mmap=False)``: weights read into memory
+  snapshot-mmap  — ``from_snapshot()``: weights memory-mapped
+
+With ``--workers N`` the N processes of a run are alive together when
+memory is sampled, so PSS (proportional set size, Linux only) shows how
+much of each worker's RSS is shared with its siblings.
+
+The snapshot is exported to a temporary directory first unless
+``--snapshot`` points at one. The first run after exporting reads a warm
+page cache; on a freshly booted host the mmap advantage is larger still.
+
+Usage::
+
+    python benchmarks/bench_coqui_cold_start.py --runs 5 --workers 4
+    python benchmarks/bench_coqui_cold_start.py --model tts_models/en/vctk/vits
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+CHILD = r"""
+import json, sys, time
+t0 = time.perf_counter()
+from tts_v2.adapters.synthesizer.coqui_adapter import CoquiSynthesizerAdapter
+import_s = time.perf_counter() - t0
+mode, source = sys.argv[1], sys.argv[2]
+if mode == "model" and source == "tiny":
+    from tts_v2.adapters.synthesizer.coqui_tiny_model import build_tiny_vits
+    adapter = CoquiSynthesizerAdapter(model_name="tiny-vits", use_gpu=False, tts_model=build_tiny_vits())
+elif mode == "model":
+    adapter = CoquiSynthesizerAdapter(model_name=source, use_gpu=False)
+else:
+    adapter = CoquiSynthesizerAdapter.from_snapshot(source, mmap=mode == "snapshot-mmap", use_gpu=False)
+print(json.dumps({"import_s": import_s, "load_s": adapter.load_s}), flush=True)
+sys.stdin.readline()
+memory = {}
+try:
+    with open("/proc/self/smaps_rollup") as fh:
+        for line in fh:
+            key, _, value = line.partition(":")
+            if key in ("Rss", "Pss"):
+                memory[key.lower() + "_mb"] = int(value.split()[0]) / 1024
+except OSError:
+    import resource
+    memory["rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+print(json.dumps(memory), flush=True)
+"""
+
+
+def run_workers(mode: str, source: str, workers: int) -> list:
+    """Start ``workers`` processes together; return one result dict each."""
+    t0 = time.perf_counter()
+    procs = [
+        subprocess.Popen(
+            [sys.executable, "-c", CHILD, mode, source],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        )
+        for _ in range(workers)
+    ]
+    results = []
+    for proc in procs:
+        line = proc.stdout.readline()
+        if not line:
+            raise RuntimeError(f"{mode} worker exited with {proc.wait()}")
+        results.append({**json.loads(line), "ready_s": time.perf_counter() - t0})
+    for proc, result in zip(procs, results):
+        proc.stdin.write("\n")
+        proc.stdin.flush()
+        result.update(json.loads(proc.stdout.readline()))
+        proc.wait()
+    return results
+
+
+def export(model: str, directory: str) -> None:
+    from tts_v2.adapters.synthesizer.coqui_adapter import CoquiSynthesizerAdapter
+    from tts_v2.adapters.synthesizer.coqui_tiny_model import build_tiny_vits
+
+    if model == "tiny":
+        adapter = CoquiSynthesizerAdapter(model_name="tiny-vits", use_gpu=False, tts_model=build_tiny_vits())
+    else:
+        adapter = CoquiSynthesizerAdapter(model_name=model, use_gpu=False)
+    adapter.export_snapshot(directory)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default="tiny", help="'tiny' or a Coqui model name")
+    parser.add_argument("--snapshot", default=None, help="Existing snapshot directory (default: export one)")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=1, help="Processes started together per run")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot = args.snapshot
+        if snapshot is None:
+            snapshot = f"{tmp}/snapshot"
+            export(args.model, snapshot)
+
+        modes = {"model": args.model, "snapshot-read": snapshot, "snapshot-mmap": snapshot}
+        print(f"{'mode':<14} {'ready_s':>8} {'load_s':>8} {'import_s':>9} {'rss_mb':>8} {'pss_mb':>8}")
+        for name, source in modes.items():
+            results = [r for _ in range(args.runs) for r in run_workers(name, source, args.workers)]
+
+            def median(key: str) -> float:
+                values = [r[key] for r in results if key in r]
+                return statistics.median(values) if values else float("nan")
+
+            print(
+                f"{name:<14} {median('ready_s'):>8.2f} {median('load_s'):>8.3f} {median('import_s'):>9.2f} "
+                f"{median('rss_mb'):>8.1f} {median('pss_mb'):>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark CoquiSynthesizerAdapter CPU modes — RTF per mode.
+
+Compares:
+  default   — stock torch settings (no CpuPerformanceConfig)
+  cpu       — inference_mode + explicit thread counts
+  cpu-int8  — as ``cpu`` plus dynamic int8 quantisation (if it passes the gate)
+
+Runs offline against a tiny random VITS by default; pass ``--model`` to
+benchmark a real checkpoint (e.g. ``tts_models/en/vctk/vits``).
+
+Usage::
+
+    python benchmarks/bench_coqui_cpu.py --runs 5 --threads 4
+    python benchmarks/bench_coqui_cpu.py --model tts_models/en/vctk/vits
+"""
+
+import argparse
+import statistics
+import time
+
+from tts_v2.adapters.synthesizer.coqui_adapter import CoquiSynthesizerAdapter, CpuPerformanceConfig
+from tts_v2.adapters.synthesizer.coqui_tiny_model import build_tiny_vits
+from tts_v2.domain.audio import SynthesisRequest
+
+PROMPTS = [
+    "Your one time password is four eight two nine one three.",
+    "This call may be recorded for quality and compliance purposes.",
+    "Your account balance is one thousand two hundred and thirty four dollars and fifty cents.",
+]
+
+
+def build(model: str, perf: CpuPerformanceConfig = None) -> CoquiSynthesizerAdapter:
+    if model == "tiny":
+        return CoquiSynthesizerAdapter(
+            model_name="tiny-vits", use_gpu=False, tts_model=build_tiny_vits(), cpu_performance=perf,
+        )
+    return CoquiSynthesizerAdapter(model_name=model, use_gpu=False, cpu_performance=perf)
+
+
+def measure(adapter: CoquiSynthesizerAdapter, runs: int) -> dict:
+    adapter.synthesize(SynthesisRequest(text=PROMPTS[0], persona="neutral_male"))  # warm-up
+    rtfs = []
+    for _ in range(runs):
+        for text in PROMPTS:
+            t0 = time.perf_counter()
+            chunk = adapter.synthesize(SynthesisRequest(text=text, persona="neutral_male"))
+            rtfs.append((time.perf_counter() - t0) / chunk.duration_s)
+    return {"rtf_mean": statistics.fmean(rtfs), "rtf_p50": statistics.median(rtfs)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default="tiny", help="'tiny' or a Coqui model name")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    modes = {
+        "default": None,
+        "cpu": CpuPerformanceConfig(intra_op_threads=args.threads, inter_op_threads=1),
+        "cpu-int8": CpuPerformanceConfig(intra_op_threads=args.threads, inter_op_threads=1, quantize=True),
+    }
+
+    print(f"{'mode':<10} {'load_s':>8} {'rtf_mean':>9} {'rtf_p50':>8}  notes")
+    for name, perf in modes.items():
+        t0 = time.perf_counter()
+        adapter = build(args.model, perf)
+        load_s = time.perf_counter() - t0
+        result = measure(adapter, args.runs)
+        notes = ""
+        if perf is not None and perf.quantize:
+            report = adapter.quantization_report or {}
+            notes = (
+                f"int8={'on' if adapter.quantized else 'rejected'} "
+                f"snr={report.get('snr_db', float('nan')):.1f}dB "
+                f"modules={report.get('quantized_modules', 0)}"
+            )
+        print(f"{name:<10} {load_s:>8.2f} {result['rtf_mean']:>9.3f} {result['rtf_p50']:>8.3f}  {notes}")
+
+
+if __name__ == "__main__":
+    main()
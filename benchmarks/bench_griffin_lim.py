@@ -0,0 +1,62 @@
+"""Benchmark GriffinLimVocoderAdapter — batch vs streaming two-stage latency.
+
+Simulates an acoustic model that emits mel frames at a fixed rate and
+reports time-to-first-audio and RTF for batch vocoding (wait for the full
+spectrogram) versus ``vocode_stream()``.
+
+Usage::
+
+    python benchmarks/bench_griffin_lim.py --seconds 6 --frames-per-step 8
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from tts_v2.adapters.vocoder.griffin_lim_adapter import GriffinLimVocoderAdapter
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=6.0, help="audio length")
+    parser.add_argument("--frames-per-step", type=int, default=8, help="mel frames emitted per model step")
+    parser.add_argument("--model-rtf", type=float, default=0.05, help="simulated acoustic-model RTF")
+    parser.add_argument("--chunk-frames", type=int, default=16)
+    parser.add_argument("--n-iter", type=int, default=32)
+    args = parser.parse_args()
+
+    vocoder = GriffinLimVocoderAdapter(n_iter=args.n_iter)
+    sr = vocoder.sample_rate
+    t = np.arange(int(sr * args.seconds)) / sr
+    mel = vocoder.mel_spectrogram((0.4 * np.sin(2 * np.pi * 180 * t * (1 + 0.3 * t))).astype(np.float32))
+    step_s = args.frames_per_step * vocoder.hop_length / sr * args.model_rtf
+
+    def acoustic_model():
+        for i in range(0, mel.shape[1], args.frames_per_step):
+            time.sleep(step_s)
+            yield mel[:, i:i + args.frames_per_step]
+
+    t0 = time.perf_counter()
+    full = np.concatenate(list(acoustic_model()), axis=1)
+    wav = vocoder.vocode(full)
+    batch_total = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    first_audio = None
+    n = 0
+    for block in vocoder.vocode_stream(acoustic_model(), chunk_frames=args.chunk_frames):
+        if first_audio is None:
+            first_audio = time.perf_counter() - t0
+        n += block.size
+    stream_total = time.perf_counter() - t0
+
+    duration = wav.size / sr
+    print(f"audio {duration:.2f}s | mel frames {mel.shape[1]} | n_iter {args.n_iter}")
+    print(f"{'mode':<8} {'first_audio_s':>14} {'total_s':>8} {'rtf':>6}")
+    print(f"{'batch':<8} {batch_total:>14.3f} {batch_total:>8.3f} {batch_total / duration:>6.3f}")
+    print(f"{'stream':<8} {first_audio:>14.3f} {stream_total:>8.3f} {stream_total / (n / sr):>6.3f}")
+
+
+if __name__ == "__main__":
+    main()
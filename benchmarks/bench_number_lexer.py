@@ -0,0 +1,66 @@
+"""Benchmark expand_numbers_in_text() — cost versus statement length.
+
+Builds synthetic statements of increasing size from transaction lines
+(currency, OTPs, reference codes, plain numbers) and reports time per
+kilobyte; a flat column means normalisation is linear in text length.
+
+Usage::
+
+    python benchmarks/bench_number_lexer.py --lines 10 100 1000
+"""
+
+import argparse
+import logging
+import random
+import time
+
+from tts_v2.text_normalization.number_formatter import expand_numbers_in_text, lex_numbers
+
+_TEMPLATES = [
+    "Payment of ${amount} to account {acct} on {day}.{month}.2025, reference {code}.",
+    "Your one time password is {otp}. Do not share it with anyone.",
+    "Interest of {rate}% applies to balances above ${amount}.",
+    "SWIFT {code} transfer of ${amount} is pending, {n} items remaining.",
+]
+
+
+def statement(lines: int, rng: random.Random) -> str:
+    out = []
+    for _ in range(lines):
+        out.append(rng.choice(_TEMPLATES).format(
+            amount=f"{rng.randint(1, 999)},{rng.randint(0, 999):03d}.{rng.randint(0, 99):02d}",
+            acct=rng.randint(10_000_000, 99_999_999),
+            day=rng.randint(1, 28), month=rng.randint(1, 12),
+            code="".join(rng.choice("ABCDEFGHJKLMNPQRSTUVWXYZ0123456789") for _ in range(8)),
+            otp=rng.randint(100_000, 999_999),
+            rate=f"{rng.randint(1, 19)}.{rng.randint(0, 99):02d}",
+            n=rng.randint(1, 40),
+        ))
+    return " ".join(out)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    rng = random.Random(0)
+    print(f"{'lines':>6} {'kB':>8} {'spans':>7} {'lex_ms':>8} {'expand_ms':>10} {'us_per_kB':>10}")
+    for lines in args.lines:
+        text = statement(lines, rng)
+        kb = len(text) / 1024
+        lex_s = expand_s = float("inf")
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            spans = lex_numbers(text)
+            lex_s = min(lex_s, time.perf_counter() - t0)
+            t0 = time.perf_counter()
+            expand_numbers_in_text(text)
+            expand_s = min(expand_s, time.perf_counter() - t0)
+        print(f"{lines:>6} {kb:>8.1f} {len(spans):>7} {lex_s * 1e3:>8.2f} {expand_s * 1e3:>10.2f} {expand_s * 1e6 / kb:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
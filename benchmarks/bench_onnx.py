@@ -0,0 +1,117 @@
+"""Benchmark OnnxSynthesizerAdapter against the PyTorch adapter — RTF and memory.
+
+Each mode runs in a fresh interpreter so peak RSS belongs to that mode
+alone (imports included). Modes:
+
+  torch         — CoquiSynthesizerAdapter, inference_mode + ``--threads``
+  onnx          — OnnxSynthesizerAdapter, all graph optimisations, IO binding
+  onnx-no-bind  — as ``onnx`` with a plain ``session.run()`` feed dict
+  onnx-basic    — as ``onnx`` with basic graph optimisations only
+
+The ONNX export is written to a temporary directory first (and validated)
+unless ``--export`` points at one. Runs offline against a tiny random VITS
+by default; pass ``--model`` for a real checkpoint.
+
+Usage::
+
+    python benchmarks/bench_onnx.py --runs 5 --threads 4
+    python benchmarks/bench_onnx.py --model tts_models/en/vctk/vits
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+
+CHILD = r"""
+import json, resource, statistics, sys, time
+mode, model, export, threads, runs = sys.argv[1], sys.argv[2], sys.argv[3], int(sys.argv[4]), int(sys.argv[5])
+from tts_v2.domain.audio import SynthesisRequest
+PROMPTS = [
+    "Your one time password is four eight two nine one three.",
+    "This call may be recorded for quality and compliance purposes.",
+    "Your account balance is one thousand two hundred and thirty four dollars and fifty cents.",
+]
+t0 = time.perf_counter()
+if mode == "torch":
+    from tts_v2.adapters.synthesizer.coqui_adapter import CoquiSynthesizerAdapter, CpuPerformanceConfig
+    perf = CpuPerformanceConfig(intra_op_threads=threads, inter_op_threads=1)
+    if model == "tiny":
+        from tts_v2.adapters.synthesizer.coqui_tiny_model import build_tiny_vits
+        adapter = CoquiSynthesizerAdapter(model_name="tiny-vits", use_gpu=False, tts_model=build_tiny_vits(), cpu_performance=perf)
+    else:
+        adapter = CoquiSynthesizerAdapter(model_name=model, use_gpu=False, cpu_performance=perf)
+else:
+    from tts_v2.adapters.synthesizer.onnx_adapter import OnnxSessionConfig, OnnxSynthesizerAdapter
+    session = OnnxSessionConfig(
+        intra_op_threads=threads,
+        io_binding=mode != "onnx-no-bind",
+        graph_optimization="basic" if mode == "onnx-basic" else "all",
+    )
+    adapter = OnnxSynthesizerAdapter(export, session=session)
+load_s = time.perf_counter() - t0
+adapter.synthesize(SynthesisRequest(text=PROMPTS[0], persona="neutral_male"))  # warm-up
+rtfs = []
+for _ in range(runs):
+    for text in PROMPTS:
+        t = time.perf_counter()
+        chunk = adapter.synthesize(SynthesisRequest(text=text, persona="neutral_male"))
+        rtfs.append((time.perf_counter() - t) / chunk.duration_s)
+print(json.dumps({
+    "load_s": load_s,
+    "rtf_mean": statistics.fmean(rtfs),
+    "rtf_p50": statistics.median(rtfs),
+    "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}))
+"""
+
+MODES = ("torch", "onnx", "onnx-no-bind", "onnx-basic")
+
+
+def export(model: str, directory: str) -> dict:
+    from tts_v2.adapters.synthesizer.coqui_adapter import CoquiSynthesizerAdapter
+    from tts_v2.adapters.synthesizer.coqui_onnx import export_onnx, validate_onnx_export
+    from tts_v2.adapters.synthesizer.coqui_tiny_model import build_tiny_vits
+
+    if model == "tiny":
+        adapter = CoquiSynthesizerAdapter(model_name="tiny-vits", use_gpu=False, tts_model=build_tiny_vits())
+    else:
+        adapter = CoquiSynthesizerAdapter(model_name=model, use_gpu=False)
+    export_onnx(adapter._tts_model, directory, adapter.model_name)
+    return validate_onnx_export(adapter._tts_model, directory)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default="tiny", help="'tiny' or a Coqui model name")
+    parser.add_argument("--export", default=None, help="Existing ONNX export directory (default: export one)")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = args.export
+        if directory is None:
+            directory = f"{tmp}/onnx"
+            report = export(args.model, directory)
+            print(
+                f"validation: passed={report['passed']} snr≥{report['min_snr_db']:.1f} dB "
+                f"corr≥{report['min_correlation']:.4f}"
+            )
+
+        print(f"{'mode':<13} {'rtf_mean':>9} {'rtf_p50':>9} {'load_s':>8} {'peak_rss_mb':>12}")
+        for mode in MODES:
+            out = subprocess.run(
+                [sys.executable, "-c", CHILD, mode, args.model, directory, str(args.threads), str(args.runs)],
+                capture_output=True, text=True, check=True,
+            ).stdout
+            result = json.loads(out.strip().splitlines()[-1])
+            print(
+                f"{mode:<13} {result['rtf_mean']:>9.4f} {result['rtf_p50']:>9.4f} "
+                f"{result['load_s']:>8.2f} {result['peak_rss_mb']:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
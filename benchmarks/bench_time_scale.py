@@ -0,0 +1,49 @@
+"""Benchmark WsolaTimeScalerAdapter — cost of a rate variant vs. synthesis.
+
+Re-times a synthetic voiced signal at each rate and reports milliseconds
+per second of audio and the RTF of re-timing alone. Compare with the
+synthesis RTF from ``bench_coqui_cpu.py`` to see what serving a rate
+variant from a stored rendition saves.
+
+Usage::
+
+    python benchmarks/bench_time_scale.py --seconds 5 --runs 20
+"""
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from tts_v2.adapters.time_scale.wsola_adapter import WsolaTimeScalerAdapter
+from tts_v2.domain.audio import AudioChunk
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0, help="audio length")
+    parser.add_argument("--sample-rate", type=int, default=22050)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    sr = args.sample_rate
+    t = np.arange(int(sr * args.seconds)) / sr
+    f0 = 140 + 30 * np.sin(2 * np.pi * 0.5 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / sr
+    samples = (0.3 * sum(np.sin(h * phase) / h for h in (1, 2, 3, 4))).astype(np.float32)
+    scaler = WsolaTimeScalerAdapter()
+
+    print(f"{'rate':>5} {'ms/s_audio':>11} {'rtf':>8}")
+    for rate in (0.7, 0.85, 1.15, 1.3):
+        timings = []
+        for _ in range(args.runs):
+            t0 = time.perf_counter()
+            scaler.retime(AudioChunk(samples, sr, "bench"), rate)
+            timings.append(time.perf_counter() - t0)
+        elapsed = statistics.median(timings)
+        print(f"{rate:>5.2f} {1000 * elapsed / args.seconds:>11.2f} {elapsed / args.seconds:>8.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""EncodedFileSinkAdapter — compressed audio files encoded on a worker pool.
+
+Float WAV costs ~88 KB per second of 22.05 kHz audio. This sink encodes to
+FLAC, Ogg Vorbis, Ogg Opus or 16-bit PCM WAV (see
+:data:`~tts_v2.shared.audio_utils.ENCODED_FORMATS`) on background threads,
+so ``write()`` returns as soon as the job is queued. At most
+``max_pending`` jobs are outstanding; beyond that ``write()`` blocks until
+a worker finishes, which bounds the memory held by queued chunks.
+
+Because the file appears after ``write()`` returns, callers that need to
+know when (or whether) it landed use :meth:`submit` for a future, or
+:meth:`flush` before reading the outputs. Files are published with an
+atomic rename (see :mod:`.write_behind`).
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ...domain.audio import AudioChunk
+from ...shared.audio_utils import ENCODED_FORMATS, encode_audio
+from .write_behind import CompletionCallback, DirectoryCache, WriteBehindExecutor, atomic_write
+
+logger = logging.getLogger(__name__)
+
+
+class EncodedFileSinkAdapter:
+    """Implements AudioSinkPort by encoding compressed files in the background.
+
+    The destination's suffix is replaced with the format's extension
+    (``call.wav`` → ``call.flac``) and the returned path reflects that.
+    Chunk samples must not be modified after ``write()`` until the job
+    completes; pooled buffers are retained until then.
+
+    Args:
+        fmt:         Key of ``ENCODED_FORMATS`` — ``"flac"``, ``"ogg-vorbis"``,
+                     ``"ogg-opus"`` or ``"wav-pcm16"``.
+        max_workers: Encoder threads. libsndfile releases the GIL while
+                     encoding, so several workers encode in parallel.
+        max_pending: Jobs queued or running before ``write()`` blocks.
+        on_complete: Called as ``on_complete(path, error)`` after each job.
+
+    Raises:
+        ValueError: If ``fmt`` is unknown or unsupported by libsndfile.
+    """
+
+    def __init__(
+        self,
+        fmt: str = "flac",
+        max_workers: int = 2,
+        max_pending: int = 32,
+        on_complete: Optional[CompletionCallback] = None,
+    ) -> None:
+        if fmt not in ENCODED_FORMATS:
+            raise ValueError(f"Unknown format '{fmt}'. Choose from: {sorted(ENCODED_FORMATS)}")
+        self._fmt = fmt
+        self._extension = ENCODED_FORMATS[fmt].extension
+        self._max_workers = max_workers
+        self._writer = WriteBehindExecutor(
+            "tts-encode", max_workers=max_workers, max_pending=max_pending, on_complete=on_complete
+        )
+        self._dirs = DirectoryCache()
+        self._lock = threading.Lock()
+
+        self._files = 0
+        self._audio_s = 0.0
+        self._encode_s = 0.0
+        self._raw_bytes = 0
+        self._encoded_bytes = 0
+        logger.info(f"EncodedFileSinkAdapter ready | format={fmt} | workers={max_workers} | max_pending={max_pending}")
+
+    # ------------------------------------------------------------------
+    # AudioSinkPort implementation
+    # ------------------------------------------------------------------
+
+    def write(self, chunk: AudioChunk, destination: str) -> str:
+        """Queue ``chunk`` for encoding and return the path it will be written to."""
+        path = self.target_path(destination)
+        self.submit(chunk, path)
+        return path
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def target_path(self, destination: str) -> str:
+        """Absolute output path for ``destination`` with this format's extension."""
+        return os.path.abspath(str(Path(destination).with_suffix(self._extension)))
+
+    def submit(self, chunk: AudioChunk, destination: str) -> "Future[str]":
+        """Queue ``chunk`` and return a future resolving to the written path.
+
+        Blocks while ``max_pending`` jobs are outstanding.
+
+        Raises:
+            RuntimeError: If the sink has been closed.
+        """
+        path = self.target_path(destination)
+        held = chunk.retain()
+        try:
+            return self._writer.submit(path, self._encode, held, path)
+        except BaseException:
+            held.release()
+            raise
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for every job queued so far. Returns False on timeout."""
+        return self._writer.flush(timeout)
+
+    def close(self) -> None:
+        """Finish queued jobs and stop the workers."""
+        self._writer.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return compression and throughput counters.
+
+        ``compression_ratio`` compares encoded size with the float32 WAV
+        payload of the same audio; ``encode_x_realtime`` is audio seconds
+        encoded per second of worker time.
+        """
+        with self._lock:
+            return {
+                "format": self._fmt,
+                "files": self._files,
+                "failures": self._writer.failures,
+                "pending": self._writer.pending,
+                "audio_s": round(self._audio_s, 3),
+                "raw_bytes": self._raw_bytes,
+                "encoded_bytes": self._encoded_bytes,
+                "compression_ratio": round(self._raw_bytes / self._encoded_bytes, 3) if self._encoded_bytes else 0.0,
+                "encode_s": round(self._encode_s, 4),
+                "encode_x_realtime": round(self._audio_s / self._encode_s, 1) if self._encode_s > 0 else 0.0,
+            }
+
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+
+    def _encode(self, chunk: AudioChunk, path: str) -> str:
+        t0 = time.perf_counter()
+        try:
+            data, rate = encode_audio(chunk.samples, chunk.sample_rate, self._fmt)
+        finally:
+            chunk.release()
+        encode_s = time.perf_counter() - t0
+
+        target = Path(path)
+        self._dirs.ensure(target.parent)
+        atomic_write(target, lambda tmp: Path(tmp).write_bytes(data))
+
+        with self._lock:
+            self._files += 1
+            self._audio_s += chunk.duration_s
+            self._encode_s += encode_s
+            self._raw_bytes += chunk.samples.size * 4
+            self._encoded_bytes += len(data)
+        logger.info(f"Saved {self._fmt} → {path} ({chunk.duration_s:.2f}s @ {rate}Hz, {len(data)} bytes)")
+        return path
+
+    def __repr__(self) -> str:
+        return f"EncodedFileSinkAdapter(fmt={self._fmt!r}, max_workers={self._max_workers})"
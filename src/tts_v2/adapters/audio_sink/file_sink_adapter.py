@@ -1,29 +1,135 @@
-"""FileSinkAdapter — writes AudioChunk to a WAV file."""
+"""FileSinkAdapter — writes AudioChunk to a WAV file.
+
+Files are written to a hidden temporary name in the target directory and
+renamed into place, so a crash mid-write never leaves a truncated WAV
+under the final name.
+
+With ``write_behind=True`` the write happens on a background I/O pool:
+``write()`` returns the final path immediately and slow or network
+filesystems no longer add to request latency. Completion is reported
+through :meth:`FileSinkAdapter.submit` futures and the ``on_complete``
+callback; :meth:`FileSinkAdapter.flush` waits for queued writes and
+:meth:`FileSinkAdapter.close` (also run at interpreter exit) drains them.
+"""
 
 import logging
+import os
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Dict, Optional
 
 from ...domain.audio import AudioChunk
 from ...shared.audio_utils import save_wav
+from .write_behind import CompletionCallback, DirectoryCache, WriteBehindExecutor, atomic_write
 
 logger = logging.getLogger(__name__)
 
 
 class FileSinkAdapter:
-    """Implements AudioSinkPort by writing a WAV file to disk."""
+    """Implements AudioSinkPort by writing a WAV file to disk.
+
+    Args:
+        write_behind: Write on a background pool instead of the caller's thread.
+        max_workers:  I/O threads (write-behind only).
+        max_pending:  Queued writes before ``write()`` blocks (write-behind only).
+        on_complete:  Called as ``on_complete(path, error)`` after each
+                      background write; ``error`` is None on success.
+    """
+
+    def __init__(
+        self,
+        write_behind: bool = False,
+        max_workers: int = 2,
+        max_pending: int = 64,
+        on_complete: Optional[CompletionCallback] = None,
+    ) -> None:
+        self._dirs = DirectoryCache()
+        self._writer: Optional[WriteBehindExecutor] = None
+        if write_behind:
+            self._writer = WriteBehindExecutor(
+                "tts-file-sink", max_workers=max_workers, max_pending=max_pending, on_complete=on_complete
+            )
 
     def write(self, chunk: AudioChunk, destination: str) -> str:
         """Write AudioChunk samples to a WAV file.
 
+        In write-behind mode the file appears after this returns; use
+        :meth:`submit` or :meth:`flush` to wait for it.
+
         Args:
             chunk:       AudioChunk to write.
             destination: File path (parent dirs created automatically).
 
         Returns:
-            Resolved absolute file path as string.
+            Absolute file path as string.
+        """
+        if self._writer is None:
+            return self._write_now(chunk, destination)
+        path = os.path.abspath(destination)
+        self._submit_background(chunk, path)
+        return path
+
+    def submit(self, chunk: AudioChunk, destination: str) -> "Future[str]":
+        """Queue a write and return a future resolving to the absolute path.
+
+        Without write-behind the write happens before this returns and the
+        future is already resolved.
         """
-        save_wav(chunk.samples, destination, chunk.sample_rate)
-        from pathlib import Path
-        return str(Path(destination).resolve())
+        path = os.path.abspath(destination)
+        if self._writer is not None:
+            return self._submit_background(chunk, path)
+        future: "Future[str]" = Future()
+        try:
+            future.set_result(self._write_now(chunk, path))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued writes. Returns False on timeout."""
+        return self._writer.flush(timeout) if self._writer is not None else True
+
+    def close(self) -> None:
+        """Drain queued writes and stop the I/O pool."""
+        if self._writer is not None:
+            self._writer.close()
+
+    def stats(self) -> Dict[str, Any]:
+        if self._writer is None:
+            return {"write_behind": False}
+        return {"write_behind": True, "pending": self._writer.pending, "failures": self._writer.failures}
+
+    def _submit_background(self, chunk: AudioChunk, path: str) -> "Future[str]":
+        held = chunk.retain()
+        try:
+            return self._writer.submit(path, self._write_held, held, path)
+        except BaseException:
+            held.release()
+            raise
+
+    def _write_held(self, chunk: AudioChunk, destination: str) -> str:
+        try:
+            return self._write_now(chunk, destination)
+        finally:
+            chunk.release()
+
+    def _write_now(self, chunk: AudioChunk, destination: str) -> str:
+        target = Path(os.path.abspath(destination))
+        self._dirs.ensure(target.parent)
+        container = target.suffix.lstrip(".").upper() or "WAV"
+
+        def write_tmp(tmp: str) -> None:
+            save_wav(chunk.samples, tmp, chunk.sample_rate, format=container, create_dirs=False)
+
+        try:
+            atomic_write(target, write_tmp)
+        except Exception:
+            if target.parent.is_dir():
+                raise
+            # Directory removed since it was cached — recreate once and retry.
+            self._dirs.ensure(target.parent, force=True)
+            atomic_write(target, write_tmp)
+        return str(target)
 
     def __repr__(self) -> str:
-        return "FileSinkAdapter()"
+        return f"FileSinkAdapter(write_behind={self._writer is not None})"
@@ -0,0 +1,263 @@
+"""StreamingWavSinkAdapter — append AudioChunks to a WAV file as they arrive.
+
+``FileSinkAdapter`` and ``save_wav()`` need the whole waveform before the
+first byte is written. This sink opens the destination once, writes a
+44-byte header, and appends each chunk's samples as it arrives, so memory
+stays at one chunk however long the recording is:
+
+    with sink.open("outputs/statement.wav", sample_rate=22050) as wav:
+        for chunk in chunks:
+            wav.append(chunk)
+
+The RIFF and ``data`` sizes are patched after every append (or only on
+close with ``header_every_chunk=False``), so a reader tailing the file
+always sees a valid WAV of everything written so far.
+
+Peak safety works per block. A running gain starts at 1.0 and is lowered
+whenever a block would exceed ``peak_limit``. It never rises again, so
+audio already written is never contradicted by a louder later section.
+This matches ``save_wav()`` whenever the loudest peak is in the first
+block.
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Optional
+
+import numpy as np
+
+from ...domain.audio import AudioChunk
+from ...shared.audio_utils import WAV_HEADER_BYTES, wav_header
+from ...shared.buffer_pool import default_pool
+from .write_behind import DirectoryCache
+
+logger = logging.getLogger(__name__)
+
+_MAX_DATA_BYTES = 0xFFFFFFFF - (WAV_HEADER_BYTES - 8)
+_SAMPLE_BYTES = {"PCM_16": 2, "FLOAT": 4}
+
+
+class WavStreamWriter:
+    """One WAV file being written chunk by chunk. Use as a context manager.
+
+    Args:
+        path:               Destination file (parent directory must exist).
+        sample_rate:        Sample rate every appended chunk must have.
+        subtype:            ``"PCM_16"`` or ``"FLOAT"``.
+        peak_limit:         Largest absolute sample value written.
+        header_every_chunk: Patch the header sizes after every append.
+        on_close:           Called with the writer once it has been closed.
+
+    Raises:
+        ValueError: If ``subtype`` is unsupported.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        sample_rate: int,
+        subtype: str = "PCM_16",
+        peak_limit: float = 1.0,
+        header_every_chunk: bool = True,
+        on_close: Optional[Callable[["WavStreamWriter"], None]] = None,
+    ) -> None:
+        if subtype not in _SAMPLE_BYTES:
+            raise ValueError(f"Unsupported WAV subtype '{subtype}'. Choose from: {sorted(_SAMPLE_BYTES)}")
+        self.path = path
+        self.sample_rate = sample_rate
+        self.subtype = subtype
+        self.peak_limit = peak_limit
+        self._header_every_chunk = header_every_chunk
+        self._on_close = on_close
+        self._fh: Optional[BinaryIO] = open(path, "wb")
+        self._fh.write(wav_header(sample_rate, 0, subtype))
+        self._fh.flush()
+        self._data_bytes = 0
+        self._gain = 1.0
+        self._gain_drops = 0
+
+    @property
+    def frames(self) -> int:
+        return self._data_bytes // _SAMPLE_BYTES[self.subtype]
+
+    @property
+    def duration_s(self) -> float:
+        return self.frames / self.sample_rate
+
+    @property
+    def gain(self) -> float:
+        """Current peak-safety gain (1.0 until a block exceeded ``peak_limit``)."""
+        return self._gain
+
+    @property
+    def gain_drops(self) -> int:
+        """Number of blocks that lowered the gain."""
+        return self._gain_drops
+
+    @property
+    def closed(self) -> bool:
+        return self._fh is None
+
+    def append(self, chunk: AudioChunk) -> None:
+        """Scale, convert and append ``chunk``; the caller still owns it.
+
+        Raises:
+            ValueError: On a sample-rate mismatch, a closed writer, or if the
+                        file would pass the 4 GiB RIFF limit.
+        """
+        if self._fh is None:
+            raise ValueError(f"WavStreamWriter for {self.path} is closed")
+        if chunk.sample_rate != self.sample_rate:
+            raise ValueError(
+                f"Chunk sample rate {chunk.sample_rate} Hz does not match stream rate {self.sample_rate} Hz"
+            )
+        samples = np.asarray(chunk.samples, dtype=np.float32)
+        if samples.size == 0:
+            return
+        n_bytes = samples.size * _SAMPLE_BYTES[self.subtype]
+        if self._data_bytes + n_bytes > _MAX_DATA_BYTES:
+            raise ValueError(f"{self.path} would exceed the 4 GiB WAV size limit")
+
+        peak = float(np.abs(samples).max())
+        if peak * self._gain > self.peak_limit:
+            self._gain = self.peak_limit / peak
+            self._gain_drops += 1
+            logger.warning(f"[wav-stream] peak {peak:.3f} at {self.duration_s:.2f}s — gain lowered to {self._gain:.3f}")
+
+        pool = default_pool()
+        scaled = pool.acquire(samples.size)
+        pcm = pool.acquire(samples.size, np.int16) if self.subtype == "PCM_16" else None
+        try:
+            np.multiply(samples, self._gain, out=scaled.array)
+            if pcm is not None:
+                np.clip(scaled.array, -1.0, 1.0, out=scaled.array)
+                scaled.array *= 32767
+                np.copyto(pcm.array, scaled.array, casting="unsafe")
+                self._fh.write(pcm.array.astype("<i2", copy=False).tobytes())
+            else:
+                self._fh.write(scaled.array.astype("<f4", copy=False).tobytes())
+        finally:
+            scaled.release()
+            if pcm is not None:
+                pcm.release()
+        self._data_bytes += n_bytes
+
+        if self._header_every_chunk:
+            self._patch_header()
+        self._fh.flush()
+
+    def close(self) -> str:
+        """Patch the header, close the file and return its path. Idempotent."""
+        if self._fh is not None:
+            try:
+                self._patch_header()
+            finally:
+                self._fh.close()
+                self._fh = None
+            logger.info(f"Saved WAV → {self.path} ({self.duration_s:.2f}s @ {self.sample_rate}Hz, streamed)")
+            if self._on_close is not None:
+                self._on_close(self)
+        return self.path
+
+    def _patch_header(self) -> None:
+        self._fh.seek(0)
+        self._fh.write(wav_header(self.sample_rate, self._data_bytes, self.subtype))
+        self._fh.seek(0, os.SEEK_END)
+
+    def __enter__(self) -> "WavStreamWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"WavStreamWriter(path={self.path!r}, frames={self.frames}, closed={self.closed})"
+
+
+class StreamingWavSinkAdapter:
+    """Implements AudioSinkPort by writing WAVs incrementally.
+
+    ``write()`` handles a single chunk; :meth:`write_stream` and
+    :meth:`open` take many chunks for one destination.
+
+    Args:
+        subtype:            ``"PCM_16"`` (as ``save_wav()`` writes) or ``"FLOAT"``.
+        peak_limit:         Largest absolute sample value written.
+        header_every_chunk: Keep the header valid after every append so the
+                            file can be read while it grows.
+    """
+
+    def __init__(self, subtype: str = "PCM_16", peak_limit: float = 1.0, header_every_chunk: bool = True) -> None:
+        if subtype not in _SAMPLE_BYTES:
+            raise ValueError(f"Unsupported WAV subtype '{subtype}'. Choose from: {sorted(_SAMPLE_BYTES)}")
+        self._subtype = subtype
+        self._peak_limit = peak_limit
+        self._header_every_chunk = header_every_chunk
+        self._dirs = DirectoryCache()
+        self._lock = threading.Lock()
+        self._files = 0
+        self._audio_s = 0.0
+        self._gain_drops = 0
+
+    # ------------------------------------------------------------------
+    # AudioSinkPort implementation
+    # ------------------------------------------------------------------
+
+    def write(self, chunk: AudioChunk, destination: str) -> str:
+        """Write one chunk as a complete WAV and return its absolute path."""
+        with self.open(destination, chunk.sample_rate) as wav:
+            wav.append(chunk)
+        return wav.path
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def open(self, destination: str, sample_rate: int) -> WavStreamWriter:
+        """Create ``destination`` and return a writer for appending chunks."""
+        path = os.path.abspath(destination)
+        self._dirs.ensure(Path(path).parent)
+        return WavStreamWriter(
+            path, sample_rate, self._subtype, self._peak_limit, self._header_every_chunk, on_close=self._record
+        )
+
+    def write_stream(self, chunks: Iterable[AudioChunk], destination: str) -> Optional[str]:
+        """Append every chunk to ``destination`` and return its absolute path.
+
+        Chunks are consumed: each is released once appended. The file is
+        created on the first chunk, so an empty stream writes nothing and
+        returns None. If the iterator raises, the partial file is closed
+        with a valid header and the error propagates.
+        """
+        writer: Optional[WavStreamWriter] = None
+        try:
+            for chunk in chunks:
+                try:
+                    if writer is None:
+                        writer = self.open(destination, chunk.sample_rate)
+                    writer.append(chunk)
+                finally:
+                    chunk.release()
+        finally:
+            if writer is not None:
+                writer.close()
+        return writer.path if writer is not None else None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "files": self._files,
+                "audio_s": round(self._audio_s, 3),
+                "gain_drops": self._gain_drops,
+            }
+
+    def _record(self, writer: WavStreamWriter) -> None:
+        with self._lock:
+            self._files += 1
+            self._audio_s += writer.duration_s
+            self._gain_drops += writer.gain_drops
+
+    def __repr__(self) -> str:
+        return f"StreamingWavSinkAdapter(subtype={self._subtype!r}, peak_limit={self._peak_limit})"
@@ -0,0 +1,152 @@
+"""Write-behind helpers shared by the file sinks.
+
+* :class:`WriteBehindExecutor` — bounded thread pool that runs file jobs
+  off the request path and reports completion through futures and an
+  optional callback. Outstanding jobs are flushed at interpreter exit.
+* :func:`atomic_write` — write to a hidden temporary file in the target
+  directory and publish it with ``os.replace``, so readers see either the
+  previous file or the complete new one, never a truncated one.
+* :class:`DirectoryCache` — remembers directories already created so
+  ``mkdir`` is issued once per directory rather than once per file.
+"""
+
+import atexit
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+CompletionCallback = Callable[[str, Optional[BaseException]], None]
+
+
+class DirectoryCache:
+    """Thread-safe memo of directories known to exist."""
+
+    def __init__(self) -> None:
+        self._known: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def ensure(self, directory: Path, force: bool = False) -> None:
+        """Create ``directory`` unless already seen; ``force`` re-checks."""
+        key = str(directory)
+        if key in self._known and not force:
+            return
+        directory.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._known.add(key)
+
+
+def atomic_write(target: Path, writer: Callable[[str], None]) -> None:
+    """Call ``writer(tmp_path)`` and rename the result onto ``target``.
+
+    The temporary file lives in ``target``'s directory (same filesystem,
+    so the rename is atomic) and is removed if ``writer`` fails.
+    """
+    tmp = target.with_name(f".{target.name}.{uuid.uuid4().hex[:8]}.part")
+    try:
+        writer(str(tmp))
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+class WriteBehindExecutor:
+    """Bounded pool for file jobs whose result is the written path.
+
+    ``submit()`` blocks while ``max_pending`` jobs are queued or running.
+    Each job's future resolves to the path it wrote; ``on_complete`` (if
+    given) is called from the worker thread with ``(path, None)`` or
+    ``(path, exception)``.
+
+    Args:
+        name:        Thread-name prefix and log tag.
+        max_workers: Worker threads.
+        max_pending: Outstanding jobs before ``submit()`` blocks.
+        on_complete: Optional completion callback.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int = 2,
+        max_pending: int = 64,
+        on_complete: Optional[CompletionCallback] = None,
+    ) -> None:
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be ≥ 1, got {max_pending}")
+        self._name = name
+        self._on_complete = on_complete
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._outstanding: Set["Future[str]"] = set()
+        self._closed = False
+        self.failures = 0
+        atexit.register(self.close)
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._outstanding)
+
+    def submit(self, path: str, job: Callable[..., str], *args: Any) -> "Future[str]":
+        """Queue ``job(*args)``, which writes ``path`` and returns it.
+
+        Raises:
+            RuntimeError: If the executor has been closed.
+        """
+        self._slots.acquire()
+        try:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError(f"{self._name} is closed")
+                future = self._executor.submit(job, *args)
+                self._outstanding.add(future)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda f: self._on_done(path, f))
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for every job queued so far. Returns False on timeout."""
+        with self._lock:
+            pending = set(self._outstanding)
+        _, not_done = wait(pending, timeout=timeout)
+        return not not_done
+
+    def close(self) -> None:
+        """Finish queued jobs and stop the workers. Idempotent."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            outstanding = len(self._outstanding)
+        if outstanding:
+            logger.info(f"[{self._name}] flushing {outstanding} pending write(s)")
+        self._executor.shutdown(wait=True)
+        atexit.unregister(self.close)
+
+    def _on_done(self, path: str, future: "Future[str]") -> None:
+        error = future.exception()
+        with self._lock:
+            self._outstanding.discard(future)
+            if error is not None:
+                self.failures += 1
+        self._slots.release()
+        if error is not None:
+            logger.error(f"[{self._name}] write to {path} failed: {error}")
+        if self._on_complete is not None:
+            try:
+                self._on_complete(path, error)
+            except Exception as exc:
+                logger.error(f"[{self._name}] completion callback raised: {exc}")
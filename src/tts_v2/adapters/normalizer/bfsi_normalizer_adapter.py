@@ -1,8 +1,11 @@
 """BFSINormalizerAdapter — implements NormalizerPort with full BFSI pipeline."""
 
 import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict
 
-from ...text_normalization.abbreviation_handler import expand_abbreviations
+from ...text_normalization.abbreviation_handler import expand_abbreviations, get_abbreviation_version
 from ...text_normalization.number_formatter import expand_numbers_in_text
 
 logger = logging.getLogger(__name__)
@@ -18,9 +21,79 @@ class BFSINormalizerAdapter:
     This ordering matters: abbreviation expansion happens first so that
     "OTP 482913" becomes "One Time Password 482913" before the number
     pass converts "482913" to "four eight two nine one three".
+
+    Results are memoised in a bounded LRU keyed by the raw input text, so
+    repeated IVR templates skip both passes. Every entry is tagged with the
+    abbreviation dictionary version it was computed under; when
+    ``add_abbreviation()`` bumps the version the whole cache is dropped on
+    the next lookup, so stale expansions are never served.
+
+    Args:
+        cache_size: Maximum number of cached inputs. ``0`` disables caching.
     """
 
+    def __init__(self, cache_size: int = 1024) -> None:
+        if cache_size < 0:
+            raise ValueError(f"cache_size must be >= 0, got {cache_size}")
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_version = get_abbreviation_version()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
     def normalize(self, text: str) -> str:
+        if self._cache_size == 0:
+            return self._normalize_uncached(text)
+
+        version = get_abbreviation_version()
+        with self._lock:
+            if version != self._cache_version:
+                self._cache.clear()
+                self._cache_version = version
+                self._invalidations += 1
+                logger.info(f"[normalize] abbreviation registry changed (v{version}); cache cleared")
+            cached = self._cache.get(text)
+            if cached is not None:
+                self._cache.move_to_end(text)
+                self._hits += 1
+                logger.debug(f"[normalize] cache hit for {len(text)} chars")
+                return cached
+            self._misses += 1
+
+        result = self._normalize_uncached(text)
+
+        with self._lock:
+            # Only publish if the registry did not change while we were working.
+            if version == self._cache_version:
+                self._cache[text] = result
+                self._cache.move_to_end(text)
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+        return result
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the current hit rate."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "size": len(self._cache),
+                "max_size": self._cache_size,
+                "invalidations": self._invalidations,
+                "registry_version": self._cache_version,
+            }
+
+    def clear_cache(self) -> None:
+        """Drop all cached results (counters are kept)."""
+        with self._lock:
+            self._cache.clear()
+
+    @staticmethod
+    def _normalize_uncached(text: str) -> str:
         logger.info(f"[normalize] input: '{text}'")
         text = expand_abbreviations(text)
         text = expand_numbers_in_text(text)
@@ -28,4 +101,4 @@ class BFSINormalizerAdapter:
         return text
 
     def __repr__(self) -> str:
-        return "BFSINormalizerAdapter()"
+        return f"BFSINormalizerAdapter(cache_size={self._cache_size})"
@@ -0,0 +1,130 @@
+"""StreamingNormalizerAdapter — incremental BFSI normalisation for token streams.
+
+LLM responses arrive as a stream of text fragments. This adapter buffers
+fragments and releases normalised segments as soon as a cut point is safe,
+so synthesis can start before the response is complete.
+
+A cut is safe when it falls on whitespace that is already followed by the
+start of the next token. Every BFSI pattern (abbreviations such as
+"AU/NZ", currency, OTP and plain numbers) matches within a single
+whitespace-delimited token, with one exception — currency allows
+"$ 100" — so cuts directly after a "$" are never taken. Under these rules
+normalising the pieces separately gives exactly the same text as
+normalising the concatenation, i.e.::
+
+    "".join(adapter.normalize_stream(fragments)) == \\
+        BFSINormalizerAdapter().normalize("".join(fragments))
+"""
+
+import logging
+import re
+from typing import FrozenSet, Iterable, Iterator, Optional, Tuple
+
+from ...ports.normalizer_port import NormalizerPort
+from ...text_normalization.abbreviation_handler import get_abbreviation_version, get_abbreviations
+from .bfsi_normalizer_adapter import BFSINormalizerAdapter
+
+logger = logging.getLogger(__name__)
+
+# Whitespace run followed by the first character of the next token.
+_CUT_RE = re.compile(r"\s+(?=\S)")
+# Sentence terminator, optionally followed by closing quotes/brackets.
+_SENTENCE_END_RE = re.compile(r"[.!?][\"')\]]*$")
+
+
+class StreamingNormalizerAdapter:
+    """Implements NormalizerPort plus ``normalize_stream()`` for fragment streams.
+
+    Segments are cut at sentence ends once at least ``min_chars`` are
+    buffered. If no sentence end arrives before ``max_chars``, the buffer is
+    cut at the last safe word boundary instead, bounding time-to-first-audio
+    on long run-on sentences.
+
+    Segments keep their surrounding whitespace so that the concatenation is
+    exact; strip them before building a SynthesisRequest.
+
+    Args:
+        normalizer: Token-local normaliser to apply to each segment.
+                    Defaults to a cached BFSINormalizerAdapter.
+        min_chars:  Minimum segment length before a sentence cut is taken.
+        max_chars:  Buffer length at which a word-boundary cut is forced.
+    """
+
+    def __init__(
+        self,
+        normalizer: Optional[NormalizerPort] = None,
+        min_chars: int = 20,
+        max_chars: int = 240,
+    ) -> None:
+        if min_chars < 0 or max_chars <= 0:
+            raise ValueError(f"Invalid segment bounds: min_chars={min_chars}, max_chars={max_chars}")
+        self._norm = normalizer or BFSINormalizerAdapter()
+        self._min_chars = min_chars
+        self._max_chars = max_chars
+        self._dotted: Tuple[int, FrozenSet[str]] = (-1, frozenset())
+
+    def normalize(self, text: str) -> str:
+        return self._norm.normalize(text)
+
+    def normalize_stream(self, fragments: Iterable[str]) -> Iterator[str]:
+        """Yield normalised segments as soon as each one is safe to release.
+
+        Args:
+            fragments: Iterable of raw text fragments (e.g. LLM tokens).
+
+        Yields:
+            Normalised, non-empty text segments in order.
+        """
+        buffer = ""
+        for fragment in fragments:
+            if not fragment:
+                continue
+            buffer += fragment
+            while True:
+                cut = self._find_cut(buffer)
+                if cut is None:
+                    break
+                segment, buffer = buffer[:cut], buffer[cut:]
+                logger.debug(f"[normalize_stream] releasing {len(segment)} chars")
+                yield self._norm.normalize(segment)
+        if buffer:
+            yield self._norm.normalize(buffer)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _find_cut(self, buffer: str) -> Optional[int]:
+        """Return the index to cut ``buffer`` at, or None to keep waiting."""
+        last_safe: Optional[int] = None
+        for m in _CUT_RE.finditer(buffer):
+            head = buffer[: m.start()]
+            if not head.strip() or head.endswith("$"):
+                continue
+            cut = m.end()
+            if cut >= self._min_chars and self._is_sentence_end(head):
+                return cut
+            last_safe = cut
+        if last_safe is not None and len(buffer) >= self._max_chars:
+            return last_safe
+        return None
+
+    def _is_sentence_end(self, head: str) -> bool:
+        if not _SENTENCE_END_RE.search(head):
+            return False
+        last_token = head.rsplit(None, 1)[-1].lower()
+        return last_token not in self._dotted_abbreviations()
+
+    def _dotted_abbreviations(self) -> FrozenSet[str]:
+        """Abbreviations ending in '.' (e.g. "i.e.") — not sentence ends."""
+        version = get_abbreviation_version()
+        if self._dotted[0] != version:
+            dotted = frozenset(k.lower() for k in get_abbreviations() if k.endswith("."))
+            self._dotted = (version, dotted)
+        return self._dotted[1]
+
+    def __repr__(self) -> str:
+        return (
+            f"StreamingNormalizerAdapter(normalizer={self._norm!r}, "
+            f"min_chars={self._min_chars}, max_chars={self._max_chars})"
+        )
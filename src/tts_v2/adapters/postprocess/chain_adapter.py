@@ -0,0 +1,226 @@
+"""PostProcessingChainAdapter — vectorised, in-place waveform conditioning.
+
+Runs a configurable sequence of steps on the AudioChunk buffer between the
+synthesizer and the sink:
+
+    TrimSilence      — energy-based leading/trailing silence removal (view, no copy)
+    LoudnessTarget   — gated-RMS loudness normalisation (BS.1770-style gating)
+    PeakLimiter      — look-ahead block limiter with interpolated gain
+    Fade             — short fade-in / fade-out ramps
+
+Every step works on whole-array NumPy operations and writes into the
+existing float32 buffer; the only allocation per request is a copy when the
+synthesizer returned a read-only or non-float32 array, and that copy can be
+drawn from a buffer pool.
+"""
+
+import logging
+from dataclasses import dataclass, replace
+from typing import Dict, Optional, Protocol, Sequence
+
+import numpy as np
+
+from ...domain.audio import AudioChunk
+from ...shared.buffer_pool import BufferPool
+
+logger = logging.getLogger(__name__)
+
+_EPS = 1e-12
+
+
+class PostProcessingStep(Protocol):
+    """One stage of the chain. May modify ``samples`` in place; returns the (possibly sliced) buffer."""
+
+    def apply(self, samples: np.ndarray, sample_rate: int) -> np.ndarray:
+        ...
+
+
+def _frame_power(samples: np.ndarray, frame_len: int) -> np.ndarray:
+    """Mean-square energy of consecutive non-overlapping frames."""
+    n_frames = samples.size // frame_len
+    frames = samples[: n_frames * frame_len].reshape(n_frames, frame_len)
+    return np.einsum("ij,ij->i", frames, frames) / frame_len
+
+
+@dataclass(frozen=True)
+class TrimSilence:
+    """Drop leading/trailing frames quieter than ``threshold_db`` below the loudest frame.
+
+    ``keep_leading_ms`` / ``keep_trailing_ms`` of audio are retained around
+    the detected speech so plosive onsets and decays are not clipped.
+    """
+
+    threshold_db: float = -40.0
+    frame_ms: float = 10.0
+    keep_leading_ms: float = 20.0
+    keep_trailing_ms: float = 60.0
+
+    def apply(self, samples: np.ndarray, sample_rate: int) -> np.ndarray:
+        frame_len = max(1, int(sample_rate * self.frame_ms / 1000))
+        if samples.size < frame_len:
+            return samples
+        power_db = 10.0 * np.log10(_frame_power(samples, frame_len) + _EPS)
+        voiced = np.flatnonzero(power_db > power_db.max() + self.threshold_db)
+        if voiced.size == 0:
+            return samples
+        start = max(0, voiced[0] * frame_len - int(sample_rate * self.keep_leading_ms / 1000))
+        end = min(samples.size, (voiced[-1] + 1) * frame_len + int(sample_rate * self.keep_trailing_ms / 1000))
+        if start or end < samples.size:
+            logger.debug(f"[postprocess] trimmed {start} leading / {samples.size - end} trailing samples")
+        return samples[start:end]
+
+
+@dataclass(frozen=True)
+class LoudnessTarget:
+    """Scale to a target gated loudness in dBFS (RMS, no K-weighting).
+
+    Follows the BS.1770 gating scheme — 400 ms blocks with 75 % overlap, an
+    absolute gate at -70 dB and a relative gate 10 dB below the ungated
+    mean — so pauses do not drag the measurement down. Gain is capped at
+    ``max_gain_db`` to avoid amplifying near-silent output.
+    """
+
+    target_db: float = -20.0
+    max_gain_db: float = 20.0
+    block_ms: float = 400.0
+
+    def measure(self, samples: np.ndarray, sample_rate: int) -> Optional[float]:
+        block = max(1, int(sample_rate * self.block_ms / 1000))
+        step = max(1, block // 4)
+        if samples.size < block:
+            power = np.array([np.dot(samples, samples) / max(samples.size, 1)])
+        else:
+            csum = np.concatenate(([0.0], np.cumsum(samples.astype(np.float64) ** 2)))
+            starts = np.arange(0, samples.size - block + 1, step)
+            power = (csum[starts + block] - csum[starts]) / block
+        power = power[power > 10 ** (-70 / 10)]
+        if power.size == 0:
+            return None
+        relative_gate = power.mean() * 10 ** (-10 / 10)
+        gated = power[power > relative_gate]
+        return float(10.0 * np.log10(gated.mean() if gated.size else power.mean()))
+
+    def apply(self, samples: np.ndarray, sample_rate: int) -> np.ndarray:
+        loudness = self.measure(samples, sample_rate)
+        if loudness is None:
+            return samples
+        gain_db = min(self.target_db - loudness, self.max_gain_db)
+        np.multiply(samples, np.float32(10 ** (gain_db / 20)), out=samples)
+        logger.debug(f"[postprocess] loudness {loudness:.1f} dB → gain {gain_db:+.1f} dB")
+        return samples
+
+
+@dataclass(frozen=True)
+class PeakLimiter:
+    """Keep |samples| ≤ ``ceiling`` with a smooth, look-ahead gain curve.
+
+    The signal is split into ``lookahead_ms`` blocks; each block's required
+    gain is the minimum over itself and its neighbours, and the per-sample
+    gain is linearly interpolated between block centres. Because every
+    interpolated gain is bounded by the block's own requirement, no sample
+    exceeds the ceiling; a final clip guards the array edges.
+    """
+
+    ceiling: float = 0.95
+    lookahead_ms: float = 5.0
+
+    def apply(self, samples: np.ndarray, sample_rate: int) -> np.ndarray:
+        if samples.size == 0:
+            return samples
+        block = max(1, int(sample_rate * self.lookahead_ms / 1000))
+        n_blocks = -(-samples.size // block)
+        padded_peaks = np.zeros(n_blocks * block, dtype=np.float32)
+        np.abs(samples, out=padded_peaks[: samples.size])
+        peaks = padded_peaks.reshape(n_blocks, block).max(axis=1)
+        if peaks.max() <= self.ceiling:
+            return samples
+
+        gains = np.minimum(1.0, self.ceiling / np.maximum(peaks, _EPS))
+        smoothed = gains.copy()
+        smoothed[1:] = np.minimum(smoothed[1:], gains[:-1])
+        smoothed[:-1] = np.minimum(smoothed[:-1], gains[1:])
+        centres = np.arange(n_blocks) * block + block / 2
+        curve = np.interp(np.arange(samples.size), centres, smoothed).astype(np.float32)
+        np.multiply(samples, curve, out=samples)
+        np.clip(samples, -self.ceiling, self.ceiling, out=samples)
+        logger.debug(f"[postprocess] limiter engaged (peak {peaks.max():.3f} → {self.ceiling})")
+        return samples
+
+
+@dataclass
+class Fade:
+    """Linear fade-in and fade-out ramps to avoid clicks at segment edges."""
+
+    fade_in_ms: float = 5.0
+    fade_out_ms: float = 10.0
+
+    def __post_init__(self) -> None:
+        self._ramps: Dict[int, np.ndarray] = {}
+
+    def _ramp(self, n: int) -> np.ndarray:
+        ramp = self._ramps.get(n)
+        if ramp is None:
+            ramp = np.linspace(0.0, 1.0, n, endpoint=False, dtype=np.float32)
+            self._ramps[n] = ramp
+        return ramp
+
+    def apply(self, samples: np.ndarray, sample_rate: int) -> np.ndarray:
+        n_in = min(samples.size, int(sample_rate * self.fade_in_ms / 1000))
+        n_out = min(samples.size, int(sample_rate * self.fade_out_ms / 1000))
+        if n_in:
+            samples[:n_in] *= self._ramp(n_in)
+        if n_out:
+            samples[samples.size - n_out:] *= self._ramp(n_out)[::-1]
+        return samples
+
+
+class PostProcessingChainAdapter:
+    """Implements PostProcessorPort by running ``steps`` in order on the chunk buffer.
+
+    Usage::
+
+        chain = PostProcessingChainAdapter.telephony()
+        service = TTSService(..., postprocessor=chain)
+
+    The input chunk is consumed: its buffer is modified in place, or — when
+    a copy is needed — its pooled buffer (if any) is released.
+
+    Args:
+        steps:       Ordered post-processing steps.
+        buffer_pool: Optional pool for the copy of read-only input.
+    """
+
+    def __init__(self, steps: Sequence[PostProcessingStep], buffer_pool: Optional[BufferPool] = None) -> None:
+        self._steps = list(steps)
+        self._pool = buffer_pool
+
+    @classmethod
+    def telephony(
+        cls, target_db: float = -20.0, ceiling: float = 0.95, buffer_pool: Optional[BufferPool] = None
+    ) -> "PostProcessingChainAdapter":
+        """Trim → loudness → limiter → fades, tuned for IVR playback."""
+        return cls([
+            TrimSilence(),
+            LoudnessTarget(target_db=target_db),
+            PeakLimiter(ceiling=ceiling),
+            Fade(),
+        ], buffer_pool=buffer_pool)
+
+    def process(self, chunk: AudioChunk) -> AudioChunk:
+        samples, lease = chunk.samples, chunk.lease
+        if samples.dtype != np.float32 or not samples.flags.writeable or not samples.flags.c_contiguous:
+            if self._pool is None:
+                copy, copy_lease = np.array(samples, dtype=np.float32, order="C"), None
+            else:
+                copy_lease = self._pool.acquire(samples.size)
+                copy = copy_lease.array
+                np.copyto(copy, samples, casting="unsafe")
+            chunk.release()
+            samples, lease = copy, copy_lease
+        chunk.lease = None  # the reference moves to the returned chunk
+        for step in self._steps:
+            samples = step.apply(samples, chunk.sample_rate)
+        return replace(chunk, samples=samples, lease=lease)
+
+    def __repr__(self) -> str:
+        return f"PostProcessingChainAdapter(steps={self._steps!r})"
@@ -0,0 +1,87 @@
+"""InMemoryRenditionStoreAdapter — bounded LRU of finished renditions."""
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from ...domain.audio import AudioChunk, SynthesisRequest
+
+logger = logging.getLogger(__name__)
+
+_Key = Tuple[str, str, str]
+
+
+def rendition_key(request: SynthesisRequest) -> _Key:
+    """(persona, speaker override, normalised text) — what determines the audio."""
+    return (request.persona, request.speaker_id or "", request.text)
+
+
+class InMemoryRenditionStoreAdapter:
+    """Implements RenditionStorePort with an in-process LRU.
+
+    Stored samples are copied once and frozen (``writeable=False``), so the
+    same buffer can be handed to any number of callers; in-place consumers
+    such as PostProcessingChainAdapter copy read-only input first.
+
+    Args:
+        max_entries: Renditions kept before the least-recently-used is dropped.
+        max_bytes:   Optional cap on total sample bytes held.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: Optional[int] = None) -> None:
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be ≥ 1, got {max_entries}")
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[_Key, AudioChunk]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def lookup(self, request: SynthesisRequest) -> Optional[AudioChunk]:
+        key = rendition_key(request)
+        with self._lock:
+            chunk = self._entries.get(key)
+            if chunk is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        logger.debug(f"[rendition] hit for persona='{request.persona}' ({len(request.text)} chars)")
+        return chunk
+
+    def store(self, request: SynthesisRequest, chunk: AudioChunk) -> None:
+        samples = np.array(chunk.samples, dtype=np.float32)
+        samples.setflags(write=False)
+        frozen = replace(chunk, samples=samples, lease=None)
+        key = rendition_key(request)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.samples.nbytes
+            self._entries[key] = frozen
+            self._bytes += samples.nbytes
+            while len(self._entries) > self._max_entries or (
+                self._max_bytes is not None and self._bytes > self._max_bytes and len(self._entries) > 1
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.samples.nbytes
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def __repr__(self) -> str:
+        return f"InMemoryRenditionStoreAdapter(max_entries={self._max_entries})"
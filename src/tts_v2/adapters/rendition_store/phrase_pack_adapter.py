@@ -0,0 +1,224 @@
+"""PhrasePackAdapter — memory-mapped pack of pre-rendered phrases.
+
+Compliance lines ("this call may be recorded", "terms and conditions") are
+spoken on almost every call. ``tts-v2-build-pack`` renders them once per
+speaker into a single file; this adapter maps that file read-only and
+serves exact matches as views into the mapping — no synthesis, no copy.
+
+Pack layout (little-endian)::
+
+    b"TTSPACK1"  uint64 index_len  index (UTF-8 JSON)  pad → 64
+    float32 samples of every entry, each starting on a 64-byte boundary
+
+The index records the model the pack was rendered with and, per entry,
+the ``speaker_id``, sample rate, normalised text and sample span. Entries
+are keyed by speaker rather than persona, so remapping a persona to a new
+speaker misses the pack instead of playing the old voice; loading a pack
+built for a different model raises ValueError.
+
+Text matches after collapsing whitespace and case-folding, so
+``"This call may be recorded"`` hits an entry rendered from
+``"this call may be recorded"``.
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from ...domain.audio import AudioChunk, SynthesisRequest
+from ...domain.voice import get_speaker
+
+logger = logging.getLogger(__name__)
+
+PACK_MAGIC = b"TTSPACK1"
+PACK_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<8sQ")
+_ALIGN = 64
+
+_Key = Tuple[str, str]
+
+
+def pack_key(speaker_id: str, text: str) -> _Key:
+    """(speaker_id, whitespace-collapsed case-folded text)."""
+    return (speaker_id, " ".join(text.split()).casefold())
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def write_phrase_pack(path: str, model: str, entries: Iterable[Tuple[str, str, AudioChunk]]) -> int:
+    """Write ``(speaker_id, normalised_text, chunk)`` entries to a pack file.
+
+    Each chunk is copied and released; later duplicates of the same key
+    are skipped. The file is written to a
+    temporary name and renamed into place, so a running service mapping
+    the old pack is never handed a half-written one.
+
+    Returns:
+        Number of entries written.
+    """
+    index = []
+    blobs = []
+    seen = set()
+    offset = 0
+    for speaker_id, text, chunk in entries:
+        key = pack_key(speaker_id, text)
+        if key in seen:
+            chunk.release()
+            continue
+        seen.add(key)
+        samples = np.array(chunk.samples, dtype="<f4")
+        chunk.release()
+        index.append({
+            "speaker_id": speaker_id,
+            "text": text,
+            "sample_rate": chunk.sample_rate,
+            "offset": offset,
+            "length": int(samples.size),
+        })
+        blobs.append((offset, samples))
+        offset = _aligned(offset + samples.nbytes)
+
+    header = json.dumps({
+        "format": PACK_FORMAT_VERSION,
+        "model": model,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "entries": index,
+    }).encode("utf-8")
+    data_start = _aligned(_HEADER.size + len(header))
+
+    tmp = f"{path}.{os.getpid()}.part"
+    try:
+        with open(tmp, "wb") as fh:
+            fh.write(_HEADER.pack(PACK_MAGIC, len(header)))
+            fh.write(header)
+            for entry_offset, samples in blobs:
+                fh.seek(data_start + entry_offset)
+                fh.write(samples.tobytes())
+            fh.truncate(data_start + offset)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    logger.info(f"[phrase-pack] wrote {len(index)} entries ({data_start + offset} bytes) → {path}")
+    return len(index)
+
+
+class PhrasePackAdapter:
+    """Implements RenditionStorePort over a read-only, memory-mapped pack.
+
+    Returned chunks are read-only views into the mapping and stay valid
+    until :meth:`close`. ``store()`` is a no-op — packs are built offline
+    with ``tts-v2-build-pack``.
+
+    Args:
+        path:  Pack file written by :func:`write_phrase_pack`.
+        model: Model identifier the service synthesises with; must equal
+               the pack's.
+
+    Raises:
+        ValueError: If the file is not a pack, has an unsupported format
+                    version, or was built for a different model.
+    """
+
+    def __init__(self, path: str, model: str) -> None:
+        self._path = path
+        with open(path, "rb") as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._header = self._read_header(model)
+        except BaseException:
+            self._mmap.close()
+            raise
+        data_start = self._header["data_start"]
+        self._entries: Dict[_Key, Tuple[int, int, int]] = {
+            pack_key(e["speaker_id"], e["text"]): (data_start + e["offset"], e["length"], e["sample_rate"])
+            for e in self._header["entries"]
+        }
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        logger.info(
+            f"PhrasePackAdapter ready | {len(self._entries)} entries | "
+            f"model={model} | {len(self._mmap) / 1e6:.1f} MB mapped"
+        )
+
+    def _read_header(self, model: str) -> Dict[str, Any]:
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError(f"{self._path} is not a phrase pack")
+        magic, index_len = _HEADER.unpack_from(self._mmap, 0)
+        if magic != PACK_MAGIC:
+            raise ValueError(f"{self._path} is not a phrase pack")
+        header = json.loads(self._mmap[_HEADER.size:_HEADER.size + index_len].decode("utf-8"))
+        if header.get("format") != PACK_FORMAT_VERSION:
+            raise ValueError(f"Unsupported phrase pack format {header.get('format')} in {self._path}")
+        if header.get("model") != model:
+            raise ValueError(
+                f"Phrase pack {self._path} was built for model '{header.get('model')}', "
+                f"service uses '{model}' — rebuild it with tts-v2-build-pack"
+            )
+        header["data_start"] = _aligned(_HEADER.size + index_len)
+        return header
+
+    # ------------------------------------------------------------------
+    # RenditionStorePort implementation
+    # ------------------------------------------------------------------
+
+    def lookup(self, request: SynthesisRequest) -> Optional[AudioChunk]:
+        speaker_id = request.speaker_id if request.speaker_id is not None else get_speaker(request.persona).speaker_id
+        span = self._entries.get(pack_key(speaker_id, request.text))
+        with self._lock:
+            if span is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        start, length, sample_rate = span
+        samples = np.frombuffer(self._mmap, dtype="<f4", count=length, offset=start)
+        logger.debug(f"[phrase-pack] hit for speaker='{speaker_id}' ({len(request.text)} chars)")
+        return AudioChunk(samples=samples, sample_rate=sample_rate, speaker_id=speaker_id)
+
+    def store(self, request: SynthesisRequest, chunk: AudioChunk) -> None:
+        """No-op: packs are immutable at runtime."""
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @property
+    def model(self) -> str:
+        return self._header["model"]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "mapped_bytes": len(self._mmap),
+                "model": self.model,
+                "created": self._header.get("created"),
+            }
+
+    def close(self) -> None:
+        """Unmap the pack once no returned chunk is still referenced."""
+        try:
+            self._mmap.close()
+        except BufferError:
+            logger.warning("[phrase-pack] chunks still reference the pack — leaving it mapped")
+
+    def __repr__(self) -> str:
+        return f"PhrasePackAdapter(path={self._path!r}, entries={len(self._entries)}, model={self.model!r})"
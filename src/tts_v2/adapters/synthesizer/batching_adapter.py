@@ -0,0 +1,238 @@
+"""MicroBatchingSynthesizerAdapter — coalesces concurrent requests into batches.
+
+Many request threads call ``synthesize()`` at once (one per live call).
+This adapter queues them, lets a single dispatcher thread collect up to
+``max_batch_size`` requests, splits the batch into groups of similar text
+length (so short prompts are not padded to the longest one) and sends each
+group to the backend's ``synthesize_batch()``. Every caller blocks only on
+its own future.
+
+The collection window adapts to load. It is scaled by a moving average of
+recent batch sizes: while requests arrive one at a time the average is 1
+and the window is zero, so a lone request is dispatched immediately. Under
+concurrent load, requests that queued up during the previous forward pass
+raise the average and widen the window up to ``max_wait_ms``. The window
+counts from the oldest queued request's arrival, so time spent waiting for
+the previous batch also counts toward it.
+
+Requests cancelled or past their deadline while queued are failed with
+RequestCancelled at dispatch instead of taking a row in the batch.
+
+No framework imports here — batching is delegated to the backend.
+"""
+
+import logging
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Sequence
+
+from ...domain.audio import AudioChunk, SynthesisRequest
+from ...domain.cancellation import RequestCancelled
+from ...ports.batch_synthesizer_port import BatchSynthesizerPort
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Pending:
+    request: SynthesisRequest
+    future: "Future[AudioChunk]"
+    enqueued: float
+
+
+class MicroBatchingSynthesizerAdapter:
+    """Implements SynthesizerPort on top of a BatchSynthesizerPort backend.
+
+    Usage::
+
+        backend = CoquiSynthesizerAdapter(token_cache_size=4096)
+        service = TTSService(
+            synthesizer=MicroBatchingSynthesizerAdapter(backend, max_batch_size=8),
+            ...
+        )
+
+    Batches only form when several threads call ``synthesize()`` at once,
+    so the caller's concurrency limit (e.g. the server's
+    ``max_concurrency``) should be at least ``max_batch_size``.
+
+    Args:
+        backend:          Batch-capable synthesizer.
+        max_batch_size:   Upper bound on requests collected per dispatch.
+        max_wait_ms:      Longest collection window, reached under sustained load.
+        max_length_ratio: Longest/shortest text length allowed in one group.
+        ewma_alpha:       Smoothing factor for the batch-size moving average.
+    """
+
+    def __init__(
+        self,
+        backend: BatchSynthesizerPort,
+        max_batch_size: int = 8,
+        max_wait_ms: float = 20.0,
+        max_length_ratio: float = 2.0,
+        ewma_alpha: float = 0.2,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be ≥ 1, got {max_batch_size}")
+        if max_length_ratio < 1.0:
+            raise ValueError(f"max_length_ratio must be ≥ 1, got {max_length_ratio}")
+        self._backend = backend
+        self._max_batch = max_batch_size
+        self._max_wait_s = max_wait_ms / 1000.0
+        self._max_ratio = max_length_ratio
+        self._alpha = ewma_alpha
+
+        self._queue: Deque[_Pending] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._ewma_batch = 1.0
+        self._batches = 0
+        self._groups = 0
+        self._requests = 0
+        self._size_histogram: Counter = Counter()
+        self._dropped = 0
+
+        self._thread = threading.Thread(target=self._run, name="tts-microbatch", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"MicroBatchingSynthesizerAdapter ready | backend={type(backend).__name__} | "
+            f"max_batch={max_batch_size} | max_wait={max_wait_ms}ms"
+        )
+
+    # ------------------------------------------------------------------
+    # SynthesizerPort implementation
+    # ------------------------------------------------------------------
+
+    def synthesize(self, request: SynthesisRequest) -> AudioChunk:
+        """Queue ``request`` and block until its batch has been synthesised."""
+        return self.submit(request).result()
+
+    def get_speakers(self) -> List[str]:
+        return self._backend.get_speakers()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def submit(self, request: SynthesisRequest) -> "Future[AudioChunk]":
+        """Queue ``request`` and return a future for its AudioChunk.
+
+        Raises:
+            RuntimeError: If the adapter has been closed.
+        """
+        future: "Future[AudioChunk]" = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("MicroBatchingSynthesizerAdapter is closed")
+            self._queue.append(_Pending(request, future, time.monotonic()))
+            self._cond.notify()
+        return future
+
+    def stats(self) -> Dict[str, Any]:
+        """Return batching counters and the current adaptive window."""
+        with self._cond:
+            return {
+                "requests": self._requests,
+                "batches": self._batches,
+                "groups": self._groups,
+                "mean_batch_size": round(self._requests / self._batches, 3) if self._batches else 0.0,
+                "batch_size_histogram": dict(sorted(self._size_histogram.items())),
+                "ewma_batch_size": round(self._ewma_batch, 3),
+                "window_ms": round(self._window_s() * 1000.0, 3),
+                "queue_depth": len(self._queue),
+                "cancelled": self._dropped,
+            }
+
+    def close(self) -> None:
+        """Stop the dispatcher; requests still queued fail with RuntimeError."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    # ------------------------------------------------------------------
+    # Dispatcher
+    # ------------------------------------------------------------------
+
+    def _window_s(self) -> float:
+        if self._max_batch == 1:
+            return 0.0
+        load = (self._ewma_batch - 1.0) / (self._max_batch - 1)
+        return self._max_wait_s * min(1.0, max(0.0, load))
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    break
+                deadline = self._queue[0].enqueued + self._window_s()
+                while len(self._queue) < self._max_batch and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                n = min(len(self._queue), self._max_batch)
+                batch = [self._queue.popleft() for _ in range(n)]
+                self._ewma_batch += self._alpha * (n - self._ewma_batch)
+                self._batches += 1
+                self._requests += n
+                self._size_histogram[n] += 1
+
+            for group in self._group_by_length(batch):
+                self._dispatch(group)
+
+        with self._cond:
+            leftover, self._queue = list(self._queue), deque()
+        for pending in leftover:
+            pending.future.set_exception(RuntimeError("MicroBatchingSynthesizerAdapter is closed"))
+
+    def _group_by_length(self, batch: Sequence[_Pending]) -> List[List[_Pending]]:
+        """Split into runs of similar text length, shortest group first."""
+        ordered = sorted(batch, key=lambda p: len(p.request.text))
+        groups: List[List[_Pending]] = []
+        for pending in ordered:
+            if groups and len(pending.request.text) <= self._max_ratio * max(1, len(groups[-1][0].request.text)):
+                groups[-1].append(pending)
+            else:
+                groups.append([pending])
+        return groups
+
+    def _dispatch(self, group: List[_Pending]) -> None:
+        live = []
+        for pending in group:
+            if not pending.future.set_running_or_notify_cancel():
+                continue
+            try:
+                pending.request.check_cancelled()
+            except RequestCancelled as exc:
+                pending.future.set_exception(exc)
+                with self._cond:
+                    self._dropped += 1
+                continue
+            live.append(pending)
+        if not live:
+            return
+        with self._cond:
+            self._groups += 1
+        logger.debug(f"[microbatch] dispatching {len(live)} request(s)")
+        try:
+            chunks = self._backend.synthesize_batch([p.request for p in live])
+            if len(chunks) != len(live):
+                raise RuntimeError(f"Backend returned {len(chunks)} chunks for {len(live)} requests")
+        except Exception as exc:
+            logger.error(f"[microbatch] batch of {len(live)} failed: {exc}")
+            for pending in live:
+                pending.future.set_exception(exc)
+            return
+        for pending, chunk in zip(live, chunks):
+            pending.future.set_result(chunk)
+
+    def __repr__(self) -> str:
+        return (
+            f"MicroBatchingSynthesizerAdapter(backend={self._backend!r}, "
+            f"max_batch_size={self._max_batch}, max_wait_ms={self._max_wait_s * 1000:g})"
+        )
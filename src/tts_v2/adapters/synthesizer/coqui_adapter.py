@@ -3,14 +3,24 @@
 All Coqui/torch imports are scoped to this file.
 """
 
+import contextlib
+import copy
 import logging
-from typing import List, Optional
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
 from ...domain.audio import AudioChunk, SynthesisRequest
-from ...domain.voice import get_speaker
+from ...domain.cancellation import RequestCancelled
+from ...domain.voice import NO_SPEAKER, get_speaker
+from ...shared.audio_utils import compare_waveforms
+from ...shared.buffer_pool import BufferPool
 from ...shared.device_utils import apply_transformers_shim, resolve_device
+from .coqui_snapshot import export_snapshot, load_snapshot
 
 # Apply shim before Coqui import
 apply_transformers_shim()
@@ -25,6 +35,45 @@ except ImportError as exc:
 
 logger = logging.getLogger(__name__)
 
+# Coqui's Synthesizer.tts() appends this many zero samples after every sentence.
+_SENTENCE_GAP_SAMPLES = 10000
+_SENTENCE_GAP = np.zeros(_SENTENCE_GAP_SAMPLES, dtype=np.float32)
+_SENTENCE_GAP.setflags(write=False)
+
+
+def _concat(pieces: Sequence[np.ndarray]) -> np.ndarray:
+    if not pieces:
+        return np.zeros(0, dtype=np.float32)
+    if len(pieces) == 1:
+        return pieces[0]
+    return np.concatenate(pieces)
+
+
+@dataclass(frozen=True)
+class CpuPerformanceConfig:
+    """Opt-in CPU inference settings for CoquiSynthesizerAdapter.
+
+    Thread counts are process-wide torch settings; ``None`` keeps torch's
+    default. ``torch.set_num_interop_threads`` can only be applied before
+    the first parallel op in the process — later attempts are logged and
+    ignored.
+
+    Dynamic int8 quantisation covers ``nn.Linear`` (and recurrent) layers —
+    PyTorch has no dynamic kernels for convolutions, so VITS conv stacks
+    stay float. The quantised model is only kept if a seeded probe
+    utterance stays within ``min_snr_db`` / ``max_length_delta`` of the
+    float model; otherwise the adapter falls back to float weights.
+    """
+
+    intra_op_threads: Optional[int] = None
+    inter_op_threads: Optional[int] = None
+    inference_mode: bool = True
+    quantize: bool = False
+    min_snr_db: float = 20.0
+    max_length_delta: float = 0.02
+    probe_text: str = "Your one time password is four eight two nine one three."
+    seed: int = 0
+
 
 class CoquiSynthesizerAdapter:
     """Wraps Coqui TTS to implement SynthesizerPort.
@@ -33,9 +82,40 @@ class CoquiSynthesizerAdapter:
     - MPS-safe loading (gpu=False + manual .to(device) post-load)
     - Multi-speaker VCTK VITS model (default)
     - Persona → speaker_id resolution via domain registry
+    - Optional CPU performance mode (threads, inference_mode, int8)
 
     Swap this adapter for FishSpeechAdapter or F5TTSAdapter to change
     backends without touching the service layer.
+
+    Pass ``tts_model`` to wrap an already-constructed Coqui model (e.g. the
+    tiny random VITS from ``coqui_tiny_model``) instead of loading
+    ``model_name`` through the model manager.
+
+    VITS models with speaker-ID embeddings (the VCTK default) bypass
+    ``TTS.tts()``, which returns each waveform as a Python list of floats,
+    and call ``model.inference()`` per sentence instead; the output tensor
+    is exposed to NumPy as a float32 view without a copy. Sentence
+    splitting, silence trimming and inter-sentence silence follow Coqui's
+    ``Synthesizer.tts()`` so the audio is unchanged. Other model families
+    (separate vocoder, d-vectors, language embeddings) keep the high-level
+    API.
+
+    With ``token_cache_size > 0`` each sentence is cleaned and phonemised
+    once and the resulting token IDs are kept in a bounded LRU keyed by
+    ``(model_name, sentence)``. Only the direct path tokenises through the
+    cache; for models on the high-level API the cache is disabled with a
+    warning and ``token_cache_stats()`` reports ``max_size`` 0.
+
+    ``synthesize_batch()`` (BatchSynthesizerPort) renders many requests with
+    a single padded forward pass; see MicroBatchingSynthesizerAdapter.
+
+    With ``buffer_pool`` set, sentence waveforms are assembled directly
+    into a pooled buffer and the returned AudioChunk carries its lease.
+
+    :meth:`export_snapshot` writes the loaded model to a prepared local
+    snapshot and :meth:`from_snapshot` starts from one with memory-mapped
+    weights, skipping the model manager and checkpoint unpickling (see
+    ``coqui_snapshot``). ``load_s`` records how long construction took.
     """
 
     def __init__(
@@ -44,28 +124,104 @@ class CoquiSynthesizerAdapter:
         use_gpu: bool = True,
         device: Optional[str] = None,
         sample_rate: int = 22050,
+        cpu_performance: Optional[CpuPerformanceConfig] = None,
+        tts_model: Optional[Any] = None,
+        token_cache_size: int = 0,
+        buffer_pool: Optional[BufferPool] = None,
     ) -> None:
+        if token_cache_size < 0:
+            raise ValueError(f"token_cache_size must be >= 0, got {token_cache_size}")
+        t0 = time.perf_counter()
         self.model_name = model_name
         self.sample_rate = sample_rate
         self.device = resolve_device(preferred=device, use_gpu=use_gpu)
+        self.cpu_performance = cpu_performance
+        self.quantized = False
+        self.quantization_report: Optional[Dict[str, float]] = None
 
-        logger.info(f"Loading Coqui model '{model_name}' (cpu load → move to {self.device})")
-        try:
-            # Always load on CPU — Coqui's gpu=True only activates CUDA,
-            # raises AssertionError on Mac MPS.
-            self.model = TTS(model_name=model_name, progress_bar=False, gpu=False)
-        except Exception as exc:
-            raise RuntimeError(f"Failed to load Coqui model '{model_name}': {exc}") from exc
+        self._token_cache_size = token_cache_size
+        self._token_cache: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+        self._token_lock = threading.Lock()
+        self._token_hits = 0
+        self._token_misses = 0
+        self._segmenter = None
+        self._pool = buffer_pool
+
+        if tts_model is not None:
+            logger.info(f"Wrapping preloaded Coqui model '{model_name}'")
+            self.model = None
+            self._tts_model = tts_model
+        else:
+            logger.info(f"Loading Coqui model '{model_name}' (cpu load → move to {self.device})")
+            try:
+                # Always load on CPU — Coqui's gpu=True only activates CUDA,
+                # raises AssertionError on Mac MPS.
+                self.model = TTS(model_name=model_name, progress_bar=False, gpu=False)
+            except Exception as exc:
+                raise RuntimeError(f"Failed to load Coqui model '{model_name}': {exc}") from exc
+            self._tts_model = self.model.synthesizer.tts_model
 
         if self.device != "cpu":
             try:
-                self.model.tts.to(self.device)
+                if self.model is not None:
+                    self.model.tts.to(self.device)
+                else:
+                    self._tts_model.to(self.device)
                 logger.info(f"Model moved to {self.device}")
             except Exception as exc:
                 logger.warning(f"Could not move to {self.device}: {exc}. Falling back to CPU.")
                 self.device = "cpu"
 
-        logger.info(f"CoquiSynthesizerAdapter ready | model={model_name} | device={self.device}")
+        self._direct = self._supports_direct_inference()
+        if self._token_cache_size and not self._direct:
+            logger.warning(
+                f"token_cache_size={self._token_cache_size} ignored: '{model_name}' "
+                f"tokenises inside Coqui's high-level API"
+            )
+            self._token_cache_size = 0
+        if cpu_performance is not None:
+            self._apply_cpu_performance(cpu_performance)
+
+        self.load_s = time.perf_counter() - t0
+        logger.info(
+            f"CoquiSynthesizerAdapter ready | model={model_name} | device={self.device} | load={self.load_s:.2f}s"
+        )
+
+    @classmethod
+    def from_snapshot(cls, path: str, mmap: bool = True, **kwargs: Any) -> "CoquiSynthesizerAdapter":
+        """Load from a snapshot written by :meth:`export_snapshot`.
+
+        Args:
+            path:     Snapshot directory.
+            mmap:     Memory-map the weights so workers on one host share them.
+            **kwargs: Remaining constructor arguments (``use_gpu``,
+                      ``cpu_performance``, ``token_cache_size``, …).
+
+        Raises:
+            ValueError: If ``path`` is not a supported snapshot.
+        """
+        t0 = time.perf_counter()
+        tts_model, manifest = load_snapshot(path, mmap=mmap)
+        adapter = cls(
+            model_name=manifest["model_name"],
+            sample_rate=manifest["sample_rate"],
+            tts_model=tts_model,
+            **kwargs,
+        )
+        adapter.load_s = time.perf_counter() - t0
+        return adapter
+
+    def export_snapshot(self, path: str) -> Dict[str, Any]:
+        """Write the loaded float model to a snapshot directory; returns its manifest.
+
+        Raises:
+            ValueError: If the adapter swapped in int8 weights — export from
+                        a float adapter and pass ``cpu_performance`` to
+                        :meth:`from_snapshot` instead.
+        """
+        if self.quantized:
+            raise ValueError("Cannot snapshot an int8-quantised model; export before quantising")
+        return export_snapshot(self._tts_model, path, self.model_name)
 
     # ------------------------------------------------------------------
     # SynthesizerPort implementation
@@ -73,33 +229,327 @@ class CoquiSynthesizerAdapter:
 
     def synthesize(self, request: SynthesisRequest) -> AudioChunk:
         """Synthesise speech and return an AudioChunk."""
-        speaker = get_speaker(request.persona)
+        speaker_id = request.speaker_id if request.speaker_id is not None else get_speaker(request.persona).speaker_id
         logger.info(
             f"[synthesize] persona='{request.persona}' | "
-            f"speaker='{speaker.speaker_id}' | "
+            f"speaker='{speaker_id}' | "
             f"text_len={len(request.text)}"
         )
 
         try:
-            wav = self.model.tts(text=request.text, speaker=speaker.speaker_id)
+            pieces = self._infer_pieces(request.text, speaker_id, request)
+        except RequestCancelled:
+            raise
         except Exception as exc:
             logger.error(f"[synthesize] Coqui synthesis failed: {exc}")
             raise RuntimeError(f"Coqui synthesis failed: {exc}") from exc
 
-        samples = np.asarray(wav, dtype=np.float32)
-        chunk = AudioChunk(
-            samples=samples,
-            sample_rate=self.sample_rate,
-            speaker_id=speaker.speaker_id,
-        )
+        chunk = self._to_chunk(pieces, speaker_id)
         logger.info(f"[synthesize] produced {chunk.duration_s:.2f}s AudioChunk")
         return chunk
 
+    def synthesize_batch(self, requests: Sequence[SynthesisRequest]) -> List[AudioChunk]:
+        """Synthesise several requests with one padded forward pass.
+
+        Every sentence of every request becomes one row of the batch; rows
+        are cut back to their own length using the decoder's ``y_mask`` and
+        reassembled per request with the usual inter-sentence silence.
+        Models without direct inference (separate vocoder, d-vectors,
+        language embeddings) render the requests one at a time instead.
+
+        Raises:
+            RuntimeError: If synthesis fails, including a batch that mixes
+                          ``NO_SPEAKER`` requests with speaker requests.
+        """
+        speaker_ids = [r.speaker_id if r.speaker_id is not None else get_speaker(r.persona).speaker_id for r in requests]
+        logger.info(f"[synthesize_batch] {len(requests)} requests")
+        try:
+            if self._direct:
+                wavs = self._infer_batch([r.text for r in requests], speaker_ids)
+            else:
+                wavs = [self._infer_pieces(r.text, speaker_id) for r, speaker_id in zip(requests, speaker_ids)]
+        except Exception as exc:
+            logger.error(f"[synthesize_batch] Coqui batch synthesis failed: {exc}")
+            raise RuntimeError(f"Coqui batch synthesis failed: {exc}") from exc
+        return [self._to_chunk(pieces, speaker_id) for pieces, speaker_id in zip(wavs, speaker_ids)]
+
     def get_speakers(self) -> List[str]:
         """Return Coqui model's available speaker IDs."""
-        return getattr(self.model, "speakers", None) or []
+        if self.model is not None:
+            return getattr(self.model, "speakers", None) or []
+        speaker_manager = getattr(self._tts_model, "speaker_manager", None)
+        return list(speaker_manager.name_to_id) if speaker_manager is not None else []
+
+    def memory_bytes(self) -> int:
+        """Return the resident size of the model's parameters and buffers."""
+        tensors = list(self._tts_model.parameters()) + list(self._tts_model.buffers())
+        return sum(t.numel() * t.element_size() for t in tensors)
+
+    # ------------------------------------------------------------------
+    # Inference
+    # ------------------------------------------------------------------
+
+    def _infer(self, text: str, speaker_id: str) -> np.ndarray:
+        """Run the model once and return the whole waveform."""
+        return _concat(self._infer_pieces(text, speaker_id))
+
+    def _infer_pieces(
+        self, text: str, speaker_id: str, request: Optional[SynthesisRequest] = None
+    ) -> List[np.ndarray]:
+        """Run the model once, under inference_mode when CPU mode asks for it.
+
+        Returns float32 segments whose concatenation is the waveform. With
+        ``request`` given, the direct path checks it for cancellation before
+        each sentence.
+        """
+        perf = self.cpu_performance
+        guard = torch.inference_mode() if perf and perf.inference_mode else contextlib.nullcontext()
+        with guard:
+            if self._direct:
+                return self._infer_sentences(text, speaker_id, request)
+            if self.model is not None:
+                return [np.asarray(self.model.tts(text=text, speaker=speaker_id or None), dtype=np.float32)]
+            # A bare model has no vocoder: render each sentence the way
+            # Synthesizer.tts() does with Griffin-Lim.
+            pieces: List[np.ndarray] = []
+            for sentence in self._split_sentences(text):
+                if request is not None:
+                    request.check_cancelled()
+                outputs = self._tts_model.synthesize(
+                    text=sentence,
+                    speaker=speaker_id or None,
+                    use_griffin_lim=True,
+                )
+                waveform = np.asarray(outputs["wav"], dtype=np.float32).squeeze()
+                pieces.append(self._trim(waveform))
+                pieces.append(_SENTENCE_GAP)
+            return pieces
+
+    def _to_chunk(self, pieces: Sequence[np.ndarray], speaker_id: str) -> AudioChunk:
+        """Join segments into an AudioChunk, in a pooled buffer when configured."""
+        if self._pool is None:
+            return AudioChunk(samples=_concat(pieces), sample_rate=self.sample_rate, speaker_id=speaker_id)
+        lease = self._pool.acquire(sum(p.size for p in pieces))
+        offset = 0
+        for piece in pieces:
+            lease.array[offset: offset + piece.size] = piece
+            offset += piece.size
+        return AudioChunk(samples=lease.array, sample_rate=self.sample_rate, speaker_id=speaker_id, lease=lease)
+
+    def _infer_sentences(
+        self, text: str, speaker_id: str, request: Optional[SynthesisRequest] = None
+    ) -> List[np.ndarray]:
+        """Mirror Synthesizer.tts(): per-sentence inference + trailing silence.
+
+        Raises:
+            RequestCancelled: If ``request`` is cancelled or expires between sentences.
+        """
+        speaker_index = self._speaker_index(speaker_id)
+        sid = None if speaker_index is None else torch.tensor([speaker_index], device=self.device)
+        pieces: List[np.ndarray] = []
+        for sentence in self._split_sentences(text):
+            if request is not None:
+                request.check_cancelled()
+            ids = torch.from_numpy(self._tokens_for(sentence)).to(self.device, dtype=torch.long)
+            ids = ids.unsqueeze(0)
+            outputs = self._tts_model.inference(
+                ids,
+                aux_input={
+                    "x_lengths": torch.tensor(ids.shape[1:2], device=self.device),
+                    "speaker_ids": sid,
+                    "d_vectors": None,
+                    "language_ids": None,
+                },
+            )
+            # A view of the output tensor on CPU; only the final assembly copies.
+            waveform = outputs["model_outputs"][0].detach().cpu().numpy().squeeze()
+            pieces.append(self._trim(waveform.astype(np.float32, copy=False)))
+            pieces.append(_SENTENCE_GAP)
+        return pieces
+
+    def _infer_batch(self, texts: Sequence[str], speaker_ids: Sequence[str]) -> List[List[np.ndarray]]:
+        """Batched counterpart of _infer_sentences(); one segment list per text."""
+        rows: List[Tuple[int, np.ndarray, Optional[int]]] = []
+        for index, (text, speaker_id) in enumerate(zip(texts, speaker_ids)):
+            speaker_index = self._speaker_index(speaker_id)
+            for sentence in self._split_sentences(text):
+                rows.append((index, self._tokens_for(sentence), speaker_index))
+        if not rows:
+            return [[] for _ in texts]
+
+        lengths = np.array([ids.size for _, ids, _ in rows], dtype=np.int64)
+        padded = np.zeros((len(rows), int(lengths.max())), dtype=np.int64)
+        for row, (_, ids, _) in enumerate(rows):
+            padded[row, : ids.size] = ids
+        speaker_indices = [spk for _, _, spk in rows]
+        if all(spk is None for spk in speaker_indices):
+            sid = None
+        elif any(spk is None for spk in speaker_indices):
+            raise ValueError("Cannot batch NO_SPEAKER requests with speaker requests")
+        else:
+            sid = torch.tensor(speaker_indices, dtype=torch.long, device=self.device)
+        hop_length = self._tts_model.config.audio["hop_length"]
+
+        perf = self.cpu_performance
+        guard = torch.inference_mode() if perf and perf.inference_mode else contextlib.nullcontext()
+        with guard:
+            outputs = self._tts_model.inference(
+                torch.from_numpy(padded).to(self.device),
+                aux_input={
+                    "x_lengths": torch.from_numpy(lengths).to(self.device),
+                    "speaker_ids": sid,
+                    "d_vectors": None,
+                    "language_ids": None,
+                },
+            )
+            frames = outputs["y_mask"].sum(dim=(1, 2)).long().cpu().numpy()
+            waveforms = outputs["model_outputs"].data.cpu().numpy()
+
+        pieces: List[List[np.ndarray]] = [[] for _ in texts]
+        for row, (index, _, _) in enumerate(rows):
+            waveform = waveforms[row].reshape(-1)[: int(frames[row]) * hop_length]
+            pieces[index].append(self._trim(waveform.astype(np.float32, copy=False)))
+            pieces[index].append(_SENTENCE_GAP)
+        return pieces
+
+    def _trim(self, waveform: np.ndarray) -> np.ndarray:
+        """Cut trailing silence when the model's audio config asks for it, as Synthesizer.tts() does."""
+        audio_config = self._tts_model.config.audio
+        if "do_trim_silence" in audio_config and audio_config["do_trim_silence"]:
+            return waveform[: self._tts_model.ap.find_endpoint(waveform)]
+        return waveform
+
+    def _split_sentences(self, text: str) -> List[str]:
+        if self.model is not None:
+            return self.model.synthesizer.split_into_sentences(text)
+        if self._segmenter is None:
+            import pysbd
+
+            self._segmenter = pysbd.Segmenter(language="en", clean=True)
+        return self._segmenter.segment(text)
+
+    def _tokens_for(self, sentence: str) -> np.ndarray:
+        """Return cached token IDs for ``sentence``, running the tokenizer on a miss."""
+        if not self._token_cache_size:
+            return np.asarray(self._tts_model.tokenizer.text_to_ids(sentence), dtype=np.int32)
+        key = (self.model_name, sentence)
+        with self._token_lock:
+            ids = self._token_cache.get(key)
+            if ids is not None:
+                self._token_cache.move_to_end(key)
+                self._token_hits += 1
+                return ids
+            self._token_misses += 1
+
+        ids = np.asarray(self._tts_model.tokenizer.text_to_ids(sentence), dtype=np.int32)
+        ids.setflags(write=False)
+        with self._token_lock:
+            self._token_cache[key] = ids
+            self._token_cache.move_to_end(key)
+            if len(self._token_cache) > self._token_cache_size:
+                self._token_cache.popitem(last=False)
+        return ids
+
+    def token_cache_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for the token sequence cache."""
+        with self._token_lock:
+            lookups = self._token_hits + self._token_misses
+            return {
+                "hits": self._token_hits,
+                "misses": self._token_misses,
+                "hit_rate": round(self._token_hits / lookups, 4) if lookups else 0.0,
+                "size": len(self._token_cache),
+                "max_size": self._token_cache_size,
+            }
+
+    def _supports_direct_inference(self) -> bool:
+        """True if ``_infer_sentences()`` reproduces ``Synthesizer.tts()`` for this model."""
+        if self.model is not None and self.model.synthesizer.vocoder_model is not None:
+            return False
+        config = self._tts_model.config
+        model_args = getattr(config, "model_args", None)
+        return (
+            getattr(config, "model", None) == "vits"
+            and not getattr(model_args, "use_d_vector_file", False)
+            and not getattr(model_args, "use_language_embedding", False)
+        )
+
+    def _speaker_index(self, speaker_id: str) -> Optional[int]:
+        speaker_manager = getattr(self._tts_model, "speaker_manager", None)
+        if speaker_manager is None or speaker_id == NO_SPEAKER:
+            return None
+        return speaker_manager.name_to_id[speaker_id]
+
+    # ------------------------------------------------------------------
+    # CPU performance mode
+    # ------------------------------------------------------------------
+
+    def _apply_cpu_performance(self, perf: CpuPerformanceConfig) -> None:
+        if perf.intra_op_threads:
+            torch.set_num_threads(perf.intra_op_threads)
+        if perf.inter_op_threads:
+            try:
+                torch.set_num_interop_threads(perf.inter_op_threads)
+            except RuntimeError as exc:
+                logger.warning(f"[cpu] inter-op threads already fixed for this process: {exc}")
+        logger.info(
+            f"[cpu] threads intra={torch.get_num_threads()} "
+            f"inter={torch.get_num_interop_threads()} | "
+            f"inference_mode={perf.inference_mode}"
+        )
+
+        if not perf.quantize:
+            return
+        if self.device != "cpu":
+            logger.warning(f"[cpu] int8 quantisation skipped: device is '{self.device}'")
+            return
+        self._quantize(perf)
+
+    def _quantize(self, perf: CpuPerformanceConfig) -> None:
+        """Swap in a dynamically-quantised copy if it passes the quality gate."""
+        float_model = self._tts_model
+        probe_speaker = (self.get_speakers() or [get_speaker("neutral_male").speaker_id])[0]
+
+        def probe() -> np.ndarray:
+            # Same seed for both renders, without reseeding the caller's global RNG.
+            with torch.random.fork_rng(devices=[] if self.device == "cpu" else None):
+                torch.manual_seed(perf.seed)
+                return np.asarray(self._infer(perf.probe_text, probe_speaker), dtype=np.float32)
+
+        reference = probe()
+
+        quantized_model = torch.ao.quantization.quantize_dynamic(
+            copy.deepcopy(float_model),
+            {torch.nn.Linear, torch.nn.LSTM, torch.nn.GRU},
+            dtype=torch.qint8,
+        )
+        n_quantized = sum(
+            1 for m in quantized_model.modules()
+            if type(m).__module__.startswith("torch.ao.nn.quantized")
+        )
+        self._set_tts_model(quantized_model)
+
+        candidate = probe()
+        report = compare_waveforms(reference, candidate)
+        report["quantized_modules"] = n_quantized
+        self.quantization_report = report
+
+        length_ok = abs(report["length_ratio"] - 1.0) <= perf.max_length_delta
+        if n_quantized and length_ok and report["snr_db"] >= perf.min_snr_db:
+            self.quantized = True
+            logger.info(f"[cpu] int8 dynamic quantisation accepted: {report}")
+        else:
+            self._set_tts_model(float_model)
+            logger.warning(f"[cpu] int8 quantisation rejected, keeping float weights: {report}")
+
+    def _set_tts_model(self, tts_model: Any) -> None:
+        self._tts_model = tts_model
+        if self.model is not None:
+            self.model.synthesizer.tts_model = tts_model
 
     def __repr__(self) -> str:
         return (
-            f"CoquiSynthesizerAdapter(model={self.model_name!r}, device={self.device!r})"
+            f"CoquiSynthesizerAdapter(model={self.model_name!r}, device={self.device!r}"
+            f"{', direct' if self._direct else ''}"
+            f"{', int8' if self.quantized else ''})"
         )
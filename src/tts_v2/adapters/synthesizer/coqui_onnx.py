@@ -0,0 +1,269 @@
+"""ONNX export of Coqui VITS models for OnnxSynthesizerAdapter.
+
+An export directory holds everything the ONNX adapter needs::
+
+    <export>/
+        manifest.json   format version, model name, speakers, default scales
+        config.json     the model's Coqpit config (text front-end settings)
+        model.onnx      graph: input, input_lengths, scales[, sid] → output
+
+The graph wraps ``Vits.inference()`` for one utterance. ``scales`` is
+``[noise_scale, length_scale, noise_scale_dp]`` so callers can set the
+sampling noise per run; the model's own values are recorded in the
+manifest as defaults. ``sid`` is the speaker embedding row and is present
+only for multi-speaker models.
+
+Only VITS models with speaker-ID embeddings are supported: d-vector and
+language-embedding variants take inputs the graph does not expose.
+
+:func:`validate_onnx_export` renders the same prompts through the PyTorch
+and ONNX adapters with sampling noise disabled (both are then
+deterministic) and compares them with :func:`compare_waveforms`.
+
+The manifest is plain JSON and can be read without torch
+(:func:`read_onnx_manifest`). All Coqui/torch imports are scoped to the
+functions that need them.
+"""
+
+import copy
+import inspect
+import json
+import logging
+import os
+import shutil
+import time
+from typing import Any, Dict, Optional, Sequence
+
+from ...shared.audio_utils import compare_waveforms
+
+logger = logging.getLogger(__name__)
+
+ONNX_FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+CONFIG_FILE = "config.json"
+MODEL_FILE = "model.onnx"
+DEFAULT_OPSET = 15
+
+DEFAULT_VALIDATION_TEXTS = (
+    "Your one time password is four eight two nine one three.",
+    "This call may be recorded for quality and compliance purposes.",
+    "Your account balance is one thousand two hundred dollars. Thank you for banking with us.",
+)
+
+
+def read_onnx_manifest(directory: str) -> Dict[str, Any]:
+    """Return the export's manifest.
+
+    Raises:
+        ValueError: If ``directory`` is not an ONNX export or has an
+                    unsupported format version.
+    """
+    path = os.path.join(directory, MANIFEST_FILE)
+    try:
+        with open(path, encoding="utf-8") as fh:
+            manifest = json.load(fh)
+    except FileNotFoundError as exc:
+        raise ValueError(f"{directory} is not an ONNX export (no {MANIFEST_FILE})") from exc
+    if manifest.get("format") != ONNX_FORMAT_VERSION or manifest.get("kind") != "onnx":
+        raise ValueError(f"Unsupported ONNX export format {manifest.get('format')} in {directory}")
+    return manifest
+
+
+def export_onnx(
+    tts_model: Any, directory: str, model_name: str, opset: int = DEFAULT_OPSET
+) -> Dict[str, Any]:
+    """Trace ``tts_model`` (a Coqui ``Vits``) to an ONNX export directory.
+
+    The export is assembled next to ``directory`` and renamed into place,
+    replacing any previous export there.
+
+    Args:
+        tts_model:  Loaded float model, e.g. ``adapter._tts_model`` or
+                    ``build_tiny_vits()``.
+        directory:  Export directory to create.
+        model_name: Identifier recorded in the manifest.
+        opset:      ONNX opset version.
+
+    Returns:
+        The manifest written.
+
+    Raises:
+        ValueError: If the model is not a speaker-ID VITS model.
+    """
+    import torch
+
+    config = copy.deepcopy(tts_model.config)
+    model_args = getattr(config, "model_args", None)
+    if getattr(config, "model", None) != "vits":
+        raise ValueError(f"ONNX export supports VITS models only, got '{getattr(config, 'model', None)}'")
+    if getattr(model_args, "use_d_vector_file", False) or getattr(model_args, "use_language_embedding", False):
+        raise ValueError("ONNX export does not support d-vector or language-embedding VITS models")
+    for section in (config, model_args):
+        if section is not None and getattr(section, "speakers_file", None):
+            section.speakers_file = None
+
+    speaker_manager = getattr(tts_model, "speaker_manager", None)
+    speakers = dict(speaker_manager.name_to_id) if speaker_manager is not None else {}
+    multi_speaker = bool(getattr(model_args, "use_speaker_embedding", False))
+    scales = [
+        float(tts_model.inference_noise_scale),
+        float(tts_model.length_scale),
+        float(tts_model.inference_noise_scale_dp),
+    ]
+
+    wrapper = _onnx_wrapper(tts_model).eval()
+    ids = torch.randint(low=1, high=8, size=(1, 32), dtype=torch.long)
+    args = (ids, torch.tensor([ids.shape[1]], dtype=torch.long), torch.tensor(scales, dtype=torch.float32))
+    input_names = ["input", "input_lengths", "scales"]
+    dynamic_axes = {
+        "input": {0: "batch", 1: "tokens"},
+        "input_lengths": {0: "batch"},
+        "output": {0: "batch", 2: "samples"},
+    }
+    if multi_speaker:
+        args += (torch.zeros(1, dtype=torch.long),)
+        input_names.append("sid")
+        dynamic_axes["sid"] = {0: "batch"}
+
+    kwargs: Dict[str, Any] = {}
+    if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+        kwargs["dynamo"] = False  # the TorchScript exporter handles VITS' data-dependent lengths
+
+    directory = os.path.abspath(directory)
+    tmp = f"{directory}.{os.getpid()}.part"
+    t0 = time.perf_counter()
+    try:
+        os.makedirs(tmp)
+        config.save_json(os.path.join(tmp, CONFIG_FILE))
+        with torch.no_grad():
+            torch.onnx.export(
+                wrapper,
+                args,
+                os.path.join(tmp, MODEL_FILE),
+                input_names=input_names,
+                output_names=["output"],
+                dynamic_axes=dynamic_axes,
+                opset_version=opset,
+                **kwargs,
+            )
+        manifest = {
+            "format": ONNX_FORMAT_VERSION,
+            "kind": "onnx",
+            "model_name": model_name,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "torch": torch.__version__,
+            "opset": opset,
+            "sample_rate": int(config.audio["sample_rate"]),
+            "inputs": input_names,
+            "speakers": speakers,
+            "scales": scales,
+            "onnx_bytes": os.path.getsize(os.path.join(tmp, MODEL_FILE)),
+        }
+        with open(os.path.join(tmp, MANIFEST_FILE), "w", encoding="utf-8") as fh:
+            json.dump(manifest, fh, indent=2)
+        if os.path.isdir(directory):
+            shutil.rmtree(directory)
+        os.replace(tmp, directory)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    logger.info(
+        f"[onnx] exported '{model_name}' → {directory} in {time.perf_counter() - t0:.1f}s "
+        f"({manifest['onnx_bytes'] / 1e6:.1f} MB, opset {opset})"
+    )
+    return manifest
+
+
+def validate_onnx_export(
+    tts_model: Any,
+    directory: str,
+    texts: Sequence[str] = DEFAULT_VALIDATION_TEXTS,
+    speaker_id: Optional[str] = None,
+    min_snr_db: float = 20.0,
+    max_length_delta: float = 0.02,
+) -> Dict[str, Any]:
+    """Compare ONNX output with the PyTorch model on ``texts``.
+
+    Sampling noise is disabled on both sides for the comparison and
+    restored afterwards.
+
+    Args:
+        tts_model:        The model the export was traced from.
+        directory:        Export directory.
+        texts:            Prompts to render (already normalised).
+        speaker_id:       Speaker name; defaults to the first in the manifest.
+        min_snr_db:       Lowest acceptable per-prompt SNR.
+        max_length_delta: Largest acceptable ``|length_ratio - 1|``.
+
+    Returns:
+        ``{"passed", "min_snr_db", "min_correlation", "max_length_delta",
+        "prompts": [compare_waveforms() report, ...]}``.
+    """
+    from .coqui_adapter import CoquiSynthesizerAdapter
+    from .onnx_adapter import OnnxSynthesizerAdapter
+    from ...domain.audio import SynthesisRequest
+
+    manifest = read_onnx_manifest(directory)
+    if speaker_id is None:
+        speaker_id = next(iter(manifest["speakers"]), None)
+    reference = CoquiSynthesizerAdapter(model_name=manifest["model_name"], use_gpu=False, tts_model=tts_model)
+    candidate = OnnxSynthesizerAdapter(directory, noise_scale=0.0, noise_scale_dp=0.0)
+
+    saved = (tts_model.inference_noise_scale, tts_model.inference_noise_scale_dp)
+    tts_model.inference_noise_scale, tts_model.inference_noise_scale_dp = 0.0, 0.0
+    try:
+        prompts = []
+        for text in texts:
+            request = SynthesisRequest(text=text, persona="neutral_male", speaker_id=speaker_id)
+            prompts.append(compare_waveforms(
+                reference.synthesize(request).samples, candidate.synthesize(request).samples
+            ))
+    finally:
+        tts_model.inference_noise_scale, tts_model.inference_noise_scale_dp = saved
+
+    report = {
+        "min_snr_db": min(p["snr_db"] for p in prompts),
+        "min_correlation": min(p["correlation"] for p in prompts),
+        "max_length_delta": max(abs(p["length_ratio"] - 1.0) for p in prompts),
+        "prompts": prompts,
+    }
+    report["passed"] = report["min_snr_db"] >= min_snr_db and report["max_length_delta"] <= max_length_delta
+    log = logger.info if report["passed"] else logger.warning
+    log(
+        f"[onnx] validation {'passed' if report['passed'] else 'FAILED'} | "
+        f"snr≥{report['min_snr_db']:.1f} dB | corr≥{report['min_correlation']:.4f} | "
+        f"Δlen≤{report['max_length_delta']:.4f}"
+    )
+    return report
+
+
+def _onnx_wrapper(tts_model: Any) -> Any:
+    """``nn.Module`` whose ``forward`` is one ``Vits.inference()`` call with explicit scales."""
+    import torch
+
+    class VitsOnnxWrapper(torch.nn.Module):
+        def __init__(self, model: Any) -> None:
+            super().__init__()
+            self.model = model
+
+        def forward(self, input, input_lengths, scales, sid=None):  # noqa: A002 — ONNX input name
+            model = self.model
+            saved = (model.inference_noise_scale, model.length_scale, model.inference_noise_scale_dp)
+            model.inference_noise_scale, model.length_scale, model.inference_noise_scale_dp = (
+                scales[0], scales[1], scales[2]
+            )
+            try:
+                outputs = model.inference(
+                    input,
+                    aux_input={
+                        "x_lengths": input_lengths,
+                        "speaker_ids": sid,
+                        "d_vectors": None,
+                        "language_ids": None,
+                    },
+                )
+            finally:
+                model.inference_noise_scale, model.length_scale, model.inference_noise_scale_dp = saved
+            return outputs["model_outputs"]
+
+    return VitsOnnxWrapper(tts_model)
@@ -0,0 +1,194 @@
+"""Prepared local snapshots of Coqui models for fast, page-shared start-up.
+
+``TTS(model_name=...)`` resolves the model manager, parses the released
+config and unpickles the training checkpoint on every process start. A
+snapshot is written once from an already-loaded model and holds only what
+inference needs::
+
+    <snapshot>/
+        manifest.json   format version, model name, torch version, sizes
+        config.json     the model's Coqpit config (speaker-file paths cleared)
+        speakers.json   speaker name → embedding row
+        weights.pt      state dict in torch's zip format, one record per tensor
+
+:func:`load_snapshot` builds the model skeleton on the ``meta`` device (no
+random initialisation), loads ``weights.pt`` with ``torch.load(mmap=True)``
+and assigns the mapped tensors as the model's parameters, so no weight is
+copied. The mapping is file-backed and never written to, so every worker
+on a host that loads the same snapshot shares one copy of the weights in
+the page cache. Moving the model to a GPU or quantising it copies the
+weights, as usual. Requires torch ≥ 2.1.
+
+The manifest is plain JSON and can be read without torch
+(:func:`read_snapshot_manifest`). All Coqui/torch imports are scoped to
+the functions that need them.
+"""
+
+import copy
+import json
+import logging
+import os
+import shutil
+import time
+from typing import Any, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+CONFIG_FILE = "config.json"
+SPEAKERS_FILE = "speakers.json"
+WEIGHTS_FILE = "weights.pt"
+
+
+def read_snapshot_manifest(directory: str) -> Dict[str, Any]:
+    """Return the snapshot's manifest.
+
+    Raises:
+        ValueError: If ``directory`` is not a snapshot or has an unsupported
+                    format version.
+    """
+    path = os.path.join(directory, MANIFEST_FILE)
+    try:
+        with open(path, encoding="utf-8") as fh:
+            manifest = json.load(fh)
+    except FileNotFoundError as exc:
+        raise ValueError(f"{directory} is not a model snapshot (no {MANIFEST_FILE})") from exc
+    if manifest.get("format") != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported model snapshot format {manifest.get('format')} in {directory}")
+    return manifest
+
+
+def export_snapshot(tts_model: Any, directory: str, model_name: str) -> Dict[str, Any]:
+    """Write ``tts_model`` (a Coqui ``BaseTTS``) to a snapshot directory.
+
+    The snapshot is assembled next to ``directory`` and renamed into
+    place, replacing any previous snapshot there. Processes that already
+    mapped the old weights keep their mapping.
+
+    Args:
+        tts_model:  Loaded float model, e.g. ``adapter._tts_model`` or
+                    ``build_tiny_vits()``.
+        directory:  Snapshot directory to create.
+        model_name: Identifier recorded in the manifest (the adapter's
+                    ``model_name``).
+
+    Returns:
+        The manifest written.
+    """
+    import torch
+
+    config = copy.deepcopy(tts_model.config)
+    # Speakers travel in speakers.json; the released config points at files
+    # inside the model-manager cache that the snapshot must not depend on.
+    for section in (config, getattr(config, "model_args", None)):
+        if section is not None and getattr(section, "speakers_file", None):
+            section.speakers_file = None
+    speaker_manager = getattr(tts_model, "speaker_manager", None)
+    speakers = dict(speaker_manager.name_to_id) if speaker_manager is not None else {}
+
+    state = {name: t.detach().to("cpu").contiguous() for name, t in tts_model.state_dict().items()}
+    manifest = {
+        "format": SNAPSHOT_FORMAT_VERSION,
+        "model_name": model_name,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "torch": torch.__version__,
+        "sample_rate": int(config.audio["sample_rate"]),
+        "tensors": len(state),
+        "weight_bytes": sum(t.numel() * t.element_size() for t in state.values()),
+    }
+
+    directory = os.path.abspath(directory)
+    tmp = f"{directory}.{os.getpid()}.part"
+    try:
+        os.makedirs(tmp)
+        config.save_json(os.path.join(tmp, CONFIG_FILE))
+        with open(os.path.join(tmp, SPEAKERS_FILE), "w", encoding="utf-8") as fh:
+            json.dump(speakers, fh)
+        torch.save(state, os.path.join(tmp, WEIGHTS_FILE))
+        with open(os.path.join(tmp, MANIFEST_FILE), "w", encoding="utf-8") as fh:
+            json.dump(manifest, fh, indent=2)
+        if os.path.isdir(directory):
+            shutil.rmtree(directory)
+        os.replace(tmp, directory)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    logger.info(
+        f"[snapshot] wrote '{model_name}' → {directory} "
+        f"({manifest['tensors']} tensors, {manifest['weight_bytes'] / 1e6:.1f} MB)"
+    )
+    return manifest
+
+
+def load_snapshot(directory: str, mmap: bool = True) -> Tuple[Any, Dict[str, Any]]:
+    """Load a snapshot written by :func:`export_snapshot`.
+
+    Args:
+        directory: Snapshot directory.
+        mmap:      Map ``weights.pt`` instead of reading it into memory.
+
+    Returns:
+        ``(tts_model, manifest)`` with the model in eval mode on the CPU.
+
+    Raises:
+        ValueError: If ``directory`` is not a supported snapshot.
+    """
+    import torch
+    from TTS.config import load_config
+    from TTS.tts.utils.speakers import SpeakerManager
+
+    manifest = read_snapshot_manifest(directory)
+    t0 = time.perf_counter()
+    config = load_config(os.path.join(directory, CONFIG_FILE))
+    state = torch.load(
+        os.path.join(directory, WEIGHTS_FILE), map_location="cpu", weights_only=True, mmap=mmap
+    )
+
+    # Build the skeleton without allocating or initialising weights, then
+    # adopt the loaded tensors as parameters (no copy).
+    model = _build_skeleton(config)
+    model.load_state_dict(state, assign=True)
+    if any(t.is_meta for t in list(model.parameters()) + list(model.buffers())):
+        # Non-persistent buffers are not in the state dict; build them for real.
+        logger.warning("[snapshot] model has buffers outside its state dict — initialising on CPU")
+        model = _build_skeleton(config, device="cpu")
+        model.load_state_dict(state, assign=True)
+
+    with open(os.path.join(directory, SPEAKERS_FILE), encoding="utf-8") as fh:
+        speakers = json.load(fh)
+    if speakers:
+        speaker_manager = SpeakerManager()
+        speaker_manager.name_to_id = speakers
+        model.speaker_manager = speaker_manager
+    model.eval()
+    logger.info(
+        f"[snapshot] loaded '{manifest['model_name']}' from {directory} in "
+        f"{time.perf_counter() - t0:.3f}s ({'mmap' if mmap else 'read'})"
+    )
+    return model, manifest
+
+
+def _build_skeleton(config: Any, device: str = "meta") -> Any:
+    """Construct the model for ``config`` with its modules on ``device``.
+
+    Only ``nn.Module`` construction runs under the device context: VITS'
+    ``init_from_config`` reads config-derived tensors back with ``.item()``,
+    which meta tensors cannot do, so the audio processor and tokenizer are
+    built on the CPU first. Model families other than VITS are built with
+    ``setup_model`` on the CPU.
+    """
+    import torch
+    from TTS.tts.models import setup_model
+
+    if getattr(config, "model", None) != "vits":
+        return setup_model(config)
+
+    from TTS.tts.models.vits import Vits
+    from TTS.tts.utils.text.tokenizer import TTSTokenizer
+    from TTS.utils.audio import AudioProcessor
+
+    ap = AudioProcessor.init_from_config(config)
+    tokenizer, config = TTSTokenizer.init_from_config(config)
+    with torch.device(device):
+        return Vits(config, ap, tokenizer)
@@ -0,0 +1,59 @@
+"""Tiny randomly-initialised Coqui VITS model for offline tests and benchmarks.
+
+Produces noise, not speech — but it exercises exactly the same modules,
+tokenizer and inference path as the pretrained VCTK checkpoint, so CPU
+modes, caches and export tooling can be verified without downloading
+weights. Uses graphemes (no espeak dependency).
+
+All Coqui/torch imports are scoped to this file.
+"""
+
+from typing import Sequence
+
+DEFAULT_TINY_SPEAKERS = ("p225", "p226", "p227", "p228")
+
+
+def build_tiny_vits(speakers: Sequence[str] = DEFAULT_TINY_SPEAKERS, seed: int = 0):
+    """Build a small multi-speaker ``TTS.tts.models.vits.Vits`` in eval mode.
+
+    Args:
+        speakers: Speaker names registered in the model's speaker manager.
+        seed:     torch RNG seed for the random weights (the global RNG is left untouched).
+
+    Returns:
+        A Coqui ``Vits`` instance whose ``speaker_manager.name_to_id`` maps
+        ``speakers`` to embedding rows.
+    """
+    import torch
+    from TTS.tts.configs.vits_config import VitsConfig
+    from TTS.tts.models.vits import Vits, VitsArgs
+    from TTS.tts.utils.speakers import SpeakerManager
+
+    config = VitsConfig(
+        model_args=VitsArgs(
+            hidden_channels=32,
+            hidden_channels_ffn_text_encoder=64,
+            num_heads_text_encoder=2,
+            num_layers_text_encoder=2,
+            num_layers_posterior_encoder=2,
+            num_layers_flow=2,
+            upsample_initial_channel_decoder=32,
+            resblock_kernel_sizes_decoder=[3],
+            resblock_dilation_sizes_decoder=[[1, 3, 5]],
+            use_speaker_embedding=True,
+            num_speakers=len(speakers),
+            speaker_embedding_channels=16,
+            init_discriminator=False,
+        ),
+        use_phonemes=False,
+        text_cleaner="english_cleaners",
+    )
+    # Seed the weights without reseeding the caller's global RNG.
+    with torch.random.fork_rng(devices=[]):
+        torch.manual_seed(seed)
+        model = Vits.init_from_config(config)
+    speaker_manager = SpeakerManager()
+    speaker_manager.name_to_id = {name: idx for idx, name in enumerate(speakers)}
+    model.speaker_manager = speaker_manager
+    model.eval()
+    return model
@@ -5,11 +5,12 @@ This is why hexagonal architecture makes testing so easy.
 """
 
 import logging
-from typing import List
+from typing import List, Optional, Sequence
 
 import numpy as np
 
 from ...domain.audio import AudioChunk, SynthesisRequest
+from ...shared.buffer_pool import BufferPool
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +19,7 @@ _DURATION_S = 1.0  # 1 second of silence per call
 
 
 class MockSynthesizerAdapter:
-    """Implements SynthesizerPort with deterministic silence.
+    """Implements SynthesizerPort (and BatchSynthesizerPort) with deterministic silence.
 
     Use in any test that exercises the service layer without needing a GPU:
 
@@ -26,16 +27,27 @@ class MockSynthesizerAdapter:
             synthesizer=MockSynthesizerAdapter(),
             ...
         )
+
+    Args:
+        buffer_pool: Optional pool to draw output buffers from.
     """
 
+    _pool: Optional[BufferPool] = None
+
+    def __init__(self, buffer_pool: Optional[BufferPool] = None) -> None:
+        self._pool = buffer_pool
+
     def synthesize(self, request: SynthesisRequest) -> AudioChunk:
         n_samples = int(_SAMPLE_RATE * _DURATION_S)
         logger.debug(f"[mock] synthesize called for persona='{request.persona}'")
-        return AudioChunk(
-            samples=np.zeros(n_samples, dtype=np.float32),
-            sample_rate=_SAMPLE_RATE,
-            speaker_id="mock",
-        )
+        if self._pool is None:
+            return AudioChunk(samples=np.zeros(n_samples, dtype=np.float32), sample_rate=_SAMPLE_RATE, speaker_id="mock")
+        lease = self._pool.acquire(n_samples)
+        lease.array.fill(0.0)
+        return AudioChunk(samples=lease.array, sample_rate=_SAMPLE_RATE, speaker_id="mock", lease=lease)
+
+    def synthesize_batch(self, requests: Sequence[SynthesisRequest]) -> List[AudioChunk]:
+        return [self.synthesize(request) for request in requests]
 
     def get_speakers(self) -> List[str]:
         return ["mock"]
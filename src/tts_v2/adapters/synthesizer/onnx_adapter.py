@@ -0,0 +1,288 @@
+"""OnnxSynthesizerAdapter — implements SynthesizerPort with onnxruntime.
+
+Runs a VITS graph written by ``coqui_onnx.export_onnx()`` (or
+``tts-v2-export-onnx``) on the onnxruntime CPU execution provider.
+Sentence splitting and the silence between sentences match
+CoquiSynthesizerAdapter, so the two adapters are interchangeable behind
+SynthesizerPort.
+
+Inference itself needs no torch. The default text front-end is Coqui's
+tokenizer, built from the exported config, and Coqui's config classes
+still import torch. Pass ``tokenizer=`` to use a different front-end.
+
+All onnxruntime imports are scoped to this file.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ...domain.audio import AudioChunk, SynthesisRequest
+from ...domain.cancellation import RequestCancelled
+from ...domain.voice import get_speaker
+from ...shared.buffer_pool import BufferPool
+from .coqui_onnx import CONFIG_FILE, MODEL_FILE, read_onnx_manifest
+
+try:
+    import onnxruntime as ort
+except ImportError as exc:
+    raise RuntimeError("onnxruntime not installed. Run: pip install onnxruntime") from exc
+
+logger = logging.getLogger(__name__)
+
+# Same inter-sentence silence as Coqui's Synthesizer.tts().
+_SENTENCE_GAP_SAMPLES = 10000
+_SENTENCE_GAP = np.zeros(_SENTENCE_GAP_SAMPLES, dtype=np.float32)
+_SENTENCE_GAP.setflags(write=False)
+
+_GRAPH_OPTIMIZATION = {
+    "disable": ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+    "basic": ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+    "extended": ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+    "all": ort.GraphOptimizationLevel.ORT_ENABLE_ALL,
+}
+
+
+@dataclass(frozen=True)
+class OnnxSessionConfig:
+    """onnxruntime CPU session settings for OnnxSynthesizerAdapter.
+
+    Thread counts of ``None`` keep onnxruntime's defaults: one intra-op
+    thread per physical core, and sequential execution of graph nodes.
+    When several workers share one host, set ``intra_op_threads`` so that
+    workers × threads does not exceed the number of cores.
+
+    ``allow_spinning=False`` stops idle intra-op threads from busy-waiting
+    between runs. Latency goes up slightly, but cores are left free for
+    the other workers. ``io_binding`` binds the NumPy inputs and the output
+    directly to the session instead of converting the feed dict on every
+    run.
+    """
+
+    intra_op_threads: Optional[int] = None
+    inter_op_threads: Optional[int] = None
+    graph_optimization: str = "all"
+    allow_spinning: bool = True
+    memory_arena: bool = True
+    io_binding: bool = True
+
+    def __post_init__(self) -> None:
+        if self.graph_optimization not in _GRAPH_OPTIMIZATION:
+            raise ValueError(
+                f"graph_optimization must be one of {sorted(_GRAPH_OPTIMIZATION)}, got '{self.graph_optimization}'"
+            )
+
+
+class OnnxSynthesizerAdapter:
+    """Wraps an onnxruntime session over an exported VITS graph to implement SynthesizerPort.
+
+    Args:
+        path:           Export directory written by ``export_onnx()``.
+        session:        Session settings; defaults to ``OnnxSessionConfig()``.
+        noise_scale:    Sampling noise of the flow; default from the export.
+        length_scale:   Duration multiplier; default from the export.
+        noise_scale_dp: Sampling noise of the duration predictor; default
+                        from the export.
+        tokenizer:      ``text → token IDs``; defaults to Coqui's tokenizer
+                        built from the exported config.
+        buffer_pool:    Optional pool for output buffers.
+
+    Raises:
+        ValueError: If ``path`` is not a supported ONNX export.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        session: Optional[OnnxSessionConfig] = None,
+        noise_scale: Optional[float] = None,
+        length_scale: Optional[float] = None,
+        noise_scale_dp: Optional[float] = None,
+        tokenizer: Optional[Callable[[str], Sequence[int]]] = None,
+        buffer_pool: Optional[BufferPool] = None,
+    ) -> None:
+        t0 = time.perf_counter()
+        self.path = path
+        self.manifest = read_onnx_manifest(path)
+        self.model_name = self.manifest["model_name"]
+        self.sample_rate = int(self.manifest["sample_rate"])
+        self.session_config = session or OnnxSessionConfig()
+        default_noise, default_length, default_noise_dp = self.manifest["scales"]
+        self._scales = np.array(
+            [
+                default_noise if noise_scale is None else noise_scale,
+                default_length if length_scale is None else length_scale,
+                default_noise_dp if noise_scale_dp is None else noise_scale_dp,
+            ],
+            dtype=np.float32,
+        )
+        self._speakers: Dict[str, int] = dict(self.manifest["speakers"])
+        self._has_sid = "sid" in self.manifest["inputs"]
+        self._tokenizer = tokenizer or _coqui_tokenizer(os.path.join(path, CONFIG_FILE))
+        self._segmenter = None
+        self._pool = buffer_pool
+
+        self._session = ort.InferenceSession(
+            os.path.join(path, MODEL_FILE),
+            sess_options=self._session_options(self.session_config),
+            providers=["CPUExecutionProvider"],
+        )
+
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._sentences = 0
+        self._infer_s = 0.0
+        self._audio_s = 0.0
+
+        self.load_s = time.perf_counter() - t0
+        logger.info(
+            f"OnnxSynthesizerAdapter ready | model={self.model_name} | "
+            f"opt={self.session_config.graph_optimization} | io_binding={self.session_config.io_binding} | "
+            f"load={self.load_s:.2f}s"
+        )
+
+    # ------------------------------------------------------------------
+    # SynthesizerPort implementation
+    # ------------------------------------------------------------------
+
+    def synthesize(self, request: SynthesisRequest) -> AudioChunk:
+        """Synthesise speech and return an AudioChunk."""
+        speaker_id = request.speaker_id if request.speaker_id is not None else get_speaker(request.persona).speaker_id
+        logger.info(
+            f"[synthesize] persona='{request.persona}' | "
+            f"speaker='{speaker_id}' | "
+            f"text_len={len(request.text)}"
+        )
+
+        t0 = time.perf_counter()
+        try:
+            pieces = self._infer_sentences(request.text, speaker_id, request)
+        except RequestCancelled:
+            raise
+        except Exception as exc:
+            logger.error(f"[synthesize] ONNX synthesis failed: {exc}")
+            raise RuntimeError(f"ONNX synthesis failed: {exc}") from exc
+
+        chunk = self._to_chunk(pieces, speaker_id)
+        with self._lock:
+            self._requests += 1
+            self._sentences += len(pieces) // 2
+            self._infer_s += time.perf_counter() - t0
+            self._audio_s += chunk.duration_s
+        logger.info(f"[synthesize] produced {chunk.duration_s:.2f}s AudioChunk")
+        return chunk
+
+    def get_speakers(self) -> List[str]:
+        """Return the speaker names recorded in the export."""
+        return list(self._speakers)
+
+    def memory_bytes(self) -> int:
+        """Return the size of the serialised graph (weights included)."""
+        return int(self.manifest["onnx_bytes"])
+
+    def stats(self) -> Dict[str, Any]:
+        """Return request / sentence counts and the measured real-time factor."""
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "sentences": self._sentences,
+                "infer_s": round(self._infer_s, 4),
+                "audio_s": round(self._audio_s, 4),
+                "rtf": round(self._infer_s / self._audio_s, 4) if self._audio_s else 0.0,
+            }
+
+    # ------------------------------------------------------------------
+    # Inference
+    # ------------------------------------------------------------------
+
+    def _infer_sentences(
+        self, text: str, speaker_id: str, request: Optional[SynthesisRequest] = None
+    ) -> List[np.ndarray]:
+        """Per-sentence graph runs + trailing silence, like CoquiSynthesizerAdapter.
+
+        Raises:
+            RequestCancelled: If ``request`` is cancelled or expires between sentences.
+        """
+        sid = np.array([self._speakers[speaker_id]], dtype=np.int64) if self._has_sid else None
+        pieces: List[np.ndarray] = []
+        for sentence in self._split_sentences(text):
+            if request is not None:
+                request.check_cancelled()
+            ids = np.asarray(self._tokenizer(sentence), dtype=np.int64).reshape(1, -1)
+            pieces.append(self._run(ids, sid))
+            pieces.append(_SENTENCE_GAP)
+        return pieces
+
+    def _run(self, ids: np.ndarray, sid: Optional[np.ndarray]) -> np.ndarray:
+        """One graph run; returns the waveform as float32."""
+        feeds = {
+            "input": ids,
+            "input_lengths": np.array([ids.shape[1]], dtype=np.int64),
+            "scales": self._scales,
+        }
+        if sid is not None:
+            feeds["sid"] = sid
+        if not self.session_config.io_binding:
+            output = self._session.run(["output"], feeds)[0]
+        else:
+            # A binding holds per-run state, so each call gets its own.
+            binding = self._session.io_binding()
+            for name, value in feeds.items():
+                binding.bind_cpu_input(name, value)
+            binding.bind_output("output", "cpu")
+            self._session.run_with_iobinding(binding)
+            output = binding.get_outputs()[0].numpy()
+        return output.reshape(-1).astype(np.float32, copy=False)
+
+    def _split_sentences(self, text: str) -> List[str]:
+        if self._segmenter is None:
+            import pysbd
+
+            self._segmenter = pysbd.Segmenter(language="en", clean=True)
+        return self._segmenter.segment(text)
+
+    def _to_chunk(self, pieces: Sequence[np.ndarray], speaker_id: str) -> AudioChunk:
+        """Join segments into an AudioChunk, in a pooled buffer when configured."""
+        total = sum(p.size for p in pieces)
+        if self._pool is None:
+            samples = np.concatenate(pieces) if pieces else np.zeros(0, dtype=np.float32)
+            return AudioChunk(samples=samples, sample_rate=self.sample_rate, speaker_id=speaker_id)
+        lease = self._pool.acquire(total)
+        offset = 0
+        for piece in pieces:
+            lease.array[offset: offset + piece.size] = piece
+            offset += piece.size
+        return AudioChunk(samples=lease.array, sample_rate=self.sample_rate, speaker_id=speaker_id, lease=lease)
+
+    @staticmethod
+    def _session_options(config: OnnxSessionConfig) -> "ort.SessionOptions":
+        options = ort.SessionOptions()
+        options.graph_optimization_level = _GRAPH_OPTIMIZATION[config.graph_optimization]
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        if config.intra_op_threads:
+            options.intra_op_num_threads = config.intra_op_threads
+        if config.inter_op_threads:
+            options.inter_op_num_threads = config.inter_op_threads
+        options.enable_cpu_mem_arena = config.memory_arena
+        options.add_session_config_entry("session.intra_op.allow_spinning", "1" if config.allow_spinning else "0")
+        return options
+
+    def __repr__(self) -> str:
+        return (
+            f"OnnxSynthesizerAdapter(model={self.model_name!r}, "
+            f"opt={self.session_config.graph_optimization!r}, io_binding={self.session_config.io_binding})"
+        )
+
+
+def _coqui_tokenizer(config_path: str) -> Callable[[str], Sequence[int]]:
+    """Coqui's TTSTokenizer for an exported config, as a ``text → IDs`` callable."""
+    from TTS.config import load_config
+    from TTS.tts.utils.text.tokenizer import TTSTokenizer
+
+    tokenizer, _ = TTSTokenizer.init_from_config(load_config(config_path))
+    return tokenizer.text_to_ids
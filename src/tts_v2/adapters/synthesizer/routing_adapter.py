@@ -0,0 +1,292 @@
+"""RoutingSynthesizerAdapter — serves personas from several models in one process.
+
+Each persona is routed to a (model, speaker_id) pair; single-speaker models
+are routed without a speaker ID. Models are built by a
+factory on first use and kept resident in LRU order; when the estimated
+resident size of all loaded models exceeds the configured budget, the
+least-recently-used idle models are evicted.
+
+No framework imports here — the factories own all model-specific code.
+"""
+
+import gc
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, List, Optional
+
+from ...domain.audio import AudioChunk, SynthesisRequest
+from ...domain.voice import NO_SPEAKER
+from ...ports.synthesizer_port import SynthesizerPort
+
+logger = logging.getLogger(__name__)
+
+ModelFactory = Callable[[], SynthesizerPort]
+EventListener = Callable[[Dict[str, Any]], None]
+
+
+@dataclass(frozen=True)
+class ModelSpec:
+    """How to build one backend model and how much memory it is expected to use."""
+
+    key: str                              # e.g. "vctk_vits"
+    factory: ModelFactory                 # zero-arg callable returning a SynthesizerPort
+    memory_bytes: Optional[int] = None    # None → ask the adapter / measure RSS delta
+
+
+@dataclass(frozen=True)
+class PersonaRoute:
+    """Maps a persona onto a model key and that model's speaker ID."""
+
+    model_key: str
+    speaker_id: Optional[str] = None      # None → single-speaker model
+
+
+@dataclass
+class _LoadedModel:
+    adapter: SynthesizerPort
+    memory_bytes: int
+    in_use: int = 0
+
+
+def _rss_bytes() -> int:
+    """Current resident set size in bytes (Linux), or 0 if unavailable."""
+    try:
+        import os
+
+        with open("/proc/self/statm", "r", encoding="ascii") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return 0
+
+
+class RoutingSynthesizerAdapter:
+    """Implements SpeakerRoutingPort by dispatching each persona to its own model.
+
+    Usage::
+
+        router = RoutingSynthesizerAdapter(memory_budget_bytes=2 * 1024**3)
+        router.register_model("vctk", lambda: CoquiSynthesizerAdapter())
+        router.register_model("ljspeech", lambda: CoquiSynthesizerAdapter(
+            model_name="tts_models/en/ljspeech/vits"))
+        router.route_persona("professional_male", "vctk", "p225")
+        router.route_persona("narrator", "ljspeech")
+
+    Load and eviction events are logged and, if ``listener`` is given,
+    passed to it as dicts (``{"event": "model_load", ...}``) so they can be
+    forwarded to metrics or an audit trail.
+
+    Args:
+        memory_budget_bytes: Soft cap on the summed footprint of resident models.
+        listener:            Optional callback receiving load/evict events.
+    """
+
+    def __init__(
+        self,
+        memory_budget_bytes: int,
+        listener: Optional[EventListener] = None,
+    ) -> None:
+        if memory_budget_bytes <= 0:
+            raise ValueError(f"memory_budget_bytes must be > 0, got {memory_budget_bytes}")
+        self._budget = memory_budget_bytes
+        self._listener = listener
+        self._specs: Dict[str, ModelSpec] = {}
+        self._routes: Dict[str, PersonaRoute] = {}
+        self._loaded: "OrderedDict[str, _LoadedModel]" = OrderedDict()
+        self._lock = threading.Lock()        # guards _loaded and counters
+        self._load_lock = threading.Lock()   # serialises model construction
+        self._loads = 0
+        self._evictions = 0
+
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+
+    def register_model(
+        self,
+        key: str,
+        factory: ModelFactory,
+        memory_bytes: Optional[int] = None,
+    ) -> None:
+        """Declare a model that can be loaded on demand."""
+        self._specs[key] = ModelSpec(key=key, factory=factory, memory_bytes=memory_bytes)
+        logger.info(f"[router] registered model '{key}'")
+
+    def route_persona(self, persona: str, model_key: str, speaker_id: Optional[str] = None) -> None:
+        """Serve ``persona`` from ``model_key`` using that model's ``speaker_id``.
+
+        Leave ``speaker_id`` unset for single-speaker models.
+        """
+        if model_key not in self._specs:
+            raise ValueError(f"Unknown model '{model_key}'. Registered: {list(self._specs)}")
+        self._routes[persona] = PersonaRoute(model_key=model_key, speaker_id=speaker_id)
+        logger.info(f"[router] persona '{persona}' → model '{model_key}' speaker '{speaker_id}'")
+
+    # ------------------------------------------------------------------
+    # SynthesizerPort implementation
+    # ------------------------------------------------------------------
+
+    def synthesize(self, request: SynthesisRequest) -> AudioChunk:
+        route = self._routes.get(request.persona)
+        if route is None:
+            raise RuntimeError(
+                f"No model route for persona '{request.persona}'. "
+                f"Routed personas: {list(self._routes)}"
+            )
+        loaded = self._acquire(route.model_key)
+        try:
+            return loaded.adapter.synthesize(replace(request, speaker_id=self._route_speaker(route)))
+        finally:
+            with self._lock:
+                loaded.in_use -= 1
+
+    def get_speakers(self) -> List[str]:
+        """Return the routed speaker IDs (does not load any model)."""
+        return sorted({route.speaker_id for route in self._routes.values() if route.speaker_id})
+
+    def speaker_for(self, persona: str) -> Optional[str]:
+        """Return the speaker ID ``persona`` is routed to, or ``None`` if unrouted."""
+        route = self._routes.get(persona)
+        return None if route is None else self._route_speaker(route)
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def loaded_models(self) -> List[str]:
+        """Resident model keys, least-recently-used first."""
+        with self._lock:
+            return list(self._loaded)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "loaded": list(self._loaded),
+                "resident_bytes": self._resident_bytes(),
+                "budget_bytes": self._budget,
+                "loads": self._loads,
+                "evictions": self._evictions,
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _acquire(self, key: str) -> _LoadedModel:
+        """Return the resident model for ``key``, loading it if needed, marked in-use."""
+        with self._lock:
+            loaded = self._loaded.get(key)
+            if loaded is not None:
+                self._loaded.move_to_end(key)
+                loaded.in_use += 1
+                return loaded
+
+        with self._load_lock:
+            # Another thread may have finished loading while we waited.
+            with self._lock:
+                loaded = self._loaded.get(key)
+                if loaded is not None:
+                    self._loaded.move_to_end(key)
+                    loaded.in_use += 1
+                    return loaded
+
+            spec = self._specs.get(key)
+            if spec is None:
+                raise RuntimeError(f"Model '{key}' is routed but not registered")
+
+            if spec.memory_bytes is not None:
+                self._evict_for(spec.memory_bytes)
+
+            t_start = time.monotonic()
+            rss_before = _rss_bytes()
+            try:
+                adapter = spec.factory()
+            except Exception as exc:
+                logger.error(f"[router] failed to load model '{key}': {exc}")
+                raise RuntimeError(f"Failed to load model '{key}': {exc}") from exc
+            load_s = time.monotonic() - t_start
+            memory_bytes = self._measure(spec, adapter, rss_before)
+
+            with self._lock:
+                loaded = _LoadedModel(adapter=adapter, memory_bytes=memory_bytes, in_use=1)
+                self._loaded[key] = loaded
+                self._loads += 1
+                resident = self._resident_bytes()
+            self._emit({
+                "event": "model_load",
+                "model": key,
+                "memory_bytes": memory_bytes,
+                "load_s": round(load_s, 3),
+                "resident_bytes": resident,
+            })
+            # Estimate was unknown up front — trim others now that we know it.
+            if spec.memory_bytes is None:
+                self._evict_for(0)
+            return loaded
+
+    def _evict_for(self, incoming_bytes: int) -> None:
+        """Evict idle LRU models until ``incoming_bytes`` fits in the budget."""
+        while True:
+            with self._lock:
+                if self._resident_bytes() + incoming_bytes <= self._budget:
+                    return
+                victim_key = next(
+                    (k for k, m in self._loaded.items() if m.in_use == 0), None
+                )
+                if victim_key is None:
+                    logger.warning(
+                        f"[router] over memory budget "
+                        f"({self._resident_bytes() + incoming_bytes} > {self._budget} bytes) "
+                        f"but every resident model is busy"
+                    )
+                    return
+                victim = self._loaded.pop(victim_key)
+                self._evictions += 1
+                resident = self._resident_bytes()
+
+            close = getattr(victim.adapter, "close", None)
+            if callable(close):
+                close()
+            del victim
+            gc.collect()
+            self._emit({
+                "event": "model_evict",
+                "model": victim_key,
+                "resident_bytes": resident,
+            })
+
+    @staticmethod
+    def _measure(spec: ModelSpec, adapter: SynthesizerPort, rss_before: int) -> int:
+        if spec.memory_bytes is not None:
+            return spec.memory_bytes
+        reporter = getattr(adapter, "memory_bytes", None)
+        if callable(reporter):
+            try:
+                return int(reporter())
+            except Exception as exc:
+                logger.warning(f"[router] memory_bytes() failed for '{spec.key}': {exc}")
+        return max(_rss_bytes() - rss_before, 0)
+
+    @staticmethod
+    def _route_speaker(route: PersonaRoute) -> str:
+        return NO_SPEAKER if route.speaker_id is None else route.speaker_id
+
+    def _resident_bytes(self) -> int:
+        return sum(m.memory_bytes for m in self._loaded.values())
+
+    def _emit(self, event: Dict[str, Any]) -> None:
+        logger.info(f"[router] {event}")
+        if self._listener is not None:
+            try:
+                self._listener(event)
+            except Exception as exc:
+                logger.warning(f"[router] event listener failed: {exc}")
+
+    def __repr__(self) -> str:
+        return (
+            f"RoutingSynthesizerAdapter(models={list(self._specs)}, "
+            f"budget_bytes={self._budget})"
+        )
@@ -0,0 +1,140 @@
+"""SimulatedSynthesizerAdapter — latency-modelled stand-in for a real model.
+
+MockSynthesizerAdapter answers instantly with one second of silence, which
+hides every queueing effect. This adapter models a backend well enough for
+offline capacity planning:
+
+* audio duration grows with text length (``chars_per_second``);
+* compute time is ``duration × rtf``, scaled by log-normal ``jitter``;
+* at most ``max_parallel`` renders run at once — the device is a shared
+  resource, so extra callers queue exactly as they would on a real model;
+* ``failure_rate`` of calls raise RuntimeError;
+* a request cancelled or expired while waiting for the device raises
+  RequestCancelled instead of rendering.
+
+``synthesize_batch()`` models a padded forward pass: the batch costs its
+slowest member plus ``batch_overhead`` of that per extra row.
+
+No framework imports; the output is silence drawn from an optional pool.
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+
+from ...domain.audio import AudioChunk, SynthesisRequest
+from ...shared.buffer_pool import BufferPool
+
+logger = logging.getLogger(__name__)
+
+
+class SimulatedSynthesizerAdapter:
+    """Implements SynthesizerPort (and BatchSynthesizerPort) with modelled latency.
+
+    Args:
+        rtf:              Mean compute seconds per audio second.
+        chars_per_second: Speaking rate used to derive audio duration.
+        jitter:           Sigma of the log-normal compute-time multiplier (0 = none).
+        failure_rate:     Probability that a call raises RuntimeError.
+        max_parallel:     Concurrent renders the simulated device admits.
+        batch_overhead:   Extra cost per additional batch row, as a fraction
+                          of the slowest row.
+        sample_rate:      Output sample rate in Hz.
+        seed:             Seed for jitter and failures (None → nondeterministic).
+        buffer_pool:      Optional pool to draw output buffers from.
+        sleep:            Injected for tests; defaults to ``time.sleep``.
+    """
+
+    def __init__(
+        self,
+        rtf: float = 0.3,
+        chars_per_second: float = 15.0,
+        jitter: float = 0.1,
+        failure_rate: float = 0.0,
+        max_parallel: int = 1,
+        batch_overhead: float = 0.1,
+        sample_rate: int = 22050,
+        seed: Optional[int] = None,
+        buffer_pool: Optional[BufferPool] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rtf < 0 or chars_per_second <= 0:
+            raise ValueError("rtf must be ≥ 0 and chars_per_second > 0")
+        if not 0.0 <= failure_rate <= 1.0:
+            raise ValueError(f"failure_rate must be in [0, 1], got {failure_rate}")
+        if max_parallel < 1:
+            raise ValueError(f"max_parallel must be ≥ 1, got {max_parallel}")
+        self.rtf = rtf
+        self.chars_per_second = chars_per_second
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.max_parallel = max_parallel
+        self.batch_overhead = batch_overhead
+        self.sample_rate = sample_rate
+        self._pool = buffer_pool
+        self._sleep = sleep
+        self._device = threading.BoundedSemaphore(max_parallel)
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # SynthesizerPort implementation
+    # ------------------------------------------------------------------
+
+    def synthesize(self, request: SynthesisRequest) -> AudioChunk:
+        duration_s = self.duration_for(request.text)
+        compute_s, fail = self._draw(duration_s)
+        with self._device:
+            request.check_cancelled()
+            self._sleep(compute_s)
+        if fail:
+            raise RuntimeError("Simulated synthesis failure")
+        logger.debug(f"[simulated] {duration_s:.2f}s audio in {compute_s:.3f}s for persona='{request.persona}'")
+        return self._silence(duration_s, "simulated" if request.speaker_id is None else request.speaker_id)
+
+    def synthesize_batch(self, requests: Sequence[SynthesisRequest]) -> List[AudioChunk]:
+        if not requests:
+            return []
+        durations = [self.duration_for(r.text) for r in requests]
+        draws = [self._draw(d) for d in durations]
+        slowest = max(compute for compute, _ in draws)
+        with self._device:
+            self._sleep(slowest * (1.0 + self.batch_overhead * (len(requests) - 1)))
+        if any(fail for _, fail in draws):
+            raise RuntimeError("Simulated batch synthesis failure")
+        return [self._silence(d, "simulated" if r.speaker_id is None else r.speaker_id) for d, r in zip(durations, requests)]
+
+    def get_speakers(self) -> List[str]:
+        return ["simulated"]
+
+    # ------------------------------------------------------------------
+    # Model
+    # ------------------------------------------------------------------
+
+    def duration_for(self, text: str) -> float:
+        """Audio seconds produced for ``text``."""
+        return max(1, len(text)) / self.chars_per_second
+
+    def _draw(self, duration_s: float):
+        with self._rng_lock:
+            multiplier = self._rng.lognormvariate(0.0, self.jitter) if self.jitter > 0 else 1.0
+            fail = self.failure_rate > 0 and self._rng.random() < self.failure_rate
+        return duration_s * self.rtf * multiplier, fail
+
+    def _silence(self, duration_s: float, speaker_id: str) -> AudioChunk:
+        n_samples = int(duration_s * self.sample_rate)
+        if self._pool is None:
+            return AudioChunk(samples=np.zeros(n_samples, dtype=np.float32), sample_rate=self.sample_rate, speaker_id=speaker_id)
+        lease = self._pool.acquire(n_samples)
+        lease.array.fill(0.0)
+        return AudioChunk(samples=lease.array, sample_rate=self.sample_rate, speaker_id=speaker_id, lease=lease)
+
+    def __repr__(self) -> str:
+        return (
+            f"SimulatedSynthesizerAdapter(rtf={self.rtf}, jitter={self.jitter}, "
+            f"failure_rate={self.failure_rate}, max_parallel={self.max_parallel})"
+        )
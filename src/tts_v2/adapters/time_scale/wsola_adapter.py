@@ -0,0 +1,129 @@
+"""WsolaTimeScalerAdapter — pitch-preserving speaking-rate change in NumPy.
+
+WSOLA (waveform-similarity overlap-add) cuts the input into Hann-windowed
+frames and lays them down at a fixed synthesis hop. Analysis positions
+advance by ``hop × rate``, so the output is ``1 / rate`` times as long.
+Each frame may shift by up to ``tolerance_ms`` from its nominal position;
+the shift that best continues the previous frame (highest
+cross-correlation with the audio that naturally followed it) is chosen.
+Overlapping frames therefore stay in phase and pitch is unchanged.
+
+Only the position search is sequential — each search depends on the
+previous choice — and it is one ``np.correlate`` call per frame. Frame
+gathering, windowing and overlap-add are whole-array operations. With 50 % overlap, periodic Hann windows sum to
+exactly one, so no gain normalisation is needed.
+
+Cost is roughly ``(2 × tolerance + 1) × frame`` multiply-adds per output
+hop: about 2 ms per second of 22.05 kHz audio, a small fraction of VITS
+synthesis time on CPU (``benchmarks/bench_time_scale.py``).
+"""
+
+import logging
+from dataclasses import replace
+from typing import Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ...domain.audio import MAX_SPEAKING_RATE, MIN_SPEAKING_RATE, AudioChunk
+from ...shared.buffer_pool import BufferPool
+
+logger = logging.getLogger(__name__)
+
+
+def wsola(samples: np.ndarray, rate: float, frame_len: int, tolerance: int) -> np.ndarray:
+    """Time-scale ``samples`` by ``1 / rate`` with WSOLA.
+
+    Args:
+        samples:   Mono float waveform.
+        rate:      Speed-up factor (> 1 shortens).
+        frame_len: Frame length in samples; rounded up to even.
+        tolerance: Largest shift, in samples, from a frame's nominal position.
+
+    Returns:
+        New float32 array of ``round(len(samples) / rate)`` samples.
+    """
+    frame_len += frame_len % 2
+    hop = frame_len // 2
+    out_len = int(round(samples.size / rate))
+    n_frames = out_len // hop + 2
+
+    # Nominal analysis start of each frame, relative to ``hop`` zeros placed
+    # before the signal so the first output hop is not faded in.
+    nominal = np.round(np.arange(n_frames) * (hop * rate)).astype(np.int64)
+    padded_len = int(nominal[-1]) + 2 * tolerance + hop + frame_len + 1
+    padded = np.zeros(max(padded_len, tolerance + hop + samples.size), dtype=np.float32)
+    padded[tolerance + hop: tolerance + hop + samples.size] = samples
+    windows = sliding_window_view(padded, frame_len)
+
+    # Candidate starts for frame k are nominal[k] + 0 … 2·tolerance in
+    # ``padded`` (nominal ± tolerance in signal coordinates).
+    starts = np.empty(n_frames, dtype=np.int64)
+    starts[0] = tolerance
+    for k in range(1, n_frames):
+        follow = starts[k - 1] + hop
+        region = padded[nominal[k]: nominal[k] + 2 * tolerance + frame_len]
+        scores = np.correlate(region, padded[follow: follow + frame_len], "valid")
+        best = int(np.argmax(scores))
+        starts[k] = nominal[k] + (best if scores[best] > 0 else tolerance)
+
+    window = (0.5 - 0.5 * np.cos(2 * np.pi * np.arange(frame_len) / frame_len)).astype(np.float32)
+    frames = windows[starts] * window
+    out = frames[:, :hop].copy()
+    out[1:] += frames[:-1, hop:]
+    return out.reshape(-1)[hop: hop + out_len]
+
+
+class WsolaTimeScalerAdapter:
+    """Implements TimeScalerPort with WSOLA.
+
+    Args:
+        frame_ms:     Analysis frame length. 20–30 ms spans two or more
+                      pitch periods of adult speech.
+        tolerance_ms: Largest shift searched around each nominal frame
+                      position; should cover one pitch period (≥ 12 ms
+                      for voices down to ~80 Hz).
+        buffer_pool:  Optional pool for output buffers.
+
+    Raises:
+        ValueError: From :meth:`retime` if ``rate`` is outside
+                    [MIN_SPEAKING_RATE, MAX_SPEAKING_RATE].
+    """
+
+    def __init__(
+        self,
+        frame_ms: float = 25.0,
+        tolerance_ms: float = 12.0,
+        buffer_pool: Optional[BufferPool] = None,
+    ) -> None:
+        if frame_ms <= 0 or tolerance_ms < 0:
+            raise ValueError(f"frame_ms must be > 0 and tolerance_ms ≥ 0, got {frame_ms}, {tolerance_ms}")
+        self.frame_ms = frame_ms
+        self.tolerance_ms = tolerance_ms
+        self._pool = buffer_pool
+
+    # ------------------------------------------------------------------
+    # TimeScalerPort implementation
+    # ------------------------------------------------------------------
+
+    def retime(self, chunk: AudioChunk, rate: float) -> AudioChunk:
+        if not MIN_SPEAKING_RATE <= rate <= MAX_SPEAKING_RATE:
+            raise ValueError(f"rate must be in [{MIN_SPEAKING_RATE}, {MAX_SPEAKING_RATE}], got {rate}")
+        if rate == 1.0 or chunk.samples.size == 0:
+            return chunk
+
+        frame_len = max(2, int(chunk.sample_rate * self.frame_ms / 1000))
+        tolerance = int(chunk.sample_rate * self.tolerance_ms / 1000)
+        scaled = wsola(np.asarray(chunk.samples, dtype=np.float32), rate, frame_len, tolerance)
+        logger.debug(f"[retime] rate={rate:.2f} | {chunk.duration_s:.2f}s → {scaled.size / chunk.sample_rate:.2f}s")
+
+        lease = None
+        if self._pool is not None:
+            lease = self._pool.acquire(scaled.size)
+            lease.array[:] = scaled
+            scaled = lease.array
+        chunk.release()
+        return replace(chunk, samples=scaled, lease=lease)
+
+    def __repr__(self) -> str:
+        return f"WsolaTimeScalerAdapter(frame_ms={self.frame_ms}, tolerance_ms={self.tolerance_ms})"
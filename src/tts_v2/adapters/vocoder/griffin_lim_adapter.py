@@ -0,0 +1,288 @@
+"""GriffinLimVocoderAdapter — model-free CPU vocoder for two-stage pipelines.
+
+Inverts a mel-spectrogram with fast Griffin-Lim (Perraudin et al., 2013)
+on vectorised NumPy STFT/ISTFT. The mel filterbank, its pseudo-inverse,
+the analysis window and the overlap-add window envelopes are computed once
+per adapter, so per-call cost is the FFTs plus a few matrix products.
+
+``vocode_stream()`` converts mel frames incrementally. Each block is
+solved with the previous block's final phases pinned on its left context
+frames; because emitted samples only ever depend on pinned frames, the
+streamed output is seam-free overlap-add of one consistent phase
+assignment and can be played out while the acoustic model is still
+producing frames.
+
+Quality is well below a neural vocoder — this is the offline reference for
+two-stage latency, not a production voice.
+"""
+
+import logging
+from typing import Dict, Iterable, Iterator, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _hz_to_mel(hz: np.ndarray) -> np.ndarray:
+    """Slaney mel scale (linear below 1 kHz, logarithmic above)."""
+    hz = np.atleast_1d(np.asarray(hz, dtype=np.float64))
+    f_sp = 200.0 / 3
+    mels = hz / f_sp
+    min_log_hz, min_log_mel, logstep = 1000.0, 1000.0 / f_sp, np.log(6.4) / 27.0
+    log_region = hz >= min_log_hz
+    mels[log_region] = min_log_mel + np.log(hz[log_region] / min_log_hz) / logstep
+    return mels
+
+
+def _mel_to_hz(mels: np.ndarray) -> np.ndarray:
+    mels = np.atleast_1d(np.asarray(mels, dtype=np.float64))
+    f_sp = 200.0 / 3
+    hz = f_sp * mels
+    min_log_hz, min_log_mel, logstep = 1000.0, 1000.0 / f_sp, np.log(6.4) / 27.0
+    log_region = mels >= min_log_mel
+    hz[log_region] = min_log_hz * np.exp(logstep * (mels[log_region] - min_log_mel))
+    return hz
+
+
+def mel_filterbank(
+    sample_rate: int,
+    n_fft: int,
+    n_mels: int,
+    fmin: float = 0.0,
+    fmax: Optional[float] = None,
+) -> np.ndarray:
+    """Slaney-normalised triangular mel filterbank, shape (n_mels, n_fft // 2 + 1)."""
+    fmax = fmax if fmax is not None else sample_rate / 2
+    fft_freqs = np.linspace(0.0, sample_rate / 2, n_fft // 2 + 1)
+    mel_range = _hz_to_mel(np.array([fmin, fmax]))
+    mel_points = _mel_to_hz(np.linspace(mel_range[0], mel_range[1], n_mels + 2))
+    fdiff = np.diff(mel_points)
+    ramps = mel_points[:, None] - fft_freqs[None, :]
+    lower = -ramps[:-2] / fdiff[:-1, None]
+    upper = ramps[2:] / fdiff[1:, None]
+    weights = np.maximum(0.0, np.minimum(lower, upper))
+    weights *= (2.0 / (mel_points[2:] - mel_points[:-2]))[:, None]
+    return weights.astype(np.float32)
+
+
+class GriffinLimVocoderAdapter:
+    """Implements VocoderPort by Griffin-Lim phase reconstruction.
+
+    Args:
+        sample_rate: Output sample rate in Hz.
+        n_fft:       FFT size (a multiple of ``hop_length``, at least 2×).
+        hop_length:  Frame hop in samples.
+        n_mels:      Number of mel bands expected in the input.
+        fmin, fmax:  Mel filterbank frequency range.
+        n_iter:      Griffin-Lim iterations per call / per streamed block.
+        momentum:    Fast Griffin-Lim momentum (0 gives classic GL).
+        power:       Exponent the mel magnitudes were raised to (1 = magnitude, 2 = power).
+        log_input:   True if input mels are natural-log compressed.
+        seed:        Seed for the initial random phases.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 22050,
+        n_fft: int = 1024,
+        hop_length: int = 256,
+        n_mels: int = 80,
+        fmin: float = 0.0,
+        fmax: Optional[float] = 8000.0,
+        n_iter: int = 32,
+        momentum: float = 0.99,
+        power: float = 1.0,
+        log_input: bool = False,
+        seed: int = 0,
+    ) -> None:
+        if n_fft % hop_length or n_fft < 2 * hop_length:
+            raise ValueError(
+                f"n_fft ({n_fft}) must be a multiple of hop_length ({hop_length}) and at least twice it"
+            )
+        self.sample_rate = sample_rate
+        self.n_fft = n_fft
+        self.hop_length = hop_length
+        self.n_mels = n_mels
+        self.n_iter = n_iter
+        self.momentum = momentum
+        self.power = power
+        self.log_input = log_input
+        self._seed = seed
+        self._overlap = n_fft // hop_length
+
+        self._mel_basis = mel_filterbank(sample_rate, n_fft, n_mels, fmin, fmax)
+        self._mel_inverse = np.linalg.pinv(self._mel_basis).astype(np.float32)
+        self._window = np.hanning(n_fft + 1)[:-1].astype(np.float32)  # periodic Hann
+        self._envelopes: Dict[int, np.ndarray] = {}
+
+    # ------------------------------------------------------------------
+    # VocoderPort implementation
+    # ------------------------------------------------------------------
+
+    def vocode(self, mel: np.ndarray) -> np.ndarray:
+        """Convert a full mel-spectrogram (n_mels × T) to a float32 waveform."""
+        mag = self._mel_to_magnitude(mel)
+        angles = self._initial_angles(mag.shape[0], np.random.default_rng(self._seed))
+        angles = self._griffin_lim(mag, angles, n_fixed=0)
+        wav = self._istft(mag * angles)
+        pad = self.n_fft // 2
+        return wav[pad: pad + (mag.shape[0] - 1) * self.hop_length]
+
+    def is_passthrough(self) -> bool:
+        return False
+
+    # ------------------------------------------------------------------
+    # Streaming
+    # ------------------------------------------------------------------
+
+    def vocode_stream(
+        self,
+        mel_chunks: Iterable[np.ndarray],
+        chunk_frames: int = 16,
+    ) -> Iterator[np.ndarray]:
+        """Convert mel frames incrementally, yielding waveform blocks.
+
+        Each yielded block covers ``chunk_frames * hop_length`` samples
+        (the last one may differ). A block is released once ``overlap - 1``
+        lookahead frames beyond it have arrived, so algorithmic latency is
+        ``(chunk_frames + n_fft / hop_length - 1)`` frames. The concatenated
+        output has the same length as ``vocode()`` on the full mel.
+
+        Args:
+            mel_chunks:   Iterable of (n_mels × t_i) mel blocks, in order.
+            chunk_frames: Frames finalised per Griffin-Lim block.
+        """
+        if chunk_frames < 1:
+            raise ValueError(f"chunk_frames must be >= 1, got {chunk_frames}")
+        rng = np.random.default_rng(self._seed)
+        context = lookahead = self._overlap - 1
+        hop, pad = self.hop_length, self.n_fft // 2
+
+        mags = np.zeros((0, self.n_fft // 2 + 1), dtype=np.float32)
+        angles = np.zeros((0, self.n_fft // 2 + 1), dtype=np.complex64)
+        base = 0          # global index of mags[0] / angles[0]
+        start = 0         # first frame not yet finalised
+        emitted = 0       # global sample index of the next sample to emit (uncentered)
+
+        def solve(end: int, final: bool):
+            nonlocal mags, angles, base, start, emitted
+            b0 = max(0, start - context)
+            b1 = mags.shape[0] + base if final else end + lookahead
+            block_mag = mags[b0 - base: b1 - base]
+            fixed = angles[b0 - base: start - base]
+            block_angles = np.concatenate(
+                [fixed, self._initial_angles(block_mag.shape[0] - fixed.shape[0], rng)]
+            )
+            block_angles = self._griffin_lim(block_mag, block_angles, n_fixed=fixed.shape[0])
+            wav = self._istft(block_mag * block_angles)
+
+            stop = (b1 - 1) * hop + pad if final else end * hop
+            lo = max(emitted, pad)
+            out = wav[lo - b0 * hop: stop - b0 * hop] if stop > lo else wav[:0]
+            emitted = max(emitted, stop)
+
+            finished = b1 if final else end
+            angles = np.concatenate([angles[: start - base], block_angles[start - b0: finished - b0]])
+            start = finished
+            keep_from = max(0, start - context)
+            mags, angles = mags[keep_from - base:], angles[keep_from - base:]
+            base = keep_from
+            return out
+
+        for mel in mel_chunks:
+            mags = np.concatenate([mags, self._mel_to_magnitude(mel)])
+            while mags.shape[0] + base - start >= chunk_frames + lookahead:
+                block = solve(start + chunk_frames, final=False)
+                if block.size:
+                    yield block
+        if mags.shape[0] + base > start:
+            block = solve(mags.shape[0] + base, final=True)
+            if block.size:
+                yield block
+
+    # ------------------------------------------------------------------
+    # Analysis helper
+    # ------------------------------------------------------------------
+
+    def mel_spectrogram(self, samples: np.ndarray) -> np.ndarray:
+        """Centred magnitude mel-spectrogram (n_mels × T) in this adapter's format."""
+        pad = self.n_fft // 2
+        padded = np.pad(np.asarray(samples, dtype=np.float32), pad, mode="reflect")
+        mel = self._mel_basis @ np.abs(self._stft(padded)).T
+        if self.power != 1.0:
+            mel = mel ** self.power
+        return np.log(np.maximum(mel, 1e-5)) if self.log_input else mel
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _mel_to_magnitude(self, mel: np.ndarray) -> np.ndarray:
+        """(n_mels × T) mel → (T × F) linear magnitude via the pseudo-inverse."""
+        mel = np.asarray(mel, dtype=np.float32)
+        if mel.ndim != 2 or mel.shape[0] != self.n_mels:
+            raise ValueError(f"Expected mel of shape ({self.n_mels}, T), got {mel.shape}")
+        if self.log_input:
+            mel = np.exp(mel)
+        mag = np.maximum(self._mel_inverse @ mel, 0.0)
+        if self.power != 1.0:
+            mag = mag ** (1.0 / self.power)
+        return np.ascontiguousarray(mag.T, dtype=np.float32)
+
+    def _initial_angles(self, n_frames: int, rng: np.random.Generator) -> np.ndarray:
+        phase = rng.uniform(0.0, 2 * np.pi, size=(n_frames, self.n_fft // 2 + 1))
+        return np.exp(1j * phase).astype(np.complex64)
+
+    def _griffin_lim(self, mag: np.ndarray, angles: np.ndarray, n_fixed: int) -> np.ndarray:
+        """Fast Griffin-Lim; the first ``n_fixed`` frames keep their given phase."""
+        fixed = angles[:n_fixed].copy()
+        previous = np.zeros_like(angles)
+        alpha = self.momentum / (1.0 + self.momentum)
+        for _ in range(self.n_iter):
+            rebuilt = self._stft(self._istft(mag * angles))
+            angles = rebuilt - alpha * previous
+            angles /= np.abs(angles) + 1e-8
+            angles[:n_fixed] = fixed
+            previous = rebuilt
+        return angles
+
+    def _stft(self, samples: np.ndarray) -> np.ndarray:
+        """Uncentred STFT, shape (T × F) with T = 1 + (len - n_fft) // hop."""
+        frames = np.lib.stride_tricks.sliding_window_view(samples, self.n_fft)[:: self.hop_length]
+        return np.fft.rfft(frames * self._window, axis=-1).astype(np.complex64, copy=False)
+
+    def _istft(self, spec: np.ndarray) -> np.ndarray:
+        """Windowed overlap-add inverse of ``_stft`` (vectorised across frames)."""
+        n_frames = spec.shape[0]
+        frames = np.fft.irfft(spec, n=self.n_fft, axis=-1).astype(np.float32, copy=False)
+        frames *= self._window
+        wav = self._overlap_add(frames.reshape(n_frames, self._overlap, self.hop_length))
+        return wav / self._envelope(n_frames)
+
+    def _overlap_add(self, segments: np.ndarray) -> np.ndarray:
+        """Sum (T × overlap × hop) frame segments into a (T + overlap - 1) * hop signal."""
+        n_frames = segments.shape[0]
+        out = np.zeros((n_frames + self._overlap - 1, self.hop_length), dtype=np.float32)
+        for j in range(self._overlap):
+            out[j: j + n_frames] += segments[:, j, :]
+        return out.reshape(-1)
+
+    def _envelope(self, n_frames: int) -> np.ndarray:
+        """Cached sum of squared windows for ``n_frames`` frames (floored to avoid /0)."""
+        env = self._envelopes.get(n_frames)
+        if env is None:
+            sq = np.broadcast_to(
+                (self._window ** 2).reshape(1, self._overlap, self.hop_length),
+                (n_frames, self._overlap, self.hop_length),
+            )
+            env = np.maximum(self._overlap_add(sq), 1e-8)
+            if len(self._envelopes) < 64:
+                self._envelopes[n_frames] = env
+        return env
+
+    def __repr__(self) -> str:
+        return (
+            f"GriffinLimVocoderAdapter(sample_rate={self.sample_rate}, n_fft={self.n_fft}, "
+            f"hop_length={self.hop_length}, n_mels={self.n_mels}, n_iter={self.n_iter})"
+        )
@@ -1,15 +1,23 @@
 """Domain layer: Speaker identities and audio value objects."""
-from .voice import Speaker, get_speaker, list_personas, register_persona, AGENT_REGISTRY, DEFAULT_PERSONA
-from .audio import AudioChunk, SynthesisRequest, SynthesisResult
+from .voice import Speaker, get_speaker, list_personas, register_persona, AGENT_REGISTRY, DEFAULT_PERSONA, NO_SPEAKER
+from .audio import AudioChunk, SynthesisRequest, SynthesisResult, MIN_SPEAKING_RATE, MAX_SPEAKING_RATE
+from .cancellation import CancellationToken, RequestCancelled
+from .registry import VersionedRegistry
 
 __all__ = [
     "Speaker",
     "AudioChunk",
     "SynthesisRequest",
     "SynthesisResult",
+    "MIN_SPEAKING_RATE",
+    "MAX_SPEAKING_RATE",
     "get_speaker",
     "list_personas",
     "register_persona",
     "AGENT_REGISTRY",
     "DEFAULT_PERSONA",
+    "NO_SPEAKER",
+    "VersionedRegistry",
+    "CancellationToken",
+    "RequestCancelled",
 ]
@@ -7,11 +7,18 @@ No torch, no coqui, no soundfile in this file.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import time
+from dataclasses import dataclass, field, replace
 from typing import Any, Dict, Optional
 
 import numpy as np
 
+from .cancellation import CANCELLED, DEADLINE_EXCEEDED, CancellationToken, RequestCancelled
+
+# Speaking-rate range a SynthesisRequest may ask for (see SynthesisRequest.rate).
+MIN_SPEAKING_RATE = 0.7
+MAX_SPEAKING_RATE = 1.3
+
 
 @dataclass
 class AudioChunk:
@@ -19,11 +26,20 @@ class AudioChunk:
 
     Carries a float32 mono waveform together with its provenance metadata.
     Use ``to_pcm_bytes()`` for IVR / streaming output.
+
+    ``lease`` is set when ``samples`` lives in a pooled buffer (see
+    ``shared.buffer_pool``). Each AudioChunk object holds one reference:
+    call ``release()`` once the audio has been consumed, and ``retain()``
+    to obtain an independent reference for a consumer that outlives the
+    caller (e.g. a background writer). ``dataclasses.replace()`` moves the
+    reference to the new object rather than adding one. Samples must not
+    be read after the last reference is released.
     """
 
     samples: np.ndarray   # float32, mono
     sample_rate: int       # Hz, typically 22050 or 24000
     speaker_id: str        # backend speaker ID used to produce this chunk
+    lease: Optional[Any] = field(default=None, repr=False, compare=False)  # pooled-buffer handle
 
     @property
     def duration_s(self) -> float:
@@ -38,6 +54,18 @@ class AudioChunk:
         pcm = (self.samples * 32767).astype(np.int16)
         return pcm.tobytes()
 
+    def retain(self) -> "AudioChunk":
+        """Return a new AudioChunk holding its own reference to the same samples."""
+        if self.lease is not None:
+            self.lease.retain()
+        return replace(self)
+
+    def release(self) -> None:
+        """Return the pooled buffer once every reference is released. Idempotent per object."""
+        lease, self.lease = self.lease, None
+        if lease is not None:
+            lease.release()
+
     def __repr__(self) -> str:
         return (
             f"AudioChunk(speaker={self.speaker_id!r}, "
@@ -52,12 +80,43 @@ class SynthesisRequest:
 
     Text arriving here is assumed to be pre-normalised. The TTSService
     normalises raw text before creating the request passed to the synthesizer.
+
+    ``speaker_id`` is normally left unset (``None``) and adapters resolve
+    it from the persona registry. Routing adapters set it when a persona is
+    served by a model whose speaker IDs differ from the registry's;
+    ``NO_SPEAKER`` selects the only voice of a single-speaker model.
+
+    ``priority`` orders requests under overload: when the service's
+    overload controller trips, requests below its shedding threshold are
+    rejected first (e.g. marketing prompts at -1 vs. live calls at 0).
+
+    ``rate`` changes the speaking rate without changing pitch (1.2 = 20 %
+    faster). The model always renders at 1.0; the service re-times that
+    base rendition, so rate variants of the same text share one synthesis
+    and one cache entry. Must lie in [MIN_SPEAKING_RATE, MAX_SPEAKING_RATE].
+
+    ``cancel_token`` and ``deadline`` (a ``time.monotonic()`` timestamp)
+    let the caller abandon the request; pipeline stages call
+    :meth:`check_cancelled` between steps. Both survive
+    ``dataclasses.replace()``, so adapters see them on the normalised copy.
     """
 
     text: str                                         # normalised, TTS-ready text
     persona: str                                      # agent persona key
     output_path: Optional[str] = None                 # if set, sink writes to this path
     metadata: Dict[str, Any] = field(default_factory=dict)  # compliance metadata
+    speaker_id: Optional[str] = None                  # backend speaker; None → resolve from persona, "" → single-speaker
+    priority: int = 0                                 # higher = more important; shed lowest first
+    rate: float = 1.0                                 # speaking-rate multiplier; 1.0 = as synthesised
+    cancel_token: Optional[CancellationToken] = field(default=None, compare=False)
+    deadline: Optional[float] = None                  # time.monotonic() after which the result is useless
+
+    def check_cancelled(self) -> None:
+        """Raise RequestCancelled if the token was cancelled or the deadline has passed."""
+        if self.cancel_token is not None and self.cancel_token.cancelled:
+            raise RequestCancelled(CANCELLED, f"Request cancelled: {self.cancel_token.reason}")
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise RequestCancelled(DEADLINE_EXCEEDED, "Request deadline exceeded")
 
 
 @dataclass
@@ -66,6 +125,9 @@ class SynthesisResult:
 
     ``chunk`` is populated when no output_path was requested (in-memory mode).
     ``output_path`` is populated when the audio_sink wrote a file.
+    ``degradation`` names the overload fallback used, if any
+    ("shed", "cached" or "fallback"). ``outcome`` is "ok", "shed",
+    "cancelled" or "deadline_exceeded", as in the audit event.
     """
 
     request: SynthesisRequest
@@ -73,6 +135,8 @@ class SynthesisResult:
     output_path: Optional[str]       # file result
     success: bool
     error: Optional[str] = None
+    degradation: Optional[str] = None
+    outcome: str = "ok"
 
     @property
     def duration_s(self) -> float:
@@ -0,0 +1,59 @@
+"""Domain: cooperative cancellation for in-flight synthesis requests.
+
+Standard library only. A caller that may lose interest in a request (an
+IVR leg that hangs up, an HTTP client that disconnects) attaches a
+:class:`CancellationToken` and/or a deadline to its ``SynthesisRequest``
+and cancels the token from any thread. The pipeline checks the request
+between stages and between segments of multi-segment synthesis and stops
+with :class:`RequestCancelled`; work already running inside one model
+call is not interrupted.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+CANCELLED = "cancelled"
+DEADLINE_EXCEEDED = "deadline_exceeded"
+
+
+class RequestCancelled(Exception):
+    """Raised at a pipeline checkpoint once a request is cancelled or expired.
+
+    ``outcome`` is ``"cancelled"`` or ``"deadline_exceeded"`` and is what
+    the audit event records.
+    """
+
+    def __init__(self, outcome: str, message: str) -> None:
+        super().__init__(message)
+        self.outcome = outcome
+
+
+class CancellationToken:
+    """Thread-safe, one-way cancellation flag shared by a caller and the pipeline."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._reason: Optional[str] = None
+
+    def cancel(self, reason: str = "cancelled by caller") -> None:
+        """Request cancellation. Idempotent; the first reason is kept."""
+        if not self._event.is_set():
+            self._reason = reason
+            self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    @property
+    def reason(self) -> Optional[str]:
+        return self._reason
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until cancelled or ``timeout`` elapses; return ``cancelled``."""
+        return self._event.wait(timeout)
+
+    def __repr__(self) -> str:
+        return f"CancellationToken(cancelled={self.cancelled}, reason={self._reason!r})"
@@ -0,0 +1,126 @@
+"""Domain: copy-on-write versioned registry for runtime-mutable lookup tables.
+
+IMPORTANT: This module has NO external imports — standard library only.
+
+Request threads read personas, abbreviations and domain phrases on every
+call while operators may add entries at runtime. ``VersionedRegistry``
+keeps the current contents as an immutable snapshot paired with a version
+number. Writers build a new dict under a lock and publish it with a single
+attribute assignment, so readers never lock and never observe a
+half-applied update. Structures derived from the contents (compiled
+regexes, flattened lists, caches) key themselves on the version and rebuild
+only when it changes — see :meth:`VersionedRegistry.derived`.
+"""
+
+from __future__ import annotations
+
+import threading
+from types import MappingProxyType
+from typing import Callable, Dict, Generic, Iterator, Mapping, Optional, Tuple, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+T = TypeVar("T")
+
+
+class VersionedRegistry(Mapping[K, V]):
+    """Read-only Mapping view of an atomically swapped, versioned snapshot.
+
+    Reads (``[]``, ``in``, iteration, ``get``) go to the snapshot current at
+    the time of the call. Use :meth:`snapshot` when several reads must see
+    the same contents, e.g. iterating while also looking keys up.
+
+    Args:
+        initial: Starting contents (copied). Version starts at 0.
+    """
+
+    def __init__(self, initial: Optional[Mapping[K, V]] = None) -> None:
+        self._state: Tuple[int, Mapping[K, V]] = (0, MappingProxyType(dict(initial or {})))
+        self._write_lock = threading.Lock()
+
+    # -- reads (lock-free) ----------------------------------------------
+
+    def snapshot(self) -> Tuple[int, Mapping[K, V]]:
+        """Return ``(version, contents)`` as one consistent, immutable pair."""
+        return self._state
+
+    @property
+    def version(self) -> int:
+        """Monotonically increasing; bumped by every successful write."""
+        return self._state[0]
+
+    def __getitem__(self, key: K) -> V:
+        return self._state[1][key]
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._state[1])
+
+    def __len__(self) -> int:
+        return len(self._state[1])
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._state[1]
+
+    def __repr__(self) -> str:
+        version, contents = self._state
+        return f"VersionedRegistry(version={version}, size={len(contents)})"
+
+    # -- writes (serialised) --------------------------------------------
+
+    def update(self, mutator: Callable[[Dict[K, V]], Optional[bool]]) -> int:
+        """Apply ``mutator`` to a private copy and publish it as a new version.
+
+        ``mutator`` receives a mutable dict copy of the current contents.
+        Returning ``False`` means "nothing changed": the copy is discarded
+        and the version is not bumped. Exceptions propagate and leave the
+        registry untouched.
+
+        Returns:
+            The registry version after the call.
+        """
+        with self._write_lock:
+            version, contents = self._state
+            working = dict(contents)
+            if mutator(working) is False:
+                return version
+            self._state = (version + 1, MappingProxyType(working))
+            return version + 1
+
+    def set(self, key: K, value: V) -> int:
+        """Insert or replace one entry. Returns the new version."""
+        def apply(working: Dict[K, V]) -> None:
+            working[key] = value
+        return self.update(apply)
+
+    # -- derived structures ---------------------------------------------
+
+    def derived(self, builder: Callable[[Mapping[K, V]], T]) -> "Derived[T]":
+        """Return a callable that caches ``builder(snapshot)`` per version."""
+        return Derived(self, builder)
+
+
+class Derived(Generic[T]):
+    """Lazily rebuilt value computed from a registry snapshot.
+
+    Concurrent callers may occasionally build the same version twice; each
+    result is consistent with the snapshot it was built from, so the race is
+    harmless and no lock is taken on the read path.
+    """
+
+    def __init__(self, registry: VersionedRegistry, builder: Callable[[Mapping], T]) -> None:
+        self._registry = registry
+        self._builder = builder
+        self._cache: Optional[Tuple[int, T]] = None
+
+    def __call__(self) -> T:
+        return self.with_version()[1]
+
+    def with_version(self) -> Tuple[int, T]:
+        """Return ``(version, value)`` for the current snapshot."""
+        version, contents = self._registry.snapshot()
+        cached = self._cache
+        if cached is not None and cached[0] == version:
+            return cached
+        built = (version, self._builder(contents))
+        self._cache = built
+        return built
@@ -8,7 +8,9 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import List, Optional
+
+from .registry import VersionedRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -34,8 +36,11 @@ class Speaker:
 # Speaker IDs here reference VCTK speakers in Coqui's pretrained VITS model.
 # When swapping to FishSpeech / F5-TTS, update speaker_id only — persona keys
 # stay the same so the service layer never needs to change.
+#
+# A VersionedRegistry: reads are lock-free against an immutable snapshot;
+# register_persona() publishes a new snapshot and bumps AGENT_REGISTRY.version.
 # ---------------------------------------------------------------------------
-AGENT_REGISTRY: Dict[str, Speaker] = {
+AGENT_REGISTRY: VersionedRegistry[str, Speaker] = VersionedRegistry({
     "professional_male": Speaker(
         persona="professional_male",
         speaker_id="p225",
@@ -60,10 +65,15 @@ AGENT_REGISTRY: Dict[str, Speaker] = {
         agent_name="Professional Financial Advisor",
         description="Confident, knowledgeable. Suitable for investment and advisory content.",
     ),
-}
+})
 
 DEFAULT_PERSONA = "neutral_male"
 
+# ``speaker_id`` of a single-speaker model: it has one voice and takes no
+# speaker argument. Distinct from ``None``, which means "resolve from the
+# persona registry".
+NO_SPEAKER = ""
+
 
 def get_speaker(persona: str, fallback: Optional[str] = None) -> Speaker:
     """Resolve a persona name to a Speaker value object.
@@ -79,14 +89,15 @@ def get_speaker(persona: str, fallback: Optional[str] = None) -> Speaker:
     Raises:
         ValueError: If neither persona nor fallback are registered.
     """
-    if persona in AGENT_REGISTRY:
-        speaker = AGENT_REGISTRY[persona]
+    _, registry = AGENT_REGISTRY.snapshot()
+    if persona in registry:
+        speaker = registry[persona]
         logger.debug(f"Resolved persona '{persona}' → speaker '{speaker.speaker_id}'")
         return speaker
 
     effective_fallback = fallback or DEFAULT_PERSONA
-    if effective_fallback in AGENT_REGISTRY:
-        speaker = AGENT_REGISTRY[effective_fallback]
+    if effective_fallback in registry:
+        speaker = registry[effective_fallback]
         logger.warning(
             f"Persona '{persona}' not found. "
             f"Falling back to '{effective_fallback}' → '{speaker.speaker_id}'"
@@ -129,10 +140,10 @@ def register_persona(
             description="Local AU accent, suitable for domestic retail banking.",
         )
     """
-    AGENT_REGISTRY[persona] = Speaker(
+    version = AGENT_REGISTRY.set(persona, Speaker(
         persona=persona,
         speaker_id=speaker_id,
         agent_name=agent_name,
         description=description,
-    )
-    logger.info(f"Registered persona '{persona}' → speaker '{speaker_id}' ({agent_name})")
+    ))
+    logger.info(f"Registered persona '{persona}' → speaker '{speaker_id}' ({agent_name}) [v{version}]")
@@ -0,0 +1,5 @@
+"""Entry points: driving adapters that wire adapters into TTSService and expose it.
+
+These modules are composition roots — unlike ``service/`` they may import
+adapters and shared infrastructure freely.
+"""
@@ -0,0 +1,107 @@
+"""Phrase-pack builder — pre-render recurring phrases for every persona.
+
+Renders each registered domain phrase (``text_normalization.domain_phrases``)
+plus any lines from ``--phrases`` files for every persona in
+``AGENT_REGISTRY``, and writes them to one pack file for
+:class:`~tts_v2.adapters.rendition_store.phrase_pack_adapter.PhrasePackAdapter`.
+
+Every phrase goes through :meth:`TTSService.prepare` and
+:meth:`TTSService.render`, so the pack holds exactly what ``speak()``
+would produce with the same ``--model`` / ``--postprocess`` options and
+is keyed by the same normalised text. Personas sharing a speaker are
+rendered once.
+
+Usage::
+
+    tts-v2-build-pack outputs/phrases.pack --phrases compliance_lines.txt
+    tts-v2-serve --phrase-pack outputs/phrases.pack
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from ..adapters.rendition_store.phrase_pack_adapter import pack_key, write_phrase_pack
+from ..domain.audio import AudioChunk, SynthesisRequest
+from ..domain.voice import list_personas
+from ..service.tts_service import TTSService
+from ..text_normalization import list_domain_phrases
+from .common import add_pipeline_arguments, build_service, model_id
+
+logger = logging.getLogger(__name__)
+
+
+def load_phrases(paths: Sequence[str]) -> List[str]:
+    """Read one phrase per line; blank lines and ``#`` comments are skipped."""
+    phrases = []
+    for path in paths:
+        for line in Path(path).read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                phrases.append(line)
+    return phrases
+
+
+def render_phrases(
+    service: TTSService,
+    phrases: Sequence[str],
+    personas: Sequence[str],
+) -> Iterator[Tuple[str, str, AudioChunk]]:
+    """Yield ``(speaker_id, normalised_text, chunk)`` for every phrase × distinct speaker."""
+    seen = set()
+    for persona in personas:
+        for phrase in phrases:
+            prepared = service.prepare(SynthesisRequest(text=phrase, persona=persona))
+            speaker_id, text = prepared.synth_request.speaker_id, prepared.synth_request.text
+            key = pack_key(speaker_id, text)
+            if key in seen:
+                continue
+            seen.add(key)
+            yield speaker_id, text, service.render(prepared)
+
+
+# ---------------------------------------------------------------------------
+# Console script
+# ---------------------------------------------------------------------------
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="tts-v2-build-pack", description="Pre-render recurring phrases into a pack.")
+    parser.add_argument("output", help="Pack file to write")
+    parser.add_argument("--phrases", action="append", default=[], help="Text file with one phrase per line (repeatable)")
+    parser.add_argument("--no-domain-phrases", action="store_true", help="Only render --phrases files")
+    parser.add_argument("--persona", action="append", default=None, help="Restrict to these personas (repeatable)")
+    add_pipeline_arguments(parser)
+    args = parser.parse_args(argv)
+    args.phrase_pack = None  # never serve a build from an existing pack
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    logging.getLogger("tts_v2.service").setLevel(logging.WARNING)
+
+    phrases = ([] if args.no_domain_phrases else list_domain_phrases()) + load_phrases(args.phrases)
+    if not phrases:
+        parser.error("no phrases to render")
+    personas = args.persona or list_personas()
+
+    t0 = time.monotonic()
+    service = build_service(args)
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    written = write_phrase_pack(args.output, model_id(args), render_phrases(service, phrases, personas))
+    summary = {
+        "output": args.output,
+        "model": model_id(args),
+        "phrases": len(phrases),
+        "personas": len(personas),
+        "entries": written,
+        "bytes": Path(args.output).stat().st_size,
+        "wall_s": round(time.monotonic() - t0, 3),
+    }
+    print(json.dumps(summary), file=sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
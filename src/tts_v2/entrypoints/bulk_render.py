@@ -0,0 +1,354 @@
+"""Bulk renderer — pipelined normalise → synthesise → write over bounded queues.
+
+Campaign files (CSV or JSONL of prompts) are rendered by three stages
+running concurrently::
+
+    reader/normalise thread ──► [prepared queue] ──► synthesis (caller thread)
+                                                            │
+    writer/audit thread     ◄── [rendered queue] ◄──────────┘
+
+Stage boundaries are :meth:`TTSService.prepare`,
+:meth:`TTSService.lookup_stored` / :meth:`TTSService.render` and
+:meth:`TTSService.deliver`: rows matching the phrase pack, and rate
+variants of stored renditions, are served without synthesis as in
+``speak()``. Overload shedding and fallback rendering do not apply — a
+bulk run is not latency-bound. The queues are bounded, which caps memory at
+``queue_size`` rendered clips while letting WAV encoding, disk writes and
+audit I/O overlap with synthesis. The report records how long the
+synthesis stage waited on either side, so it is easy to see whether the
+model ever sat idle.
+
+Input rows need ``text`` and ``persona``; ``id`` names the output file
+(``<out-dir>/<id>.wav``, or ``output`` for an explicit path) and ``rate``
+sets the speaking rate (default 1.0). Any other CSV columns — or a JSONL
+``metadata`` object — become audit metadata. A row that fails validation
+is reported as a failed item and the run continues; only an unreadable
+file (I/O error, malformed JSON) stops it.
+
+Usage::
+
+    tts-v2-render campaign.csv --out-dir outputs/campaign --audit-log outputs/audit.jsonl
+"""
+
+import argparse
+import csv
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ..adapters.audio_sink.encoded_sink_adapter import EncodedFileSinkAdapter
+from ..adapters.audio_sink.file_sink_adapter import FileSinkAdapter
+from ..domain.audio import SynthesisRequest
+from ..service.tts_service import TTSService
+from ..shared.audio_utils import ENCODED_FORMATS
+from ..shared.buffer_pool import BufferPool
+from .common import add_pipeline_arguments, build_service
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+@dataclass(frozen=True)
+class InvalidRow:
+    """A campaign row that could not be turned into a SynthesisRequest."""
+
+    label: str
+    error: ValueError
+
+
+@dataclass
+class BulkRenderReport:
+    """Counters for one bulk run. Times are in seconds."""
+
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    audio_s: float = 0.0
+    wall_s: float = 0.0
+    stored: int = 0                # served by TTSService.lookup_stored()
+    synth_busy_s: float = 0.0      # inside lookup_stored() / render()
+    synth_starved_s: float = 0.0   # waiting for the normalise stage
+    synth_blocked_s: float = 0.0   # waiting for the writer to drain
+    errors: List[Tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def items_per_s(self) -> float:
+        return self.total / self.wall_s if self.wall_s > 0 else 0.0
+
+    @property
+    def rtf(self) -> float:
+        """Wall-clock seconds per second of rendered audio."""
+        return self.wall_s / self.audio_s if self.audio_s > 0 else 0.0
+
+    @property
+    def synth_utilisation(self) -> float:
+        return self.synth_busy_s / self.wall_s if self.wall_s > 0 else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "stored": self.stored,
+            "audio_s": round(self.audio_s, 3),
+            "wall_s": round(self.wall_s, 3),
+            "items_per_s": round(self.items_per_s, 3),
+            "rtf": round(self.rtf, 4),
+            "synth_utilisation": round(self.synth_utilisation, 3),
+            "synth_starved_s": round(self.synth_starved_s, 3),
+            "synth_blocked_s": round(self.synth_blocked_s, 3),
+        }
+
+
+class BulkRenderer:
+    """Render many requests through a TTSService with overlapping stages.
+
+    Args:
+        service:             Fully wired TTSService; its sink does the writing.
+        queue_size:          Capacity of each inter-stage queue.
+        progress_interval_s: Minimum seconds between progress callbacks.
+        on_progress:         Called with ``BulkRenderReport.as_dict()``
+                             snapshots; defaults to an INFO log line.
+    """
+
+    def __init__(
+        self,
+        service: TTSService,
+        queue_size: int = 8,
+        progress_interval_s: float = 5.0,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> None:
+        if queue_size < 1:
+            raise ValueError(f"queue_size must be ≥ 1, got {queue_size}")
+        self._service = service
+        self._queue_size = queue_size
+        self._interval = progress_interval_s
+        self._on_progress = on_progress or _log_progress
+
+    def run(self, requests: Iterable[Union[SynthesisRequest, InvalidRow]]) -> BulkRenderReport:
+        """Render every request; per-item failures are recorded, not raised.
+
+        ``InvalidRow`` items (from :func:`load_requests`) are counted as
+        failures without being rendered.
+
+        Raises:
+            Exception: Re-raises an error from iterating ``requests`` itself
+                       (e.g. a malformed input file) after draining the pipeline.
+        """
+        report = BulkRenderReport()
+        lock = threading.Lock()
+        prepared_q: "queue.Queue[Any]" = queue.Queue(self._queue_size)
+        rendered_q: "queue.Queue[Any]" = queue.Queue(self._queue_size)
+        source_error: List[BaseException] = []
+        t0 = time.monotonic()
+        last_report = [t0]
+
+        def fail(request: Union[SynthesisRequest, InvalidRow], exc: BaseException) -> None:
+            if isinstance(request, InvalidRow):
+                label = request.label
+            else:
+                label = request.output_path or request.text[:40]
+            logger.error(f"[bulk] failed {label!r}: {exc}")
+            with lock:
+                report.failed += 1
+                report.errors.append((label, str(exc)))
+
+        def prepare_stage() -> None:
+            try:
+                for request in requests:
+                    with lock:
+                        report.total += 1
+                    if isinstance(request, InvalidRow):
+                        fail(request, request.error)
+                        continue
+                    try:
+                        prepared_q.put(self._service.prepare(request))
+                    except Exception as exc:
+                        fail(request, exc)
+            except BaseException as exc:
+                source_error.append(exc)
+            finally:
+                prepared_q.put(_DONE)
+
+        def deliver_stage() -> None:
+            while True:
+                item = rendered_q.get()
+                if item is _DONE:
+                    return
+                prepared, chunk, source = item
+                try:
+                    self._service.deliver(prepared, chunk, source=source)
+                except Exception as exc:
+                    fail(prepared.request, exc)
+                    continue
+                now = time.monotonic()
+                with lock:
+                    report.succeeded += 1
+                    report.audio_s += chunk.duration_s
+                    due = now - last_report[0] >= self._interval
+                    if due:
+                        last_report[0] = now
+                        report.wall_s = now - t0
+                        snapshot = report.as_dict()
+                if due:
+                    snapshot["prepared_queue"] = prepared_q.qsize()
+                    snapshot["rendered_queue"] = rendered_q.qsize()
+                    self._on_progress(snapshot)
+
+        threads = [
+            threading.Thread(target=prepare_stage, name="bulk-prepare", daemon=True),
+            threading.Thread(target=deliver_stage, name="bulk-deliver", daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                t_wait = time.monotonic()
+                prepared = prepared_q.get()
+                t_got = time.monotonic()
+                if prepared is _DONE:
+                    break
+                try:
+                    chunk, source = self._service.lookup_stored(prepared)
+                    if chunk is None:
+                        chunk, source = self._service.render(prepared), "synthesis"
+                    else:
+                        with lock:
+                            report.stored += 1
+                except Exception as exc:
+                    fail(prepared.request, exc)
+                    chunk = None
+                t_done = time.monotonic()
+                if chunk is not None:
+                    rendered_q.put((prepared, chunk, source))
+                t_put = time.monotonic()
+                report.synth_starved_s += t_got - t_wait
+                report.synth_busy_s += t_done - t_got
+                report.synth_blocked_s += t_put - t_done
+            threads[0].join()
+        finally:
+            rendered_q.put(_DONE)
+            threads[1].join()
+
+        report.wall_s = time.monotonic() - t0
+        if source_error:
+            raise source_error[0]
+        return report
+
+
+def _log_progress(snapshot: Dict[str, Any]) -> None:
+    logger.info(
+        f"[bulk] {snapshot['succeeded'] + snapshot['failed']}/{snapshot['total']} done | "
+        f"{snapshot['items_per_s']:.2f} items/s | RTF={snapshot['rtf']:.3f} | "
+        f"synth util={snapshot['synth_utilisation']:.0%} | "
+        f"queues={snapshot['prepared_queue']}/{snapshot['rendered_queue']}"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Input parsing
+# ---------------------------------------------------------------------------
+
+def load_requests(path: str, out_dir: str, fmt: str = "auto") -> Iterator[Union[SynthesisRequest, InvalidRow]]:
+    """Stream SynthesisRequests from a CSV or JSONL campaign file.
+
+    A row that fails validation (no ``text`` or ``persona``, a bad
+    ``rate``, a JSONL line that is not an object) is yielded as an
+    ``InvalidRow`` so the caller can record it and carry on.
+
+    Args:
+        path:    Input file.
+        out_dir: Directory for ``<id>.wav`` outputs.
+        fmt:     ``"csv"``, ``"jsonl"`` or ``"auto"`` (by file extension).
+
+    Raises:
+        OSError:             If the file cannot be read.
+        json.JSONDecodeError: On a JSONL line that is not valid JSON.
+    """
+    if fmt == "auto":
+        fmt = "jsonl" if Path(path).suffix.lower() in (".jsonl", ".ndjson") else "csv"
+    with open(path, newline="", encoding="utf-8") as f:
+        if fmt == "jsonl":
+            rows: Iterable[Dict[str, Any]] = (json.loads(line) for line in f if line.strip())
+        else:
+            rows = csv.DictReader(f)
+        for index, row in enumerate(rows, start=1):
+            try:
+                yield _row_to_request(row, index, out_dir)
+            except ValueError as exc:
+                yield InvalidRow(label=f"row {index}", error=exc)
+
+
+def _row_to_request(row: Dict[str, Any], index: int, out_dir: str) -> SynthesisRequest:
+    if not isinstance(row, dict):
+        raise ValueError(f"Row {index}: expected an object, got {type(row).__name__}")
+    row = dict(row)
+    text, persona = row.pop("text", None), row.pop("persona", None)
+    if not text or not persona:
+        raise ValueError(f"Row {index}: 'text' and 'persona' are required")
+    row_id = str(row.pop("id", None) or f"{index:06d}")
+    output = row.pop("output", None) or str(Path(out_dir) / f"{row_id}.wav")
+    rate = row.pop("rate", None)
+    try:
+        rate = float(rate) if rate not in (None, "") else 1.0
+    except (TypeError, ValueError):
+        raise ValueError(f"Row {index}: 'rate' must be a number, got {rate!r}") from None
+    metadata = row.pop("metadata", None)
+    if metadata is not None and not isinstance(metadata, dict):
+        # e.g. a CSV column named "metadata": an ordinary column value.
+        row["metadata"] = metadata
+        metadata = None
+    metadata = {**{k: v for k, v in row.items() if v not in (None, "")}, **(metadata or {}), "id": row_id}
+    return SynthesisRequest(text=text, persona=persona, output_path=output, metadata=metadata, rate=rate)
+
+
+# ---------------------------------------------------------------------------
+# Console script
+# ---------------------------------------------------------------------------
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="tts-v2-render", description="Render a CSV/JSONL campaign file to WAVs.")
+    parser.add_argument("input", help="CSV or JSONL file with text, persona and optional id/output columns")
+    parser.add_argument("--out-dir", default="outputs/bulk")
+    parser.add_argument("--format", choices=("auto", "csv", "jsonl"), default="auto")
+    parser.add_argument(
+        "--audio-format", choices=("wav", *sorted(ENCODED_FORMATS)), default="wav",
+        help="Output encoding; anything but float 'wav' is encoded on background workers",
+    )
+    parser.add_argument("--encode-workers", type=int, default=2)
+    parser.add_argument("--queue-size", type=int, default=8)
+    parser.add_argument("--progress-interval", type=float, default=5.0)
+    add_pipeline_arguments(parser)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    logging.getLogger("tts_v2.service").setLevel(logging.WARNING)
+
+    encoder = None
+    if args.audio_format != "wav":
+        encoder = EncodedFileSinkAdapter(args.audio_format, max_workers=args.encode_workers)
+    pool = BufferPool()
+    service = build_service(args, audio_sink=encoder or FileSinkAdapter(), buffer_pool=pool)
+    renderer = BulkRenderer(service, queue_size=args.queue_size, progress_interval_s=args.progress_interval)
+    report = renderer.run(load_requests(args.input, args.out_dir, args.format))
+    summary = report.as_dict()
+    encode_failures = 0
+    if encoder is not None:
+        encoder.close()
+        summary["encoding"] = encoder.stats()
+        encode_failures = summary["encoding"]["failures"]
+    summary["buffer_pool"] = pool.stats()
+    print(json.dumps(summary), file=sys.stdout)
+    return 1 if report.failed or encode_failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
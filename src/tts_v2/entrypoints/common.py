@@ -0,0 +1,109 @@
+"""Shared composition helpers for the console entry points."""
+
+import argparse
+from typing import Optional
+
+from ..adapters.audit.file_audit_adapter import FileAuditAdapter
+from ..adapters.audit.noop_audit_adapter import NoOpAuditAdapter
+from ..adapters.normalizer.bfsi_normalizer_adapter import BFSINormalizerAdapter
+from ..adapters.postprocess.chain_adapter import PostProcessingChainAdapter
+from ..adapters.rendition_store.phrase_pack_adapter import PhrasePackAdapter
+from ..adapters.synthesizer.coqui_onnx import read_onnx_manifest
+from ..adapters.synthesizer.coqui_snapshot import read_snapshot_manifest
+from ..adapters.time_scale.wsola_adapter import WsolaTimeScalerAdapter
+from ..domain.audio import AudioChunk
+from ..ports.audio_sink_port import AudioSinkPort
+from ..ports.synthesizer_port import SynthesizerPort
+from ..service.profiling import ProfilingPolicy, RequestProfiler
+from ..service.tts_service import TTSService
+from ..shared.buffer_pool import BufferPool
+
+
+class NullSink:
+    """AudioSinkPort that writes nothing — for callers that keep audio in memory."""
+
+    def write(self, chunk: AudioChunk, destination: str) -> str:
+        return destination
+
+
+def add_pipeline_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the model / normaliser / audit options every entry point shares."""
+    parser.add_argument("--model", default="tts_models/en/vctk/vits")
+    parser.add_argument("--model-snapshot", default=None,
+                        help="Load the model from a snapshot built by tts-v2-export-snapshot (overrides --model)")
+    parser.add_argument("--onnx-model", default=None,
+                        help="Synthesise with onnxruntime from an export built by tts-v2-export-onnx (overrides --model)")
+    parser.add_argument("--onnx-threads", type=int, default=None, help="Intra-op threads per ONNX session")
+    parser.add_argument("--cpu", action="store_true", help="Disable GPU/MPS")
+    parser.add_argument("--mock", action="store_true", help="Use MockSynthesizerAdapter (no model)")
+    parser.add_argument("--postprocess", action="store_true", help="Apply the telephony post-processing chain")
+    parser.add_argument("--audit-log", default=None, help="JSONL audit file (default: no audit)")
+    parser.add_argument("--phrase-pack", default=None, help="Pre-rendered phrase pack built by tts-v2-build-pack")
+    parser.add_argument("--profile-sample-rate", type=float, default=0.0,
+                        help="Fraction of requests to profile with cProfile (default: 0)")
+    parser.add_argument("--profile-slow-ms", type=float, default=None,
+                        help="Sample the stack of requests running longer than this")
+    parser.add_argument("--profile-dir", default="outputs/profiles", help="Directory for profile dumps")
+    parser.add_argument("--profile-max-files", type=int, default=200, help="Profile dumps kept in --profile-dir")
+
+
+def model_id(args: argparse.Namespace) -> str:
+    """Identifier of the model ``build_service(args)`` synthesises with (phrase packs record it)."""
+    if args.mock:
+        return "mock"
+    if args.onnx_model:
+        return read_onnx_manifest(args.onnx_model)["model_name"]
+    if args.model_snapshot:
+        return read_snapshot_manifest(args.model_snapshot)["model_name"]
+    return args.model
+
+
+def build_service(
+    args: argparse.Namespace,
+    audio_sink: Optional[AudioSinkPort] = None,
+    buffer_pool: Optional[BufferPool] = None,
+    synthesizer: Optional[SynthesizerPort] = None,
+) -> TTSService:
+    """Compose the default production pipeline from parsed CLI arguments.
+
+    ``buffer_pool`` is shared by the synthesizer and post-processor for
+    output buffers. ``synthesizer`` overrides ``--mock`` / ``--model`` /
+    ``--model-snapshot`` / ``--onnx-model``.
+    ``--profile-*`` options attach a :class:`RequestProfiler`;
+    ``--phrase-pack`` maps a pack built for the same model. Requests with
+    a ``rate`` are re-timed with :class:`WsolaTimeScalerAdapter`.
+    """
+    if synthesizer is None and args.mock:
+        from ..adapters.synthesizer.mock_adapter import MockSynthesizerAdapter
+        synthesizer = MockSynthesizerAdapter(buffer_pool=buffer_pool)
+    elif synthesizer is None and args.onnx_model:
+        from ..adapters.synthesizer.onnx_adapter import OnnxSessionConfig, OnnxSynthesizerAdapter
+        synthesizer = OnnxSynthesizerAdapter(
+            args.onnx_model, session=OnnxSessionConfig(intra_op_threads=args.onnx_threads), buffer_pool=buffer_pool
+        )
+    elif synthesizer is None and args.model_snapshot:
+        from ..adapters.synthesizer.coqui_adapter import CoquiSynthesizerAdapter
+        synthesizer = CoquiSynthesizerAdapter.from_snapshot(
+            args.model_snapshot, use_gpu=not args.cpu, buffer_pool=buffer_pool
+        )
+    elif synthesizer is None:
+        from ..adapters.synthesizer.coqui_adapter import CoquiSynthesizerAdapter
+        synthesizer = CoquiSynthesizerAdapter(model_name=args.model, use_gpu=not args.cpu, buffer_pool=buffer_pool)
+    profiler = None
+    if args.profile_sample_rate > 0 or args.profile_slow_ms is not None:
+        profiler = RequestProfiler(ProfilingPolicy(
+            sample_rate=args.profile_sample_rate,
+            slow_threshold_s=args.profile_slow_ms / 1000.0 if args.profile_slow_ms is not None else None,
+            output_dir=args.profile_dir,
+            max_profiles=args.profile_max_files,
+        ))
+    return TTSService(
+        synthesizer=synthesizer,
+        normalizer=BFSINormalizerAdapter(),
+        audio_sink=audio_sink or NullSink(),
+        audit=FileAuditAdapter(args.audit_log) if args.audit_log else NoOpAuditAdapter(),
+        postprocessor=PostProcessingChainAdapter.telephony(buffer_pool=buffer_pool) if args.postprocess else None,
+        profiler=profiler,
+        phrase_pack=PhrasePackAdapter(args.phrase_pack, model=model_id(args)) if args.phrase_pack else None,
+        time_scaler=WsolaTimeScalerAdapter(buffer_pool=buffer_pool),
+    )
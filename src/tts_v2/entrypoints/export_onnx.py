@@ -0,0 +1,69 @@
+"""ONNX exporter — trace a Coqui VITS model for OnnxSynthesizerAdapter.
+
+Loads ``--model`` through the Coqui model manager, a prepared snapshot
+(``--snapshot``) or the tiny random VITS (``--tiny``), writes an ONNX
+export and checks it against the PyTorch model with
+``validate_onnx_export()``. The command exits non-zero if the check fails;
+the export is left in place for inspection. Workers then start with
+``--onnx-model``::
+
+    tts-v2-export-onnx /opt/models/vctk-vits-onnx --model tts_models/en/vctk/vits
+    tts-v2-serve --onnx-model /opt/models/vctk-vits-onnx --onnx-threads 2
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="tts-v2-export-onnx", description="Export a Coqui VITS model to ONNX and validate it."
+    )
+    parser.add_argument("output", help="Export directory to write (replaced if it exists)")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--model", default="tts_models/en/vctk/vits")
+    source.add_argument("--snapshot", default=None, help="Export from a tts-v2-export-snapshot directory")
+    source.add_argument("--tiny", action="store_true", help="Export the tiny random VITS (offline tests)")
+    parser.add_argument("--opset", type=int, default=None, help="ONNX opset (default: 15)")
+    parser.add_argument("--min-snr-db", type=float, default=20.0, help="Validation threshold per prompt")
+    parser.add_argument("--skip-validation", action="store_true")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    from ..adapters.synthesizer.coqui_adapter import CoquiSynthesizerAdapter
+    from ..adapters.synthesizer.coqui_onnx import DEFAULT_OPSET, export_onnx, validate_onnx_export
+
+    t0 = time.monotonic()
+    if args.tiny:
+        from ..adapters.synthesizer.coqui_tiny_model import build_tiny_vits
+        adapter = CoquiSynthesizerAdapter(model_name="tiny-vits", use_gpu=False, tts_model=build_tiny_vits())
+    elif args.snapshot:
+        adapter = CoquiSynthesizerAdapter.from_snapshot(args.snapshot, mmap=False, use_gpu=False)
+    else:
+        adapter = CoquiSynthesizerAdapter(model_name=args.model, use_gpu=False)
+    manifest = export_onnx(adapter._tts_model, args.output, adapter.model_name, opset=args.opset or DEFAULT_OPSET)
+    summary = {
+        "output": args.output,
+        "model": manifest["model_name"],
+        "onnx_bytes": manifest["onnx_bytes"],
+        "opset": manifest["opset"],
+    }
+    passed = True
+    if not args.skip_validation:
+        report = validate_onnx_export(adapter._tts_model, args.output, min_snr_db=args.min_snr_db)
+        passed = report["passed"]
+        summary["validation"] = {k: v for k, v in report.items() if k != "prompts"}
+    summary["wall_s"] = round(time.monotonic() - t0, 3)
+    print(json.dumps(summary), file=sys.stdout)
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,365 @@
+"""Load generator — drive TTSService with synthetic or recorded traffic.
+
+Three arrival models, all going through ``TTSService.speak()``:
+
+* **open loop** — requests arrive at a fixed rate (Poisson or evenly
+  spaced) regardless of how fast they complete, so queues build up once
+  the offered load exceeds capacity;
+* **closed loop** — a fixed number of clients each send their next
+  request as soon as the previous one returns;
+* **replay** — the events of a recorded ``audit.jsonl`` are re-sent with
+  their original spacing, optionally sped up.
+
+Latency is measured from the scheduled arrival, so time spent waiting for
+a free worker thread counts; ``queue`` is that wait on its own. With
+``--timeout-ms`` every request carries a deadline measured from that same
+arrival, and requests that run out of time are counted as ``expired``
+rather than ``failed``. Pair with
+``SimulatedSynthesizerAdapter`` (``--simulate``) to plan capacity without
+a model.
+
+Usage::
+
+    tts-v2-loadgen open --rate 4 --duration 60 --simulate --sim-rtf 0.25
+    tts-v2-loadgen closed --concurrency 8 --count 400 --simulate
+    tts-v2-loadgen replay outputs/audit.jsonl --speed 2 --mock
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..adapters.synthesizer.simulated_adapter import SimulatedSynthesizerAdapter
+from ..domain.audio import SynthesisRequest
+from ..domain.cancellation import CANCELLED, DEADLINE_EXCEEDED
+from ..service.tts_service import TTSService
+from ..shared.buffer_pool import BufferPool
+from .common import add_pipeline_arguments, build_service
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TEXTS = (
+    "Your OTP is 482913. Do not share it with anyone.",
+    "Your EMI of Rs. 12,500 is due on 5th March.",
+    "Thank you for calling. Your request has been registered.",
+    "Your KYC is pending. Please visit the nearest branch.",
+    "A debit of Rs. 2,340 was made from your account ending 4821.",
+    "Your credit card statement is now available.",
+)
+
+
+@dataclass
+class LoadReport:
+    """Outcome of one load run. Times are in seconds."""
+
+    mode: str
+    offered: int = 0
+    completed: int = 0
+    failed: int = 0
+    expired: int = 0
+    audio_s: float = 0.0
+    wall_s: float = 0.0
+    degraded: Counter = field(default_factory=Counter)
+    latency_s: List[float] = field(default_factory=list)
+    queue_s: List[float] = field(default_factory=list)
+    service_s: List[float] = field(default_factory=list)
+
+    @property
+    def throughput_rps(self) -> float:
+        return self.completed / self.wall_s if self.wall_s > 0 else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "offered": self.offered,
+            "completed": self.completed,
+            "failed": self.failed,
+            "expired": self.expired,
+            "degraded": dict(self.degraded),
+            "wall_s": round(self.wall_s, 3),
+            "throughput_rps": round(self.throughput_rps, 3),
+            "audio_s_per_s": round(self.audio_s / self.wall_s, 3) if self.wall_s > 0 else 0.0,
+            "latency_s": percentiles(self.latency_s),
+            "queue_s": percentiles(self.queue_s),
+            "service_s": percentiles(self.service_s),
+        }
+
+
+def percentiles(values: Sequence[float]) -> Dict[str, float]:
+    """p50 / p95 / p99 / max / mean of ``values`` (zeros when empty)."""
+    if not values:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0, "mean": 0.0}
+    arr = np.asarray(values, dtype=np.float64)
+    p50, p95, p99 = np.percentile(arr, [50, 95, 99])
+    return {
+        "p50": round(float(p50), 4),
+        "p95": round(float(p95), 4),
+        "p99": round(float(p99), 4),
+        "max": round(float(arr.max()), 4),
+        "mean": round(float(arr.mean()), 4),
+    }
+
+
+class LoadGenerator:
+    """Send requests to a TTSService and collect latency statistics.
+
+    Args:
+        service:     Fully wired TTSService.
+        max_workers: Worker threads for open-loop and replay runs. Arrivals
+                     beyond this many in flight wait (and show up as ``queue``).
+        timeout_s:   Optional per-request deadline, counted from arrival.
+    """
+
+    def __init__(self, service: TTSService, max_workers: int = 64, timeout_s: Optional[float] = None) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be ≥ 1, got {max_workers}")
+        if timeout_s is not None and timeout_s <= 0:
+            raise ValueError(f"timeout_s must be > 0, got {timeout_s}")
+        self._service = service
+        self._max_workers = max_workers
+        self._timeout_s = timeout_s
+
+    # ------------------------------------------------------------------
+    # Arrival models
+    # ------------------------------------------------------------------
+
+    def open_loop(
+        self,
+        requests: Iterable[SynthesisRequest],
+        rate_rps: float,
+        duration_s: Optional[float] = None,
+        poisson: bool = True,
+        seed: Optional[int] = None,
+    ) -> LoadReport:
+        """Issue ``requests`` at ``rate_rps`` until they or ``duration_s`` run out."""
+        if rate_rps <= 0:
+            raise ValueError(f"rate_rps must be > 0, got {rate_rps}")
+        rng = random.Random(seed)
+
+        def schedule() -> Iterator[Tuple[float, SynthesisRequest]]:
+            offset = 0.0
+            for index, request in enumerate(requests):
+                if not poisson:
+                    offset = index / rate_rps
+                if duration_s is not None and offset >= duration_s:
+                    return
+                yield offset, request
+                if poisson:
+                    offset += rng.expovariate(rate_rps)
+
+        return self._run_schedule(schedule(), "open")
+
+    def closed_loop(
+        self,
+        requests: Iterable[SynthesisRequest],
+        concurrency: int,
+        duration_s: Optional[float] = None,
+    ) -> LoadReport:
+        """Run ``concurrency`` clients back to back until ``requests`` or ``duration_s`` run out."""
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be ≥ 1, got {concurrency}")
+        report = LoadReport(mode="closed")
+        lock = threading.Lock()
+        source = iter(requests)
+        t0 = time.monotonic()
+
+        def client() -> None:
+            while duration_s is None or time.monotonic() - t0 < duration_s:
+                with lock:
+                    request = next(source, None)
+                    if request is None:
+                        return
+                    report.offered += 1
+                now = time.monotonic()
+                self._issue(request, now, report, lock)
+
+        clients = [threading.Thread(target=client, name=f"loadgen-{i}", daemon=True) for i in range(concurrency)]
+        for thread in clients:
+            thread.start()
+        for thread in clients:
+            thread.join()
+        report.wall_s = time.monotonic() - t0
+        return report
+
+    def replay(self, schedule: Iterable[Tuple[float, SynthesisRequest]], speed: float = 1.0) -> LoadReport:
+        """Re-send ``(offset_s, request)`` pairs, compressing time by ``speed``."""
+        if speed <= 0:
+            raise ValueError(f"speed must be > 0, got {speed}")
+        return self._run_schedule(((offset / speed, request) for offset, request in schedule), "replay")
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _run_schedule(self, schedule: Iterable[Tuple[float, SynthesisRequest]], mode: str) -> LoadReport:
+        report = LoadReport(mode=mode)
+        lock = threading.Lock()
+        t0 = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="loadgen") as pool:
+            for offset, request in schedule:
+                arrival = t0 + offset
+                delay = arrival - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                report.offered += 1
+                pool.submit(self._issue, request, arrival, report, lock)
+        report.wall_s = time.monotonic() - t0
+        return report
+
+    def _issue(self, request: SynthesisRequest, arrival: float, report: LoadReport, lock: threading.Lock) -> None:
+        if self._timeout_s is not None:
+            request = replace(request, deadline=arrival + self._timeout_s)
+        start = time.monotonic()
+        try:
+            result = self._service.speak(request)
+            error: Optional[Exception] = None
+        except Exception as exc:
+            result, error = None, exc
+        end = time.monotonic()
+
+        audio_s = 0.0
+        if result is not None and result.chunk is not None:
+            audio_s = result.chunk.duration_s
+            result.chunk.release()
+        degradation = result.degradation if result is not None else None
+        outcome = result.outcome if result is not None else "error"
+        with lock:
+            report.queue_s.append(start - arrival)
+            report.service_s.append(end - start)
+            report.latency_s.append(end - arrival)
+            if degradation:
+                report.degraded[degradation] += 1
+            if result is not None and result.success:
+                report.completed += 1
+                report.audio_s += audio_s
+            elif outcome in (CANCELLED, DEADLINE_EXCEEDED):
+                report.expired += 1
+            elif degradation != "shed":
+                report.failed += 1
+        if error is not None:
+            logger.debug(f"[loadgen] request failed: {error}")
+
+
+# ---------------------------------------------------------------------------
+# Inputs
+# ---------------------------------------------------------------------------
+
+def load_audit_schedule(path: str) -> List[Tuple[float, SynthesisRequest]]:
+    """Read a FileAuditAdapter log as ``(offset_s, request)`` pairs sorted by time.
+
+    Events without ``ts``, ``text_raw`` or ``persona`` are skipped.
+    """
+    events = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            event = json.loads(line)
+            if event.get("ts") is None or not event.get("text_raw") or not event.get("persona"):
+                continue
+            events.append(event)
+    if not events:
+        return []
+    events.sort(key=lambda e: e["ts"])
+    t_first = events[0]["ts"]
+    return [
+        (
+            event["ts"] - t_first,
+            SynthesisRequest(
+                text=event["text_raw"],
+                persona=event["persona"],
+                metadata=dict(event.get("metadata") or {}),
+            ),
+        )
+        for event in events
+    ]
+
+
+def synthetic_requests(texts: Sequence[str], personas: Sequence[str], seed: Optional[int] = None) -> Iterator[SynthesisRequest]:
+    """Endless stream of requests drawing text and persona at random."""
+    rng = random.Random(seed)
+    for index in itertools.count():
+        yield SynthesisRequest(text=rng.choice(texts), persona=rng.choice(personas), metadata={"loadgen": index})
+
+
+# ---------------------------------------------------------------------------
+# Console script
+# ---------------------------------------------------------------------------
+
+def main(argv: Optional[List[str]] = None) -> int:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--texts", default=None, help="File with one prompt per line (default: built-in BFSI prompts)")
+    common.add_argument("--persona", action="append", default=None, help="Persona to draw from (repeatable)")
+    common.add_argument("--workers", type=int, default=64, help="Worker threads for open-loop / replay runs")
+    common.add_argument("--seed", type=int, default=None)
+    common.add_argument("--timeout-ms", type=float, default=None, help="Per-request deadline from arrival (default: none)")
+    common.add_argument("--simulate", action="store_true", help="Use SimulatedSynthesizerAdapter")
+    common.add_argument("--sim-rtf", type=float, default=0.3)
+    common.add_argument("--sim-jitter", type=float, default=0.1)
+    common.add_argument("--sim-failure-rate", type=float, default=0.0)
+    common.add_argument("--sim-parallel", type=int, default=1, help="Concurrent renders the simulated device admits")
+    add_pipeline_arguments(common)
+
+    parser = argparse.ArgumentParser(prog="tts-v2-loadgen", description="Drive TTSService with synthetic or recorded load.")
+    modes = parser.add_subparsers(dest="mode", required=True)
+    open_p = modes.add_parser("open", parents=[common], help="Fixed arrival rate")
+    open_p.add_argument("--rate", type=float, required=True, help="Requests per second")
+    open_p.add_argument("--duration", type=float, default=30.0)
+    open_p.add_argument("--uniform", action="store_true", help="Evenly spaced arrivals instead of Poisson")
+    closed_p = modes.add_parser("closed", parents=[common], help="Fixed concurrency")
+    closed_p.add_argument("--concurrency", type=int, required=True)
+    closed_p.add_argument("--count", type=int, default=100)
+    replay_p = modes.add_parser("replay", parents=[common], help="Replay an audit.jsonl with original timing")
+    replay_p.add_argument("audit_log")
+    replay_p.add_argument("--speed", type=float, default=1.0, help="Time compression factor")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    logging.getLogger("tts_v2").setLevel(logging.WARNING)
+
+    pool = BufferPool()
+    synthesizer = None
+    if args.simulate:
+        synthesizer = SimulatedSynthesizerAdapter(
+            rtf=args.sim_rtf,
+            jitter=args.sim_jitter,
+            failure_rate=args.sim_failure_rate,
+            max_parallel=args.sim_parallel,
+            seed=args.seed,
+            buffer_pool=pool,
+        )
+    service = build_service(args, buffer_pool=pool, synthesizer=synthesizer)
+    timeout_s = args.timeout_ms / 1000 if args.timeout_ms is not None else None
+    generator = LoadGenerator(service, max_workers=args.workers, timeout_s=timeout_s)
+
+    texts = DEFAULT_TEXTS
+    if args.texts:
+        texts = tuple(line.strip() for line in Path(args.texts).read_text(encoding="utf-8").splitlines() if line.strip())
+    personas = args.persona or ["professional_female", "professional_male", "friendly_female", "neutral_male"]
+    source = synthetic_requests(texts, personas, seed=args.seed)
+
+    if args.mode == "open":
+        report = generator.open_loop(source, args.rate, duration_s=args.duration, poisson=not args.uniform, seed=args.seed)
+    elif args.mode == "closed":
+        report = generator.closed_loop(itertools.islice(source, args.count), args.concurrency)
+    else:
+        report = generator.replay(load_audit_schedule(args.audit_log), speed=args.speed)
+
+    print(json.dumps(report.as_dict()), file=sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
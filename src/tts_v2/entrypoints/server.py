@@ -0,0 +1,545 @@
+"""TTS server — HTTP chunked streaming and WebSocket PCM frames over TTSService.
+
+Standard library only (``http.server``), so it runs wherever the pipeline
+itself runs. The service (and therefore the model) is built once by a
+background warm-up thread and shared by every request.
+
+Endpoints::
+
+    GET  /ready[?wait=<seconds>]   200 once warm-up finished, 503 before (wait ≤ 30 s)
+    POST /synthesize               JSON {"text", "persona", "speaker_id"?, "rate"?, "timeout_ms"?, ...}
+                                   → chunked audio
+                                   (?format=pcm → audio/L16, ?format=wav → streaming WAV)
+    GET  /ws                       WebSocket; see below
+
+WebSocket protocol (RFC 6455, no extensions): the client sends one text
+frame per utterance with the same JSON body as ``/synthesize``. The server
+answers with a text frame ``{"event": "start", "sample_rate": N}``, binary
+frames of signed 16-bit little-endian mono PCM, and a final text frame
+``{"event": "end", "duration_s": ...}`` (or ``{"event": "error", ...}``).
+
+Long texts are split at sentence boundaries and each sentence is
+synthesised and sent as soon as it is ready, so the first audio leaves
+the server after the first sentence rather than the whole utterance.
+
+Usage::
+
+    tts-v2-serve --port 8080 --max-concurrency 2
+    tts-v2-serve --mock            # no model; for integration tests
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import logging
+import math
+import struct
+import sys
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from ..adapters.normalizer.streaming_normalizer_adapter import StreamingNormalizerAdapter
+from ..domain.audio import AudioChunk, SynthesisRequest
+from ..domain.cancellation import CANCELLED, DEADLINE_EXCEEDED, RequestCancelled
+from ..domain.voice import NO_SPEAKER
+from ..service.tts_service import TTSService
+from ..shared.audio_utils import pcm_to_bytes, wav_header
+from ..shared.buffer_pool import BufferPool
+from .common import add_pipeline_arguments, build_service
+
+logger = logging.getLogger(__name__)
+
+_WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_OP_CONT, _OP_TEXT, _OP_BINARY, _OP_CLOSE, _OP_PING, _OP_PONG = 0x0, 0x1, 0x2, 0x8, 0x9, 0xA
+_MAX_BODY_BYTES = 1 << 20
+_MAX_READY_WAIT_S = 30.0   # /ready?wait= is clamped to this; each wait holds a handler thread
+
+
+class _RawText:
+    """Identity NormalizerPort — lets StreamingNormalizerAdapter act as a sentence splitter."""
+
+    def normalize(self, text: str) -> str:
+        return text
+
+
+class ServerBusy(Exception):
+    """Raised when no synthesis slot frees up within the queue timeout."""
+
+
+class TTSServer:
+    """Serve a TTSService over HTTP and WebSocket.
+
+    Args:
+        service_factory: Builds the TTSService. Called once, on the warm-up
+                         thread, so model loading does not block ``start()``.
+        host, port:      Bind address. ``port=0`` picks a free port.
+        max_concurrency: Maximum number of utterances synthesised at once.
+        queue_timeout_s: How long a request waits for a free slot (or for
+                         warm-up) before it is rejected with 503.
+        warmup_text:     Text synthesised once before reporting ready.
+        warmup_persona:  Persona used for the warm-up request.
+        frame_ms:        Audio duration per HTTP chunk / WebSocket frame.
+    """
+
+    def __init__(
+        self,
+        service_factory: Callable[[], TTSService],
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        max_concurrency: int = 2,
+        queue_timeout_s: float = 30.0,
+        warmup_text: str = "Warm up.",
+        warmup_persona: str = "professional_female",
+        frame_ms: int = 200,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be ≥ 1, got {max_concurrency}")
+        self._factory = service_factory
+        self._service: Optional[TTSService] = None
+        self._speakers: FrozenSet[str] = frozenset()
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._ready = threading.Event()
+        self._warmup_error: Optional[str] = None
+        self._queue_timeout_s = queue_timeout_s
+        self._warmup_text = warmup_text
+        self._warmup_persona = warmup_persona
+        self._frame_ms = frame_ms
+        self._segmenter = StreamingNormalizerAdapter(normalizer=_RawText(), min_chars=40)
+        self._httpd = _QuietHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._serve_thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._httpd.server_address[:2]
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start warm-up and the accept loop on background threads."""
+        threading.Thread(target=self._warm_up, name="tts-warmup", daemon=True).start()
+        self._serve_thread = threading.Thread(target=self._httpd.serve_forever, name="tts-http", daemon=True)
+        self._serve_thread.start()
+        logger.info(f"[server] listening on http://{self.address[0]}:{self.address[1]}")
+
+    def serve_forever(self) -> None:
+        """Warm up in the background and serve on the calling thread."""
+        threading.Thread(target=self._warm_up, name="tts-warmup", daemon=True).start()
+        logger.info(f"[server] listening on http://{self.address[0]}:{self.address[1]}")
+        self._httpd.serve_forever()
+
+    def shutdown(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        return self._ready.wait(timeout)
+
+    def status(self) -> Dict[str, Any]:
+        return {"ready": self._ready.is_set(), "error": self._warmup_error}
+
+    def _warm_up(self) -> None:
+        t0 = time.monotonic()
+        try:
+            service = self._factory()
+            result = service.speak(SynthesisRequest(text=self._warmup_text, persona=self._warmup_persona))
+            if result.chunk is not None:
+                result.chunk.release()
+        except Exception as exc:
+            self._warmup_error = str(exc)
+            logger.error(f"[server] warm-up failed: {exc}")
+            return
+        self._service = service
+        self._speakers = frozenset(service.get_speakers())
+        self._ready.set()
+        logger.info(f"[server] ready after {time.monotonic() - t0:.2f}s warm-up")
+
+    # ------------------------------------------------------------------
+    # Synthesis
+    # ------------------------------------------------------------------
+
+    def parse_request(self, payload: Dict[str, Any]) -> SynthesisRequest:
+        """Validate a JSON body into a SynthesisRequest. Raises ValueError."""
+        if not isinstance(payload, dict):
+            raise ValueError("Request body must be a JSON object")
+        text, persona = payload.get("text"), payload.get("persona")
+        if not isinstance(text, str) or not text.strip():
+            raise ValueError("'text' must be a non-empty string")
+        if not isinstance(persona, str):
+            raise ValueError("'persona' is required")
+        metadata = payload.get("metadata") or {}
+        if not isinstance(metadata, dict):
+            raise ValueError("'metadata' must be an object")
+        rate = payload.get("rate", 1.0)
+        if isinstance(rate, bool) or not isinstance(rate, (int, float)):
+            raise ValueError("'rate' must be a number")
+        speaker_id = payload.get("speaker_id")
+        if speaker_id is not None and not isinstance(speaker_id, str):
+            raise ValueError("'speaker_id' must be a string")
+        timeout_ms = payload.get("timeout_ms")
+        deadline = None
+        if timeout_ms is not None:
+            if isinstance(timeout_ms, bool) or not isinstance(timeout_ms, (int, float)) or timeout_ms <= 0:
+                raise ValueError("'timeout_ms' must be a positive number")
+            deadline = time.monotonic() + timeout_ms / 1000.0
+        return SynthesisRequest(
+            text=text, persona=persona, metadata=metadata, speaker_id=speaker_id, rate=float(rate),
+            deadline=deadline,
+        )
+
+    def synthesize_stream(self, request: SynthesisRequest) -> Iterator[AudioChunk]:
+        """Yield one AudioChunk per sentence while holding a concurrency slot.
+
+        Every segment carries the request's ``cancel_token`` and
+        ``deadline``; once one is cancelled or expired the stream stops.
+
+        Raises:
+            ServerBusy: Not ready, no slot within ``queue_timeout_s``, or the
+                        service shed the request under overload.
+            ValueError: ``speaker_id`` not offered by the model, or unknown
+                        persona or empty text (from the service).
+            RequestCancelled: The request was cancelled or its ``timeout_ms``
+                              elapsed before the next segment was ready.
+        """
+        deadline = time.monotonic() + self._queue_timeout_s
+        if not self._ready.wait(self._queue_timeout_s):
+            raise ServerBusy(self._warmup_error or "Model is still warming up")
+        self._check_speaker(request.speaker_id)
+        if not self._slots.acquire(timeout=max(0.0, deadline - time.monotonic())):
+            raise ServerBusy("All synthesis slots are busy")
+        try:
+            segments = [s.strip() for s in self._segmenter.normalize_stream([request.text]) if s.strip()]
+            for index, segment in enumerate(segments):
+                result = self._service.speak(
+                    SynthesisRequest(
+                        text=segment,
+                        persona=request.persona,
+                        metadata={**request.metadata, "segment": index, "segments": len(segments)},
+                        speaker_id=request.speaker_id,
+                        rate=request.rate,
+                        cancel_token=request.cancel_token,
+                        deadline=request.deadline,
+                    )
+                )
+                if not result.success:
+                    if result.outcome in (CANCELLED, DEADLINE_EXCEEDED):
+                        raise RequestCancelled(result.outcome, result.error or result.outcome)
+                    if result.outcome == "shed":
+                        raise ServerBusy(result.error or "Request shed: service overloaded")
+                    raise RuntimeError(result.error or f"Synthesis failed ({result.outcome})")
+                yield result.chunk
+        finally:
+            self._slots.release()
+
+    def _check_speaker(self, speaker_id: Optional[str]) -> None:
+        """Reject a client ``speaker_id`` the model does not offer.
+
+        ``NO_SPEAKER`` is accepted only by single-speaker models.
+        """
+        if speaker_id is None or speaker_id in self._speakers:
+            return
+        if speaker_id == NO_SPEAKER and not self._speakers:
+            return
+        raise ValueError(f"Unknown speaker_id '{speaker_id}'")
+
+    def pcm_frames(self, chunk: AudioChunk) -> Iterator[bytes]:
+        """Split a chunk into ``frame_ms`` frames of int16 PCM.
+
+        The chunk is consumed: its pooled buffer (if any) is released once
+        the PCM has been produced.
+        """
+        pcm = pcm_to_bytes(chunk.samples)
+        chunk.release()
+        frame_bytes = max(2, int(chunk.sample_rate * self._frame_ms / 1000) * 2)
+        for start in range(0, len(pcm), frame_bytes):
+            yield pcm[start:start + frame_bytes]
+
+
+# ---------------------------------------------------------------------------
+# HTTP / WebSocket handler
+# ---------------------------------------------------------------------------
+
+def _wav_stream_header(sample_rate: int) -> bytes:
+    """44-byte PCM16 mono WAV header with 'unknown length' sizes for streaming."""
+    return wav_header(sample_rate)
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    """Log client disconnects at DEBUG instead of printing a traceback."""
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        exc = sys.exc_info()[1]
+        if isinstance(exc, ConnectionError):
+            logger.debug(f"[server] client {client_address} disconnected: {exc}")
+            return
+        super().handle_error(request, client_address)
+
+
+def _make_handler(server: TTSServer):
+    class Handler(_TTSRequestHandler):
+        tts = server
+    return Handler
+
+
+class _TTSRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    tts: TTSServer
+
+    def log_message(self, fmt: str, *args: Any) -> None:
+        logger.debug(f"[server] {self.address_string()} {fmt % args}")
+
+    # -- routing -------------------------------------------------------
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        if url.path == "/ready":
+            self._handle_ready(parse_qs(url.query))
+        elif url.path == "/ws":
+            self._handle_websocket()
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path {url.path}"})
+
+    def do_POST(self) -> None:
+        url = urlsplit(self.path)
+        if url.path == "/synthesize":
+            self._handle_synthesize(parse_qs(url.query))
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path {url.path}"})
+
+    # -- endpoints -----------------------------------------------------
+
+    def _handle_ready(self, query: Dict[str, List[str]]) -> None:
+        raw = query.get("wait", ["0"])[0]
+        try:
+            wait = float(raw)
+        except ValueError:
+            wait = math.nan
+        if not math.isfinite(wait) or wait < 0:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": f"wait must be a number of seconds >= 0, got '{raw}'"})
+            return
+        wait = min(wait, _MAX_READY_WAIT_S)
+        if wait > 0:
+            self.tts.wait_ready(wait)
+        status = self.tts.status()
+        code = HTTPStatus.OK if status["ready"] else HTTPStatus.SERVICE_UNAVAILABLE
+        self._send_json(code, status)
+
+    def _handle_synthesize(self, query: Dict[str, List[str]]) -> None:
+        fmt = query.get("format", ["pcm"])[0]
+        if fmt not in ("pcm", "wav"):
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": f"Unsupported format '{fmt}'"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+            if length < 0:
+                raise ValueError("Invalid Content-Length")
+            if length > _MAX_BODY_BYTES:
+                raise ValueError("Request body too large")
+            request = self.tts.parse_request(json.loads(self.rfile.read(length) or b"null"))
+            stream = self.tts.synthesize_stream(request)
+            first = next(stream)
+        except ServerBusy as exc:
+            self._send_json(HTTPStatus.SERVICE_UNAVAILABLE, {"error": str(exc)}, {"Retry-After": "1"})
+            return
+        except RequestCancelled as exc:
+            self._send_json(HTTPStatus.GATEWAY_TIMEOUT, {"error": str(exc), "outcome": exc.outcome})
+            return
+        except (ValueError, json.JSONDecodeError) as exc:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+            return
+        except Exception as exc:
+            logger.error(f"[server] synthesis failed: {exc}")
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(exc)})
+            return
+
+        self.send_response(HTTPStatus.OK)
+        content_type = "audio/wav" if fmt == "wav" else f"audio/L16; rate={first.sample_rate}; channels=1"
+        self.send_header("Content-Type", content_type)
+        self.send_header("X-Sample-Rate", str(first.sample_rate))
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            if fmt == "wav":
+                self._write_chunk(_wav_stream_header(first.sample_rate))
+            for chunk in _prepend(first, stream):
+                for frame in self.tts.pcm_frames(chunk):
+                    self._write_chunk(frame)
+            self._write_chunk(b"")
+        except Exception as exc:
+            # Headers are gone; the only way to signal failure is to drop the connection.
+            logger.error(f"[server] stream aborted: {exc}")
+            stream.close()
+            self.close_connection = True
+
+    def _handle_websocket(self) -> None:
+        key = self.headers.get("Sec-WebSocket-Key")
+        if self.headers.get("Upgrade", "").lower() != "websocket" or not key:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": "Expected a WebSocket upgrade"})
+            return
+        accept = base64.b64encode(hashlib.sha1((key + _WS_GUID).encode()).digest()).decode()
+        self.send_response(HTTPStatus.SWITCHING_PROTOCOLS)
+        self.send_header("Upgrade", "websocket")
+        self.send_header("Connection", "Upgrade")
+        self.send_header("Sec-WebSocket-Accept", accept)
+        self.end_headers()
+        self.close_connection = True
+
+        try:
+            while True:
+                message = self._ws_receive()
+                if message is None:
+                    return
+                self._ws_synthesize(message)
+        except OSError as exc:
+            logger.info(f"[server] websocket client went away: {exc}")
+
+    def _ws_synthesize(self, message: bytes) -> None:
+        stream: Optional[Iterator[AudioChunk]] = None
+        try:
+            request = self.tts.parse_request(json.loads(message))
+            stream = self.tts.synthesize_stream(request)
+            total_s = 0.0
+            started = False
+            for chunk in stream:
+                if not started:
+                    self._ws_send_json({"event": "start", "sample_rate": chunk.sample_rate})
+                    started = True
+                for frame in self.tts.pcm_frames(chunk):
+                    self._ws_send(_OP_BINARY, frame)
+                total_s += chunk.duration_s
+            self._ws_send_json({"event": "end", "duration_s": round(total_s, 3)})
+        except OSError:
+            raise
+        except ServerBusy as exc:
+            self._ws_send_json({"event": "error", "status": 503, "error": str(exc)})
+        except RequestCancelled as exc:
+            self._ws_send_json({"event": "error", "status": 504, "error": str(exc), "outcome": exc.outcome})
+        except (ValueError, json.JSONDecodeError) as exc:
+            self._ws_send_json({"event": "error", "status": 400, "error": str(exc)})
+        except Exception as exc:
+            logger.error(f"[server] websocket synthesis failed: {exc}")
+            self._ws_send_json({"event": "error", "status": 500, "error": str(exc)})
+        finally:
+            if stream is not None:
+                stream.close()
+
+    # -- helpers -------------------------------------------------------
+
+    def _send_json(self, status: int, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(b"%X\r\n%s\r\n" % (len(data), data))
+        if not data:
+            self.wfile.flush()
+
+    def _ws_send(self, opcode: int, payload: bytes) -> None:
+        n = len(payload)
+        if n < 126:
+            header = struct.pack("!BB", 0x80 | opcode, n)
+        elif n < 1 << 16:
+            header = struct.pack("!BBH", 0x80 | opcode, 126, n)
+        else:
+            header = struct.pack("!BBQ", 0x80 | opcode, 127, n)
+        self.wfile.write(header + payload)
+        self.wfile.flush()
+
+    def _ws_send_json(self, body: Dict[str, Any]) -> None:
+        self._ws_send(_OP_TEXT, json.dumps(body).encode())
+
+    def _ws_receive(self) -> Optional[bytes]:
+        """Return the next complete data message, answering pings; None on close.
+
+        Closes with 1002 on an unmasked client frame (RFC 6455 §5.1) and
+        with 1009 once a message outgrows ``_MAX_BODY_BYTES``, counting
+        every continuation frame.
+        """
+        parts: List[bytes] = []
+        size = 0
+        while True:
+            head = self.rfile.read(2)
+            if len(head) < 2:
+                return None
+            fin, opcode = head[0] & 0x80, head[0] & 0x0F
+            masked, n = head[1] & 0x80, head[1] & 0x7F
+            if not masked:
+                self._ws_send(_OP_CLOSE, struct.pack("!H", 1002))
+                return None
+            if n == 126:
+                n = struct.unpack("!H", self.rfile.read(2))[0]
+            elif n == 127:
+                n = struct.unpack("!Q", self.rfile.read(8))[0]
+            if size + n > _MAX_BODY_BYTES:
+                self._ws_send(_OP_CLOSE, struct.pack("!H", 1009))
+                return None
+            mask = self.rfile.read(4)
+            payload = self.rfile.read(n)
+            payload = (np.frombuffer(payload, np.uint8) ^ np.resize(np.frombuffer(mask, np.uint8), n)).tobytes()
+
+            if opcode == _OP_CLOSE:
+                self._ws_send(_OP_CLOSE, payload[:2])
+                return None
+            if opcode == _OP_PING:
+                self._ws_send(_OP_PONG, payload)
+                continue
+            if opcode == _OP_PONG:
+                continue
+            if opcode in (_OP_TEXT, _OP_BINARY, _OP_CONT):
+                parts.append(payload)
+                size += n
+                if fin:
+                    return b"".join(parts)
+
+
+def _prepend(first: AudioChunk, rest: Iterator[AudioChunk]) -> Iterator[AudioChunk]:
+    yield first
+    yield from rest
+
+
+# ---------------------------------------------------------------------------
+# Console script
+# ---------------------------------------------------------------------------
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="tts-v2-serve", description="Serve TTSService over HTTP/WebSocket.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--max-concurrency", type=int, default=2)
+    parser.add_argument("--queue-timeout", type=float, default=30.0)
+    add_pipeline_arguments(parser)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    server = TTSServer(
+        service_factory=lambda: build_service(args, buffer_pool=BufferPool()),
+        host=args.host,
+        port=args.port,
+        max_concurrency=args.max_concurrency,
+        queue_timeout_s=args.queue_timeout,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("[server] shutting down")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,11 @@ from .vocoder_port import VocoderPort
 from .normalizer_port import NormalizerPort
 from .audio_sink_port import AudioSinkPort
 from .audit_port import AuditPort
+from .post_processor_port import PostProcessorPort
+from .batch_synthesizer_port import BatchSynthesizerPort
+from .rendition_store_port import RenditionStorePort
+from .time_scaler_port import TimeScalerPort
+from .speaker_routing_port import SpeakerRoutingPort
 
 __all__ = [
     "SynthesizerPort",
@@ -11,4 +16,9 @@ __all__ = [
     "NormalizerPort",
     "AudioSinkPort",
     "AuditPort",
+    "PostProcessorPort",
+    "BatchSynthesizerPort",
+    "RenditionStorePort",
+    "TimeScalerPort",
+    "SpeakerRoutingPort",
 ]
@@ -10,14 +10,21 @@ class AudioSinkPort(Protocol):
     """Write an AudioChunk to a destination.
 
     Implementations:
-        FileSinkAdapter    — writes WAV to disk
-        StreamSinkAdapter  — writes PCM to a socket/IVR stream (future)
-        NullSinkAdapter    — discards audio, for unit tests
+        FileSinkAdapter         — writes WAV to disk
+        EncodedFileSinkAdapter  — FLAC / Ogg / PCM16 encoded in the background
+        StreamingWavSinkAdapter — appends chunk streams to one WAV incrementally
+        StreamSinkAdapter       — writes PCM to a socket/IVR stream (future)
+        NullSinkAdapter         — discards audio, for unit tests
     """
 
     def write(self, chunk: AudioChunk, destination: str) -> str:
         """Persist or stream the audio chunk.
 
+        ``chunk.samples`` is only guaranteed valid until this returns —
+        the caller may release a pooled buffer afterwards. Sinks that
+        finish the write in the background take their own reference with
+        ``chunk.retain()`` and release it when done.
+
         Args:
             chunk:       The synthesised AudioChunk.
             destination: Adapter-specific destination string.
@@ -21,8 +21,13 @@ class AuditPort(Protocol):
             speaker_id    (str)   backend speaker ID
             text_len      (int)   character count of normalised text
             duration_s    (float) audio duration in seconds
+            elapsed_s     (float) service time, excluding waits between stages
+            queue_s       (float) time spent queued between pipeline stages
             rtf           (float) real-time factor (elapsed / duration)
             output_path   (str)   where the file was written, if applicable
+            degradation   (str)   overload fallback used: "shed", "cached",
+                                  "fallback", or None for normal service
+            load          (dict)  rolling RTF / in-flight count at admission
             ts            (float) unix timestamp (added by adapter if absent)
 
         Args:
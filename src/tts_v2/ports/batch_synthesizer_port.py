@@ -0,0 +1,30 @@
+"""BatchSynthesizerPort — SynthesizerPort for backends that can batch forward passes."""
+
+from typing import List, Protocol, Sequence, runtime_checkable
+
+from ..domain.audio import AudioChunk, SynthesisRequest
+from .synthesizer_port import SynthesizerPort
+
+
+@runtime_checkable
+class BatchSynthesizerPort(SynthesizerPort, Protocol):
+    """A SynthesizerPort that can also render several requests in one call.
+
+    Implementations:
+        CoquiSynthesizerAdapter  — one padded VITS forward pass per batch
+        MockSynthesizerAdapter   — loops over synthesize(), for tests
+    """
+
+    def synthesize_batch(self, requests: Sequence[SynthesisRequest]) -> List[AudioChunk]:
+        """Synthesise every request, returning chunks in the same order.
+
+        Args:
+            requests: Fully-normalised requests; may mix personas.
+
+        Returns:
+            One AudioChunk per request, ``result[i]`` for ``requests[i]``.
+
+        Raises:
+            RuntimeError: On synthesis failure (the whole batch fails).
+        """
+        ...
@@ -0,0 +1,31 @@
+"""PostProcessorPort — contract for waveform conditioning between synthesis and sink."""
+
+from typing import Protocol, runtime_checkable
+
+from ..domain.audio import AudioChunk
+
+
+@runtime_checkable
+class PostProcessorPort(Protocol):
+    """Condition a synthesised AudioChunk before it is written or streamed.
+
+    Implementations:
+        PostProcessingChainAdapter — silence trim, loudness, limiter, fades
+    """
+
+    def process(self, chunk: AudioChunk) -> AudioChunk:
+        """Return the processed chunk.
+
+        Implementations may modify ``chunk.samples`` in place and return a
+        chunk that shares (a view of) the same buffer — callers must not
+        rely on the input chunk being unchanged. The input's buffer
+        reference (``chunk.lease``) passes to the returned chunk, or is
+        released if the implementation copies.
+
+        Args:
+            chunk: Freshly synthesised audio.
+
+        Returns:
+            Processed AudioChunk.
+        """
+        ...
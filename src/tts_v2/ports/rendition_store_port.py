@@ -0,0 +1,29 @@
+"""RenditionStorePort — contract for pre-rendered / cached audio lookups."""
+
+from typing import Optional, Protocol, runtime_checkable
+
+from ..domain.audio import AudioChunk, SynthesisRequest
+
+
+@runtime_checkable
+class RenditionStorePort(Protocol):
+    """Look up and record finished renditions of normalised requests.
+
+    Keys are derived from the normalised text and the voice (persona or
+    ``speaker_id``); output paths and metadata are ignored.
+
+    Implementations:
+        InMemoryRenditionStoreAdapter — bounded in-process LRU
+        PhrasePackAdapter             — memory-mapped pre-rendered phrase pack
+    """
+
+    def lookup(self, request: SynthesisRequest) -> Optional[AudioChunk]:
+        """Return a stored rendition of ``request``, or None.
+
+        Returned samples must be treated as read-only.
+        """
+        ...
+
+    def store(self, request: SynthesisRequest, chunk: AudioChunk) -> None:
+        """Record ``chunk`` as the rendition of ``request``."""
+        ...
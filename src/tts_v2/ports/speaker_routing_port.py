@@ -0,0 +1,27 @@
+"""SpeakerRoutingPort — SynthesizerPort for backends that pick the speaker per persona."""
+
+from typing import Optional, Protocol, runtime_checkable
+
+from .synthesizer_port import SynthesizerPort
+
+
+@runtime_checkable
+class SpeakerRoutingPort(SynthesizerPort, Protocol):
+    """A SynthesizerPort that overrides the registry's speaker for some personas.
+
+    TTSService asks it which speaker a persona will actually be rendered
+    with, so the audit trail and rendition keys name that speaker rather
+    than the registry's.
+
+    Implementations:
+        RoutingSynthesizerAdapter — per-persona (model, speaker) routes
+    """
+
+    def speaker_for(self, persona: str) -> Optional[str]:
+        """Return the backend speaker ID ``persona`` is routed to.
+
+        Returns:
+            The speaker ID (``NO_SPEAKER`` for a single-speaker model), or
+            ``None`` if ``persona`` is not routed.
+        """
+        ...
@@ -16,6 +16,8 @@ class SynthesizerPort(Protocol):
     Implementations:
         CoquiSynthesizerAdapter  — wraps Coqui VITS (current default)
         MockSynthesizerAdapter   — returns silence, for unit tests
+        RoutingSynthesizerAdapter       — per-persona model routing
+        MicroBatchingSynthesizerAdapter — coalesces concurrent calls into batches
         FishSpeechAdapter        — future
         F5TTSAdapter             — future
     """
@@ -0,0 +1,30 @@
+"""TimeScalerPort — contract for changing speaking rate without resynthesis."""
+
+from typing import Protocol, runtime_checkable
+
+from ..domain.audio import AudioChunk
+
+
+@runtime_checkable
+class TimeScalerPort(Protocol):
+    """Change the duration of finished audio while keeping its pitch.
+
+    Implementations:
+        WsolaTimeScalerAdapter — NumPy WSOLA (waveform-similarity overlap-add)
+    """
+
+    def retime(self, chunk: AudioChunk, rate: float) -> AudioChunk:
+        """Return ``chunk`` spoken ``rate`` times as fast.
+
+        ``rate == 1.0`` returns ``chunk`` itself. Otherwise the result is a
+        new buffer and the input's reference (``chunk.lease``) is released;
+        ``chunk.samples`` may be read-only (stored renditions, phrase packs).
+
+        Args:
+            chunk: Audio to re-time.
+            rate:  Speaking-rate multiplier; output lasts ``duration / rate``.
+
+        Returns:
+            Re-timed AudioChunk at the same sample rate.
+        """
+        ...
@@ -18,6 +18,7 @@ class VocoderPort(Protocol):
 
     Implementations:
         PassthroughVocoderAdapter  — for end-to-end models (VITS etc.)
+        GriffinLimVocoderAdapter   — model-free NumPy reference, with vocode_stream()
         HiFiGANAdapter             — for two-stage Tacotron2/FastSpeech2 (future)
     """
 
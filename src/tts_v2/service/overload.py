@@ -0,0 +1,122 @@
+"""OverloadController — rolling RTF and in-flight tracking for load shedding.
+
+Pure Python (standard library only) so TTSService can use it without
+breaking the service-layer import rule.
+
+The controller tracks two signals:
+
+* **Rolling RTF** — synthesis seconds per audio second over the last
+  ``window_s`` seconds of primary-synthesizer renders. Samples age out,
+  so the node recovers on its own once degraded traffic stops feeding
+  the primary model.
+* **In-flight requests** — ``speak()`` calls currently admitted.
+
+The node is overloaded when either signal crosses its threshold.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterator, Tuple
+
+
+@dataclass(frozen=True)
+class OverloadPolicy:
+    """Thresholds for OverloadController.
+
+    Attributes:
+        max_rtf:             Rolling RTF above which the node is overloaded.
+        max_in_flight:       Concurrent requests above which it is overloaded.
+        shed_below_priority: Under overload, requests whose ``priority`` is
+                             below this are rejected outright.
+        window_s:            Age limit for RTF samples.
+        min_samples:         RTF is ignored until this many samples exist.
+    """
+
+    max_rtf: float = 1.0
+    max_in_flight: int = 8
+    shed_below_priority: int = 0
+    window_s: float = 30.0
+    min_samples: int = 3
+
+
+@dataclass(frozen=True)
+class LoadState:
+    """Load observed when a request was admitted."""
+
+    overloaded: bool
+    rolling_rtf: float
+    in_flight: int
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "overloaded": self.overloaded,
+            "rolling_rtf": round(self.rolling_rtf, 4),
+            "in_flight": self.in_flight,
+        }
+
+
+class OverloadController:
+    """Thread-safe load tracker consulted by TTSService on every request.
+
+    Args:
+        policy: Thresholds; defaults to :class:`OverloadPolicy`.
+    """
+
+    def __init__(self, policy: OverloadPolicy = OverloadPolicy()) -> None:
+        self.policy = policy
+        self._lock = threading.Lock()
+        self._samples: Deque[Tuple[float, float, float]] = deque()  # (t, elapsed_s, audio_s)
+        self._elapsed_sum = 0.0
+        self._audio_sum = 0.0
+        self._in_flight = 0
+
+    @contextmanager
+    def admit(self) -> Iterator[LoadState]:
+        """Count the caller as in flight and yield the load it observed."""
+        with self._lock:
+            self._in_flight += 1
+            state = self._state_locked(time.monotonic())
+        try:
+            yield state
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def record(self, elapsed_s: float, audio_s: float) -> None:
+        """Add one primary-synthesizer render to the rolling RTF."""
+        if audio_s <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._samples.append((now, elapsed_s, audio_s))
+            self._elapsed_sum += elapsed_s
+            self._audio_sum += audio_s
+            self._expire_locked(now)
+
+    def state(self) -> LoadState:
+        with self._lock:
+            return self._state_locked(time.monotonic())
+
+    def _state_locked(self, now: float) -> LoadState:
+        self._expire_locked(now)
+        rtf = self._elapsed_sum / self._audio_sum if self._audio_sum > 0 else 0.0
+        rtf_hot = len(self._samples) >= self.policy.min_samples and rtf > self.policy.max_rtf
+        busy = self._in_flight > self.policy.max_in_flight
+        return LoadState(overloaded=rtf_hot or busy, rolling_rtf=rtf, in_flight=self._in_flight)
+
+    def _expire_locked(self, now: float) -> None:
+        horizon = now - self.policy.window_s
+        while self._samples and self._samples[0][0] < horizon:
+            _, elapsed, audio = self._samples.popleft()
+            self._elapsed_sum -= elapsed
+            self._audio_sum -= audio
+        if not self._samples:
+            self._elapsed_sum = self._audio_sum = 0.0
+
+    def __repr__(self) -> str:
+        return f"OverloadController(policy={self.policy!r})"
@@ -0,0 +1,266 @@
+"""RequestProfiler — opt-in profiling of sampled and slow ``speak()`` calls.
+
+Pure Python (standard library only) so TTSService can use it without
+breaking the service-layer import rule.
+
+Two independent triggers:
+
+* **Sampling** — a ``sample_rate`` fraction of requests run under
+  :mod:`cProfile` and are dumped as ``.pstats`` (open with
+  ``python -m pstats`` or snakeviz). Only one cProfile session runs at a
+  time; a sampled request that arrives while another is being profiled is
+  skipped and counted as ``busy``.
+* **Slow requests** — a single watchdog thread polls the requests in
+  flight every ``sample_interval_s``. Once a request has been running for
+  ``slow_threshold_s`` its thread's stack is sampled until it finishes,
+  and the samples are dumped as collapsed stacks (``frame;frame;… count``,
+  the input format of ``flamegraph.pl`` and speedscope). Samples show where
+  the request spent its overrun, not the part before the threshold.
+
+Each dump has a ``.json`` sidecar with the persona, text length, elapsed
+time and trigger. The output directory keeps at most ``max_profiles``
+dumps; the oldest are deleted first.
+
+A request that is neither sampled nor watched costs one random draw; with
+a slow threshold set it also costs a dict insert and delete.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import json
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+_SAFE_NAME = re.compile(r"[^A-Za-z0-9_-]+")
+
+
+@dataclass(frozen=True)
+class ProfilingPolicy:
+    """Settings for RequestProfiler.
+
+    Attributes:
+        sample_rate:       Fraction of requests profiled with cProfile (0 = none).
+        slow_threshold_s:  Requests running longer than this get their stack
+                           sampled (None = off).
+        sample_interval_s: Watchdog polling / stack sampling interval.
+        output_dir:        Directory that receives the dumps.
+        max_profiles:      Dumps kept in ``output_dir``; oldest are deleted.
+        seed:              Seed for the sampling draw (None → nondeterministic).
+    """
+
+    sample_rate: float = 0.0
+    slow_threshold_s: Optional[float] = None
+    sample_interval_s: float = 0.01
+    output_dir: str = "outputs/profiles"
+    max_profiles: int = 200
+    seed: Optional[int] = None
+
+
+class _Watch:
+    """One in-flight request observed by the watchdog."""
+
+    __slots__ = ("ident", "t_start", "stacks")
+
+    def __init__(self, ident: int, t_start: float) -> None:
+        self.ident = ident
+        self.t_start = t_start
+        self.stacks: Counter = Counter()
+
+
+class RequestProfiler:
+    """Thread-safe profiler consulted by TTSService on every request.
+
+    Args:
+        policy: Triggers and output settings; defaults to :class:`ProfilingPolicy`
+                (which profiles nothing).
+
+    Raises:
+        ValueError: If ``sample_rate`` is outside [0, 1] or ``max_profiles`` < 1.
+    """
+
+    def __init__(self, policy: ProfilingPolicy = ProfilingPolicy()) -> None:
+        if not 0.0 <= policy.sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be in [0, 1], got {policy.sample_rate}")
+        if policy.max_profiles < 1:
+            raise ValueError(f"max_profiles must be ≥ 1, got {policy.max_profiles}")
+        self.policy = policy
+        self._rng = random.Random(policy.seed)
+        self._cprofile_lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._watches: Dict[int, _Watch] = {}
+        self._watchdog: Optional[threading.Thread] = None
+        self._dump_lock = threading.Lock()
+        self._dumps: Optional[Deque[str]] = None
+        self._sequence = 0
+
+        self._profiled = 0
+        self._slow = 0
+        self._busy = 0
+        self._pruned = 0
+        self._write_failures = 0
+
+    @contextmanager
+    def profile(self, persona: str, text_len: int) -> Iterator[None]:
+        """Profile the enclosed request if it is sampled or turns out slow."""
+        policy = self.policy
+        sampled = policy.sample_rate > 0 and self._rng.random() < policy.sample_rate
+        if not sampled and policy.slow_threshold_s is None:
+            yield
+            return
+
+        profiler: Optional[cProfile.Profile] = None
+        if sampled:
+            if self._cprofile_lock.acquire(blocking=False):
+                profiler = cProfile.Profile()
+            else:
+                with self._dump_lock:
+                    self._busy += 1
+
+        watch = self._watch_start() if policy.slow_threshold_s is not None else None
+        t0 = time.monotonic()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                self._cprofile_lock.release()
+            elapsed = time.monotonic() - t0
+            meta = {"persona": persona, "text_len": text_len, "elapsed_s": round(elapsed, 4)}
+            if profiler is not None:
+                self._dump("sampled", meta, "pstats", profiler.dump_stats)
+            if watch is not None:
+                self._watch_stop(watch)
+                if watch.stacks:
+                    stacks = watch.stacks
+                    meta["samples"] = sum(stacks.values())
+                    self._dump("slow", meta, "collapsed", lambda path: _write_collapsed(path, stacks))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return trigger and output counters."""
+        with self._dump_lock:
+            return {
+                "profiled": self._profiled,
+                "slow": self._slow,
+                "busy": self._busy,
+                "pruned": self._pruned,
+                "write_failures": self._write_failures,
+                "output_dir": self.policy.output_dir,
+            }
+
+    # ------------------------------------------------------------------
+    # Slow-request watchdog
+    # ------------------------------------------------------------------
+
+    def _watch_start(self) -> _Watch:
+        watch = _Watch(threading.get_ident(), time.monotonic())
+        with self._cond:
+            self._watches[id(watch)] = watch
+            if self._watchdog is None:
+                self._watchdog = threading.Thread(target=self._watchdog_loop, name="tts-profiler", daemon=True)
+                self._watchdog.start()
+            self._cond.notify()
+        return watch
+
+    def _watch_stop(self, watch: _Watch) -> None:
+        with self._cond:
+            del self._watches[id(watch)]
+
+    def _watchdog_loop(self) -> None:
+        threshold = self.policy.slow_threshold_s
+        interval = self.policy.sample_interval_s
+        while True:
+            with self._cond:
+                while not self._watches:
+                    self._cond.wait()
+                now = time.monotonic()
+                due = [w for w in self._watches.values() if now - w.t_start >= threshold]
+                if due:
+                    frames = sys._current_frames()
+                    for watch in due:
+                        frame = frames.get(watch.ident)
+                        if frame is not None:
+                            watch.stacks[_collapse(frame)] += 1
+                    del frames
+            time.sleep(interval)
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def _dump(self, trigger: str, meta: Dict[str, Any], extension: str, write: Any) -> None:
+        directory = self.policy.output_dir
+        with self._dump_lock:
+            if self._dumps is None:
+                os.makedirs(directory, exist_ok=True)
+                self._dumps = deque(sorted(_existing_dumps(directory)))
+            self._sequence += 1
+            stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+            persona = _SAFE_NAME.sub("_", meta["persona"])
+            base = f"{stamp}-{self._sequence:04d}-{trigger}-{persona}-{meta['text_len']}"
+            try:
+                write(os.path.join(directory, f"{base}.{extension}"))
+                with open(os.path.join(directory, f"{base}.json"), "w", encoding="utf-8") as fh:
+                    json.dump({"trigger": trigger, **meta, "format": extension}, fh)
+            except OSError as exc:
+                self._write_failures += 1
+                logger.warning(f"[profiler] could not write {base}: {exc}")
+                return
+            self._dumps.append(base)
+            if trigger == "sampled":
+                self._profiled += 1
+            else:
+                self._slow += 1
+            while len(self._dumps) > self.policy.max_profiles:
+                self._remove(self._dumps.popleft())
+        logger.info(f"[profiler] {trigger} request profiled → {base}.{extension} ({meta['elapsed_s']:.3f}s)")
+
+    def _remove(self, base: str) -> None:
+        directory = self.policy.output_dir
+        for name in os.listdir(directory):
+            if name.startswith(base + "."):
+                try:
+                    os.remove(os.path.join(directory, name))
+                except OSError:
+                    pass
+        self._pruned += 1
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestProfiler(sample_rate={self.policy.sample_rate}, "
+            f"slow_threshold_s={self.policy.slow_threshold_s}, output_dir={self.policy.output_dir!r})"
+        )
+
+
+def _collapse(frame: Any) -> str:
+    """Render a frame chain root-first as a collapsed-stack key."""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+def _write_collapsed(path: str, stacks: Counter) -> None:
+    with open(path, "w", encoding="utf-8") as fh:
+        for stack, count in stacks.most_common():
+            fh.write(f"{stack} {count}\n")
+
+
+def _existing_dumps(directory: str) -> set:
+    return {name.rsplit(".", 1)[0] for name in os.listdir(directory) if name.endswith(".json")}
@@ -16,14 +16,22 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Optional
+from dataclasses import dataclass, field, replace
+from typing import List, Optional, Tuple
 
-from ..domain.audio import AudioChunk, SynthesisRequest, SynthesisResult
-from ..domain.voice import get_speaker
+from ..domain.audio import MAX_SPEAKING_RATE, MIN_SPEAKING_RATE, AudioChunk, SynthesisRequest, SynthesisResult
+from ..domain.cancellation import RequestCancelled
+from ..domain.voice import Speaker, get_speaker
 from ..ports.audit_port import AuditPort
 from ..ports.audio_sink_port import AudioSinkPort
 from ..ports.normalizer_port import NormalizerPort
+from ..ports.post_processor_port import PostProcessorPort
+from ..ports.rendition_store_port import RenditionStorePort
+from ..ports.speaker_routing_port import SpeakerRoutingPort
 from ..ports.synthesizer_port import SynthesizerPort
+from ..ports.time_scaler_port import TimeScalerPort
+from .overload import LoadState, OverloadController
+from .profiling import RequestProfiler
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +78,13 @@ class TTSService:
         normalizer: NormalizerPort,
         audio_sink: AudioSinkPort,
         audit: AuditPort,
+        postprocessor: Optional[PostProcessorPort] = None,
+        overload: Optional[OverloadController] = None,
+        renditions: Optional[RenditionStorePort] = None,
+        fallback_synthesizer: Optional[SynthesizerPort] = None,
+        profiler: Optional[RequestProfiler] = None,
+        phrase_pack: Optional[RenditionStorePort] = None,
+        time_scaler: Optional[TimeScalerPort] = None,
     ) -> None:
         """Inject all ports.
 
@@ -78,17 +93,45 @@ class TTSService:
             normalizer:  Transforms raw text into TTS-ready spoken form.
             audio_sink:  Writes AudioChunk to a file, stream, or /dev/null.
             audit:       Records compliance events.
+            postprocessor: Optional waveform conditioning (trim, loudness,
+                         limiter, fades) applied between synthesis and sink.
+            overload:    Optional load tracker. When it reports overload,
+                         low-priority requests are shed and the rest are
+                         served from ``renditions`` or ``fallback_synthesizer``
+                         where possible (see :meth:`speak`).
+            renditions:  Optional store of finished renditions; every primary
+                         render is recorded, and lookups serve overload traffic.
+            fallback_synthesizer: Cheaper backend used under overload when no
+                         stored rendition exists.
+            profiler:    Optional profiler wrapped around every :meth:`speak`
+                         call; dumps sampled and slow requests to disk.
+            phrase_pack: Optional store of pre-rendered phrases. :meth:`speak`
+                         serves every match from it without synthesis.
+            time_scaler: Re-times audio for requests with ``rate != 1.0``;
+                         without one such requests are rejected.
         """
         self._synth = synthesizer
         self._norm = normalizer
         self._sink = audio_sink
         self._audit = audit
+        self._post = postprocessor
+        self._overload = overload
+        self._renditions = renditions
+        self._fallback = fallback_synthesizer
+        self._profiler = profiler
+        self._phrase_pack = phrase_pack
+        self._time_scaler = time_scaler
         logger.info(
             f"TTSService ready | "
             f"synthesizer={type(synthesizer).__name__} | "
             f"normalizer={type(normalizer).__name__} | "
             f"sink={type(audio_sink).__name__} | "
-            f"audit={type(audit).__name__}"
+            f"audit={type(audit).__name__} | "
+            f"postprocessor={type(postprocessor).__name__ if postprocessor else None} | "
+            f"overload={'on' if overload else 'off'} | "
+            f"profiler={'on' if profiler else 'off'} | "
+            f"phrase_pack={'on' if phrase_pack else 'off'} | "
+            f"time_scaler={type(time_scaler).__name__ if time_scaler else None}"
         )
 
     # ------------------------------------------------------------------
@@ -102,10 +145,51 @@ class TTSService:
           1. Normalise text (abbreviations, numbers, OTP)
           2. Resolve speaker via domain registry
           3. Synthesise speech via synthesizer port
+             (then post-process, if a postprocessor is configured)
           4. Write audio via audio_sink port (if output_path is set)
           5. Record audit event
           6. Return SynthesisResult
 
+        Stages 1–2, 3 and 4–6 are also exposed individually as
+        :meth:`prepare`, :meth:`lookup_stored` / :meth:`render` and
+        :meth:`deliver` so that callers such as the bulk renderer can run
+        them on separate threads.
+
+        With a ``phrase_pack`` configured, a request whose normalised text
+        and voice match a pre-rendered phrase is answered from the pack
+        (audit ``source`` ``"phrase_pack"``), skipping synthesis,
+        post-processing and load shedding.
+
+        A request with ``rate != 1.0`` is rendered at rate 1.0 and re-timed
+        by the ``time_scaler``. Before synthesising, such a request is also
+        looked up in ``renditions``, so rate variants of audio that has
+        already been rendered cost only the re-timing (audit ``source``
+        ``"rendition_store"``).
+
+        With an ``overload`` controller configured, a request admitted while
+        the node is overloaded is degraded rather than queued behind the
+        backlog, in this order:
+
+          * priority below the policy threshold → shed (``success=False``)
+          * stored rendition available          → served from ``renditions``
+          * ``fallback_synthesizer`` configured → rendered by the fallback
+          * otherwise                           → rendered normally
+
+        The choice is recorded as ``degradation`` on the result and in the
+        audit event.
+
+        A request carrying a ``cancel_token`` or ``deadline`` is checked
+        after preparation, before every synthesis call, between segments
+        inside adapters that synthesise sentence by sentence, and before
+        the sink write. Once cancelled or expired it stops there: audio
+        already rendered is released, the overload slot is freed, and the
+        result and audit event carry ``outcome`` ``"cancelled"`` or
+        ``"deadline_exceeded"`` with ``success=False``.
+
+        With a ``profiler`` configured, the whole call runs inside
+        :meth:`RequestProfiler.profile`, tagged with the persona and raw
+        text length.
+
         Args:
             request: Synthesis job. ``text`` may be raw — normalisation
                      is applied in stage 1.
@@ -116,10 +200,60 @@ class TTSService:
 
         Raises:
             RuntimeError: Propagated from synthesizer on failure.
-            ValueError:   If text is empty.
+            ValueError:   If text is empty or ``rate`` is unsupported.
+        """
+        if self._profiler is None:
+            return self._speak(request)
+        with self._profiler.profile(request.persona, len(request.text or "")):
+            return self._speak(request)
+
+    def get_speakers(self) -> List[str]:
+        """Return the backend speaker IDs the primary synthesizer accepts."""
+        return self._synth.get_speakers()
+
+    # ------------------------------------------------------------------
+    # Pipeline stages
+    # ------------------------------------------------------------------
+
+    def _speak(self, request: SynthesisRequest) -> SynthesisResult:
+        if self._overload is None:
+            return self._speak_admitted(request, None)
+        with self._overload.admit() as load:
+            return self._speak_admitted(request, load)
+
+    def _speak_admitted(self, request: SynthesisRequest, load: Optional[LoadState]) -> SynthesisResult:
+        prepared = self.prepare(request)
+        prepared.clock.resume()
+        try:
+            request.check_cancelled()
+            stored, source = self._lookup_stored(prepared)
+            if stored is not None:
+                return self.deliver(prepared, self._retime(prepared, stored), load=load, source=source)
+            if load is not None and load.overloaded:
+                return self._speak_degraded(prepared, load)
+            return self.deliver(prepared, self.render(prepared), load=load)
+        except RequestCancelled as exc:
+            return self._cancelled(prepared, exc, load)
+
+    def prepare(self, request: SynthesisRequest) -> PreparedRequest:
+        """Stages 1–2: validate, normalise text and resolve the speaker.
+
+        ``synth_request`` always has ``rate=1.0``: the model renders the
+        base rendition and :meth:`render` re-times it.
+
+        Raises:
+            ValueError: If text is empty, or ``rate`` is outside the
+                        supported range or needs a missing time scaler.
         """
         if not request.text or not request.text.strip():
             raise ValueError("SynthesisRequest.text must not be empty")
+        if request.rate != 1.0:
+            if not MIN_SPEAKING_RATE <= request.rate <= MAX_SPEAKING_RATE:
+                raise ValueError(
+                    f"SynthesisRequest.rate must be in [{MIN_SPEAKING_RATE}, {MAX_SPEAKING_RATE}], got {request.rate}"
+                )
+            if self._time_scaler is None:
+                raise ValueError("SynthesisRequest.rate != 1.0 needs a TTSService time_scaler")
 
         t_start = time.monotonic()
 
@@ -129,54 +263,319 @@ class TTSService:
 
         # 2. Resolve speaker (validates persona exists in registry)
         speaker = get_speaker(request.persona)
-        logger.info(f"[speak] persona='{request.persona}' → speaker='{speaker.speaker_id}'")
-
-        # 3. Build a normalised request for the synthesizer
-        norm_request = SynthesisRequest(
-            text=normalised_text,
-            persona=request.persona,
-            output_path=request.output_path,
-            metadata=request.metadata,
+        speaker_id = self._resolve_speaker_id(self._synth, request, speaker)
+        logger.info(f"[speak] persona='{request.persona}' → speaker='{speaker_id}'")
+
+        prepared = PreparedRequest(
+            request=request,
+            synth_request=replace(request, text=normalised_text, rate=1.0, speaker_id=speaker_id),
+            speaker=speaker,
+            t_start=t_start,
+        )
+        prepared.clock.pause()
+        return prepared
+
+    def lookup_stored(self, prepared: PreparedRequest) -> Tuple[Optional[AudioChunk], Optional[str]]:
+        """Stage 3, stored audio: serve a prepared request without synthesis.
+
+        Checks the ``phrase_pack`` and, for ``rate != 1.0``, the stored
+        ``renditions``, exactly as :meth:`speak` does before rendering.
+
+        Returns:
+            ``(chunk, source)`` with the chunk re-timed to the request's
+            ``rate`` and ``source`` naming the store for :meth:`deliver`,
+            or ``(None, None)`` when the request must be rendered.
+        """
+        prepared.clock.resume()
+        stored, source = self._lookup_stored(prepared)
+        if stored is not None:
+            stored = self._retime(prepared, stored)
+        prepared.clock.pause()
+        return stored, source
+
+    def render(self, prepared: PreparedRequest) -> AudioChunk:
+        """Stage 3: synthesise (and post-process) a prepared request.
+
+        ``renditions`` records the audio at rate 1.0; the returned chunk is
+        re-timed to the request's ``rate``.
+
+        Raises:
+            RuntimeError: Propagated from synthesizer on failure.
+            RequestCancelled: If the request was cancelled or expired before
+                              or during synthesis.
+        """
+        prepared.clock.resume()
+        t0 = time.monotonic()
+        chunk = self._synthesize_with(self._synth, prepared)
+        if self._overload is not None:
+            self._overload.record(time.monotonic() - t0, chunk.duration_s)
+        chunk = self._post_process(chunk)
+        if self._renditions is not None:
+            self._renditions.store(prepared.synth_request, chunk)
+        chunk = self._retime(prepared, chunk)
+        prepared.clock.pause()
+        return chunk
+
+    def deliver(
+        self,
+        prepared: PreparedRequest,
+        chunk: AudioChunk,
+        degradation: Optional[str] = None,
+        load: Optional[LoadState] = None,
+        source: str = "synthesis",
+    ) -> SynthesisResult:
+        """Stages 4–6: write to the sink, record the audit event, build the result.
+
+        ``source`` names where the audio came from in the audit event.
+
+        When the chunk was written to ``output_path`` it is released here
+        (see ``AudioChunk.release``); in-memory results hand the chunk and
+        its reference to the caller.
+
+        Raises:
+            RequestCancelled: If the request was cancelled or expired; the
+                              chunk is released and nothing is written.
+            Exception:        Propagated from the sink; the chunk is released.
+        """
+        prepared.clock.resume()
+        request = prepared.request
+        try:
+            request.check_cancelled()
+        except RequestCancelled:
+            chunk.release()
+            raise
+
+        # 4. Write to sink (file, stream, …)
+        output_path: Optional[str] = None
+        if request.output_path:
+            try:
+                output_path = self._sink.write(chunk, request.output_path)
+            except Exception:
+                chunk.release()
+                raise
+
+        # 5. Audit
+        rtf = self._log_audit(prepared, chunk, output_path, degradation, load, source)
+
+        logger.info(f"[speak] done | duration={chunk.duration_s:.2f}s | RTF={rtf:.3f}")
+
+        # 6. Written audio is not returned — hand a pooled buffer back.
+        if request.output_path:
+            chunk.release()
+
+        return SynthesisResult(
+            request=request,
+            chunk=chunk if not request.output_path else None,
+            output_path=output_path,
+            success=True,
+            degradation=degradation,
         )
 
-        # 4. Synthesise
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _resolve_speaker_id(synthesizer: SynthesizerPort, request: SynthesisRequest, speaker: Speaker) -> str:
+        """Backend speaker ID ``synthesizer`` will render ``request`` with.
+
+        A routing synthesizer's mapping wins, since it overrides the speaker
+        for routed personas; otherwise the request's own ``speaker_id``,
+        then the persona registry's. ``NO_SPEAKER`` is a valid result.
+        """
+        if isinstance(synthesizer, SpeakerRoutingPort):
+            routed = synthesizer.speaker_for(request.persona)
+            if routed is not None:
+                return routed
+        return speaker.speaker_id if request.speaker_id is None else request.speaker_id
+
+    def _synthesize_with(self, synthesizer: SynthesizerPort, prepared: PreparedRequest) -> AudioChunk:
+        request = prepared.request
+        request.check_cancelled()
         try:
-            chunk: AudioChunk = self._synth.synthesize(norm_request)
+            chunk: AudioChunk = synthesizer.synthesize(prepared.synth_request)
+        except RequestCancelled:
+            raise
         except Exception as exc:
             logger.error(f"[speak] synthesis failed: {exc}")
             raise RuntimeError(f"Synthesis failed for persona='{request.persona}': {exc}") from exc
 
         logger.info(
             f"[speak] synthesised {chunk.duration_s:.2f}s "
-            f"for {len(normalised_text)} chars"
+            f"for {len(prepared.synth_request.text)} chars"
         )
+        return chunk
+
+    def _lookup_stored(self, prepared: PreparedRequest) -> Tuple[Optional[AudioChunk], Optional[str]]:
+        """Return stored base audio for ``prepared`` and its audit source, if any."""
+        if self._phrase_pack is not None:
+            chunk = self._phrase_pack.lookup(prepared.synth_request)
+            if chunk is not None:
+                logger.info(f"[speak] served {chunk.duration_s:.2f}s from phrase pack")
+                return chunk, "phrase_pack"
+        if prepared.request.rate != 1.0 and self._renditions is not None:
+            chunk = self._renditions.lookup(prepared.synth_request)
+            if chunk is not None:
+                logger.info(f"[speak] re-timing stored rendition to rate={prepared.request.rate:.2f}")
+                return chunk, "rendition_store"
+        return None, None
+
+    def _retime(self, prepared: PreparedRequest, chunk: AudioChunk) -> AudioChunk:
+        rate = prepared.request.rate
+        if rate == 1.0:
+            return chunk
+        return self._time_scaler.retime(chunk, rate)
+
+    def _post_process(self, chunk: AudioChunk) -> AudioChunk:
+        if self._post is not None:
+            chunk = self._post.process(chunk)
+            logger.info(f"[speak] post-processed → {chunk.duration_s:.2f}s")
+        return chunk
+
+    def _speak_degraded(self, prepared: PreparedRequest, load: LoadState) -> SynthesisResult:
+        """Serve a request admitted under overload (see :meth:`speak`)."""
+        request = prepared.request
+        if request.priority < self._overload.policy.shed_below_priority:
+            logger.warning(
+                f"[speak] overloaded (rtf={load.rolling_rtf:.2f}, in_flight={load.in_flight}) — "
+                f"shedding priority={request.priority} request for persona='{request.persona}'"
+            )
+            self._log_audit(prepared, None, None, "shed", load, None, outcome="shed")
+            return SynthesisResult(
+                request=request,
+                chunk=None,
+                output_path=None,
+                success=False,
+                error="Request shed: service overloaded",
+                degradation="shed",
+                outcome="shed",
+            )
 
-        # 5. Write to sink (file, stream, …)
-        output_path: Optional[str] = None
-        if request.output_path:
-            output_path = self._sink.write(chunk, request.output_path)
-
-        elapsed = time.monotonic() - t_start
-        rtf = elapsed / chunk.duration_s if chunk.duration_s > 0 else 0.0
+        if self._renditions is not None:
+            cached = self._renditions.lookup(prepared.synth_request)
+            if cached is not None:
+                logger.info("[speak] overloaded — serving stored rendition")
+                return self.deliver(
+                    prepared, self._retime(prepared, cached), degradation="cached", load=load, source="rendition_store"
+                )
+
+        if self._fallback is not None:
+            logger.info(f"[speak] overloaded — rendering with {type(self._fallback).__name__}")
+            speaker_id = self._resolve_speaker_id(self._fallback, prepared.request, prepared.speaker)
+            prepared = replace(prepared, synth_request=replace(prepared.synth_request, speaker_id=speaker_id))
+            chunk = self._post_process(self._synthesize_with(self._fallback, prepared))
+            chunk = self._retime(prepared, chunk)
+            return self.deliver(prepared, chunk, degradation="fallback", load=load)
+
+        logger.warning("[speak] overloaded with no degradation available — rendering normally")
+        return self.deliver(prepared, self.render(prepared), load=load)
+
+    def _cancelled(
+        self, prepared: PreparedRequest, exc: RequestCancelled, load: Optional[LoadState]
+    ) -> SynthesisResult:
+        """Audit and return a request stopped at a cancellation checkpoint."""
+        request = prepared.request
+        logger.warning(
+            f"[speak] {exc.outcome} after {prepared.elapsed_s():.3f}s — "
+            f"persona='{request.persona}': {exc}"
+        )
+        self._log_audit(prepared, None, None, None, load, None, outcome=exc.outcome)
+        return SynthesisResult(
+            request=request,
+            chunk=None,
+            output_path=None,
+            success=False,
+            error=str(exc),
+            outcome=exc.outcome,
+        )
 
-        # 6. Audit
-        self._audit.log_synthesis({
+    def _log_audit(
+        self,
+        prepared: PreparedRequest,
+        chunk: Optional[AudioChunk],
+        output_path: Optional[str],
+        degradation: Optional[str],
+        load: Optional[LoadState],
+        source: Optional[str],
+        outcome: str = "ok",
+    ) -> float:
+        """Record the audit event and return the request's RTF."""
+        request = prepared.request
+        duration_s = chunk.duration_s if chunk is not None else 0.0
+        elapsed = prepared.elapsed_s()
+        rtf = elapsed / duration_s if duration_s > 0 else 0.0
+
+        event = {
             "persona": request.persona,
-            "speaker_id": speaker.speaker_id,
+            "speaker_id": prepared.synth_request.speaker_id,
             "text_raw": request.text,
-            "text_len": len(normalised_text),
-            "duration_s": round(chunk.duration_s, 3),
+            "text_len": len(prepared.synth_request.text),
+            "duration_s": round(duration_s, 3),
             "elapsed_s": round(elapsed, 3),
+            "queue_s": round(prepared.clock.queue_s, 3),
             "rtf": round(rtf, 4),
             "output_path": output_path,
             "metadata": request.metadata,
-        })
+            "degradation": degradation,
+            "source": source,
+            "rate": request.rate,
+            "outcome": outcome,
+        }
+        if load is not None:
+            event["load"] = load.as_dict()
+        self._audit.log_synthesis(event)
+        return rtf
+
+
+@dataclass
+class StageClock:
+    """Time a prepared request spends waiting between service stages.
+
+    Each stage calls :meth:`resume` on entry and :meth:`pause` when it hands
+    the request back to the caller. :meth:`TTSService.speak` runs the stages
+    back to back, so its ``queue_s`` stays near zero; pipelined callers
+    (e.g. the bulk renderer) hold requests in queues between stages.
+    """
 
-        logger.info(f"[speak] done | duration={chunk.duration_s:.2f}s | RTF={rtf:.3f}")
+    paused_at: Optional[float] = None
+    queue_s: float = 0.0
 
-        return SynthesisResult(
-            request=request,
-            chunk=chunk if not request.output_path else None,
-            output_path=output_path,
-            success=True,
-        )
+    def pause(self) -> None:
+        self.paused_at = time.monotonic()
+
+    def resume(self) -> None:
+        if self.paused_at is not None:
+            self.queue_s += time.monotonic() - self.paused_at
+            self.paused_at = None
+
+
+@dataclass(frozen=True)
+class PreparedRequest:
+    """Output of :meth:`TTSService.prepare` — a request ready for synthesis.
+
+    Attributes:
+        request:       The caller's original request (raw text).
+        synth_request: Copy with normalised text, as passed to the synthesizer.
+        speaker:       Registry speaker for the persona; the backend
+                       speaker actually used is ``synth_request.speaker_id``.
+        t_start:       ``time.monotonic()`` when preparation began.
+        clock:         Waits between stages; shared by copies made with
+                       ``dataclasses.replace``.
+    """
+
+    request: SynthesisRequest
+    synth_request: SynthesisRequest
+    speaker: Speaker
+    t_start: float
+    clock: StageClock = field(default_factory=StageClock, compare=False)
+
+    def elapsed_s(self) -> float:
+        """Service time since ``t_start``, excluding waits between stages.
+
+        This is what audit ``elapsed_s`` and ``rtf`` are measured from, so
+        RTF means the same for ``speak()`` and for pipelined stage calls.
+        """
+        now = time.monotonic()
+        clock = self.clock
+        waiting = now - clock.paused_at if clock.paused_at is not None else 0.0
+        return now - self.t_start - clock.queue_s - waiting
@@ -1,6 +1,7 @@
 """Shared infrastructure utilities — used by adapters only."""
 from .device_utils import apply_transformers_shim, resolve_device
-from .audio_utils import save_wav, pcm_to_bytes, resample
+from .buffer_pool import BufferLease, BufferPool, default_pool
+from .audio_utils import save_wav, pcm_to_bytes, resample, compare_waveforms, encode_audio, ENCODED_FORMATS, wav_header
 
 __all__ = [
     "apply_transformers_shim",
@@ -8,4 +9,11 @@ __all__ = [
     "save_wav",
     "pcm_to_bytes",
     "resample",
+    "compare_waveforms",
+    "encode_audio",
+    "ENCODED_FORMATS",
+    "wav_header",
+    "BufferPool",
+    "BufferLease",
+    "default_pool",
 ]
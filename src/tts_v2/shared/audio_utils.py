@@ -3,13 +3,17 @@
 USAGE: Import only from adapters. Never import from domain, ports, or service.
 """
 
+import io
 import logging
+import struct
 from pathlib import Path
-from typing import Union
+from typing import Dict, NamedTuple, Optional, Tuple, Union
 
 import numpy as np
 import soundfile as sf
 
+from .buffer_pool import default_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,6 +21,8 @@ def save_wav(
     samples: np.ndarray,
     filepath: Union[str, Path],
     sample_rate: int = 22050,
+    format: Optional[str] = None,
+    create_dirs: bool = True,
 ) -> None:
     """Write a float32 waveform array to a WAV file.
 
@@ -26,42 +32,163 @@ def save_wav(
         samples:     float32 mono waveform.
         filepath:    Destination path (parent dirs created automatically).
         sample_rate: Sample rate in Hz.
+        format:      libsndfile container (e.g. ``"WAV"``); inferred from
+                     the extension when None.
+        create_dirs: Create missing parent directories.
 
     Raises:
         ValueError: If waveform is empty.
         IOError:    If the file cannot be written.
     """
     filepath = Path(filepath)
-    filepath.parent.mkdir(parents=True, exist_ok=True)
+    if create_dirs:
+        filepath.parent.mkdir(parents=True, exist_ok=True)
 
     arr = np.asarray(samples, dtype=np.float32)
     if arr.size == 0:
         raise ValueError("Cannot save: waveform array is empty.")
 
+    scratch = None
     peak = np.abs(arr).max()
     if peak > 1.0:
-        arr = arr / peak
+        scratch = default_pool().acquire(arr.size)
+        arr = np.divide(arr, peak, out=scratch.array)
         logger.warning(f"Waveform normalised to prevent clipping (peak was {peak:.3f})")
 
-    sf.write(str(filepath), arr, sample_rate)
+    try:
+        sf.write(str(filepath), arr, sample_rate, format=format)
+    finally:
+        if scratch is not None:
+            scratch.release()
     logger.info(f"Saved WAV → {filepath} ({arr.shape[0] / sample_rate:.2f}s @ {sample_rate}Hz)")
 
 
+class EncodedFormat(NamedTuple):
+    """libsndfile container/codec pair for :func:`encode_audio`."""
+
+    container: str
+    subtype: str
+    extension: str
+    sample_rates: Optional[Tuple[int, ...]] = None  # None → any rate
+
+
+ENCODED_FORMATS: Dict[str, EncodedFormat] = {
+    "wav-pcm16": EncodedFormat("WAV", "PCM_16", ".wav"),
+    "flac": EncodedFormat("FLAC", "PCM_16", ".flac"),
+    "ogg-vorbis": EncodedFormat("OGG", "VORBIS", ".ogg"),
+    "ogg-opus": EncodedFormat("OGG", "OPUS", ".opus", (8000, 12000, 16000, 24000, 48000)),
+}
+
+
+def encode_audio(samples: np.ndarray, sample_rate: int, fmt: str) -> Tuple[bytes, int]:
+    """Encode a float32 waveform to an in-memory file in ``fmt``.
+
+    Peak is normalised to ≤ 1.0 as in :func:`save_wav`. Codecs restricted
+    to fixed sample rates (Opus) are fed audio resampled to the lowest
+    supported rate at or above ``sample_rate``.
+
+    Args:
+        samples:     float32 mono waveform.
+        sample_rate: Sample rate in Hz.
+        fmt:         Key of :data:`ENCODED_FORMATS`.
+
+    Returns:
+        ``(encoded_bytes, encoded_sample_rate)``.
+
+    Raises:
+        ValueError: If waveform is empty, ``fmt`` is unknown, or this
+                    libsndfile build lacks the codec.
+    """
+    spec = ENCODED_FORMATS.get(fmt)
+    if spec is None:
+        raise ValueError(f"Unknown format '{fmt}'. Choose from: {sorted(ENCODED_FORMATS)}")
+    if spec.subtype not in sf.available_subtypes(spec.container):
+        raise ValueError(f"libsndfile {sf.__libsndfile_version__} has no {spec.container}/{spec.subtype} support")
+
+    arr = np.asarray(samples, dtype=np.float32)
+    if arr.size == 0:
+        raise ValueError("Cannot encode: waveform array is empty.")
+
+    scratch = None
+    peak = np.abs(arr).max()
+    if peak > 1.0:
+        scratch = default_pool().acquire(arr.size)
+        arr = np.divide(arr, peak, out=scratch.array)
+
+    try:
+        rate = sample_rate
+        if spec.sample_rates is not None and rate not in spec.sample_rates:
+            rate = next((r for r in spec.sample_rates if r >= sample_rate), spec.sample_rates[-1])
+            arr = resample(arr, sample_rate, rate)
+
+        buffer = io.BytesIO()
+        sf.write(buffer, arr, rate, format=spec.container, subtype=spec.subtype)
+        return buffer.getvalue(), rate
+    finally:
+        if scratch is not None:
+            scratch.release()
+
+
 def pcm_to_bytes(samples: np.ndarray) -> bytes:
     """Convert float32 samples to signed 16-bit PCM bytes.
 
+    Samples outside [-1.0, 1.0] are clipped. Intermediate arrays are
+    borrowed from the shared buffer pool; only the returned bytes are new.
+
     Args:
-        samples: float32 array in range [-1.0, 1.0].
+        samples: float32 array, nominally in range [-1.0, 1.0].
 
     Returns:
         Raw int16 PCM bytes (little-endian, mono).
     """
-    return (samples * 32767).astype(np.int16).tobytes()
+    pool = default_pool()
+    scaled = pool.acquire(len(samples))
+    pcm = pool.acquire(len(samples), np.int16)
+    try:
+        np.clip(samples, -1.0, 1.0, out=scaled.array)
+        scaled.array *= 32767
+        np.copyto(pcm.array, scaled.array, casting="unsafe")
+        return pcm.array.tobytes()
+    finally:
+        scaled.release()
+        pcm.release()
+
+
+WAV_HEADER_BYTES = 44
+# subtype → (WAVE format tag, bits per sample)
+_WAV_SUBTYPES: Dict[str, Tuple[int, int]] = {"PCM_16": (1, 16), "FLOAT": (3, 32)}
+
+
+def wav_header(sample_rate: int, data_bytes: Optional[int] = None, subtype: str = "PCM_16") -> bytes:
+    """44-byte mono RIFF/WAVE header.
+
+    Args:
+        sample_rate: Sample rate in Hz.
+        data_bytes:  Size of the ``data`` chunk; None writes the
+                     ``0xFFFFFFFF`` "unknown length" marker used for streams.
+        subtype:     ``"PCM_16"`` or ``"FLOAT"`` (32-bit IEEE float).
+
+    Raises:
+        ValueError: If ``subtype`` is unsupported.
+    """
+    if subtype not in _WAV_SUBTYPES:
+        raise ValueError(f"Unsupported WAV subtype '{subtype}'. Choose from: {sorted(_WAV_SUBTYPES)}")
+    tag, bits = _WAV_SUBTYPES[subtype]
+    block_align = bits // 8
+    riff_size = 0xFFFFFFFF if data_bytes is None else WAV_HEADER_BYTES - 8 + data_bytes
+    data_size = 0xFFFFFFFF if data_bytes is None else data_bytes
+    return (
+        b"RIFF" + struct.pack("<I", riff_size) + b"WAVE"
+        + b"fmt " + struct.pack("<IHHIIHH", 16, tag, 1, sample_rate, sample_rate * block_align, block_align, bits)
+        + b"data" + struct.pack("<I", data_size)
+    )
 
 
 def resample(samples: np.ndarray, src_rate: int, tgt_rate: int) -> np.ndarray:
     """Resample audio to a different sample rate using torchaudio.
 
+    Falls back to linear interpolation when torchaudio is unavailable.
+
     Args:
         samples:  float32 mono waveform.
         src_rate: Source sample rate in Hz.
@@ -83,5 +210,52 @@ def resample(samples: np.ndarray, src_rate: int, tgt_rate: int) -> np.ndarray:
         logger.debug(f"Resampled {src_rate}Hz → {tgt_rate}Hz ({len(samples)} → {len(result)} samples)")
         return result.astype(np.float32)
     except Exception as exc:
-        logger.warning(f"torchaudio resample failed: {exc}. Returning original.")
-        return samples
+        logger.debug(f"torchaudio resample unavailable ({exc}); using linear interpolation")
+        n_out = int(round(len(samples) * tgt_rate / src_rate))
+        t_out = np.arange(n_out, dtype=np.float64) * (src_rate / tgt_rate)
+        return np.interp(t_out, np.arange(len(samples)), samples).astype(np.float32)
+
+
+def compare_waveforms(reference: np.ndarray, candidate: np.ndarray) -> Dict[str, float]:
+    """Objective difference between two renditions of the same utterance.
+
+    Used to gate lossy inference modes (quantisation, alternative runtimes)
+    against the float reference. Both arrays are truncated to the shorter
+    length before sample-wise metrics are computed.
+
+    Args:
+        reference: float32 waveform from the reference model.
+        candidate: float32 waveform from the model under test.
+
+    Returns:
+        Dict with ``snr_db`` (reference power over difference power),
+        ``correlation`` (Pearson), ``max_abs_diff`` and ``length_ratio``
+        (candidate / reference sample count).
+    """
+    ref = np.asarray(reference, dtype=np.float32).ravel()
+    cand = np.asarray(candidate, dtype=np.float32).ravel()
+    if ref.size == 0 or cand.size == 0:
+        raise ValueError("Cannot compare empty waveforms.")
+
+    n = min(ref.size, cand.size)
+    r, c = ref[:n].astype(np.float64), cand[:n].astype(np.float64)
+    diff = r - c
+    signal_power = float(np.dot(r, r))
+    noise_power = float(np.dot(diff, diff))
+    if noise_power == 0.0:
+        snr_db = float("inf")
+    elif signal_power == 0.0:
+        snr_db = float("-inf")
+    else:
+        snr_db = 10.0 * np.log10(signal_power / noise_power)
+
+    r_c, c_c = r - r.mean(), c - c.mean()
+    denom = np.sqrt(np.dot(r_c, r_c) * np.dot(c_c, c_c))
+    correlation = float(np.dot(r_c, c_c) / denom) if denom > 0 else 0.0
+
+    return {
+        "snr_db": float(snr_db),
+        "correlation": correlation,
+        "max_abs_diff": float(np.abs(diff).max()),
+        "length_ratio": cand.size / ref.size,
+    }
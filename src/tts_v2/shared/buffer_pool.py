@@ -0,0 +1,184 @@
+"""Size-classed, reference-counted pool of reusable NumPy buffers.
+
+USAGE: Import only from adapters. Never import from domain, ports, or service.
+
+Every request used to allocate fresh arrays for the waveform and again for
+PCM conversion and peak normalisation. Under sustained load that churns the
+allocator and fragments RSS. :class:`BufferPool` keeps released buffers in
+power-of-two size classes and hands them out again:
+
+    lease = pool.acquire(n_samples)          # BufferLease, refcount 1
+    lease.array[:] = ...                     # float32 view of exactly n_samples
+    chunk = AudioChunk(lease.array, sr, speaker, lease=lease)
+    ...
+    chunk.release()                          # refcount 0 → buffer back in pool
+
+A lease that is dropped without ``release()`` is simply garbage-collected
+(and counted as abandoned) — it never returns to the pool, because views of
+its memory may still be alive.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class BufferLease:
+    """Reference-counted handle on one pooled buffer.
+
+    ``array`` is a view of exactly the requested length and dtype. Contents
+    are uninitialised. Do not touch ``array`` (or views of it) after the
+    last ``release()``.
+    """
+
+    __slots__ = ("array", "_raw", "_pool", "_refs", "__weakref__")
+
+    def __init__(self, pool: "BufferPool", raw: np.ndarray, array: np.ndarray) -> None:
+        self.array = array
+        self._raw = raw
+        self._pool = pool
+        self._refs = 1
+
+    @property
+    def refcount(self) -> int:
+        return self._refs
+
+    def retain(self) -> "BufferLease":
+        """Add a reference; each ``retain()`` needs a matching ``release()``."""
+        with self._pool._lock:
+            if self._refs <= 0:
+                raise RuntimeError("BufferLease already released")
+            self._refs += 1
+        return self
+
+    def release(self) -> None:
+        """Drop a reference; the last one returns the buffer to the pool."""
+        with self._pool._lock:
+            if self._refs <= 0:
+                raise RuntimeError("BufferLease already released")
+            self._refs -= 1
+            if self._refs:
+                return
+            raw, self._raw = self._raw, None
+        self._pool._give_back(raw)
+
+    def __del__(self) -> None:
+        if self._refs > 0 and self._raw is not None:
+            self._pool._abandon(self._raw.nbytes)
+
+    def __repr__(self) -> str:
+        return f"BufferLease(size={self.array.size}, dtype={self.array.dtype}, refs={self._refs})"
+
+
+class BufferPool:
+    """Thread-safe pool of byte buffers in power-of-two size classes.
+
+    Args:
+        min_class_bytes: Smallest class; smaller requests round up to it.
+        max_class_bytes: Requests larger than this bypass the pool.
+        max_free_bytes:  Cap on idle bytes kept for reuse; buffers released
+                         beyond it are freed.
+    """
+
+    def __init__(
+        self,
+        min_class_bytes: int = 16 * 1024,
+        max_class_bytes: int = 64 * 1024 * 1024,
+        max_free_bytes: int = 128 * 1024 * 1024,
+    ) -> None:
+        self._min_class = 1 << max(0, int(min_class_bytes - 1).bit_length())
+        self._max_class = max_class_bytes
+        self._max_free = max_free_bytes
+        self._free: DefaultDict[int, List[np.ndarray]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+        self._free_bytes = 0
+        self._leased_bytes = 0
+        self._peak_resident = 0
+        self._hits = 0
+        self._misses = 0
+        self._oversize = 0
+        self._abandoned = 0
+
+    def class_bytes(self, nbytes: int) -> int:
+        """Size class that a request of ``nbytes`` is served from."""
+        return max(self._min_class, 1 << max(0, int(nbytes - 1).bit_length()))
+
+    def acquire(self, size: int, dtype: Any = np.float32) -> BufferLease:
+        """Lease an uninitialised 1-D array of ``size`` elements."""
+        dtype = np.dtype(dtype)
+        nbytes = size * dtype.itemsize
+        cls = self.class_bytes(nbytes)
+        raw: Optional[np.ndarray] = None
+        with self._lock:
+            if cls <= self._max_class:
+                bucket = self._free[cls]
+                if bucket:
+                    raw = bucket.pop()
+                    self._free_bytes -= cls
+                    self._hits += 1
+                else:
+                    self._misses += 1
+            else:
+                self._oversize += 1
+        if raw is None:
+            raw = np.empty(cls if cls <= self._max_class else nbytes, dtype=np.uint8)
+        with self._lock:
+            self._leased_bytes += raw.nbytes
+            self._peak_resident = max(self._peak_resident, self._leased_bytes + self._free_bytes)
+        return BufferLease(self, raw, raw[:nbytes].view(dtype))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit rate and byte counters.
+
+        ``resident_bytes`` is leased plus idle pooled memory;
+        ``peak_resident_bytes`` is its high-water mark.
+        """
+        with self._lock:
+            requests = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "oversize": self._oversize,
+                "abandoned": self._abandoned,
+                "hit_rate": round(self._hits / requests, 4) if requests else 0.0,
+                "leased_bytes": self._leased_bytes,
+                "free_bytes": self._free_bytes,
+                "resident_bytes": self._leased_bytes + self._free_bytes,
+                "peak_resident_bytes": self._peak_resident,
+            }
+
+    def clear(self) -> None:
+        """Free every idle buffer."""
+        with self._lock:
+            self._free.clear()
+            self._free_bytes = 0
+
+    def _give_back(self, raw: np.ndarray) -> None:
+        cls = raw.nbytes
+        with self._lock:
+            self._leased_bytes -= cls
+            if cls <= self._max_class and cls == self.class_bytes(cls) and self._free_bytes + cls <= self._max_free:
+                self._free[cls].append(raw)
+                self._free_bytes += cls
+
+    def _abandon(self, nbytes: int) -> None:
+        with self._lock:
+            self._leased_bytes -= nbytes
+            self._abandoned += 1
+
+    def __repr__(self) -> str:
+        return f"BufferPool(min_class={self._min_class}, max_class={self._max_class}, max_free={self._max_free})"
+
+
+_DEFAULT_POOL = BufferPool()
+
+
+def default_pool() -> BufferPool:
+    """Process-wide pool used for scratch buffers in ``audio_utils``."""
+    return _DEFAULT_POOL
@@ -1,19 +1,44 @@
 """BFSI text normalization package."""
-from .number_formatter import format_money, format_otp, expand_numbers_in_text, normalize_phone_number
-from .abbreviation_handler import expand_abbreviations, add_abbreviation, get_abbreviations
-from .domain_phrases import find_domain_phrases, find_phrases_by_category, list_categories
+from .number_formatter import (
+    NumericSpan,
+    format_money,
+    format_otp,
+    expand_numbers_in_text,
+    lex_numbers,
+    normalize_phone_number,
+)
+from .abbreviation_handler import (
+    expand_abbreviations,
+    add_abbreviation,
+    get_abbreviations,
+    get_abbreviation_version,
+)
+from .domain_phrases import (
+    find_domain_phrases,
+    find_phrases_by_category,
+    list_domain_phrases,
+    list_categories,
+    add_domain_phrase,
+    get_domain_phrase_version,
+)
 from .synthetic_hooks import augment_synthetic
 
 __all__ = [
     "format_money",
     "format_otp",
     "expand_numbers_in_text",
+    "lex_numbers",
+    "NumericSpan",
     "normalize_phone_number",
     "expand_abbreviations",
     "add_abbreviation",
     "get_abbreviations",
+    "get_abbreviation_version",
     "find_domain_phrases",
     "find_phrases_by_category",
+    "list_domain_phrases",
     "list_categories",
+    "add_domain_phrase",
+    "get_domain_phrase_version",
     "augment_synthetic",
 ]
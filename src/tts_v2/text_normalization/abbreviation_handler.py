@@ -2,11 +2,15 @@
 
 import logging
 import re
-from typing import Dict, Match
+from typing import Dict, Mapping, Match, Pattern, Tuple
+
+from ..domain.registry import VersionedRegistry
 
 logger = logging.getLogger(__name__)
 
-_ABBREVIATIONS: Dict[str, str] = {
+# Copy-on-write registry: expand_abbreviations() reads a consistent snapshot
+# without locking; add_abbreviation() publishes a new one and bumps the version.
+_ABBREVIATIONS: VersionedRegistry[str, str] = VersionedRegistry({
     "KYC": "Know Your Customer",
     "AML": "Anti-Money Laundering",
     "KYB": "Know Your Business",
@@ -51,9 +55,22 @@ _ABBREVIATIONS: Dict[str, str] = {
     "vs": "versus",
     "i.e.": "that is",
     "e.g.": "for example",
-}
+})
+
+
+def _build_matcher(abbreviations: Mapping[str, str]) -> Tuple[Pattern, Dict[str, str]]:
+    """Compile the alternation pattern and case-insensitive lookup for one snapshot."""
+    keys_sorted = sorted(abbreviations.keys(), key=len, reverse=True)
+    pattern = re.compile(
+        r"\b(" + "|".join(re.escape(k) for k in keys_sorted) + r")\b",
+        flags=re.IGNORECASE,
+    )
+    logger.debug(f"expand_abbreviations: compiled pattern for {len(keys_sorted)} abbreviations")
+    return pattern, {k.upper(): v for k, v in abbreviations.items()}
+
 
-_ABBREVIATIONS_CI: Dict[str, str] = {k.upper(): v for k, v in _ABBREVIATIONS.items()}
+# Rebuilt only when the registry version changes.
+_matcher = _ABBREVIATIONS.derived(_build_matcher)
 
 
 def expand_abbreviations(text: str) -> str:
@@ -62,9 +79,15 @@ def expand_abbreviations(text: str) -> str:
         logger.warning("Input text is empty or not a string")
         return text
 
+    if not _ABBREVIATIONS:
+        logger.warning("Abbreviation dictionary is empty")
+        return text
+
+    pattern, lookup = _matcher()
+
     def repl(m: Match) -> str:
         original = m.group(0)
-        replacement = _ABBREVIATIONS_CI.get(original.upper())
+        replacement = lookup.get(original.upper())
         if not replacement:
             return original
         if original.isupper():
@@ -78,15 +101,6 @@ def expand_abbreviations(text: str) -> str:
         logger.info(f"expand_abbreviations: '{original}' → '{out}'")
         return out
 
-    if not _ABBREVIATIONS:
-        logger.warning("Abbreviation dictionary is empty")
-        return text
-
-    keys_sorted = sorted(_ABBREVIATIONS.keys(), key=len, reverse=True)
-    pattern = re.compile(
-        r"\b(" + "|".join(re.escape(k) for k in keys_sorted) + r")\b",
-        flags=re.IGNORECASE,
-    )
     result = pattern.sub(repl, text)
     logger.info(f"expand_abbreviations: done (input {len(text)} chars → output {len(result)} chars)")
     return result
@@ -94,11 +108,15 @@ def expand_abbreviations(text: str) -> str:
 
 def add_abbreviation(short: str, expanded: str) -> None:
     """Register a new abbreviation at runtime."""
-    _ABBREVIATIONS[short.upper()] = expanded
-    _ABBREVIATIONS_CI[short.upper()] = expanded
-    logger.info(f"Registered abbreviation: {short} -> {expanded}")
+    version = _ABBREVIATIONS.set(short.upper(), expanded)
+    logger.info(f"Registered abbreviation: {short} -> {expanded} [v{version}]")
 
 
 def get_abbreviations() -> Dict[str, str]:
     """Return current abbreviation dictionary for inspection."""
-    return _ABBREVIATIONS.copy()
+    return dict(_ABBREVIATIONS.snapshot()[1])
+
+
+def get_abbreviation_version() -> int:
+    """Return the dictionary version, incremented by every add_abbreviation()."""
+    return _ABBREVIATIONS.version
@@ -1,44 +1,54 @@
 """BFSI domain-specific phrase detection and classification."""
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from ..domain.registry import VersionedRegistry
 
 logger = logging.getLogger(__name__)
 
-_DOMAIN_PHRASES: Dict[str, List[str]] = {
-    "fraud_alerts": [
+# Category → tuple of lower-case phrases. Copy-on-write: readers see an
+# immutable snapshot; add_domain_phrase() publishes a new version.
+_DOMAIN_PHRASES: VersionedRegistry[str, Tuple[str, ...]] = VersionedRegistry({
+    "fraud_alerts": (
         "fraud alert", "suspicious activity", "suspicious transaction",
         "unauthorised access", "account compromised", "unusual activity detected",
         "potential fraud", "fraudulent transaction",
-    ],
-    "account_actions": [
+    ),
+    "account_actions": (
         "account locked", "account closed", "account suspended",
         "account frozen", "account cancelled", "account deactivated", "account restricted",
-    ],
-    "compliance_notices": [
+    ),
+    "compliance_notices": (
         "please confirm", "verify your identity", "update your details",
         "review your account", "check your balance", "confirm your address", "update your contact",
-    ],
-    "transaction_terms": [
+    ),
+    "transaction_terms": (
         "chargeback", "refund", "reversal", "pending transaction",
         "declined", "failed transaction", "cancelled transaction",
-    ],
-    "security_terms": [
+    ),
+    "security_terms": (
         "account number", "card number", "one time password",
         "security code", "pin code", "password reset", "two factor authentication",
-    ],
-    "product_names": [
+    ),
+    "product_names": (
         "savings account", "transaction account", "home loan", "personal loan",
         "credit card", "debit card", "investment account", "superannuation",
-    ],
-    "regulatory_phrases": [
+    ),
+    "regulatory_phrases": (
         "this call may be recorded", "for quality and compliance",
         "privacy notice", "terms and conditions", "financial advice",
         "product disclosure", "financial services guide",
-    ],
-}
+    ),
+})
+
+
+def _flatten(categories: Mapping[str, Tuple[str, ...]]) -> Tuple[str, ...]:
+    return tuple(p for phrases in categories.values() for p in phrases)
 
-_ALL_PHRASES: List[str] = [p for phrases in _DOMAIN_PHRASES.values() for p in phrases]
+
+# Flattened phrase list, rebuilt only when the registry version changes.
+_all_phrases = _DOMAIN_PHRASES.derived(_flatten)
 
 
 def find_domain_phrases(text: str) -> List[str]:
@@ -46,25 +56,26 @@ def find_domain_phrases(text: str) -> List[str]:
     if not text or not isinstance(text, str):
         return []
     lower = text.lower()
-    found = [p for p in _ALL_PHRASES if p in lower]
+    found = [p for p in _all_phrases() if p in lower]
     logger.debug(f"Found {len(found)} domain phrases")
     return found
 
 
 def find_phrases_by_category(text: str, category: str) -> List[str]:
     """Find phrases in a specific category."""
-    if category not in _DOMAIN_PHRASES:
+    phrases = _DOMAIN_PHRASES.get(category)
+    if phrases is None:
         raise ValueError(f"Category '{category}' not found. Available: {list(_DOMAIN_PHRASES)}")
     if not text or not isinstance(text, str):
         return []
     lower = text.lower()
-    return [p for p in _DOMAIN_PHRASES[category] if p in lower]
+    return [p for p in phrases if p in lower]
 
 
 def classify_phrase(phrase: str) -> Optional[str]:
     """Return category name for a known phrase, or None."""
     phrase_lower = phrase.lower()
-    for category, phrases in _DOMAIN_PHRASES.items():
+    for category, phrases in _DOMAIN_PHRASES.snapshot()[1].items():
         if phrase_lower in phrases:
             return category
     return None
@@ -72,13 +83,35 @@ def classify_phrase(phrase: str) -> Optional[str]:
 
 def add_domain_phrase(category: str, phrase: str) -> None:
     """Register a new domain phrase at runtime."""
-    if category not in _DOMAIN_PHRASES:
-        raise ValueError(f"Category '{category}' not found.")
     phrase_lower = phrase.lower()
-    if phrase_lower not in _DOMAIN_PHRASES[category]:
-        _DOMAIN_PHRASES[category].append(phrase_lower)
-        _ALL_PHRASES.append(phrase_lower)
-        logger.info(f"Registered domain phrase: '{phrase_lower}' → '{category}'")
+
+    def apply(categories: Dict[str, Tuple[str, ...]]) -> bool:
+        if category not in categories:
+            raise ValueError(f"Category '{category}' not found.")
+        if phrase_lower in categories[category]:
+            return False
+        categories[category] = categories[category] + (phrase_lower,)
+        return True
+
+    version_before = _DOMAIN_PHRASES.version
+    version = _DOMAIN_PHRASES.update(apply)
+    if version != version_before:
+        logger.info(f"Registered domain phrase: '{phrase_lower}' → '{category}' [v{version}]")
+
+
+def get_domain_phrase_version() -> int:
+    """Return the phrase registry version, incremented by every add_domain_phrase()."""
+    return _DOMAIN_PHRASES.version
+
+
+def list_domain_phrases(category: Optional[str] = None) -> List[str]:
+    """Return every registered phrase, or those of one category."""
+    if category is None:
+        return list(_all_phrases())
+    phrases = _DOMAIN_PHRASES.get(category)
+    if phrases is None:
+        raise ValueError(f"Category '{category}' not found. Available: {list(_DOMAIN_PHRASES)}")
+    return list(phrases)
 
 
 def list_categories() -> List[str]:
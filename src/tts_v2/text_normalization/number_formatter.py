@@ -9,18 +9,35 @@ Provides:
 
 import logging
 import re
-from typing import Optional, Tuple
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
 
 from num2words import num2words
 
 logger = logging.getLogger(__name__)
 
-# Regex for currency amounts
-_CURRENCY_RE = re.compile(r"\$\s?([0-9]{1,3}(?:,[0-9]{3})*(?:\.[0-9]{2})?)")
-# Regex for plain numeric amounts
-_NUMBER_RE = re.compile(r"\b([0-9]{1,3}(?:,[0-9]{3})*(?:\.[0-9]{2})?)\b")
-# Regex for OTP/reference codes (sequences of 4+ digits or alphanumeric)
-_OTP_RE = re.compile(r"\b([0-9]{4,}|[A-Z0-9]{4,})\b")
+# Amount body shared by currency and plain numbers: 1,234.50
+_AMOUNT = r"[0-9]{1,3}(?:,[0-9]{3})*(?:\.[0-9]{2})?"
+# One scan classifies every token: a "$" amount, or a maximal run of word characters.
+_TOKEN_RE = re.compile(rf"(?P<currency>\$\s?(?P<amount>{_AMOUNT}))|\w+")
+# Plain number anchored at a token start. Ends at a word boundary that is not
+# the start of a currency amount (whose spoken form begins with a letter).
+_NUMBER_AT_RE = re.compile(rf"{_AMOUNT}\b(?!\$\s?[0-9])")
+_ASCII_DIGITS = frozenset("0123456789")
+
+
+@dataclass(frozen=True)
+class NumericSpan:
+    """A token rewritten by :func:`expand_numbers_in_text`.
+
+    ``start``/``end`` index the input text; ``kind`` is ``"currency"``,
+    ``"otp"`` or ``"number"``; ``spoken`` replaces ``text[start:end]``.
+    """
+
+    start: int
+    end: int
+    kind: str
+    spoken: str
 
 
 def format_money(amount: float, currency: str = "AUD") -> str:
@@ -109,65 +126,120 @@ def _expand_decimal_part(dec_str: str) -> str:
     return f"point {digits_spoken}"
 
 
-def expand_numbers_in_text(text: str, preserve_otps: bool = True) -> str:
+def lex_numbers(text: str, preserve_otps: bool = True) -> List[NumericSpan]:
+    """Classify every numeric token in ``text`` in one left-to-right scan.
+
+    Reproduces the historical three-pass rules (currency, then OTP, then
+    plain numbers, each applied to the previous pass's output) without
+    rebuilding the string between passes:
+
+    - ``$`` amounts are spoken as money.
+    - A run of four or more ASCII digits bounded by non-word characters is
+      an OTP, spoken digit by digit (only if ``preserve_otps``).
+    - Remaining amounts (``7``, ``1,234``, ``12.50``) bounded by non-word
+      characters are spoken as cardinals.
+
+    A spoken currency amount starts and ends with a letter, so a word run
+    touching one is never an OTP or number on its own. Uppercase codes such
+    as ``SWIFT`` or ``AB12`` are left alone without further work.
+
+    Returns:
+        Non-overlapping spans in ascending order.
+    """
+    tokens = list(_TOKEN_RE.finditer(text))
+    spans: List[NumericSpan] = []
+    number_end = 0
+    for i, m in enumerate(tokens):
+        start, end = m.span()
+        if m.group("currency") is not None:
+            spoken = _spell_currency(m.group("amount"))
+            if spoken is not None:
+                spans.append(NumericSpan(start, end, "currency", spoken))
+            continue
+        if start < number_end or text[start] not in _ASCII_DIGITS:
+            continue
+        after_currency = i > 0 and tokens[i - 1].group("currency") is not None and tokens[i - 1].end() == start
+        before_currency = (
+            i + 1 < len(tokens) and tokens[i + 1].group("currency") is not None and tokens[i + 1].start() == end
+        )
+        if after_currency or before_currency:
+            continue
+        word = m.group()
+        if preserve_otps and len(word) >= 4 and word.isascii() and word.isdigit():
+            expanded = format_otp(word)
+            logger.info(f"expand_numbers_in_text: OTP '{word}' → '{expanded}'")
+            spans.append(NumericSpan(start, end, "otp", expanded))
+            continue
+        number = _NUMBER_AT_RE.match(text, start)
+        if number is not None:
+            number_end = number.end()
+            spoken = _spell_number(number.group())
+            if spoken is not None:
+                spans.append(NumericSpan(start, number_end, "number", spoken))
+    return spans
+
+
+def expand_numbers_in_text(
+    text: str,
+    preserve_otps: bool = True,
+    spans: Optional[Sequence[NumericSpan]] = None,
+) -> str:
     """Expand numeric amounts in text to spoken forms.
 
     Handles:
-    - Currency amounts: $1,234.50 -> 'one thousand two hundred and thirty-four dollars and fifty cents'
+    - Currency amounts: $1,234.50 -> 'one thousand, two hundred and thirty-four dollars and fifty cents'
     - OTP/reference codes: 482913 -> 'four eight two nine one three'
-    - Plain numbers: 1205 -> 'one thousand two hundred and five'
+    - Plain amounts: 1,205 -> 'one thousand, two hundred and five'
     - Decimals: 123.45 -> 'one hundred and twenty-three point four five'
 
     Args:
         text: Input text with numeric amounts
         preserve_otps: If True, expand 4+ digit sequences digit-by-digit (OTP mode).
-                       If False, convert as cardinal numbers.
+                       If False, they are left as written.
+        spans: Output of ``lex_numbers(text, preserve_otps)`` when the caller
+               has already lexed ``text``.
 
     Returns:
         Text with expanded numbers
     """
-
-    def replace_currency(m: re.Match) -> str:
-        amount_str = m.group(1).replace(",", "")
-        try:
-            return format_money(float(amount_str))
-        except Exception as e:
-            logger.warning(f"Failed to convert currency {amount_str}: {e}")
-            return m.group(0)
-
-    def replace_otp_match(m: re.Match) -> str:
-        num_str = m.group(1)
-        if num_str.isdigit():
-            expanded = format_otp(num_str)
-            logger.info(f"expand_numbers_in_text: OTP '{num_str}' → '{expanded}'")
-            return expanded
-        return m.group(0)
-
-    def replace_number(m: re.Match) -> str:
-        num_str = m.group(1).replace(",", "")
-        try:
-            if "." in num_str:
-                whole, dec = num_str.split(".")
-                spoken_whole = num2words(int(whole), to="cardinal", lang="en")
-                return f"{spoken_whole} {_expand_decimal_part(dec)}"
-            else:
-                return num2words(int(num_str), to="cardinal", lang="en")
-        except Exception as e:
-            logger.warning(f"Failed to convert number {num_str}: {e}")
-            return m.group(0)
-
-    # Replace in order: currencies first, then OTP/reference codes, then plain numbers
-    original = text
-    text = _CURRENCY_RE.sub(replace_currency, text)
-    if preserve_otps:
-        text = _OTP_RE.sub(replace_otp_match, text)
-    text = _NUMBER_RE.sub(replace_number, text)
-
-    if text != original:
-        logger.info(f"expand_numbers_in_text: '{original}' → '{text}'")
-    else:
+    if spans is None:
+        spans = lex_numbers(text, preserve_otps)
+    if not spans:
         logger.info("expand_numbers_in_text: no numeric tokens found")
-    return text
+        return text
+
+    parts = []
+    pos = 0
+    for span in spans:
+        parts.append(text[pos:span.start])
+        parts.append(span.spoken)
+        pos = span.end
+    parts.append(text[pos:])
+    result = "".join(parts)
+    logger.info(f"expand_numbers_in_text: '{text}' → '{result}'")
+    return result
+
+
+def _spell_currency(amount: str) -> Optional[str]:
+    amount_str = amount.replace(",", "")
+    try:
+        return format_money(float(amount_str))
+    except Exception as e:
+        logger.warning(f"Failed to convert currency {amount_str}: {e}")
+        return None
+
+
+def _spell_number(num: str) -> Optional[str]:
+    num_str = num.replace(",", "")
+    try:
+        if "." in num_str:
+            whole, dec = num_str.split(".")
+            spoken_whole = num2words(int(whole), to="cardinal", lang="en")
+            return f"{spoken_whole} {_expand_decimal_part(dec)}"
+        return num2words(int(num_str), to="cardinal", lang="en")
+    except Exception as e:
+        logger.warning(f"Failed to convert number {num_str}: {e}")
+        return None
 
 
 def normalize_phone_number(phone: str, country_code: str = "AU") -> str:
@@ -5,7 +5,9 @@ import pytest
 from tts_v2.adapters.audit.noop_audit_adapter import NoOpAuditAdapter
 from tts_v2.adapters.normalizer.bfsi_normalizer_adapter import BFSINormalizerAdapter
 from tts_v2.adapters.synthesizer.mock_adapter import MockSynthesizerAdapter
+from tts_v2.domain.voice import AGENT_REGISTRY
 from tts_v2.service.tts_service import TTSService
+from tts_v2.text_normalization import abbreviation_handler, domain_phrases
 
 
 class NullSinkAdapter:
@@ -33,3 +35,24 @@ def mock_service(null_sink):
         audio_sink=null_sink,
         audit=NoOpAuditAdapter(),
     )
+
+
+@pytest.fixture
+def restore_registries():
+    """Undo runtime additions to the process-global persona, abbreviation and phrase registries.
+
+    Restoring publishes a new version, so derived matchers and normaliser
+    caches built from the test's additions are rebuilt.
+    """
+    registries = (AGENT_REGISTRY, abbreviation_handler._ABBREVIATIONS, domain_phrases._DOMAIN_PHRASES)
+    saved = [registry.snapshot()[1] for registry in registries]
+    yield
+
+    def restore(working, contents):
+        if working == contents:
+            return False
+        working.clear()
+        working.update(contents)
+
+    for registry, contents in zip(registries, saved):
+        registry.update(lambda working, contents=contents: restore(working, contents))
@@ -0,0 +1,31 @@
+"""Tests for shared audio utilities."""
+
+import numpy as np
+import pytest
+
+from tts_v2.shared.audio_utils import compare_waveforms
+
+
+class TestCompareWaveforms:
+    def test_identical_waveforms(self):
+        x = np.sin(np.linspace(0, 100, 2000)).astype(np.float32)
+        report = compare_waveforms(x, x)
+        assert report["snr_db"] == float("inf")
+        assert report["correlation"] == pytest.approx(1.0)
+        assert report["length_ratio"] == 1.0
+
+    def test_small_noise_gives_high_snr(self):
+        rng = np.random.default_rng(0)
+        x = np.sin(np.linspace(0, 100, 2000)).astype(np.float32)
+        y = x + 0.001 * rng.standard_normal(x.size).astype(np.float32)
+        report = compare_waveforms(x, y)
+        assert report["snr_db"] > 40
+        assert report["max_abs_diff"] < 0.01
+
+    def test_length_ratio_reported(self):
+        x = np.ones(100, dtype=np.float32)
+        assert compare_waveforms(x, x[:90])["length_ratio"] == pytest.approx(0.9)
+
+    def test_empty_waveform_rejected(self):
+        with pytest.raises(ValueError):
+            compare_waveforms(np.zeros(0, dtype=np.float32), np.zeros(5, dtype=np.float32))
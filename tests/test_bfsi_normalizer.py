@@ -0,0 +1,53 @@
+"""Tests for BFSINormalizerAdapter — result cache and registry invalidation."""
+
+import pytest
+
+from tts_v2.adapters.normalizer.bfsi_normalizer_adapter import BFSINormalizerAdapter
+from tts_v2.text_normalization.abbreviation_handler import (
+    add_abbreviation,
+    get_abbreviation_version,
+)
+
+
+class TestNormalizerCache:
+    def test_repeated_input_is_served_from_cache(self):
+        norm = BFSINormalizerAdapter(cache_size=8)
+        first = norm.normalize("Your OTP is 482913")
+        second = norm.normalize("Your OTP is 482913")
+        assert first == second
+        stats = norm.cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(0.5)
+
+    def test_cache_is_bounded_lru(self):
+        norm = BFSINormalizerAdapter(cache_size=2)
+        norm.normalize("one KYC")
+        norm.normalize("two KYC")
+        norm.normalize("one KYC")      # refresh "one"
+        norm.normalize("three KYC")    # evicts "two"
+        assert norm.cache_stats()["size"] == 2
+        norm.normalize("two KYC")
+        assert norm.cache_stats()["hits"] == 1
+
+    def test_add_abbreviation_invalidates_cached_results(self, restore_registries):
+        norm = BFSINormalizerAdapter()
+        before = norm.normalize("Contact the ZQXB desk")
+        assert "ZQXB" in before
+
+        version = get_abbreviation_version()
+        add_abbreviation("ZQXB", "Zonal Query Exchange Bureau")
+        assert get_abbreviation_version() == version + 1
+
+        after = norm.normalize("Contact the ZQXB desk")
+        assert "ZONAL QUERY EXCHANGE BUREAU" in after
+        assert norm.cache_stats()["invalidations"] == 1
+
+    def test_cache_disabled_matches_cached_output(self):
+        text = "KYC check for $1,234.50 with OTP 482913"
+        assert BFSINormalizerAdapter(cache_size=0).normalize(text) == \
+            BFSINormalizerAdapter().normalize(text)
+
+    def test_negative_cache_size_rejected(self):
+        with pytest.raises(ValueError):
+            BFSINormalizerAdapter(cache_size=-1)
@@ -0,0 +1,184 @@
+"""Tests for the size-classed buffer pool and pooled AudioChunk lifecycles."""
+
+import gc
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from tts_v2.adapters.audio_sink.file_sink_adapter import FileSinkAdapter
+from tts_v2.adapters.audit.noop_audit_adapter import NoOpAuditAdapter
+from tts_v2.adapters.normalizer.bfsi_normalizer_adapter import BFSINormalizerAdapter
+from tts_v2.adapters.postprocess.chain_adapter import Fade, PostProcessingChainAdapter
+from tts_v2.adapters.rendition_store.memory_store_adapter import InMemoryRenditionStoreAdapter
+from tts_v2.adapters.synthesizer.mock_adapter import MockSynthesizerAdapter
+from tts_v2.adapters.time_scale.wsola_adapter import WsolaTimeScalerAdapter
+from tts_v2.domain.audio import AudioChunk, SynthesisRequest
+from tts_v2.service.overload import OverloadController, OverloadPolicy
+from tts_v2.service.tts_service import TTSService
+from tts_v2.shared.audio_utils import pcm_to_bytes
+from tts_v2.shared.buffer_pool import BufferPool
+
+
+class TestBufferPool:
+    def test_released_buffer_is_reused(self):
+        pool = BufferPool()
+        first = pool.acquire(1000)
+        raw_address = first.array.__array_interface__["data"][0]
+        first.release()
+        second = pool.acquire(900)
+        assert second.array.__array_interface__["data"][0] == raw_address
+        assert second.array.shape == (900,) and second.array.dtype == np.float32
+        stats = pool.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_size_classes_are_powers_of_two(self):
+        pool = BufferPool(min_class_bytes=1024)
+        assert pool.class_bytes(1) == 1024
+        assert pool.class_bytes(1025) == 2048
+        assert pool.class_bytes(4096) == 4096
+
+    def test_dtype_views(self):
+        lease = BufferPool().acquire(10, np.int16)
+        assert lease.array.dtype == np.int16 and lease.array.size == 10
+
+    def test_refcount(self):
+        pool = BufferPool()
+        lease = pool.acquire(100)
+        lease.retain()
+        lease.release()
+        assert pool.stats()["free_bytes"] == 0
+        lease.release()
+        assert pool.stats()["free_bytes"] > 0
+        with pytest.raises(RuntimeError):
+            lease.release()
+
+    def test_abandoned_lease_is_not_pooled(self):
+        pool = BufferPool()
+        lease = pool.acquire(100)
+        del lease
+        gc.collect()
+        stats = pool.stats()
+        assert stats["abandoned"] == 1
+        assert stats["leased_bytes"] == 0 and stats["free_bytes"] == 0
+
+    def test_free_bytes_cap_and_oversize(self):
+        pool = BufferPool(min_class_bytes=1024, max_class_bytes=4096, max_free_bytes=4096)
+        leases = [pool.acquire(1024) for _ in range(2)]  # 4 KiB each
+        for lease in leases:
+            lease.release()
+        assert pool.stats()["free_bytes"] == 4096
+        big = pool.acquire(10_000)
+        big.release()
+        stats = pool.stats()
+        assert stats["oversize"] == 1 and stats["free_bytes"] == 4096
+
+    def test_peak_resident_bytes(self):
+        pool = BufferPool(min_class_bytes=1024)
+        a, b = pool.acquire(256), pool.acquire(256)
+        a.release()
+        b.release()
+        stats = pool.stats()
+        assert stats["peak_resident_bytes"] == 2048
+        assert stats["resident_bytes"] == 2048
+        pool.clear()
+        assert pool.stats()["resident_bytes"] == 0
+
+
+class TestPooledChunks:
+    def test_retain_gives_independent_reference(self):
+        pool = BufferPool()
+        lease = pool.acquire(10)
+        chunk = AudioChunk(samples=lease.array, sample_rate=22050, speaker_id="p", lease=lease)
+        held = chunk.retain()
+        chunk.release()
+        chunk.release()  # idempotent per object
+        assert pool.stats()["free_bytes"] == 0
+        held.release()
+        assert pool.stats()["leased_bytes"] == 0
+
+    def test_service_returns_written_buffers_to_pool(self, tmp_path):
+        pool = BufferPool()
+        service = TTSService(
+            synthesizer=MockSynthesizerAdapter(buffer_pool=pool),
+            normalizer=BFSINormalizerAdapter(),
+            audio_sink=FileSinkAdapter(),
+            audit=NoOpAuditAdapter(),
+        )
+        for i in range(5):
+            service.speak(SynthesisRequest(text="Hello.", persona="professional_female", output_path=str(tmp_path / f"{i}.wav")))
+        stats = pool.stats()
+        assert stats["leased_bytes"] == 0
+        assert stats["hits"] == 4 and stats["misses"] == 1
+
+    def test_write_behind_sink_holds_buffer_until_written(self, tmp_path):
+        pool = BufferPool()
+        sink = FileSinkAdapter(write_behind=True)
+        service = TTSService(
+            synthesizer=MockSynthesizerAdapter(buffer_pool=pool),
+            normalizer=BFSINormalizerAdapter(),
+            audio_sink=sink,
+            audit=NoOpAuditAdapter(),
+        )
+        service.speak(SynthesisRequest(text="Hello.", persona="professional_female", output_path=str(tmp_path / "a.wav")))
+        sink.close()
+        assert pool.stats()["leased_bytes"] == 0
+        assert (tmp_path / "a.wav").exists()
+
+    def test_chain_copy_releases_input_lease(self):
+        pool = BufferPool()
+        lease = pool.acquire(22050)
+        lease.array.fill(0.1)
+        lease.array.setflags(write=False)
+        chunk = AudioChunk(samples=lease.array, sample_rate=22050, speaker_id="p", lease=lease)
+        out = PostProcessingChainAdapter([Fade()], buffer_pool=pool).process(chunk)
+        assert out.lease is not None and out.lease is not lease
+        assert chunk.lease is None
+        out.release()
+        assert pool.stats()["leased_bytes"] == 0
+
+    def test_stored_renditions_do_not_share_the_callers_lease(self):
+        pool = BufferPool()
+        service = TTSService(
+            synthesizer=MockSynthesizerAdapter(buffer_pool=pool),
+            normalizer=BFSINormalizerAdapter(),
+            audio_sink=FileSinkAdapter(),
+            audit=NoOpAuditAdapter(),
+            renditions=InMemoryRenditionStoreAdapter(),
+            time_scaler=WsolaTimeScalerAdapter(buffer_pool=pool),
+        )
+        kept = service.speak(SynthesisRequest(text="Hello.", persona="professional_female")).chunk
+        kept.samples[:] = 0.25
+        variant = service.speak(SynthesisRequest(text="Hello.", persona="professional_female", rate=1.25)).chunk
+        assert variant.samples.size == round(kept.samples.size / 1.25)
+        pool.acquire(kept.samples.size).array.fill(0.7)
+        assert np.all(kept.samples == 0.25)
+        variant.release()
+        kept.release()
+
+    def test_overload_cached_path_releases_once(self, tmp_path):
+        pool = BufferPool()
+        store = InMemoryRenditionStoreAdapter()
+
+        def service(overload=None):
+            return TTSService(
+                synthesizer=MockSynthesizerAdapter(buffer_pool=pool),
+                normalizer=BFSINormalizerAdapter(),
+                audio_sink=FileSinkAdapter(),
+                audit=NoOpAuditAdapter(),
+                renditions=store,
+                overload=overload,
+            )
+
+        first = SynthesisRequest(text="Hello.", persona="professional_female", output_path=str(tmp_path / "a.wav"))
+        service().speak(first)
+        overloaded = OverloadController(OverloadPolicy(max_in_flight=0))
+        result = service(overloaded).speak(replace(first, output_path=str(tmp_path / "b.wav")))
+        assert result.success and result.degradation == "cached"
+        assert pool.stats()["leased_bytes"] == 0
+
+
+def test_pcm_to_bytes_clips():
+    samples = np.array([-2.0, -1.0, 0.0, 0.5, 2.0], dtype=np.float32)
+    assert np.frombuffer(pcm_to_bytes(samples), dtype=np.int16).tolist() == [-32767, -32767, 0, 16383, 32767]
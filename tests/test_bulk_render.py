@@ -0,0 +1,253 @@
+"""Tests for the pipelined bulk renderer and TTSService stage methods."""
+
+import json
+import threading
+import time
+
+import pytest
+
+from tts_v2.adapters.audit.noop_audit_adapter import NoOpAuditAdapter
+from tts_v2.adapters.normalizer.bfsi_normalizer_adapter import BFSINormalizerAdapter
+from tts_v2.adapters.rendition_store.memory_store_adapter import InMemoryRenditionStoreAdapter
+from tts_v2.adapters.synthesizer.mock_adapter import MockSynthesizerAdapter
+from tts_v2.domain.audio import SynthesisRequest
+from tts_v2.entrypoints.bulk_render import BulkRenderer, InvalidRow, load_requests, main
+from tts_v2.service.tts_service import TTSService
+from tts_v2.shared.buffer_pool import BufferPool
+
+
+class RecordingSink:
+    def __init__(self, delay_s=0.0):
+        self.delay_s = delay_s
+        self.paths = []
+        self.threads = set()
+
+    def write(self, chunk, destination):
+        time.sleep(self.delay_s)
+        self.threads.add(threading.current_thread().name)
+        self.paths.append(destination)
+        return destination
+
+
+class SlowSynth(MockSynthesizerAdapter):
+    def __init__(self, delay_s=0.0, fail_on=None):
+        self.delay_s = delay_s
+        self.fail_on = fail_on
+
+    def synthesize(self, request):
+        time.sleep(self.delay_s)
+        if self.fail_on and self.fail_on in request.text:
+            raise RuntimeError("boom")
+        return super().synthesize(request)
+
+
+def make_service(sink, synth=None, audit=None, phrase_pack=None):
+    return TTSService(
+        synthesizer=synth or MockSynthesizerAdapter(),
+        normalizer=BFSINormalizerAdapter(),
+        audio_sink=sink,
+        audit=audit or NoOpAuditAdapter(),
+        phrase_pack=phrase_pack,
+    )
+
+
+def requests(n, persona="professional_female"):
+    return [SynthesisRequest(text=f"Item {i}.", persona=persona, output_path=f"out/{i}.wav") for i in range(n)]
+
+
+class TestStages:
+    def test_prepare_render_deliver_matches_speak(self):
+        events = []
+
+        class Audit:
+            def log_synthesis(self, event):
+                events.append(event)
+
+        service = make_service(RecordingSink(), audit=Audit())
+        request = SynthesisRequest(text="Your OTP is 482913", persona="professional_female", output_path="a.wav")
+        prepared = service.prepare(request)
+        assert prepared.synth_request.text != request.text
+        assert prepared.speaker.speaker_id
+        result = service.deliver(prepared, service.render(prepared))
+        service.speak(request)
+        assert result.success and result.output_path == "a.wav"
+        timings = ("elapsed_s", "queue_s", "rtf")
+        assert {k: v for k, v in events[0].items() if k not in timings} == \
+            {k: v for k, v in events[1].items() if k not in timings}
+
+    def test_waits_between_stages_are_not_counted_in_rtf(self):
+        events = []
+
+        class Audit:
+            def log_synthesis(self, event):
+                events.append(event)
+
+        service = make_service(RecordingSink(), synth=SlowSynth(delay_s=0.02), audit=Audit())
+        request = SynthesisRequest(text="Item one.", persona="professional_female", output_path="a.wav")
+        prepared = service.prepare(request)
+        time.sleep(0.1)
+        chunk = service.render(prepared)
+        time.sleep(0.1)
+        service.deliver(prepared, chunk)
+        service.speak(request)
+        queued, direct = events
+        assert queued["queue_s"] >= 0.2 and direct["queue_s"] < 0.01
+        assert 0.02 <= queued["elapsed_s"] < 0.1
+        assert queued["rtf"] == pytest.approx(queued["elapsed_s"] / queued["duration_s"], abs=1e-2)
+
+    def test_prepare_rejects_empty_text(self):
+        with pytest.raises(ValueError):
+            make_service(RecordingSink()).prepare(SynthesisRequest(text=" ", persona="professional_female"))
+
+
+class TestBulkRenderer:
+    def test_renders_all_in_order_on_writer_thread(self):
+        sink = RecordingSink()
+        report = BulkRenderer(make_service(sink), queue_size=2).run(requests(10))
+        assert report.succeeded == report.total == 10
+        assert sink.paths == [f"out/{i}.wav" for i in range(10)]
+        assert sink.threads == {"bulk-deliver"}
+        assert report.audio_s == pytest.approx(10.0)
+
+    def test_phrase_pack_hits_skip_synthesis(self):
+        events = []
+
+        class Audit:
+            def log_synthesis(self, event):
+                events.append(event)
+
+        pack = InMemoryRenditionStoreAdapter()
+        service = make_service(RecordingSink(), synth=SlowSynth(fail_on="Item 1."), audit=Audit(), phrase_pack=pack)
+        prepared = service.prepare(requests(2)[1])
+        pack.store(prepared.synth_request, MockSynthesizerAdapter().synthesize(prepared.synth_request))
+
+        report = BulkRenderer(service).run(requests(3))
+        assert report.succeeded == 3 and report.stored == 1
+        assert [e["source"] for e in events] == ["synthesis", "phrase_pack", "synthesis"]
+
+    def test_writes_overlap_with_synthesis(self):
+        sink = RecordingSink(delay_s=0.02)
+        service = make_service(sink, synth=SlowSynth(delay_s=0.02))
+        t0 = time.monotonic()
+        report = BulkRenderer(service, queue_size=4).run(requests(20))
+        elapsed = time.monotonic() - t0
+        assert report.succeeded == 20
+        assert elapsed < 0.02 * 20 * 2 * 0.8  # well under the sequential time
+        assert report.synth_utilisation > 0.6
+
+    def test_failures_are_recorded_and_do_not_stop_the_run(self):
+        reqs = requests(5)
+        service = make_service(RecordingSink(), synth=SlowSynth(fail_on="two"))
+        report = BulkRenderer(service).run(reqs + [SynthesisRequest(text="", persona="professional_female")])
+        assert report.total == 6
+        assert report.succeeded == 4
+        assert report.failed == 2
+        assert "out/2.wav" in [label for label, _ in report.errors]
+
+    def test_sink_failures_release_pooled_audio(self):
+        class FailingSink(RecordingSink):
+            def write(self, chunk, destination):
+                raise OSError("disk full")
+
+        pool = BufferPool()
+        service = make_service(FailingSink(), synth=MockSynthesizerAdapter(buffer_pool=pool))
+        report = BulkRenderer(service).run(requests(3))
+        assert report.failed == 3
+        assert pool.stats()["leased_bytes"] == 0
+
+    def test_source_errors_are_reraised(self):
+        def broken():
+            yield from requests(2)
+            raise ValueError("bad row")
+
+        with pytest.raises(ValueError, match="bad row"):
+            BulkRenderer(make_service(RecordingSink())).run(broken())
+
+    def test_progress_callback(self):
+        snapshots = []
+        BulkRenderer(make_service(RecordingSink()), progress_interval_s=0.0, on_progress=snapshots.append).run(requests(3))
+        assert len(snapshots) == 3
+        assert {"items_per_s", "rtf", "prepared_queue", "rendered_queue"} <= set(snapshots[-1])
+
+
+class TestInput:
+    def test_csv_extra_columns_become_metadata(self, tmp_path):
+        path = tmp_path / "c.csv"
+        path.write_text("id,text,persona,campaign\nabc,Hello,professional_female,q3\n,Bye,neutral_male,\n")
+        reqs = list(load_requests(str(path), "out"))
+        assert reqs[0].output_path.endswith("abc.wav")
+        assert reqs[0].metadata == {"campaign": "q3", "id": "abc"}
+        assert reqs[1].output_path.endswith("000002.wav")
+
+    def test_jsonl(self, tmp_path):
+        path = tmp_path / "c.jsonl"
+        path.write_text(json.dumps({"text": "Hi", "persona": "neutral_male", "output": "x.wav", "metadata": {"k": 1}}) + "\n")
+        (req,) = load_requests(str(path), "out")
+        assert req.output_path == "x.wav"
+        assert req.metadata == {"k": 1, "id": "000001"}
+
+    def test_rate_column(self, tmp_path):
+        path = tmp_path / "c.csv"
+        path.write_text("text,persona,rate\nHello,neutral_male,1.2\nBye,neutral_male,\n")
+        assert [r.rate for r in load_requests(str(path), "out")] == [1.2, 1.0]
+        assert "rate" not in next(load_requests(str(path), "out")).metadata
+
+    def test_missing_fields_yield_invalid_row(self, tmp_path):
+        path = tmp_path / "c.csv"
+        path.write_text("text,persona\nHello,\nBye,neutral_male\n")
+        invalid, valid = load_requests(str(path), "out")
+        assert isinstance(invalid, InvalidRow) and invalid.label == "row 1"
+        assert "Row 1" in str(invalid.error)
+        assert valid.text == "Bye"
+
+    def test_invalid_rows_fail_without_stopping_the_run(self, tmp_path):
+        path = tmp_path / "c.jsonl"
+        path.write_text(
+            '{"text": "Hello", "persona": "professional_female"}\n'
+            '{"text": "No persona"}\n'
+            '[1, 2]\n'
+            '{"text": "Bye", "persona": "neutral_male", "rate": "fast"}\n'
+            '{"text": "World", "persona": "neutral_male"}\n'
+        )
+        sink = RecordingSink()
+        report = BulkRenderer(make_service(sink)).run(load_requests(str(path), "out"))
+        assert (report.total, report.succeeded, report.failed) == (5, 2, 3)
+        assert [label for label, _ in report.errors] == ["row 2", "row 3", "row 4"]
+        assert sink.paths == ["out/000001.wav", "out/000005.wav"]
+
+    def test_malformed_jsonl_is_reraised(self, tmp_path):
+        path = tmp_path / "c.jsonl"
+        path.write_text('{"text": "Hello", "persona": "professional_female"}\n{not json\n')
+        with pytest.raises(json.JSONDecodeError):
+            BulkRenderer(make_service(RecordingSink())).run(load_requests(str(path), "out"))
+
+    def test_csv_metadata_column_is_ordinary_metadata(self, tmp_path):
+        path = tmp_path / "c.csv"
+        path.write_text("text,persona,metadata\nHello,professional_female,vip\n")
+        (req,) = load_requests(str(path), "out")
+        assert req.metadata == {"metadata": "vip", "id": "000001"}
+
+    def test_cli_reports_invalid_rows(self, tmp_path, capsys):
+        path = tmp_path / "c.csv"
+        path.write_text("id,text,persona\na,Hello,professional_female\nb,,neutral_male\nc,World,neutral_male\n")
+        code = main([str(path), "--out-dir", str(tmp_path / "wav"), "--mock"])
+        assert code == 1
+        assert sorted(p.name for p in (tmp_path / "wav").iterdir()) == ["a.wav", "c.wav"]
+        summary = json.loads(capsys.readouterr().out)
+        assert (summary["succeeded"], summary["failed"]) == (2, 1)
+
+    def test_cli_end_to_end(self, tmp_path, capsys):
+        path = tmp_path / "c.csv"
+        path.write_text("id,text,persona\na,Hello,professional_female\nb,World,neutral_male\n")
+        code = main([str(path), "--out-dir", str(tmp_path / "wav"), "--mock"])
+        assert code == 0
+        assert sorted(p.name for p in (tmp_path / "wav").iterdir()) == ["a.wav", "b.wav"]
+        assert json.loads(capsys.readouterr().out)["succeeded"] == 2
+
+    def test_cli_encoded_output(self, tmp_path, capsys):
+        path = tmp_path / "c.csv"
+        path.write_text("id,text,persona\na,Hello,professional_female\n")
+        code = main([str(path), "--out-dir", str(tmp_path / "out"), "--mock", "--audio-format", "flac"])
+        assert code == 0
+        assert [p.name for p in (tmp_path / "out").iterdir()] == ["a.flac"]
+        assert json.loads(capsys.readouterr().out)["encoding"]["files"] == 1
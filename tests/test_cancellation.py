@@ -0,0 +1,184 @@
+"""Tests for cancellation tokens and deadlines through TTSService and its adapters."""
+
+import http.client
+import json
+import time
+
+import pytest
+
+from tts_v2.adapters.normalizer.bfsi_normalizer_adapter import BFSINormalizerAdapter
+from tts_v2.adapters.synthesizer.batching_adapter import MicroBatchingSynthesizerAdapter
+from tts_v2.adapters.synthesizer.mock_adapter import MockSynthesizerAdapter
+from tts_v2.adapters.synthesizer.simulated_adapter import SimulatedSynthesizerAdapter
+from tts_v2.domain.audio import AudioChunk, SynthesisRequest
+from tts_v2.domain.cancellation import CancellationToken, RequestCancelled
+from tts_v2.entrypoints.server import TTSServer
+from tts_v2.service.overload import OverloadController, OverloadPolicy
+from tts_v2.service.tts_service import TTSService
+from tts_v2.shared.buffer_pool import BufferPool
+
+
+class RecordingAudit:
+    def __init__(self):
+        self.events = []
+
+    def log_synthesis(self, event):
+        self.events.append(event)
+
+
+class RecordingSink:
+    def __init__(self):
+        self.writes = []
+
+    def write(self, chunk, destination):
+        self.writes.append(destination)
+        return destination
+
+
+class PooledSynth(MockSynthesizerAdapter):
+    """Returns pooled audio and optionally runs a hook mid-synthesis."""
+
+    def __init__(self, pool, during=None):
+        self.pool = pool
+        self.during = during
+        self.calls = 0
+
+    def synthesize(self, request):
+        self.calls += 1
+        if self.during is not None:
+            self.during()
+        lease = self.pool.acquire(16000)
+        lease.array.fill(0.0)
+        return AudioChunk(samples=lease.array, sample_rate=16000, speaker_id="p225", lease=lease)
+
+
+def make_service(synth=None, overload=None):
+    audit, sink = RecordingAudit(), RecordingSink()
+    service = TTSService(
+        synthesizer=synth or MockSynthesizerAdapter(),
+        normalizer=BFSINormalizerAdapter(),
+        audio_sink=sink,
+        audit=audit,
+        overload=overload,
+    )
+    return service, audit, sink
+
+
+def req(**kwargs):
+    return SynthesisRequest(text="Your balance is updated.", persona="professional_female", **kwargs)
+
+
+class TestToken:
+    def test_first_reason_is_kept(self):
+        token = CancellationToken()
+        token.cancel("caller hung up")
+        token.cancel("later")
+        assert token.cancelled and token.reason == "caller hung up"
+
+    def test_check_cancelled(self):
+        req().check_cancelled()
+        with pytest.raises(RequestCancelled) as info:
+            req(deadline=time.monotonic() - 1).check_cancelled()
+        assert info.value.outcome == "deadline_exceeded"
+
+
+class TestService:
+    def test_cancelled_request_is_not_synthesised(self):
+        pool = BufferPool()
+        synth = PooledSynth(pool)
+        service, audit, _ = make_service(synth)
+        token = CancellationToken()
+        token.cancel("caller hung up")
+
+        result = service.speak(req(cancel_token=token))
+
+        assert synth.calls == 0
+        assert not result.success and result.outcome == "cancelled"
+        assert "caller hung up" in result.error
+        assert audit.events[-1]["outcome"] == "cancelled"
+
+    def test_expired_deadline_has_its_own_outcome(self):
+        service, audit, _ = make_service()
+        result = service.speak(req(deadline=time.monotonic() - 0.01))
+        assert result.outcome == "deadline_exceeded"
+        assert audit.events[-1]["outcome"] == "deadline_exceeded"
+
+    def test_cancel_during_synthesis_skips_sink_and_releases_audio(self):
+        pool = BufferPool()
+        token = CancellationToken()
+        service, audit, sink = make_service(PooledSynth(pool, during=token.cancel))
+
+        result = service.speak(req(cancel_token=token, output_path="/tmp/never.wav"))
+
+        assert result.outcome == "cancelled" and result.chunk is None
+        assert sink.writes == []
+        assert pool.stats()["leased_bytes"] == 0
+        assert audit.events[-1]["duration_s"] == 0.0
+
+    def test_overload_slot_is_freed(self):
+        controller = OverloadController(OverloadPolicy(max_in_flight=4))
+        token = CancellationToken()
+        service, _, _ = make_service(PooledSynth(BufferPool(), during=token.cancel), overload=controller)
+        service.speak(req(cancel_token=token))
+        assert controller.state().in_flight == 0
+
+    def test_successful_request_outcome_is_ok(self):
+        service, audit, _ = make_service()
+        result = service.speak(req(cancel_token=CancellationToken(), deadline=time.monotonic() + 60))
+        assert result.success and result.outcome == "ok"
+        assert audit.events[-1]["outcome"] == "ok"
+
+
+class TestAdapters:
+    def test_microbatch_drops_cancelled_requests_at_dispatch(self):
+        backend = SimulatedSynthesizerAdapter(rtf=0.0, jitter=0.0)
+        calls = []
+        original = backend.synthesize_batch
+        backend.synthesize_batch = lambda requests: calls.append(len(requests)) or original(requests)
+        adapter = MicroBatchingSynthesizerAdapter(backend, max_batch_size=4)
+        token = CancellationToken()
+        token.cancel()
+        try:
+            with pytest.raises(RequestCancelled):
+                adapter.synthesize(req(cancel_token=token))
+            assert adapter.synthesize(req()).samples.size > 0
+        finally:
+            adapter.close()
+        assert calls == [1]
+        assert adapter.stats()["cancelled"] == 1
+
+    def test_simulated_backend_checks_after_waiting_for_device(self):
+        adapter = SimulatedSynthesizerAdapter(rtf=0.0, jitter=0.0)
+        with pytest.raises(RequestCancelled):
+            adapter.synthesize(req(deadline=time.monotonic() - 1))
+
+
+class TestServer:
+    @pytest.fixture
+    def server(self):
+        srv = TTSServer(lambda: make_service()[0], port=0, max_concurrency=1, queue_timeout_s=2.0)
+        srv.start()
+        assert srv.wait_ready(5)
+        yield srv
+        srv.shutdown()
+
+    def post(self, srv, body):
+        conn = http.client.HTTPConnection(*srv.address, timeout=5)
+        conn.request("POST", "/synthesize", body=json.dumps(body), headers={"Content-Type": "application/json"})
+        resp = conn.getresponse()
+        return resp, resp.read()
+
+    def test_expired_timeout_is_504(self, server):
+        resp, body = self.post(server, {"text": "Hello there.", "persona": "neutral_male", "timeout_ms": 0.001})
+        assert resp.status == 504
+        assert json.loads(body)["outcome"] == "deadline_exceeded"
+
+    def test_generous_timeout_streams_audio(self, server):
+        resp, body = self.post(server, {"text": "Hello there.", "persona": "neutral_male", "timeout_ms": 30000})
+        assert resp.status == 200
+        assert len(body) > 0
+
+    @pytest.mark.parametrize("timeout_ms", [0, -5, "soon", True])
+    def test_invalid_timeout_is_400(self, server, timeout_ms):
+        resp, _ = self.post(server, {"text": "Hello.", "persona": "neutral_male", "timeout_ms": timeout_ms})
+        assert resp.status == 400
@@ -0,0 +1,201 @@
+"""Tests for CoquiSynthesizerAdapter against a tiny random VITS — no downloads.
+
+Skipped automatically when coqui-tts / torch are not installed.
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("TTS")
+
+from tts_v2.adapters.synthesizer.coqui_adapter import (  # noqa: E402
+    CoquiSynthesizerAdapter,
+    CpuPerformanceConfig,
+)
+from tts_v2.adapters.synthesizer.coqui_tiny_model import build_tiny_vits  # noqa: E402
+from tts_v2.domain.audio import SynthesisRequest  # noqa: E402
+
+
+def make_adapter(**kwargs):
+    return CoquiSynthesizerAdapter(
+        model_name="tiny-vits",
+        use_gpu=False,
+        tts_model=build_tiny_vits(),
+        **kwargs,
+    )
+
+
+def request(text="Your balance is ten dollars."):
+    return SynthesisRequest(text=text, persona="professional_male")
+
+
+class TestTinyVits:
+    def test_synthesize_returns_float32_chunk(self):
+        chunk = make_adapter().synthesize(request())
+        assert chunk.samples.dtype == np.float32
+        assert chunk.samples.size > 0
+        assert chunk.speaker_id == "p225"
+
+    def test_speakers_come_from_speaker_manager(self):
+        assert make_adapter().get_speakers() == ["p225", "p226", "p227", "p228"]
+
+    def test_memory_bytes_is_positive(self):
+        assert make_adapter().memory_bytes() > 0
+
+
+class TestCpuPerformanceMode:
+    def test_inference_mode_output_matches_default(self):
+        import torch
+
+        default = make_adapter()
+        fast = make_adapter(cpu_performance=CpuPerformanceConfig(intra_op_threads=1))
+        torch.manual_seed(0)
+        a = default.synthesize(request()).samples
+        torch.manual_seed(0)
+        b = fast.synthesize(request()).samples
+        np.testing.assert_allclose(a, b, atol=1e-6)
+
+    def test_quantisation_reports_quality_check(self):
+        adapter = make_adapter(
+            cpu_performance=CpuPerformanceConfig(quantize=True, min_snr_db=-100.0, max_length_delta=1.0)
+        )
+        report = adapter.quantization_report
+        assert report is not None
+        assert {"snr_db", "correlation", "length_ratio"} <= set(report)
+        assert adapter.quantized is (report["quantized_modules"] > 0)
+
+    def test_quantisation_probe_leaves_global_rng_alone(self):
+        import torch
+
+        model = build_tiny_vits()
+        torch.manual_seed(1234)
+        state = torch.random.get_rng_state()
+        CoquiSynthesizerAdapter(
+            model_name="tiny-vits",
+            use_gpu=False,
+            tts_model=model,
+            cpu_performance=CpuPerformanceConfig(quantize=True, min_snr_db=-100.0, max_length_delta=1.0),
+        )
+        assert torch.equal(torch.random.get_rng_state(), state)
+
+    def test_quantisation_rejected_when_gate_unreachable(self):
+        adapter = make_adapter(
+            cpu_performance=CpuPerformanceConfig(quantize=True, min_snr_db=float("inf"))
+        )
+        assert adapter.quantized is False
+        assert adapter.synthesize(request()).samples.size > 0
+
+
+class TestDirectInference:
+    def test_tiny_vits_uses_direct_path(self):
+        assert "direct" in repr(make_adapter())
+
+    def test_matches_coqui_synthesis_per_sentence(self):
+        import torch
+
+        adapter = make_adapter()
+        model = adapter._tts_model
+        sentences = adapter._split_sentences("Hello there. Your balance is ten dollars.")
+        torch.manual_seed(0)
+        expected = []
+        for sentence in sentences:
+            # What Synthesizer.tts() does with each sentence.
+            wav = model.synthesize(text=sentence, speaker="p225", use_griffin_lim=True)["wav"]
+            wav = np.asarray(wav, dtype=np.float32).squeeze()
+            if model.config.audio.get("do_trim_silence"):
+                wav = wav[: model.ap.find_endpoint(wav)]
+            expected += [wav, np.zeros(10000, dtype=np.float32)]
+        torch.manual_seed(0)
+        chunk = adapter.synthesize(request("Hello there. Your balance is ten dollars."))
+        np.testing.assert_array_equal(chunk.samples, np.concatenate(expected))
+
+    def test_fallback_path_matches_direct_path(self):
+        import torch
+
+        direct = make_adapter()
+        fallback = make_adapter()
+        fallback._direct = False
+        text = "Hello there. Your balance is ten dollars."
+        torch.manual_seed(0)
+        a = direct.synthesize(request(text)).samples
+        torch.manual_seed(0)
+        b = fallback.synthesize(request(text)).samples
+        np.testing.assert_array_equal(a, b)
+
+
+class TestTokenCache:
+    def test_cached_tokens_reused_across_calls(self):
+        adapter = make_adapter(token_cache_size=16)
+        adapter.synthesize(request("Hello there. Your balance is ten dollars."))
+        adapter.synthesize(request("Hello there. Your balance is ten dollars."))
+        stats = adapter.token_cache_stats()
+        assert stats["misses"] == 2
+        assert stats["hits"] == 2
+
+    def test_cached_path_matches_uncached_audio(self):
+        import torch
+
+        cached = make_adapter(token_cache_size=16)
+        uncached = make_adapter()
+        text = "Hello there. Your balance is ten dollars."
+        torch.manual_seed(0)
+        a = cached.synthesize(request(text)).samples
+        torch.manual_seed(0)
+        b = uncached.synthesize(request(text)).samples
+        np.testing.assert_array_equal(a, b)
+        assert uncached.token_cache_stats()["misses"] == 0
+
+    def test_cache_disabled_without_direct_inference(self, monkeypatch, caplog):
+        monkeypatch.setattr(CoquiSynthesizerAdapter, "_supports_direct_inference", lambda self: False)
+        adapter = make_adapter(token_cache_size=16)
+        adapter.synthesize(request("Hello there."))
+        assert adapter.token_cache_stats()["max_size"] == 0
+        assert adapter.token_cache_stats()["misses"] == 0
+        assert "token_cache_size=16 ignored" in caplog.text
+
+    def test_cache_is_bounded(self):
+        adapter = make_adapter(token_cache_size=1)
+        adapter.synthesize(request("First sentence."))
+        adapter.synthesize(request("Second sentence."))
+        assert adapter.token_cache_stats()["size"] == 1
+
+
+class TestBatchSynthesis:
+    def test_batch_returns_one_chunk_per_request_in_order(self):
+        adapter = make_adapter()
+        requests = [
+            request("Hi."),
+            SynthesisRequest(text="Your balance is ten dollars. Thank you.", persona="friendly_female"),
+        ]
+        chunks = adapter.synthesize_batch(requests)
+        assert [c.speaker_id for c in chunks] == ["p225", "p226"]
+        assert all(c.samples.dtype == np.float32 and c.samples.size > 0 for c in chunks)
+
+    def test_single_item_batch_matches_sentence_path(self):
+        import torch
+
+        adapter = make_adapter(token_cache_size=16)
+        torch.manual_seed(0)
+        (batched,) = adapter.synthesize_batch([request()])
+        torch.manual_seed(0)
+        single = adapter.synthesize(request())
+        np.testing.assert_allclose(batched.samples, single.samples, atol=1e-5)
+
+    def test_batch_without_direct_inference_renders_per_request(self):
+        import torch
+
+        adapter = make_adapter()
+        adapter._direct = False
+        requests = [request("Hi."), request("Your balance is ten dollars. Thank you.")]
+        torch.manual_seed(0)
+        batched = adapter.synthesize_batch(requests)
+        torch.manual_seed(0)
+        single = [adapter.synthesize(r) for r in requests]
+        for b, s in zip(batched, single):
+            np.testing.assert_array_equal(b.samples, s.samples)
+
+    def test_batch_rejects_mixed_speaker_and_no_speaker_rows(self):
+        requests = [request("Hi."), SynthesisRequest(text="Hello.", persona="professional_male", speaker_id="")]
+        with pytest.raises(RuntimeError, match="NO_SPEAKER"):
+            make_adapter().synthesize_batch(requests)
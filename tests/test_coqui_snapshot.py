@@ -0,0 +1,106 @@
+"""Tests for prepared model snapshots.
+
+Manifest handling runs everywhere; export / mmap load against the tiny
+random VITS is skipped when coqui-tts / torch are not installed.
+"""
+
+import argparse
+import json
+
+import numpy as np
+import pytest
+
+from tts_v2.adapters.synthesizer.coqui_snapshot import (
+    SNAPSHOT_FORMAT_VERSION,
+    read_snapshot_manifest,
+)
+from tts_v2.domain.audio import SynthesisRequest
+from tts_v2.entrypoints.common import add_pipeline_arguments, model_id
+
+
+def write_manifest(directory, **fields):
+    directory.mkdir(exist_ok=True)
+    manifest = {"format": SNAPSHOT_FORMAT_VERSION, "model_name": "tts_models/en/vctk/vits", **fields}
+    (directory / "manifest.json").write_text(json.dumps(manifest))
+    return directory
+
+
+def parse(*argv):
+    parser = argparse.ArgumentParser()
+    add_pipeline_arguments(parser)
+    return parser.parse_args(list(argv))
+
+
+class TestManifest:
+    def test_reads_model_name(self, tmp_path):
+        snapshot = write_manifest(tmp_path / "snap")
+        assert read_snapshot_manifest(str(snapshot))["model_name"] == "tts_models/en/vctk/vits"
+
+    def test_missing_manifest_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="not a model snapshot"):
+            read_snapshot_manifest(str(tmp_path))
+
+    def test_unsupported_format_raises(self, tmp_path):
+        snapshot = write_manifest(tmp_path / "snap", format=SNAPSHOT_FORMAT_VERSION + 1)
+        with pytest.raises(ValueError, match="Unsupported model snapshot format"):
+            read_snapshot_manifest(str(snapshot))
+
+    def test_model_id_comes_from_snapshot(self, tmp_path):
+        snapshot = write_manifest(tmp_path / "snap", model_name="tiny-vits")
+        assert model_id(parse("--model-snapshot", str(snapshot))) == "tiny-vits"
+        assert model_id(parse("--model-snapshot", str(snapshot), "--mock")) == "mock"
+
+
+@pytest.fixture
+def tiny_adapter():
+    pytest.importorskip("torch")
+    pytest.importorskip("TTS")
+    from tts_v2.adapters.synthesizer.coqui_adapter import CoquiSynthesizerAdapter
+    from tts_v2.adapters.synthesizer.coqui_tiny_model import build_tiny_vits
+
+    return CoquiSynthesizerAdapter(model_name="tiny-vits", use_gpu=False, tts_model=build_tiny_vits())
+
+
+class TestTinySnapshot:
+    def test_round_trip_keeps_weights_and_speakers(self, tiny_adapter, tmp_path):
+        import torch
+        from tts_v2.adapters.synthesizer.coqui_adapter import CoquiSynthesizerAdapter
+
+        manifest = tiny_adapter.export_snapshot(str(tmp_path / "snap"))
+        loaded = CoquiSynthesizerAdapter.from_snapshot(str(tmp_path / "snap"), use_gpu=False)
+
+        assert loaded.model_name == "tiny-vits"
+        assert loaded.get_speakers() == tiny_adapter.get_speakers()
+        assert loaded.memory_bytes() == manifest["weight_bytes"]
+        original = tiny_adapter._tts_model.state_dict()
+        for name, tensor in loaded._tts_model.state_dict().items():
+            assert torch.equal(tensor, original[name]), name
+
+    def test_snapshot_audio_matches_original(self, tiny_adapter, tmp_path):
+        import torch
+        from tts_v2.adapters.synthesizer.coqui_adapter import CoquiSynthesizerAdapter
+
+        tiny_adapter.export_snapshot(str(tmp_path / "snap"))
+        loaded = CoquiSynthesizerAdapter.from_snapshot(str(tmp_path / "snap"), use_gpu=False)
+        request = SynthesisRequest(text="Your balance is ten dollars.", persona="professional_male")
+        torch.manual_seed(0)
+        a = tiny_adapter.synthesize(request).samples
+        torch.manual_seed(0)
+        b = loaded.synthesize(request).samples
+        np.testing.assert_allclose(a, b, atol=1e-6)
+
+    def test_mmap_weights_are_file_backed(self, tiny_adapter, tmp_path, caplog):
+        from tts_v2.adapters.synthesizer.coqui_snapshot import load_snapshot
+
+        tiny_adapter.export_snapshot(str(tmp_path / "snap"))
+        model, _ = load_snapshot(str(tmp_path / "snap"))
+        # The meta-device skeleton was used, not the CPU fallback.
+        assert "initialising on CPU" not in caplog.text
+        assert not any(p.is_meta for p in model.parameters())
+        # Mapped storages are not resizable; storages torch allocated are.
+        assert not any(p.untyped_storage().resizable() for p in model.parameters())
+
+    def test_quantised_adapter_refuses_export(self, tiny_adapter, tmp_path):
+        tiny_adapter.quantized = True
+        with pytest.raises(ValueError, match="int8"):
+            tiny_adapter.export_snapshot(str(tmp_path / "snap"))
@@ -0,0 +1,107 @@
+"""Tests for compressed encoding and the background EncodedFileSinkAdapter."""
+
+import io
+import threading
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from tts_v2.adapters.audio_sink.encoded_sink_adapter import EncodedFileSinkAdapter
+from tts_v2.domain.audio import AudioChunk
+from tts_v2.ports.audio_sink_port import AudioSinkPort
+from tts_v2.shared.audio_utils import ENCODED_FORMATS, encode_audio
+
+
+def tone(seconds=1.0, sr=22050):
+    t = np.arange(int(seconds * sr)) / sr
+    return (0.4 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def chunk(seconds=1.0, sr=22050):
+    return AudioChunk(samples=tone(seconds, sr), sample_rate=sr, speaker_id="p1")
+
+
+class TestEncodeAudio:
+    @pytest.mark.parametrize("fmt", sorted(ENCODED_FORMATS))
+    def test_round_trip_is_smaller_than_float_wav(self, fmt, tmp_path):
+        data, rate = encode_audio(tone(), 22050, fmt)
+        assert len(data) < tone().nbytes
+        path = tmp_path / f"x{ENCODED_FORMATS[fmt].extension}"
+        path.write_bytes(data)
+        decoded, decoded_rate = sf.read(str(path), dtype="float32")
+        assert decoded_rate == rate
+        assert abs(len(decoded) / rate - 1.0) < 0.05
+
+    def test_opus_is_resampled_to_supported_rate(self):
+        _, rate = encode_audio(tone(), 22050, "ogg-opus")
+        assert rate == 24000
+
+    def test_flac_is_lossless_at_16_bits(self):
+        data, _ = encode_audio(tone(), 22050, "flac")
+        decoded, _ = sf.read(io.BytesIO(data), dtype="float32")
+        assert np.abs(decoded - tone()).max() < 1e-4
+
+    def test_unknown_format_and_empty_input_rejected(self):
+        with pytest.raises(ValueError):
+            encode_audio(tone(), 22050, "mp4")
+        with pytest.raises(ValueError):
+            encode_audio(np.zeros(0, dtype=np.float32), 22050, "flac")
+
+
+class TestEncodedFileSink:
+    def test_satisfies_port(self):
+        sink = EncodedFileSinkAdapter()
+        assert isinstance(sink, AudioSinkPort)
+        sink.close()
+
+    def test_write_returns_path_with_format_extension(self, tmp_path):
+        sink = EncodedFileSinkAdapter("flac")
+        path = sink.write(chunk(), str(tmp_path / "calls" / "a.wav"))
+        assert path.endswith("a.flac")
+        assert sink.flush(timeout=5)
+        assert sf.info(path).format == "FLAC"
+        stats = sink.stats()
+        assert stats["files"] == 1 and stats["pending"] == 0
+        assert stats["compression_ratio"] > 2
+        assert stats["encode_x_realtime"] > 0
+        sink.close()
+
+    def test_submit_future_reports_failure(self, tmp_path):
+        sink = EncodedFileSinkAdapter("flac")
+        bad = AudioChunk(samples=np.zeros(0, dtype=np.float32), sample_rate=22050, speaker_id="p1")
+        future = sink.submit(bad, str(tmp_path / "empty.wav"))
+        with pytest.raises(ValueError):
+            future.result(timeout=5)
+        sink.flush()
+        assert sink.stats()["failures"] == 1
+        sink.close()
+
+    def test_write_blocks_when_pending_limit_reached(self, tmp_path, monkeypatch):
+        gate = threading.Event()
+        sink = EncodedFileSinkAdapter("wav-pcm16", max_workers=1, max_pending=1)
+        original = sink._encode
+
+        def slow_encode(c, path):
+            gate.wait(5)
+            return original(c, path)
+
+        monkeypatch.setattr(sink, "_encode", slow_encode)
+        sink.write(chunk(0.1), str(tmp_path / "1.wav"))
+        second = threading.Thread(target=sink.write, args=(chunk(0.1), str(tmp_path / "2.wav")))
+        second.start()
+        second.join(0.1)
+        assert second.is_alive()
+        gate.set()
+        second.join(5)
+        assert not second.is_alive()
+        sink.close()
+        assert sink.stats()["files"] == 2
+
+    def test_closed_sink_rejects_writes(self, tmp_path):
+        sink = EncodedFileSinkAdapter()
+        sink.close()
+        with pytest.raises(RuntimeError):
+            sink.write(chunk(), str(tmp_path / "a.wav"))
+        with pytest.raises(ValueError):
+            EncodedFileSinkAdapter("mp3")
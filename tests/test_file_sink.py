@@ -0,0 +1,94 @@
+"""Tests for FileSinkAdapter atomic publishing and write-behind mode."""
+
+import threading
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+import tts_v2.adapters.audio_sink.file_sink_adapter as file_sink_module
+from tts_v2.adapters.audio_sink.file_sink_adapter import FileSinkAdapter
+from tts_v2.domain.audio import AudioChunk
+
+
+def chunk(n=2205, value=0.25):
+    return AudioChunk(samples=np.full(n, value, dtype=np.float32), sample_rate=22050, speaker_id="p1")
+
+
+EMPTY = AudioChunk(samples=np.zeros(0, dtype=np.float32), sample_rate=22050, speaker_id="p1")
+
+
+def leftovers(directory):
+    return [p.name for p in directory.iterdir() if p.name.endswith(".part")]
+
+
+class TestSynchronous:
+    def test_writes_complete_file(self, tmp_path):
+        path = FileSinkAdapter().write(chunk(), str(tmp_path / "a" / "b.wav"))
+        assert path == str(tmp_path / "a" / "b.wav")
+        assert sf.info(path).frames == 2205
+        assert leftovers(tmp_path / "a") == []
+
+    def test_failed_write_keeps_previous_file(self, tmp_path):
+        sink = FileSinkAdapter()
+        path = sink.write(chunk(), str(tmp_path / "x.wav"))
+        with pytest.raises(ValueError):
+            sink.write(EMPTY, path)
+        assert sf.info(path).frames == 2205
+        assert leftovers(tmp_path) == []
+
+    def test_recreates_directory_removed_after_caching(self, tmp_path):
+        sink = FileSinkAdapter()
+        sink.write(chunk(), str(tmp_path / "d" / "1.wav"))
+        (tmp_path / "d" / "1.wav").unlink()
+        (tmp_path / "d").rmdir()
+        assert sf.info(sink.write(chunk(), str(tmp_path / "d" / "2.wav"))).frames == 2205
+
+    def test_submit_returns_resolved_future(self, tmp_path):
+        future = FileSinkAdapter().submit(EMPTY, str(tmp_path / "e.wav"))
+        assert future.done()
+        with pytest.raises(ValueError):
+            future.result()
+
+
+class TestWriteBehind:
+    def test_write_returns_before_file_lands(self, tmp_path, monkeypatch):
+        gate = threading.Event()
+        real_save = file_sink_module.save_wav
+
+        def gated_save(*args, **kwargs):
+            gate.wait(5)
+            real_save(*args, **kwargs)
+
+        monkeypatch.setattr(file_sink_module, "save_wav", gated_save)
+        sink = FileSinkAdapter(write_behind=True)
+        path = sink.write(chunk(), str(tmp_path / "late.wav"))
+        assert path == str(tmp_path / "late.wav")
+        assert not (tmp_path / "late.wav").exists()
+        assert sink.stats()["pending"] == 1
+        gate.set()
+        assert sink.flush(timeout=5)
+        assert sf.info(path).frames == 2205
+        sink.close()
+
+    def test_callback_reports_success_and_failure(self, tmp_path):
+        done = []
+        sink = FileSinkAdapter(write_behind=True, on_complete=lambda path, err: done.append((path, err)))
+        sink.write(chunk(), str(tmp_path / "ok.wav"))
+        bad = sink.submit(EMPTY, str(tmp_path / "bad.wav"))
+        sink.close()
+        outcome = dict(done)
+        assert outcome[str(tmp_path / "ok.wav")] is None
+        assert isinstance(outcome[str(tmp_path / "bad.wav")], ValueError)
+        assert isinstance(bad.exception(), ValueError)
+        assert sink.stats()["failures"] == 1
+        assert not (tmp_path / "bad.wav").exists()
+        assert leftovers(tmp_path) == []
+
+    def test_close_drains_queue_and_rejects_new_writes(self, tmp_path):
+        sink = FileSinkAdapter(write_behind=True, max_workers=1)
+        paths = [sink.write(chunk(), str(tmp_path / f"{i}.wav")) for i in range(10)]
+        sink.close()
+        assert all(sf.info(p).frames == 2205 for p in paths)
+        with pytest.raises(RuntimeError):
+            sink.write(chunk(), str(tmp_path / "late.wav"))
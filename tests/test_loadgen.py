@@ -0,0 +1,140 @@
+"""Tests for SimulatedSynthesizerAdapter and the load generator."""
+
+import itertools
+import json
+import threading
+import time
+
+import pytest
+
+from tts_v2.adapters.audit.file_audit_adapter import FileAuditAdapter
+from tts_v2.adapters.audit.noop_audit_adapter import NoOpAuditAdapter
+from tts_v2.adapters.normalizer.bfsi_normalizer_adapter import BFSINormalizerAdapter
+from tts_v2.adapters.synthesizer.mock_adapter import MockSynthesizerAdapter
+from tts_v2.adapters.synthesizer.simulated_adapter import SimulatedSynthesizerAdapter
+from tts_v2.domain.audio import SynthesisRequest
+from tts_v2.entrypoints.common import NullSink
+from tts_v2.entrypoints.loadgen import LoadGenerator, load_audit_schedule, main, percentiles, synthetic_requests
+from tts_v2.ports.batch_synthesizer_port import BatchSynthesizerPort
+from tts_v2.service.overload import OverloadController, OverloadPolicy
+from tts_v2.service.tts_service import TTSService
+
+
+def make_service(synth=None, audit=None, overload=None):
+    return TTSService(
+        synthesizer=synth or MockSynthesizerAdapter(),
+        normalizer=BFSINormalizerAdapter(),
+        audio_sink=NullSink(),
+        audit=audit or NoOpAuditAdapter(),
+        overload=overload,
+    )
+
+
+def req(text="Hello there.", persona="professional_female"):
+    return SynthesisRequest(text=text, persona=persona)
+
+
+class TestSimulatedSynthesizer:
+    def test_duration_and_compute_scale_with_text(self):
+        sleeps = []
+        synth = SimulatedSynthesizerAdapter(rtf=0.5, chars_per_second=10, jitter=0.0, sleep=sleeps.append)
+        chunk = synth.synthesize(req("x" * 30))
+        assert chunk.duration_s == pytest.approx(3.0, abs=1e-3)
+        assert sleeps == [pytest.approx(1.5)]
+        assert isinstance(synth, BatchSynthesizerPort)
+
+    def test_jitter_is_seeded(self):
+        def draws(seed):
+            sleeps = []
+            synth = SimulatedSynthesizerAdapter(jitter=0.5, seed=seed, sleep=sleeps.append)
+            for _ in range(5):
+                synth.synthesize(req())
+            return sleeps
+
+        assert draws(3) == draws(3)
+        assert len(set(draws(3))) > 1
+
+    def test_failure_rate(self):
+        synth = SimulatedSynthesizerAdapter(failure_rate=1.0, sleep=lambda s: None)
+        with pytest.raises(RuntimeError):
+            synth.synthesize(req())
+
+    def test_batch_costs_slowest_plus_overhead(self):
+        sleeps = []
+        synth = SimulatedSynthesizerAdapter(rtf=1.0, chars_per_second=10, jitter=0.0, batch_overhead=0.5, sleep=sleeps.append)
+        chunks = synth.synthesize_batch([req("x" * 10), req("x" * 20)])
+        assert [c.duration_s for c in chunks] == [pytest.approx(1.0, abs=1e-3), pytest.approx(2.0, abs=1e-3)]
+        assert sleeps == [pytest.approx(3.0)]
+
+    def test_max_parallel_serialises_renders(self):
+        synth = SimulatedSynthesizerAdapter(rtf=1.0, chars_per_second=100, jitter=0.0, max_parallel=1)
+        threads = [threading.Thread(target=synth.synthesize, args=(req("x" * 5),)) for _ in range(4)]
+        t0 = time.monotonic()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert time.monotonic() - t0 >= 4 * 0.05 * 0.9
+
+
+class TestLoadGenerator:
+    def test_closed_loop_counts_and_percentiles(self):
+        report = LoadGenerator(make_service()).closed_loop(itertools.repeat(req(), 12), concurrency=3)
+        data = report.as_dict()
+        assert (data["offered"], data["completed"], data["failed"]) == (12, 12, 0)
+        assert data["latency_s"]["p50"] <= data["latency_s"]["p99"]
+        assert data["throughput_rps"] > 0
+
+    def test_open_loop_honours_rate_and_duration(self):
+        report = LoadGenerator(make_service()).open_loop(
+            itertools.repeat(req()), rate_rps=50, duration_s=0.2, poisson=False
+        )
+        assert report.offered == 10
+        assert report.wall_s >= 0.18
+
+    def test_open_loop_queueing_when_workers_saturated(self):
+        synth = SimulatedSynthesizerAdapter(rtf=1.0, chars_per_second=200, jitter=0.0, max_parallel=4)
+        report = LoadGenerator(make_service(synth), max_workers=1).open_loop(
+            itertools.repeat(req("x" * 10), 5), rate_rps=1000, poisson=False
+        )
+        assert report.completed == 5
+        assert percentiles(report.queue_s)["max"] > 0.1
+
+    def test_failures_and_sheds_are_separated(self):
+        shed_service = make_service(overload=OverloadController(OverloadPolicy(max_in_flight=0, shed_below_priority=1)))
+        report = LoadGenerator(shed_service).closed_loop([req()] * 3, concurrency=1)
+        assert report.degraded["shed"] == 3 and report.failed == 0
+        failing = make_service(SimulatedSynthesizerAdapter(failure_rate=1.0, sleep=lambda s: None))
+        assert LoadGenerator(failing).closed_loop([req()] * 2, concurrency=1).failed == 2
+
+    def test_requests_past_their_deadline_count_as_expired(self):
+        # Renders take 10 ms each on a one-slot device; the last arrivals run out of time.
+        synth = SimulatedSynthesizerAdapter(rtf=1.0, chars_per_second=500, jitter=0.0, max_parallel=1)
+        report = LoadGenerator(make_service(synth), max_workers=4, timeout_s=0.025).open_loop(
+            itertools.repeat(req("x" * 5), 4), rate_rps=1000, poisson=False
+        )
+        assert report.completed >= 1 and report.expired >= 1
+        assert report.failed == 0 and report.completed + report.expired == 4
+        assert report.as_dict()["expired"] == report.expired
+
+    def test_replay_of_recorded_audit_log(self, tmp_path):
+        log = tmp_path / "audit.jsonl"
+        service = make_service(audit=FileAuditAdapter(str(log)))
+        for text in ("First call.", "Second call."):
+            service.speak(req(text))
+            time.sleep(0.05)
+        schedule = load_audit_schedule(str(log))
+        assert [r.text for _, r in schedule] == ["First call.", "Second call."]
+        assert schedule[0][0] == 0.0 and schedule[1][0] >= 0.04
+        report = LoadGenerator(make_service()).replay(schedule, speed=10.0)
+        assert report.completed == 2
+
+    def test_synthetic_requests_are_seeded(self):
+        a = [r.text for r in itertools.islice(synthetic_requests(["a", "b", "c"], ["p"], seed=1), 10)]
+        b = [r.text for r in itertools.islice(synthetic_requests(["a", "b", "c"], ["p"], seed=1), 10)]
+        assert a == b
+
+    def test_cli_closed_loop(self, capsys):
+        code = main(["closed", "--concurrency", "2", "--count", "4", "--simulate", "--sim-rtf", "0.001", "--seed", "0"])
+        assert code == 0
+        assert json.loads(capsys.readouterr().out)["completed"] == 4
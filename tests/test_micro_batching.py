@@ -0,0 +1,126 @@
+"""Tests for MicroBatchingSynthesizerAdapter — batching, grouping, adaptive window."""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from tts_v2.adapters.synthesizer.batching_adapter import MicroBatchingSynthesizerAdapter, _Pending
+from tts_v2.adapters.synthesizer.mock_adapter import MockSynthesizerAdapter
+from tts_v2.domain.audio import AudioChunk, SynthesisRequest
+from tts_v2.ports.batch_synthesizer_port import BatchSynthesizerPort
+from tts_v2.ports.synthesizer_port import SynthesizerPort
+
+
+class RecordingBackend:
+    """Batch backend whose output encodes the request text length."""
+
+    def __init__(self, delay_s=0.0, fail=False):
+        self.delay_s = delay_s
+        self.fail = fail
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def synthesize(self, request):
+        return self.synthesize_batch([request])[0]
+
+    def synthesize_batch(self, requests):
+        with self.lock:
+            self.batches.append([r.text for r in requests])
+        time.sleep(self.delay_s)
+        if self.fail:
+            raise RuntimeError("backend down")
+        return [
+            AudioChunk(samples=np.full(len(r.text), 0.1, dtype=np.float32), sample_rate=16000, speaker_id=r.persona)
+            for r in requests
+        ]
+
+    def get_speakers(self):
+        return ["a", "b"]
+
+
+def req(text, persona="neutral_male"):
+    return SynthesisRequest(text=text, persona=persona)
+
+
+@pytest.fixture
+def make():
+    adapters = []
+
+    def factory(backend, **kwargs):
+        adapter = MicroBatchingSynthesizerAdapter(backend, **kwargs)
+        adapters.append(adapter)
+        return adapter
+
+    yield factory
+    for adapter in adapters:
+        adapter.close()
+
+
+def test_ports():
+    assert isinstance(MockSynthesizerAdapter(), BatchSynthesizerPort)
+    adapter = MicroBatchingSynthesizerAdapter(MockSynthesizerAdapter())
+    try:
+        assert isinstance(adapter, SynthesizerPort)
+        assert adapter.get_speakers() == ["mock"]
+    finally:
+        adapter.close()
+
+
+def test_single_request_is_dispatched_without_waiting(make):
+    backend = RecordingBackend()
+    adapter = make(backend, max_wait_ms=500)
+    t0 = time.monotonic()
+    chunk = adapter.synthesize(req("hello"))
+    assert time.monotonic() - t0 < 0.2
+    assert chunk.samples.size == 5
+    assert adapter.stats()["window_ms"] == 0.0
+
+
+def test_concurrent_requests_are_batched_and_routed_back(make):
+    backend = RecordingBackend(delay_s=0.05)
+    adapter = make(backend, max_batch_size=8, max_wait_ms=50, max_length_ratio=100)
+    texts = [f"utterance {i:02d}" for i in range(24)]
+    with ThreadPoolExecutor(max_workers=24) as pool:
+        chunks = list(pool.map(lambda t: adapter.synthesize(req(t)), texts))
+    assert [c.samples.size for c in chunks] == [len(t) for t in texts]
+    stats = adapter.stats()
+    assert stats["requests"] == 24
+    assert stats["batches"] < 24
+    assert max(len(b) for b in backend.batches) > 1
+    assert max(len(b) for b in backend.batches) <= 8
+
+
+def test_window_widens_under_load(make):
+    adapter = make(RecordingBackend(delay_s=0.02), max_batch_size=4, max_wait_ms=40)
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(lambda i: adapter.synthesize(req(f"x{i}")), range(64)))
+    assert adapter.stats()["window_ms"] > 0
+
+
+def test_groups_by_length(make):
+    backend = RecordingBackend()
+    adapter = make(backend, max_batch_size=4, max_length_ratio=2.0)
+    futures = [Future() for _ in range(4)]
+    with adapter._cond:  # hold the dispatcher so all four land in one batch
+        for text, future in zip(["a" * 40, "b" * 3, "c" * 50, "d" * 4], futures):
+            adapter._queue.append(_Pending(req(text), future, time.monotonic()))
+        adapter._cond.notify()
+    for f in futures:
+        f.result(timeout=5)
+    assert backend.batches == [["bbb", "dddd"], ["a" * 40, "c" * 50]]
+
+
+def test_backend_failure_propagates_to_every_caller(make):
+    adapter = make(RecordingBackend(fail=True))
+    with pytest.raises(RuntimeError, match="backend down"):
+        adapter.synthesize(req("x"))
+
+
+def test_close_rejects_new_requests():
+    adapter = MicroBatchingSynthesizerAdapter(RecordingBackend())
+    adapter.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        adapter.submit(req("x"))
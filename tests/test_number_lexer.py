@@ -0,0 +1,108 @@
+"""Tests for the single-pass numeric lexer behind expand_numbers_in_text()."""
+
+import random
+import re
+
+import pytest
+from num2words import num2words
+
+from tts_v2.text_normalization.number_formatter import (
+    NumericSpan,
+    expand_numbers_in_text,
+    format_money,
+    format_otp,
+    lex_numbers,
+)
+
+
+# ---------------------------------------------------------------------------
+# Reference: the three sequential regex passes this lexer replaced.
+# ---------------------------------------------------------------------------
+
+_CURRENCY_RE = re.compile(r"\$\s?([0-9]{1,3}(?:,[0-9]{3})*(?:\.[0-9]{2})?)")
+_NUMBER_RE = re.compile(r"\b([0-9]{1,3}(?:,[0-9]{3})*(?:\.[0-9]{2})?)\b")
+_OTP_RE = re.compile(r"\b([0-9]{4,}|[A-Z0-9]{4,})\b")
+
+
+def legacy_expand(text, preserve_otps=True):
+    def replace_currency(m):
+        amount_str = m.group(1).replace(",", "")
+        try:
+            return format_money(float(amount_str))
+        except Exception:
+            return m.group(0)
+
+    def replace_otp_match(m):
+        num_str = m.group(1)
+        if num_str.isdigit():
+            return format_otp(num_str)
+        return m.group(0)
+
+    def replace_number(m):
+        num_str = m.group(1).replace(",", "")
+        try:
+            if "." in num_str:
+                whole, dec = num_str.split(".")
+                spoken_dec = " ".join(num2words(int(d), to="cardinal", lang="en") for d in dec)
+                return f"{num2words(int(whole), to='cardinal', lang='en')} point {spoken_dec}"
+            return num2words(int(num_str), to="cardinal", lang="en")
+        except Exception:
+            return m.group(0)
+
+    text = _CURRENCY_RE.sub(replace_currency, text)
+    if preserve_otps:
+        text = _OTP_RE.sub(replace_otp_match, text)
+    return _NUMBER_RE.sub(replace_number, text)
+
+
+GOLDEN = [
+    ("Your OTP is 482913.", "Your OTP is four eight two nine one three."),
+    ("Pay $1,234.50 today", "Pay one thousand, two hundred and thirty-four dollars and fifty cents today"),
+    ("Fee of $ 5", "Fee of five dollars"),
+    ("Balance 1,205 points", "Balance one thousand, two hundred and five points"),
+    ("Rate 12.34%", "Rate twelve point three four%"),
+    ("Pi is 3.14159", "Pi is three.one four one five nine"),
+    ("SWIFT code ANZBAU3M", "SWIFT code ANZBAU3M"),
+    ("Ref AB12 and 7", "Ref AB12 and seven"),
+    ("$1234", "one hundred and twenty-three dollars4"),
+    ("1234$5", "1234five dollars"),
+    ("7$5", "7five dollars"),
+    ("1,2345", "one,two three four five"),
+    ("12,345.678", "twelve thousand, three hundred and forty-five.six hundred and seventy-eight"),
+    ("no digits here", "no digits here"),
+    ("", ""),
+]
+
+
+@pytest.mark.parametrize("text,expected", GOLDEN)
+def test_golden(text, expected):
+    assert expand_numbers_in_text(text) == expected
+    assert legacy_expand(text) == expected
+
+
+def test_without_otp_mode_long_runs_are_left_alone():
+    assert expand_numbers_in_text("Call 1205 or 12", preserve_otps=False) == "Call 1205 or twelve"
+
+
+def test_spans_index_the_input():
+    text = "Send $20 to 482913 by 5"
+    spans = lex_numbers(text)
+    assert [s.kind for s in spans] == ["currency", "otp", "number"]
+    assert [text[s.start:s.end] for s in spans] == ["$20", "482913", "5"]
+    assert spans[2] == NumericSpan(22, 23, "number", "five")
+    assert expand_numbers_in_text(text, spans=spans) == expand_numbers_in_text(text)
+
+
+def test_uppercase_codes_produce_no_spans():
+    assert lex_numbers("SWIFT BIC ANZBAU3M REF ABCD") == []
+
+
+_ALPHABET = ["0", "1", "2", "5", "9", "12", "345", "4829", ",", ".", "$", " ", "$ ", "A", "Z", "ab", "_", "%", "-", "\n", "é", "٣"]
+
+
+@pytest.mark.parametrize("preserve_otps", [True, False])
+def test_fuzz_matches_sequential_passes(preserve_otps):
+    rng = random.Random(20261019)
+    for _ in range(5000):
+        text = "".join(rng.choice(_ALPHABET) for _ in range(rng.randint(0, 20)))
+        assert expand_numbers_in_text(text, preserve_otps) == legacy_expand(text, preserve_otps), repr(text)
@@ -0,0 +1,133 @@
+"""Tests for the ONNX export and OnnxSynthesizerAdapter.
+
+Manifest handling runs everywhere; export and inference against the tiny
+random VITS are skipped when coqui-tts / torch / onnx / onnxruntime are
+not installed.
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+import pytest
+
+from tts_v2.adapters.synthesizer.coqui_onnx import ONNX_FORMAT_VERSION, read_onnx_manifest
+from tts_v2.domain.audio import SynthesisRequest
+from tts_v2.domain.cancellation import RequestCancelled
+from tts_v2.entrypoints.common import add_pipeline_arguments, model_id
+from tts_v2.shared.buffer_pool import BufferPool
+
+
+def write_manifest(directory, **fields):
+    directory.mkdir(exist_ok=True)
+    manifest = {"format": ONNX_FORMAT_VERSION, "kind": "onnx", "model_name": "tts_models/en/vctk/vits", **fields}
+    (directory / "manifest.json").write_text(json.dumps(manifest))
+    return directory
+
+
+def parse(*argv):
+    parser = argparse.ArgumentParser()
+    add_pipeline_arguments(parser)
+    return parser.parse_args(list(argv))
+
+
+def request(text="Your balance is ten dollars.", **kwargs):
+    return SynthesisRequest(text=text, persona="professional_male", **kwargs)
+
+
+class TestManifest:
+    def test_reads_model_name(self, tmp_path):
+        export = write_manifest(tmp_path / "onnx")
+        assert read_onnx_manifest(str(export))["model_name"] == "tts_models/en/vctk/vits"
+
+    def test_missing_manifest_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="not an ONNX export"):
+            read_onnx_manifest(str(tmp_path))
+
+    def test_snapshot_manifest_is_rejected(self, tmp_path):
+        export = write_manifest(tmp_path / "snap", kind=None)
+        with pytest.raises(ValueError, match="Unsupported ONNX export"):
+            read_onnx_manifest(str(export))
+
+    def test_model_id_comes_from_export(self, tmp_path):
+        export = write_manifest(tmp_path / "onnx", model_name="tiny-vits")
+        assert model_id(parse("--onnx-model", str(export))) == "tiny-vits"
+
+
+@pytest.fixture(scope="module")
+def tiny_export(tmp_path_factory):
+    pytest.importorskip("torch")
+    pytest.importorskip("TTS")
+    pytest.importorskip("onnx")
+    pytest.importorskip("onnxruntime")
+    from tts_v2.adapters.synthesizer.coqui_onnx import export_onnx
+    from tts_v2.adapters.synthesizer.coqui_tiny_model import build_tiny_vits
+
+    model = build_tiny_vits()
+    directory = str(tmp_path_factory.mktemp("export") / "tiny-onnx")
+    export_onnx(model, directory, "tiny-vits")
+    return model, directory
+
+
+def make_adapter(directory, **kwargs):
+    from tts_v2.adapters.synthesizer.onnx_adapter import OnnxSynthesizerAdapter
+
+    return OnnxSynthesizerAdapter(directory, **kwargs)
+
+
+class TestTinyOnnx:
+    def test_manifest_records_speakers_and_inputs(self, tiny_export):
+        _, directory = tiny_export
+        manifest = read_onnx_manifest(directory)
+        assert manifest["inputs"] == ["input", "input_lengths", "scales", "sid"]
+        assert list(manifest["speakers"]) == ["p225", "p226", "p227", "p228"]
+
+    def test_synthesize_returns_float32_chunk(self, tiny_export):
+        adapter = make_adapter(tiny_export[1])
+        chunk = adapter.synthesize(request("Hello there. Your balance is ten dollars."))
+        assert chunk.samples.dtype == np.float32 and chunk.samples.size > 20000
+        assert chunk.speaker_id == "p225" and chunk.sample_rate == adapter.sample_rate
+        assert adapter.stats()["sentences"] == 2
+
+    def test_matches_pytorch_adapter(self, tiny_export):
+        from tts_v2.adapters.synthesizer.coqui_onnx import validate_onnx_export
+
+        model, directory = tiny_export
+        report = validate_onnx_export(model, directory)
+        assert report["passed"], report
+        assert report["min_correlation"] > 0.99
+        assert model.inference_noise_scale > 0  # restored after validation
+
+    def test_io_binding_matches_plain_run(self, tiny_export):
+        from tts_v2.adapters.synthesizer.onnx_adapter import OnnxSessionConfig
+
+        deterministic = dict(noise_scale=0.0, noise_scale_dp=0.0)
+        bound = make_adapter(tiny_export[1], **deterministic)
+        plain = make_adapter(
+            tiny_export[1], session=OnnxSessionConfig(io_binding=False, intra_op_threads=1), **deterministic
+        )
+        np.testing.assert_array_equal(bound.synthesize(request()).samples, plain.synthesize(request()).samples)
+
+    def test_output_is_pooled(self, tiny_export):
+        pool = BufferPool()
+        chunk = make_adapter(tiny_export[1], buffer_pool=pool).synthesize(request())
+        assert chunk.lease is not None
+        chunk.release()
+        assert pool.stats()["leased_bytes"] == 0
+
+    def test_unknown_speaker_raises(self, tiny_export):
+        with pytest.raises(RuntimeError, match="ONNX synthesis failed"):
+            make_adapter(tiny_export[1]).synthesize(request(speaker_id="p999"))
+
+    def test_expired_request_is_not_run(self, tiny_export):
+        adapter = make_adapter(tiny_export[1])
+        with pytest.raises(RequestCancelled):
+            adapter.synthesize(request(deadline=time.monotonic() - 1))
+        assert adapter.stats()["requests"] == 0
+
+    def test_invalid_optimisation_level(self, tiny_export):
+        from tts_v2.adapters.synthesizer.onnx_adapter import OnnxSessionConfig
+
+        with pytest.raises(ValueError, match="graph_optimization"):
+            OnnxSessionConfig(graph_optimization="max")
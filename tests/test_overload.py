@@ -0,0 +1,211 @@
+"""Tests for OverloadController, the rendition store and degraded-mode serving."""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from tts_v2.adapters.audit.noop_audit_adapter import NoOpAuditAdapter
+from tts_v2.adapters.normalizer.bfsi_normalizer_adapter import BFSINormalizerAdapter
+from tts_v2.adapters.rendition_store.memory_store_adapter import InMemoryRenditionStoreAdapter
+from tts_v2.adapters.synthesizer.mock_adapter import MockSynthesizerAdapter
+from tts_v2.domain.audio import AudioChunk, SynthesisRequest
+from tts_v2.ports.rendition_store_port import RenditionStorePort
+from tts_v2.service.overload import OverloadController, OverloadPolicy
+from tts_v2.service.tts_service import TTSService
+
+
+class RecordingAudit:
+    def __init__(self):
+        self.events = []
+
+    def log_synthesis(self, event):
+        self.events.append(event)
+
+
+class CountingSynth(MockSynthesizerAdapter):
+    def __init__(self):
+        self.calls = 0
+
+    def synthesize(self, request):
+        self.calls += 1
+        return super().synthesize(request)
+
+
+class NullSink:
+    def write(self, chunk, destination):
+        return destination
+
+
+def make_service(overload=None, renditions=None, fallback=None, synth=None, audit=None):
+    return TTSService(
+        synthesizer=synth or CountingSynth(),
+        normalizer=BFSINormalizerAdapter(),
+        audio_sink=NullSink(),
+        audit=audit or NoOpAuditAdapter(),
+        overload=overload,
+        renditions=renditions,
+        fallback_synthesizer=fallback,
+    )
+
+
+def always_overloaded(**kwargs):
+    return OverloadController(OverloadPolicy(max_in_flight=0, **kwargs))
+
+
+def req(text="Your balance is updated.", priority=0):
+    return SynthesisRequest(text=text, persona="professional_female", priority=priority)
+
+
+class TestOverloadController:
+    def test_idle_controller_is_not_overloaded(self):
+        state = OverloadController().state()
+        assert not state.overloaded
+        assert state.rolling_rtf == 0.0
+
+    def test_rolling_rtf_crosses_threshold_after_min_samples(self):
+        ctl = OverloadController(OverloadPolicy(max_rtf=1.0, min_samples=3))
+        ctl.record(2.0, 1.0)
+        ctl.record(2.0, 1.0)
+        assert not ctl.state().overloaded
+        ctl.record(2.0, 1.0)
+        state = ctl.state()
+        assert state.overloaded
+        assert state.rolling_rtf == pytest.approx(2.0)
+
+    def test_samples_age_out(self):
+        ctl = OverloadController(OverloadPolicy(max_rtf=1.0, min_samples=1, window_s=0.05))
+        ctl.record(5.0, 1.0)
+        assert ctl.state().overloaded
+        time.sleep(0.08)
+        assert not ctl.state().overloaded
+
+    def test_in_flight_threshold(self):
+        ctl = OverloadController(OverloadPolicy(max_in_flight=1))
+        with ctl.admit() as first:
+            assert not first.overloaded
+            with ctl.admit() as second:
+                assert second.overloaded
+                assert second.in_flight == 2
+        assert ctl.state().in_flight == 0
+
+
+class TestRenditionStore:
+    def test_satisfies_port(self):
+        assert isinstance(InMemoryRenditionStoreAdapter(), RenditionStorePort)
+
+    def test_stored_copy_is_frozen_and_independent(self):
+        store = InMemoryRenditionStoreAdapter()
+        samples = np.ones(100, dtype=np.float32)
+        store.store(req(), AudioChunk(samples=samples, sample_rate=22050, speaker_id="p1"))
+        samples[:] = 0.0
+        hit = store.lookup(req())
+        assert hit is not None and hit.samples[0] == 1.0
+        assert not hit.samples.flags.writeable
+
+    def test_key_ignores_output_path_but_not_voice(self):
+        store = InMemoryRenditionStoreAdapter()
+        store.store(req(), AudioChunk(samples=np.zeros(10, dtype=np.float32), sample_rate=22050, speaker_id="p1"))
+        assert store.lookup(SynthesisRequest(text=req().text, persona="professional_female", output_path="x.wav"))
+        assert store.lookup(SynthesisRequest(text=req().text, persona="friendly_female")) is None
+
+    def test_lru_and_byte_bounds(self):
+        store = InMemoryRenditionStoreAdapter(max_entries=2, max_bytes=4 * 250)
+        for i in range(3):
+            store.store(req(f"t{i}"), AudioChunk(samples=np.zeros(100, dtype=np.float32), sample_rate=22050, speaker_id="p1"))
+        assert store.lookup(req("t0")) is None
+        assert store.stats()["entries"] == 2
+        store.store(req("big"), AudioChunk(samples=np.zeros(200, dtype=np.float32), sample_rate=22050, speaker_id="p1"))
+        assert store.stats()["entries"] == 1
+        assert store.stats()["bytes"] == 800
+
+
+class TestDegradedService:
+    def test_unloaded_service_records_rtf_and_stores_renditions(self):
+        ctl = OverloadController()
+        store = InMemoryRenditionStoreAdapter()
+        audit = RecordingAudit()
+        result = make_service(overload=ctl, renditions=store, audit=audit).speak(req())
+        assert result.success and result.degradation is None
+        assert store.stats()["entries"] == 1
+        assert audit.events[0]["degradation"] is None
+        assert audit.events[0]["load"]["overloaded"] is False
+
+    def test_low_priority_request_is_shed(self):
+        audit = RecordingAudit()
+        synth = CountingSynth()
+        service = make_service(overload=always_overloaded(shed_below_priority=1), synth=synth, audit=audit)
+        result = service.speak(req(priority=0))
+        assert not result.success
+        assert result.degradation == "shed"
+        assert synth.calls == 0
+        assert audit.events[0]["degradation"] == "shed"
+        assert audit.events[0]["load"]["overloaded"] is True
+
+    def test_cached_rendition_served_under_overload(self):
+        store = InMemoryRenditionStoreAdapter()
+        make_service(renditions=store).speak(req())
+        synth = CountingSynth()
+        audit = RecordingAudit()
+        service = make_service(overload=always_overloaded(), renditions=store, synth=synth, audit=audit)
+        result = service.speak(req())
+        assert result.success and result.degradation == "cached"
+        assert synth.calls == 0
+        assert audit.events[0]["degradation"] == "cached"
+
+    def test_fallback_used_when_no_rendition(self):
+        synth, fallback = CountingSynth(), CountingSynth()
+        service = make_service(
+            overload=always_overloaded(),
+            renditions=InMemoryRenditionStoreAdapter(),
+            fallback=fallback,
+            synth=synth,
+        )
+        result = service.speak(req())
+        assert result.success and result.degradation == "fallback"
+        assert (synth.calls, fallback.calls) == (0, 1)
+
+    def test_overloaded_without_options_renders_normally(self):
+        synth = CountingSynth()
+        result = make_service(overload=always_overloaded(), synth=synth).speak(req())
+        assert result.success and result.degradation is None
+        assert synth.calls == 1
+
+    def test_high_priority_not_shed(self):
+        service = make_service(overload=always_overloaded(shed_below_priority=1))
+        assert service.speak(req(priority=1)).success
+
+    def test_in_flight_released_after_failure(self):
+        class Broken(MockSynthesizerAdapter):
+            def synthesize(self, request):
+                raise RuntimeError("boom")
+
+        ctl = OverloadController()
+        with pytest.raises(RuntimeError):
+            make_service(overload=ctl, synth=Broken()).speak(req())
+        assert ctl.state().in_flight == 0
+
+    def test_concurrent_burst_sheds_excess(self):
+        gate = threading.Event()
+
+        class Blocking(MockSynthesizerAdapter):
+            def synthesize(self, request):
+                gate.wait(2.0)
+                return super().synthesize(request)
+
+        service = make_service(
+            overload=OverloadController(OverloadPolicy(max_in_flight=2, shed_below_priority=1)),
+            synth=Blocking(),
+        )
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(service.speak(req()))) for _ in range(2)]
+        for t in threads:
+            t.start()
+        time.sleep(0.05)
+        extra = service.speak(req())
+        gate.set()
+        for t in threads:
+            t.join()
+        assert extra.degradation == "shed"
+        assert all(r.success for r in results)
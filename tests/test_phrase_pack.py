@@ -0,0 +1,123 @@
+"""Tests for the phrase pack builder, PhrasePackAdapter and TTSService(phrase_pack=...)."""
+
+import json
+
+import numpy as np
+import pytest
+
+from tts_v2.adapters.audit.noop_audit_adapter import NoOpAuditAdapter
+from tts_v2.adapters.normalizer.bfsi_normalizer_adapter import BFSINormalizerAdapter
+from tts_v2.adapters.rendition_store.phrase_pack_adapter import PhrasePackAdapter, write_phrase_pack
+from tts_v2.adapters.synthesizer.mock_adapter import MockSynthesizerAdapter
+from tts_v2.domain.audio import AudioChunk, SynthesisRequest
+from tts_v2.domain.voice import get_speaker
+from tts_v2.entrypoints.build_phrase_pack import main, render_phrases
+from tts_v2.entrypoints.common import NullSink
+from tts_v2.ports.rendition_store_port import RenditionStorePort
+from tts_v2.service.tts_service import TTSService
+
+
+class CountingSynth(MockSynthesizerAdapter):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def synthesize(self, request):
+        self.calls += 1
+        chunk = super().synthesize(request)
+        chunk.samples[:] = np.linspace(-0.5, 0.5, chunk.samples.size, dtype=np.float32)
+        return chunk
+
+
+class RecordingAudit:
+    def __init__(self):
+        self.events = []
+
+    def log_synthesis(self, event):
+        self.events.append(event)
+
+
+def make_service(synth, phrase_pack=None, audit=None):
+    return TTSService(
+        synthesizer=synth,
+        normalizer=BFSINormalizerAdapter(),
+        audio_sink=NullSink(),
+        audit=audit or NoOpAuditAdapter(),
+        phrase_pack=phrase_pack,
+    )
+
+
+@pytest.fixture
+def pack_path(tmp_path):
+    path = str(tmp_path / "phrases.pack")
+    builder = make_service(CountingSynth())
+    phrases = ["This call may be recorded.", "Terms and conditions apply."]
+    write_phrase_pack(path, "mock", render_phrases(builder, phrases, ["professional_female", "professional_male"]))
+    return path
+
+
+def test_round_trip_is_zero_copy_and_read_only(pack_path):
+    pack = PhrasePackAdapter(pack_path, model="mock")
+    assert isinstance(pack, RenditionStorePort)
+    assert len(pack) == 4
+    chunk = pack.lookup(SynthesisRequest(text="This call may be recorded.", persona="professional_female"))
+    assert chunk.speaker_id == get_speaker("professional_female").speaker_id
+    assert chunk.samples.dtype == np.float32 and not chunk.samples.flags.writeable
+    assert chunk.samples.base is not None  # a view over the mapping, not a copy
+    assert chunk.samples.ctypes.data % 64 == 0
+    np.testing.assert_allclose(chunk.samples[[0, -1]], [-0.5, 0.5])
+
+
+def test_match_ignores_case_and_whitespace_but_not_wording(pack_path):
+    pack = PhrasePackAdapter(pack_path, model="mock")
+    hit = SynthesisRequest(text="this  call may be RECORDED.", persona="professional_male")
+    miss = SynthesisRequest(text="This call will be recorded.", persona="professional_male")
+    assert pack.lookup(hit) is not None
+    assert pack.lookup(miss) is None
+    assert pack.stats()["hits"] == 1 and pack.stats()["misses"] == 1
+
+
+def test_entries_are_keyed_by_speaker(pack_path):
+    pack = PhrasePackAdapter(pack_path, model="mock")
+    request = SynthesisRequest(text="This call may be recorded.", persona="professional_female", speaker_id="p999")
+    assert pack.lookup(request) is None
+
+
+def test_pack_for_another_model_is_rejected(pack_path, tmp_path):
+    with pytest.raises(ValueError, match="built for model 'mock'"):
+        PhrasePackAdapter(pack_path, model="tts_models/en/vctk/vits")
+    bogus = tmp_path / "bogus.pack"
+    bogus.write_bytes(b"not a pack at all")
+    with pytest.raises(ValueError, match="not a phrase pack"):
+        PhrasePackAdapter(str(bogus), model="mock")
+
+
+def test_speak_serves_pack_hits_without_synthesis(pack_path):
+    synth = CountingSynth()
+    audit = RecordingAudit()
+    service = make_service(synth, PhrasePackAdapter(pack_path, model="mock"), audit)
+    hit = service.speak(SynthesisRequest(text="Terms and conditions apply.", persona="professional_male"))
+    assert synth.calls == 0
+    assert hit.success and hit.chunk.duration_s == pytest.approx(1.0)
+    service.speak(SynthesisRequest(text="Your OTP is 4829.", persona="professional_male"))
+    assert synth.calls == 1
+    assert [e["source"] for e in audit.events] == ["phrase_pack", "synthesis"]
+
+
+def test_duplicate_keys_are_written_once(tmp_path):
+    chunk = AudioChunk(samples=np.zeros(10, dtype=np.float32), sample_rate=8000, speaker_id="p1")
+    path = str(tmp_path / "p.pack")
+    n = write_phrase_pack(path, "m", [("p1", "Hello", chunk), ("p1", "hello ", chunk), ("p2", "Hello", chunk)])
+    assert n == 2
+
+
+def test_cli_builds_pack_from_domain_and_user_phrases(tmp_path, capsys):
+    phrases = tmp_path / "lines.txt"
+    phrases.write_text("# compliance\nThis call may be recorded for quality and compliance.\n\n")
+    out = tmp_path / "out" / "phrases.pack"
+    assert main([str(out), "--mock", "--phrases", str(phrases), "--persona", "professional_female"]) == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["entries"] == summary["phrases"] > 1
+    pack = PhrasePackAdapter(str(out), model="mock")
+    request = SynthesisRequest(text="this call may be recorded", persona="professional_female")
+    assert pack.lookup(request) is not None
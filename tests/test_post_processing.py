@@ -0,0 +1,125 @@
+"""Tests for PostProcessingChainAdapter — trim, loudness, limiter, fades."""
+
+import numpy as np
+import pytest
+
+from tts_v2.adapters.audit.noop_audit_adapter import NoOpAuditAdapter
+from tts_v2.adapters.normalizer.bfsi_normalizer_adapter import BFSINormalizerAdapter
+from tts_v2.adapters.postprocess.chain_adapter import (
+    Fade,
+    LoudnessTarget,
+    PeakLimiter,
+    PostProcessingChainAdapter,
+    TrimSilence,
+)
+from tts_v2.domain.audio import AudioChunk, SynthesisRequest
+from tts_v2.ports.post_processor_port import PostProcessorPort
+from tts_v2.service.tts_service import TTSService
+
+SR = 22050
+
+
+def padded_tone(lead_s=0.5, tone_s=1.0, trail_s=0.5, amplitude=0.3):
+    t = np.arange(int(SR * tone_s)) / SR
+    body = amplitude * np.sin(2 * np.pi * 220 * t)
+    return np.concatenate([
+        np.zeros(int(SR * lead_s)), body, np.zeros(int(SR * trail_s)),
+    ]).astype(np.float32)
+
+
+def chunk_of(samples):
+    return AudioChunk(samples=samples, sample_rate=SR, speaker_id="p225")
+
+
+class TestSteps:
+    def test_trim_removes_dead_air_and_returns_view(self):
+        samples = padded_tone()
+        out = TrimSilence(keep_leading_ms=0, keep_trailing_ms=0).apply(samples, SR)
+        assert abs(out.size / SR - 1.0) < 0.02
+        assert np.shares_memory(out, samples)
+
+    def test_trim_keeps_padding(self):
+        out = TrimSilence(keep_leading_ms=20, keep_trailing_ms=60).apply(padded_tone(), SR)
+        assert abs(out.size / SR - 1.08) < 0.02
+
+    def test_trim_leaves_all_silence_untouched(self):
+        samples = np.zeros(SR, dtype=np.float32)
+        assert TrimSilence().apply(samples, SR).size == SR
+
+    def test_loudness_reaches_target_ignoring_pauses(self):
+        step = LoudnessTarget(target_db=-20.0)
+        samples = padded_tone(lead_s=1.0, trail_s=1.0, amplitude=0.05)
+        step.apply(samples, SR)
+        assert step.measure(samples, SR) == pytest.approx(-20.0, abs=0.5)
+
+    def test_loudness_gain_is_capped(self):
+        samples = padded_tone(amplitude=1e-3)
+        LoudnessTarget(target_db=-20.0, max_gain_db=6.0).apply(samples, SR)
+        assert np.abs(samples).max() == pytest.approx(2e-3, rel=0.01)
+
+    def test_limiter_enforces_ceiling_without_touching_quiet_blocks(self):
+        samples = padded_tone(lead_s=0, trail_s=0, amplitude=0.3)
+        samples[SR // 2: SR // 2 + 200] = 2.0
+        original = samples.copy()
+        PeakLimiter(ceiling=0.9).apply(samples, SR)
+        assert np.abs(samples).max() <= 0.9
+        np.testing.assert_array_equal(samples[: SR // 4], original[: SR // 4])
+
+    def test_fade_ramps_edges(self):
+        samples = np.ones(SR, dtype=np.float32)
+        Fade(fade_in_ms=10, fade_out_ms=10).apply(samples, SR)
+        assert samples[0] == 0.0
+        assert samples[-1] < 0.01
+        assert samples[SR // 2] == 1.0
+
+
+class TestChainAdapter:
+    def test_satisfies_port(self):
+        assert isinstance(PostProcessingChainAdapter.telephony(), PostProcessorPort)
+
+    def test_processes_writable_buffer_in_place(self):
+        samples = padded_tone()
+        out = PostProcessingChainAdapter.telephony().process(chunk_of(samples))
+        assert np.shares_memory(out.samples, samples)
+        assert out.duration_s < 1.2
+        assert np.abs(out.samples).max() <= 0.95
+
+    def test_copies_read_only_buffer(self):
+        samples = padded_tone()
+        samples.flags.writeable = False
+        out = PostProcessingChainAdapter([Fade()]).process(chunk_of(samples))
+        assert not np.shares_memory(out.samples, samples)
+        assert out.samples.dtype == np.float32
+
+    def test_empty_chain_is_identity(self):
+        samples = padded_tone()
+        out = PostProcessingChainAdapter([]).process(chunk_of(samples))
+        assert out.samples is samples
+        assert out.speaker_id == "p225"
+
+
+class ToneSynthesizer:
+    def synthesize(self, request):
+        return chunk_of(padded_tone())
+
+    def get_speakers(self):
+        return ["p225"]
+
+
+def test_service_applies_postprocessor_before_sink():
+    written = []
+
+    class Sink:
+        def write(self, chunk, destination):
+            written.append(chunk)
+            return destination
+
+    service = TTSService(
+        synthesizer=ToneSynthesizer(),
+        normalizer=BFSINormalizerAdapter(),
+        audio_sink=Sink(),
+        audit=NoOpAuditAdapter(),
+        postprocessor=PostProcessingChainAdapter([TrimSilence(keep_leading_ms=0, keep_trailing_ms=0)]),
+    )
+    service.speak(SynthesisRequest(text="Hello", persona="professional_female", output_path="out.wav"))
+    assert abs(written[0].duration_s - 1.0) < 0.02
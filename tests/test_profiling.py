@@ -0,0 +1,111 @@
+"""Tests for RequestProfiler and its TTSService hook."""
+
+import json
+import pstats
+import time
+
+import pytest
+
+from tts_v2.adapters.audit.noop_audit_adapter import NoOpAuditAdapter
+from tts_v2.adapters.normalizer.bfsi_normalizer_adapter import BFSINormalizerAdapter
+from tts_v2.adapters.synthesizer.mock_adapter import MockSynthesizerAdapter
+from tts_v2.domain.audio import SynthesisRequest
+from tts_v2.entrypoints.common import NullSink
+from tts_v2.service.profiling import ProfilingPolicy, RequestProfiler
+from tts_v2.service.tts_service import TTSService
+
+
+class SlowSynth(MockSynthesizerAdapter):
+    def __init__(self, delay_s):
+        super().__init__()
+        self.delay_s = delay_s
+
+    def synthesize(self, request):
+        slow_model_step(self.delay_s)
+        return super().synthesize(request)
+
+
+def slow_model_step(delay_s):
+    deadline = time.monotonic() + delay_s
+    while time.monotonic() < deadline:
+        time.sleep(0.002)
+
+
+def make_service(profiler, synth=None):
+    return TTSService(
+        synthesizer=synth or MockSynthesizerAdapter(),
+        normalizer=BFSINormalizerAdapter(),
+        audio_sink=NullSink(),
+        audit=NoOpAuditAdapter(),
+        profiler=profiler,
+    )
+
+
+def req(text="Your balance is Rs. 500."):
+    return SynthesisRequest(text=text, persona="professional_female")
+
+
+def dumps(directory, suffix):
+    return sorted(p for p in directory.iterdir() if p.suffix == suffix)
+
+
+def test_unsampled_requests_write_nothing(tmp_path):
+    profiler = RequestProfiler(ProfilingPolicy(sample_rate=0.0, output_dir=str(tmp_path / "p")))
+    make_service(profiler).speak(req())
+    assert not (tmp_path / "p").exists()
+    assert profiler.stats()["profiled"] == 0
+
+
+def test_sampled_request_dumps_pstats_with_metadata(tmp_path):
+    profiler = RequestProfiler(ProfilingPolicy(sample_rate=1.0, output_dir=str(tmp_path)))
+    make_service(profiler).speak(req())
+    (stats_file,) = dumps(tmp_path, ".pstats")
+    functions = {name for _, _, name in pstats.Stats(str(stats_file)).stats}
+    assert "synthesize" in functions
+    meta = json.loads(stats_file.with_suffix(".json").read_text())
+    assert meta["trigger"] == "sampled"
+    assert meta["persona"] == "professional_female"
+    assert meta["text_len"] == len(req().text)
+
+
+def test_slow_request_dumps_collapsed_stacks(tmp_path):
+    profiler = RequestProfiler(
+        ProfilingPolicy(slow_threshold_s=0.02, sample_interval_s=0.005, output_dir=str(tmp_path))
+    )
+    service = make_service(profiler, SlowSynth(0.15))
+    service.speak(req())
+    (collapsed,) = dumps(tmp_path, ".collapsed")
+    lines = collapsed.read_text().splitlines()
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert "speak" in stack and "slow_model_step" in stack
+    assert stack.index("speak") < stack.index("slow_model_step")  # root first
+    assert json.loads(collapsed.with_suffix(".json").read_text())["trigger"] == "slow"
+
+
+def test_fast_request_under_threshold_is_not_dumped(tmp_path):
+    profiler = RequestProfiler(ProfilingPolicy(slow_threshold_s=5.0, output_dir=str(tmp_path / "p")))
+    make_service(profiler).speak(req())
+    assert not (tmp_path / "p").exists()
+
+
+def test_output_directory_is_bounded(tmp_path):
+    profiler = RequestProfiler(ProfilingPolicy(sample_rate=1.0, max_profiles=3, output_dir=str(tmp_path)))
+    service = make_service(profiler)
+    for _ in range(5):
+        service.speak(req())
+    assert len(dumps(tmp_path, ".pstats")) == 3
+    assert len(dumps(tmp_path, ".json")) == 3
+    assert profiler.stats()["pruned"] == 2
+
+
+def test_failed_request_is_still_profiled(tmp_path):
+    profiler = RequestProfiler(ProfilingPolicy(sample_rate=1.0, output_dir=str(tmp_path)))
+    with pytest.raises(ValueError):
+        make_service(profiler).speak(req(text="   "))
+    assert len(dumps(tmp_path, ".pstats")) == 1
+
+
+def test_invalid_policy_rejected():
+    with pytest.raises(ValueError):
+        RequestProfiler(ProfilingPolicy(sample_rate=1.5))
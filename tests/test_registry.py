@@ -0,0 +1,134 @@
+"""Tests for VersionedRegistry and the registries built on it."""
+
+import threading
+
+import pytest
+
+from tts_v2.domain.registry import VersionedRegistry
+from tts_v2.domain.voice import AGENT_REGISTRY, get_speaker, register_persona
+from tts_v2.text_normalization import abbreviation_handler
+from tts_v2.text_normalization.abbreviation_handler import (
+    add_abbreviation,
+    expand_abbreviations,
+    get_abbreviation_version,
+)
+from tts_v2.text_normalization.domain_phrases import (
+    add_domain_phrase,
+    find_domain_phrases,
+    get_domain_phrase_version,
+)
+
+
+class TestVersionedRegistry:
+    def test_reads_like_a_mapping(self):
+        reg = VersionedRegistry({"a": 1})
+        assert reg["a"] == 1 and "a" in reg and len(reg) == 1 and dict(reg) == {"a": 1}
+        assert reg.get("b") is None
+
+    def test_writes_bump_version_and_leave_old_snapshots_intact(self):
+        reg = VersionedRegistry({"a": 1})
+        v0, before = reg.snapshot()
+        assert reg.set("b", 2) == v0 + 1
+        assert dict(before) == {"a": 1}
+        assert reg.snapshot() == (v0 + 1, {"a": 1, "b": 2})
+
+    def test_snapshot_is_read_only(self):
+        _, contents = VersionedRegistry({"a": 1}).snapshot()
+        with pytest.raises(TypeError):
+            contents["a"] = 2
+
+    def test_no_op_update_keeps_version(self):
+        reg = VersionedRegistry({"a": 1})
+        assert reg.update(lambda d: False) == 0
+
+    def test_failed_update_is_not_published(self):
+        reg = VersionedRegistry({"a": 1})
+
+        def boom(d):
+            d["a"] = 99
+            raise RuntimeError("x")
+
+        with pytest.raises(RuntimeError):
+            reg.update(boom)
+        assert reg.snapshot() == (0, {"a": 1})
+
+    def test_derived_rebuilds_only_on_version_change(self):
+        reg = VersionedRegistry({"a": 1})
+        builds = []
+        total = reg.derived(lambda m: builds.append(1) or sum(m.values()))
+        assert total() == 1 and total() == 1
+        reg.set("b", 2)
+        assert total.with_version() == (1, 3)
+        assert len(builds) == 2
+
+    def test_concurrent_writers_do_not_lose_updates(self):
+        reg = VersionedRegistry()
+        threads = [
+            threading.Thread(target=lambda i=i: [reg.set((i, j), j) for j in range(200)])
+            for i in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(reg) == 1600 and reg.version == 1600
+
+    def test_readers_see_consistent_snapshots_during_writes(self):
+        reg = VersionedRegistry({"n": 0, "double": 0})
+        stop = threading.Event()
+        torn = []
+
+        def writer():
+            for n in range(1, 2000):
+                reg.update(lambda d, n=n: d.update(n=n, double=2 * n))
+            stop.set()
+
+        def reader():
+            while not stop.is_set():
+                _, snap = reg.snapshot()
+                if snap["double"] != 2 * snap["n"]:
+                    torn.append(dict(snap))
+
+        threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert not torn
+
+
+class TestRuntimeRegistries:
+    def test_register_persona_bumps_version(self, restore_registries):
+        version = AGENT_REGISTRY.version
+        register_persona("registry_test", "p230", "Registry Test", "test persona")
+        assert AGENT_REGISTRY.version == version + 1
+        assert get_speaker("registry_test").speaker_id == "p230"
+
+    def test_abbreviation_matcher_is_rebuilt_only_after_add(self, restore_registries):
+        expand_abbreviations("KYC")
+        version, matcher = abbreviation_handler._matcher.with_version()
+        expand_abbreviations("AML")
+        assert abbreviation_handler._matcher.with_version()[1] is matcher
+
+        add_abbreviation("ZZQ", "zed zed queue")
+        assert get_abbreviation_version() == version + 1
+        assert expand_abbreviations("ZZQ") == "ZED ZED QUEUE"
+        assert abbreviation_handler._matcher.with_version()[1] is not matcher
+
+    def test_add_domain_phrase_is_idempotent(self, restore_registries):
+        version = get_domain_phrase_version()
+        add_domain_phrase("fraud_alerts", "Registry Test Phrase")
+        add_domain_phrase("fraud_alerts", "registry test phrase")
+        assert get_domain_phrase_version() == version + 1
+        assert "registry test phrase" in find_domain_phrases("a Registry test phrase here")
+
+    def test_add_domain_phrase_unknown_category(self):
+        version = get_domain_phrase_version()
+        with pytest.raises(ValueError):
+            add_domain_phrase("nope", "x")
+        assert get_domain_phrase_version() == version
+
+    def test_restore_fixture_undoes_additions(self):
+        assert "registry_test" not in AGENT_REGISTRY
+        assert expand_abbreviations("ZZQ") == "ZZQ"
+        assert "registry test phrase" not in find_domain_phrases("a Registry test phrase here")
@@ -0,0 +1,150 @@
+"""Tests for RoutingSynthesizerAdapter — lazy loading, LRU eviction and speaker routing."""
+
+import numpy as np
+import pytest
+
+from tts_v2.adapters.normalizer.bfsi_normalizer_adapter import BFSINormalizerAdapter
+from tts_v2.adapters.synthesizer.routing_adapter import RoutingSynthesizerAdapter
+from tts_v2.adapters.synthesizer.simulated_adapter import SimulatedSynthesizerAdapter
+from tts_v2.domain.audio import AudioChunk, SynthesisRequest
+from tts_v2.domain.voice import NO_SPEAKER
+from tts_v2.ports import SpeakerRoutingPort
+from tts_v2.service.tts_service import TTSService
+
+
+class FakeModel:
+    """Echoes the speaker_id it was asked for."""
+
+    def __init__(self, name, log):
+        self.name = name
+        self.closed = False
+        log.append(name)
+
+    def synthesize(self, request):
+        return AudioChunk(
+            samples=np.zeros(10, dtype=np.float32),
+            sample_rate=22050,
+            speaker_id=f"{self.name}:{request.speaker_id}",
+        )
+
+    def get_speakers(self):
+        return []
+
+    def close(self):
+        self.closed = True
+
+
+def make_router(budget=100, events=None):
+    built = []
+    router = RoutingSynthesizerAdapter(
+        memory_budget_bytes=budget,
+        listener=(events.append if events is not None else None),
+    )
+    for key in ("a", "b", "c"):
+        router.register_model(key, lambda key=key: FakeModel(key, built), memory_bytes=60)
+        router.route_persona(f"persona_{key}", key, f"spk_{key}")
+    return router, built
+
+
+def speak(router, persona):
+    return router.synthesize(SynthesisRequest(text="hi", persona=persona))
+
+
+class TestRouting:
+    def test_models_load_lazily(self):
+        router, built = make_router()
+        assert built == []
+        chunk = speak(router, "persona_a")
+        assert built == ["a"]
+        assert chunk.speaker_id == "a:spk_a"
+
+    def test_loaded_model_is_reused(self):
+        router, built = make_router()
+        speak(router, "persona_a")
+        speak(router, "persona_a")
+        assert built == ["a"]
+
+    def test_lru_model_evicted_when_over_budget(self):
+        events = []
+        router, built = make_router(budget=130, events=events)
+        speak(router, "persona_a")
+        speak(router, "persona_b")
+        speak(router, "persona_a")   # b becomes LRU
+        speak(router, "persona_c")
+        assert router.loaded_models() == ["a", "c"]
+        assert [e["event"] for e in events] == [
+            "model_load", "model_load", "model_evict", "model_load",
+        ]
+        assert events[2]["model"] == "b"
+
+    def test_unrouted_persona_raises_runtime_error(self):
+        router, _ = make_router()
+        with pytest.raises(RuntimeError, match="No model route"):
+            speak(router, "nobody")
+
+    def test_route_to_unknown_model_rejected(self):
+        router, _ = make_router()
+        with pytest.raises(ValueError):
+            router.route_persona("x", "missing", "spk")
+
+    def test_single_speaker_route_sends_no_speaker(self):
+        router, _ = make_router()
+        router.route_persona("narrator", "b")
+        assert speak(router, "narrator").speaker_id == f"b:{NO_SPEAKER}"
+        assert router.speaker_for("narrator") == NO_SPEAKER
+        assert router.get_speakers() == ["spk_a", "spk_b", "spk_c"]
+
+    def test_speaker_for_unrouted_persona_is_none(self):
+        router, _ = make_router()
+        assert isinstance(router, SpeakerRoutingPort)
+        assert router.speaker_for("nobody") is None
+
+
+class NullSink:
+    def write(self, chunk, destination):
+        return destination
+
+
+class CapturingAudit:
+    def __init__(self):
+        self.events = []
+
+    def log_synthesis(self, event):
+        self.events.append(event)
+
+
+class TestRoutedService:
+    def make_service(self, router, **overrides):
+        audit = CapturingAudit()
+        service = TTSService(
+            synthesizer=router,
+            normalizer=BFSINormalizerAdapter(),
+            audio_sink=NullSink(),
+            audit=audit,
+            **overrides,
+        )
+        return service, audit
+
+    @pytest.mark.parametrize("persona, speaker_id", [("neutral_male", "spk_a"), ("neutral_female", NO_SPEAKER)])
+    def test_audit_names_the_routed_speaker(self, persona, speaker_id):
+        router, _ = make_router()
+        router.route_persona("neutral_male", "a", "spk_a")
+        router.route_persona("neutral_female", "b")
+        service, audit = self.make_service(router)
+        result = service.speak(SynthesisRequest(text="Hello there.", persona=persona))
+        assert result.chunk.speaker_id.endswith(f":{speaker_id}")
+        assert audit.events[-1]["speaker_id"] == speaker_id
+
+    def test_fallback_renders_with_the_registry_speaker(self):
+        from tts_v2.service.overload import OverloadController, OverloadPolicy
+
+        router, _ = make_router()
+        router.route_persona("neutral_male", "a", "spk_a")
+        service, audit = self.make_service(
+            router,
+            fallback_synthesizer=SimulatedSynthesizerAdapter(rtf=0.0, jitter=0.0),
+            overload=OverloadController(OverloadPolicy(max_in_flight=0)),
+        )
+        result = service.speak(SynthesisRequest(text="Hello there.", persona="neutral_male"))
+        assert result.chunk.speaker_id == "p227"
+        assert audit.events[-1]["speaker_id"] == "p227"
@@ -0,0 +1,304 @@
+"""Tests for the HTTP/WebSocket server — fully offline against MockSynthesizerAdapter."""
+
+import base64
+import http.client
+import json
+import os
+import socket
+import struct
+import threading
+import time
+
+import pytest
+
+from tts_v2.adapters.audit.noop_audit_adapter import NoOpAuditAdapter
+from tts_v2.adapters.normalizer.bfsi_normalizer_adapter import BFSINormalizerAdapter
+from tts_v2.adapters.synthesizer.mock_adapter import MockSynthesizerAdapter
+from tts_v2.entrypoints.server import TTSServer
+from tts_v2.service.overload import OverloadController, OverloadPolicy
+from tts_v2.service.tts_service import TTSService
+
+MOCK_PCM_BYTES = 22050 * 2  # one second of int16 per sentence
+
+
+class NullSink:
+    def write(self, chunk, destination):
+        return destination
+
+
+def make_service(synthesizer=None, overload=None):
+    return TTSService(
+        synthesizer=synthesizer or MockSynthesizerAdapter(),
+        normalizer=BFSINormalizerAdapter(),
+        audio_sink=NullSink(),
+        audit=NoOpAuditAdapter(),
+        overload=overload,
+    )
+
+
+@pytest.fixture
+def shedding_server():
+    """Always overloaded, and every request is below the shedding threshold."""
+    overload = OverloadController(OverloadPolicy(max_in_flight=0, shed_below_priority=1))
+    srv = TTSServer(lambda: make_service(overload=overload), port=0, queue_timeout_s=2.0)
+    srv.start()
+    assert srv.wait_ready(5)
+    yield srv
+    srv.shutdown()
+
+
+@pytest.fixture
+def server():
+    srv = TTSServer(make_service, port=0, max_concurrency=1, queue_timeout_s=2.0)
+    srv.start()
+    assert srv.wait_ready(5)
+    yield srv
+    srv.shutdown()
+
+
+def post(srv, body, path="/synthesize"):
+    conn = http.client.HTTPConnection(*srv.address, timeout=5)
+    conn.request("POST", path, body=json.dumps(body), headers={"Content-Type": "application/json"})
+    resp = conn.getresponse()
+    return resp, resp.read()
+
+
+# ---------------------------------------------------------------------------
+# HTTP
+# ---------------------------------------------------------------------------
+
+class TestHttp:
+    def test_ready(self, server):
+        conn = http.client.HTTPConnection(*server.address, timeout=5)
+        conn.request("GET", "/ready")
+        resp = conn.getresponse()
+        assert resp.status == 200
+        assert json.loads(resp.read())["ready"] is True
+
+    def test_ready_is_503_until_warm_up_completes(self):
+        release = threading.Event()
+
+        def slow_factory():
+            release.wait(5)
+            return make_service()
+
+        srv = TTSServer(slow_factory, port=0)
+        srv.start()
+        try:
+            conn = http.client.HTTPConnection(*srv.address, timeout=5)
+            conn.request("GET", "/ready")
+            resp = conn.getresponse()
+            resp.read()
+            assert resp.status == 503
+            release.set()
+            conn.request("GET", "/ready?wait=5")
+            assert conn.getresponse().status == 200
+        finally:
+            release.set()
+            srv.shutdown()
+
+    @pytest.mark.parametrize("wait", ["abc", "-1", "nan", "inf"])
+    def test_ready_rejects_bad_wait(self, server, wait):
+        conn = http.client.HTTPConnection(*server.address, timeout=5)
+        conn.request("GET", f"/ready?wait={wait}")
+        resp = conn.getresponse()
+        assert resp.status == 400
+        assert "wait" in json.loads(resp.read())["error"]
+
+    def test_ready_wait_is_capped(self, monkeypatch):
+        from tts_v2.entrypoints import server as server_module
+
+        monkeypatch.setattr(server_module, "_MAX_READY_WAIT_S", 0.05)
+        release = threading.Event()
+
+        def slow_factory():
+            release.wait(5)
+            return make_service()
+
+        srv = TTSServer(slow_factory, port=0)
+        srv.start()
+        try:
+            conn = http.client.HTTPConnection(*srv.address, timeout=5)
+            t0 = time.monotonic()
+            conn.request("GET", "/ready?wait=3600")
+            resp = conn.getresponse()
+            resp.read()
+            assert resp.status == 503
+            assert time.monotonic() - t0 < 2
+        finally:
+            release.set()
+            srv.shutdown()
+
+    def test_synthesize_streams_chunked_pcm(self, server):
+        resp, body = post(server, {"text": "Your OTP is 482913.", "persona": "professional_female"})
+        assert resp.status == 200
+        assert resp.getheader("Transfer-Encoding") == "chunked"
+        assert resp.getheader("X-Sample-Rate") == "22050"
+        assert len(body) == MOCK_PCM_BYTES
+
+    def test_long_text_is_streamed_per_sentence(self, server):
+        text = "This call may be recorded for quality purposes. Your balance is 100 dollars today."
+        _, body = post(server, {"text": text, "persona": "professional_female"})
+        assert len(body) == 2 * MOCK_PCM_BYTES
+
+    def test_wav_format_has_header(self, server):
+        resp, body = post(server, {"text": "Hello.", "persona": "professional_female"}, "/synthesize?format=wav")
+        assert resp.getheader("Content-Type") == "audio/wav"
+        assert body[:4] == b"RIFF" and body[8:12] == b"WAVE"
+        assert len(body) == 44 + MOCK_PCM_BYTES
+
+    @pytest.mark.parametrize("body", [{"text": "", "persona": "professional_female"}, {"text": "Hi"}, [1, 2]])
+    def test_bad_requests_are_400(self, server, body):
+        resp, _ = post(server, body)
+        assert resp.status == 400
+
+    def test_negative_content_length_is_400(self, server):
+        conn = http.client.HTTPConnection(*server.address, timeout=5)
+        conn.putrequest("POST", "/synthesize")
+        conn.putheader("Content-Length", "-1")
+        conn.endheaders()
+        assert conn.getresponse().status == 400
+
+    def test_speaker_id_must_be_offered_by_model(self, server):
+        resp, body = post(server, {"text": "Hi.", "persona": "professional_female", "speaker_id": "p999"})
+        assert resp.status == 400 and b"p999" in body
+        resp, _ = post(server, {"text": "Hi.", "persona": "professional_female", "speaker_id": "mock"})
+        assert resp.status == 200
+
+    def test_shed_request_is_503(self, shedding_server):
+        resp, body = post(shedding_server, {"text": "Hello.", "persona": "professional_female"})
+        assert resp.status == 503 and b"shed" in body
+        assert resp.getheader("Retry-After") == "1"
+
+    def test_unknown_path_is_404(self, server):
+        resp, _ = post(server, {"text": "Hi", "persona": "professional_female"}, "/speak")
+        assert resp.status == 404
+
+    def test_concurrency_limit_rejects_with_503(self):
+        entered, release = threading.Event(), threading.Event()
+
+        class BlockingSynth(MockSynthesizerAdapter):
+            def synthesize(self, request):
+                if request.text != "Warm up.":
+                    entered.set()
+                    release.wait(5)
+                return super().synthesize(request)
+
+        srv = TTSServer(lambda: make_service(BlockingSynth()), port=0, max_concurrency=1, queue_timeout_s=0.2)
+        srv.start()
+        assert srv.wait_ready(5)
+        try:
+            first = threading.Thread(target=post, args=(srv, {"text": "One.", "persona": "professional_female"}))
+            first.start()
+            assert entered.wait(5)
+            resp, _ = post(srv, {"text": "Two.", "persona": "professional_female"})
+            assert resp.status == 503
+            assert resp.getheader("Retry-After") == "1"
+            release.set()
+            first.join(5)
+            resp, _ = post(srv, {"text": "Three.", "persona": "professional_female"})
+            assert resp.status == 200
+        finally:
+            release.set()
+            srv.shutdown()
+
+
+# ---------------------------------------------------------------------------
+# WebSocket
+# ---------------------------------------------------------------------------
+
+class WsClient:
+    """Minimal RFC 6455 client: masked frames out, unmasked frames in."""
+
+    def __init__(self, address):
+        self.sock = socket.create_connection(address, timeout=5)
+        key = base64.b64encode(os.urandom(16)).decode()
+        self.sock.sendall(
+            f"GET /ws HTTP/1.1\r\nHost: x\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n".encode()
+        )
+        self.file = self.sock.makefile("rb")
+        status = self.file.readline()
+        assert b"101" in status
+        while self.file.readline() not in (b"\r\n", b""):
+            pass
+
+    def send(self, opcode, payload, fin=True):
+        mask = os.urandom(4)
+        masked = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        n = len(payload)
+        b0 = (0x80 if fin else 0) | opcode
+        header = struct.pack("!BB", b0, 0x80 | n) if n < 126 else struct.pack("!BBH", b0, 0xFE, n)
+        self.sock.sendall(header + mask + masked)
+
+    def recv(self):
+        b0, b1 = self.file.read(2)
+        n = b1 & 0x7F
+        if n == 126:
+            n = struct.unpack("!H", self.file.read(2))[0]
+        elif n == 127:
+            n = struct.unpack("!Q", self.file.read(8))[0]
+        return b0 & 0x0F, self.file.read(n)
+
+    def utterance(self, body):
+        self.send(0x1, json.dumps(body).encode())
+        events, pcm = [], b""
+        while True:
+            opcode, payload = self.recv()
+            if opcode == 0x2:
+                pcm += payload
+                continue
+            events.append(json.loads(payload))
+            if events[-1]["event"] in ("end", "error"):
+                return events, pcm
+
+    def close(self):
+        self.send(0x8, struct.pack("!H", 1000))
+        opcode, _ = self.recv()
+        self.sock.close()
+        return opcode
+
+
+class TestWebSocket:
+    def test_binary_pcm_frames_between_start_and_end(self, server):
+        client = WsClient(server.address)
+        events, pcm = client.utterance({"text": "Your OTP is 482913.", "persona": "professional_female"})
+        assert events[0] == {"event": "start", "sample_rate": 22050}
+        assert events[-1] == {"event": "end", "duration_s": 1.0}
+        assert len(pcm) == MOCK_PCM_BYTES
+        assert client.close() == 0x8
+
+    def test_connection_is_reused_across_utterances(self, server):
+        client = WsClient(server.address)
+        for _ in range(2):
+            events, pcm = client.utterance({"text": "Hello.", "persona": "professional_female"})
+            assert events[-1]["event"] == "end"
+        client.send(0x9, b"hb")
+        assert client.recv() == (0xA, b"hb")
+        client.close()
+
+    def test_error_event_keeps_socket_open(self, server):
+        client = WsClient(server.address)
+        events, _ = client.utterance({"text": "Hi"})
+        assert events == [events[0]] and events[0]["event"] == "error" and events[0]["status"] == 400
+        events, _ = client.utterance({"text": "Hi", "persona": "professional_female"})
+        assert events[-1]["event"] == "end"
+        client.close()
+
+    def test_unmasked_client_frame_closes_with_1002(self, server):
+        client = WsClient(server.address)
+        client.sock.sendall(struct.pack("!BB", 0x81, 2) + b"{}")
+        assert client.recv() == (0x8, struct.pack("!H", 1002))
+
+    def test_fragmented_message_is_capped_with_1009(self, server):
+        client = WsClient(server.address)
+        fragment = b"x" * 60000
+        for i in range(18):  # ~1.08 MB in total, every frame well under the cap
+            client.send(0x1 if i == 0 else 0x0, fragment, fin=False)
+        assert client.recv() == (0x8, struct.pack("!H", 1009))
+
+    def test_shed_request_is_error_event(self, shedding_server):
+        client = WsClient(shedding_server.address)
+        events, pcm = client.utterance({"text": "Hello.", "persona": "professional_female"})
+        assert pcm == b"" and events[-1]["event"] == "error" and events[-1]["status"] == 503
+        client.close()
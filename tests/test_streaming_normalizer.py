@@ -0,0 +1,57 @@
+"""Tests for StreamingNormalizerAdapter — output must equal batch normalisation."""
+
+import random
+
+import pytest
+
+from tts_v2.adapters.normalizer.bfsi_normalizer_adapter import BFSINormalizerAdapter
+from tts_v2.adapters.normalizer.streaming_normalizer_adapter import StreamingNormalizerAdapter
+
+TEXTS = [
+    "Your OTP is 482913. Please do not share it with anyone.",
+    "We received $1,234.50 from your AU/NZ account. The fee is $ 25 p.a. and the rate is 5.25 i.e. fixed!",
+    "KYC and AML checks passed.  Reference ABCD1234 was raised, call 1300 123 456 now? Thanks.",
+    "  Leading spaces, a SWIFT transfer of $12345 and 1,234,567 points.\nNew line here. Done ",
+]
+
+
+def split_randomly(text, rng):
+    pieces, i = [], 0
+    while i < len(text):
+        step = rng.randint(1, 6)
+        pieces.append(text[i:i + step])
+        i += step
+    return pieces
+
+
+class TestStreamingEquivalence:
+    @pytest.mark.parametrize("text", TEXTS)
+    @pytest.mark.parametrize("seed", range(5))
+    def test_concatenated_output_matches_batch(self, text, seed):
+        fragments = split_randomly(text, random.Random(seed))
+        stream = StreamingNormalizerAdapter(min_chars=5, max_chars=30)
+        segments = list(stream.normalize_stream(fragments))
+        assert "".join(segments) == BFSINormalizerAdapter().normalize(text)
+
+    def test_emits_before_stream_ends(self):
+        stream = StreamingNormalizerAdapter(min_chars=5)
+
+        def fragments():
+            yield "Your OTP is 482913. "
+            yield "Next"
+            raise AssertionError("consumer pulled past the first sentence")
+
+        first = next(stream.normalize_stream(fragments()))
+        assert first == "Your ONE TIME PASSWORD is four eight two nine one three. "
+
+    def test_holds_back_partial_tokens(self):
+        stream = StreamingNormalizerAdapter(min_chars=0, max_chars=1)
+        segments = list(stream.normalize_stream(["Send to AU/", "NZ now. ", "Pay $", " 50 today."]))
+        joined = "".join(segments)
+        assert "AUSTRALIA AND NEW ZEALAND" in joined
+        assert "fifty dollars" in joined
+
+    def test_dotted_abbreviation_is_not_a_sentence_end(self):
+        stream = StreamingNormalizerAdapter(min_chars=0)
+        segments = list(stream.normalize_stream(["Fixed i.e. ", "no change. ", "Bye."]))
+        assert len(segments) == 2
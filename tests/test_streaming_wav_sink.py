@@ -0,0 +1,99 @@
+"""Tests for StreamingWavSinkAdapter / WavStreamWriter."""
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from tts_v2.adapters.audio_sink.streaming_wav_sink_adapter import StreamingWavSinkAdapter, WavStreamWriter
+from tts_v2.domain.audio import AudioChunk
+from tts_v2.ports.audio_sink_port import AudioSinkPort
+from tts_v2.shared.buffer_pool import BufferPool
+
+SR = 8000
+
+
+def tone(n, amplitude=0.5, sr=SR):
+    t = np.arange(n) / sr
+    return AudioChunk(samples=(amplitude * np.sin(2 * np.pi * 440 * t)).astype(np.float32), sample_rate=sr, speaker_id="p1")
+
+
+def test_implements_port_and_matches_single_write(tmp_path):
+    sink = StreamingWavSinkAdapter()
+    assert isinstance(sink, AudioSinkPort)
+    chunk = tone(800)
+    path = sink.write(chunk, str(tmp_path / "a" / "one.wav"))
+    data, sr = sf.read(path, dtype="float32")
+    assert sr == SR and data.size == 800
+    np.testing.assert_allclose(data, chunk.samples, atol=1e-4)
+
+
+def test_stream_concatenates_chunks_and_releases_them(tmp_path):
+    pool = BufferPool()
+    chunks = []
+    for n in (300, 500, 200):
+        lease = pool.acquire(n)
+        lease.array[:] = tone(n).samples
+        chunks.append(AudioChunk(lease.array, SR, "p1", lease=lease))
+    expected = np.concatenate([c.samples.copy() for c in chunks])
+    sink = StreamingWavSinkAdapter(subtype="FLOAT")
+    path = sink.write_stream(iter(chunks), str(tmp_path / "s.wav"))
+    data, _ = sf.read(path, dtype="float32")
+    np.testing.assert_array_equal(data, expected)
+    assert pool.stats()["leased_bytes"] == 0
+    assert sink.stats() == {"files": 1, "audio_s": 0.125, "gain_drops": 0}
+
+
+def test_file_is_valid_while_being_written(tmp_path):
+    path = tmp_path / "tail.wav"
+    with WavStreamWriter(str(path), SR) as wav:
+        wav.append(tone(400))
+        assert sf.info(str(path)).frames == 400
+        wav.append(tone(400))
+        assert sf.info(str(path)).frames == 800
+    assert sf.info(str(path)).frames == 800
+
+
+def test_header_patched_on_close_only(tmp_path):
+    path = tmp_path / "late.wav"
+    wav = WavStreamWriter(str(path), SR, header_every_chunk=False)
+    wav.append(tone(400))
+    assert path.stat().st_size == 44 + 800
+    assert sf.info(str(path)).frames == 0
+    wav.close()
+    wav.close()
+    assert sf.info(str(path)).frames == 400
+
+
+def test_running_gain_never_increases(tmp_path):
+    path = tmp_path / "peaks.wav"
+    with WavStreamWriter(str(path), SR, subtype="FLOAT") as wav:
+        wav.append(tone(400, amplitude=0.5))
+        wav.append(tone(400, amplitude=2.0))
+        assert wav.gain == pytest.approx(0.5, rel=1e-3)
+        wav.append(tone(400, amplitude=1.5))
+        assert wav.gain == pytest.approx(0.5, rel=1e-3) and wav.gain_drops == 1
+    data, _ = sf.read(str(path), dtype="float32")
+    assert np.abs(data).max() <= 1.0 + 1e-6
+    np.testing.assert_allclose(np.abs(data[:400]).max(), 0.5, rtol=1e-3)
+
+
+def test_sample_rate_mismatch_is_rejected(tmp_path):
+    with WavStreamWriter(str(tmp_path / "x.wav"), SR) as wav:
+        with pytest.raises(ValueError, match="sample rate"):
+            wav.append(tone(100, sr=16000))
+
+
+def test_failed_stream_leaves_valid_partial_file(tmp_path):
+    def chunks():
+        yield tone(400)
+        raise RuntimeError("synthesis failed")
+
+    path = tmp_path / "partial.wav"
+    with pytest.raises(RuntimeError):
+        StreamingWavSinkAdapter().write_stream(chunks(), str(path))
+    assert sf.info(str(path)).frames == 400
+
+
+def test_empty_stream_writes_nothing(tmp_path):
+    assert StreamingWavSinkAdapter().write_stream([], str(tmp_path / "none.wav")) is None
+    assert not (tmp_path / "none.wav").exists()
@@ -0,0 +1,150 @@
+"""Tests for WsolaTimeScalerAdapter and speaking-rate requests in TTSService."""
+
+import numpy as np
+import pytest
+
+from tts_v2.adapters.normalizer.bfsi_normalizer_adapter import BFSINormalizerAdapter
+from tts_v2.adapters.rendition_store.memory_store_adapter import InMemoryRenditionStoreAdapter
+from tts_v2.adapters.synthesizer.mock_adapter import MockSynthesizerAdapter
+from tts_v2.adapters.time_scale.wsola_adapter import WsolaTimeScalerAdapter
+from tts_v2.domain.audio import AudioChunk, SynthesisRequest
+from tts_v2.ports.time_scaler_port import TimeScalerPort
+from tts_v2.service.tts_service import TTSService
+from tts_v2.shared.buffer_pool import BufferPool
+
+SR = 22050
+
+
+def voiced(seconds=2.0, f0=150.0):
+    """Harmonic tone with a slow amplitude envelope — a stand-in for a vowel."""
+    t = np.arange(int(SR * seconds)) / SR
+    tone = sum(np.sin(2 * np.pi * f0 * h * t) / h for h in (1, 2, 3))
+    return (0.3 * tone * (0.6 + 0.4 * np.sin(2 * np.pi * 2 * t))).astype(np.float32)
+
+
+def dominant_hz(samples):
+    spectrum = np.abs(np.fft.rfft(samples * np.hanning(samples.size)))
+    return np.fft.rfftfreq(samples.size, 1 / SR)[np.argmax(spectrum)]
+
+
+class ToneSynth(MockSynthesizerAdapter):
+    def __init__(self):
+        self.calls = 0
+
+    def synthesize(self, request):
+        self.calls += 1
+        return AudioChunk(samples=voiced(1.0), sample_rate=SR, speaker_id="p225")
+
+
+class RecordingAudit:
+    def __init__(self):
+        self.events = []
+
+    def log_synthesis(self, event):
+        self.events.append(event)
+
+
+class NullSink:
+    def write(self, chunk, destination):
+        return destination
+
+
+def make_service(**overrides):
+    defaults = dict(
+        synthesizer=ToneSynth(),
+        normalizer=BFSINormalizerAdapter(),
+        audio_sink=NullSink(),
+        audit=RecordingAudit(),
+        time_scaler=WsolaTimeScalerAdapter(),
+    )
+    defaults.update(overrides)
+    return TTSService(**defaults)
+
+
+def req(rate=1.0, text="Your balance is updated."):
+    return SynthesisRequest(text=text, persona="professional_female", rate=rate)
+
+
+class TestWsola:
+    def test_implements_port(self):
+        assert isinstance(WsolaTimeScalerAdapter(), TimeScalerPort)
+
+    @pytest.mark.parametrize("rate", [0.7, 0.85, 1.15, 1.3])
+    def test_length_scales_and_pitch_is_kept(self, rate):
+        source = voiced()
+        out = WsolaTimeScalerAdapter().retime(AudioChunk(source, SR, "p225"), rate)
+        assert out.samples.size == round(source.size / rate)
+        assert out.samples.dtype == np.float32
+        assert dominant_hz(out.samples) == pytest.approx(150.0, abs=3.0)
+
+    def test_level_is_preserved(self):
+        source = voiced()
+        out = WsolaTimeScalerAdapter().retime(AudioChunk(source, SR, "p225"), 1.2).samples
+        rms = lambda x: float(np.sqrt(np.mean(x ** 2)))  # noqa: E731
+        assert rms(out) == pytest.approx(rms(source), rel=0.1)
+        assert np.abs(out).max() <= np.abs(source).max() * 1.05
+
+    def test_rate_one_returns_input(self):
+        chunk = AudioChunk(voiced(0.5), SR, "p225")
+        assert WsolaTimeScalerAdapter().retime(chunk, 1.0) is chunk
+
+    def test_rate_out_of_range_raises(self):
+        with pytest.raises(ValueError, match="rate must be in"):
+            WsolaTimeScalerAdapter().retime(AudioChunk(voiced(0.5), SR, "p225"), 1.5)
+
+    def test_read_only_input(self):
+        source = voiced(0.5)
+        source.setflags(write=False)
+        out = WsolaTimeScalerAdapter().retime(AudioChunk(source, SR, "p225"), 0.8)
+        assert out.samples.size == round(source.size / 0.8)
+
+    def test_input_lease_released_and_output_pooled(self):
+        pool = BufferPool()
+        lease = pool.acquire(int(SR * 0.5))
+        lease.array[:] = voiced(0.5)
+        chunk = AudioChunk(lease.array, SR, "p225", lease=lease)
+        out = WsolaTimeScalerAdapter(buffer_pool=pool).retime(chunk, 0.8)
+        assert chunk.lease is None and lease.refcount == 0
+        assert out.lease is not None
+        out.release()
+
+    def test_short_input(self):
+        out = WsolaTimeScalerAdapter().retime(AudioChunk(voiced(0.01), SR, "p225"), 1.3)
+        assert out.samples.size == round(int(SR * 0.01) / 1.3)
+
+
+class TestServiceRate:
+    def test_rate_retimes_output(self):
+        result = make_service().speak(req(rate=1.25))
+        assert result.chunk.samples.size == round(SR / 1.25)
+
+    def test_synthesizer_renders_at_base_rate(self):
+        seen = []
+
+        class Spy(ToneSynth):
+            def synthesize(self, request):
+                seen.append(request.rate)
+                return super().synthesize(request)
+
+        make_service(synthesizer=Spy()).speak(req(rate=0.8))
+        assert seen == [1.0]
+
+    def test_rate_variants_reuse_stored_rendition(self):
+        synth = ToneSynth()
+        audit = RecordingAudit()
+        service = make_service(synthesizer=synth, audit=audit, renditions=InMemoryRenditionStoreAdapter())
+        durations = [service.speak(req(rate=rate)).duration_s for rate in (1.0, 0.8, 1.2)]
+        assert synth.calls == 1
+        assert durations == pytest.approx([1.0, 1.25, 1 / 1.2], abs=1e-3)
+        assert [e["source"] for e in audit.events] == ["synthesis", "rendition_store", "rendition_store"]
+        assert [e["rate"] for e in audit.events] == [1.0, 0.8, 1.2]
+
+    def test_unsupported_rate_rejected_before_synthesis(self):
+        synth = ToneSynth()
+        with pytest.raises(ValueError, match="rate must be in"):
+            make_service(synthesizer=synth).speak(req(rate=2.0))
+        assert synth.calls == 0
+
+    def test_rate_without_time_scaler_rejected(self):
+        with pytest.raises(ValueError, match="time_scaler"):
+            make_service(time_scaler=None).speak(req(rate=1.1))